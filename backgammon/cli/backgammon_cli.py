@@ -4,6 +4,7 @@ Acts as coordinator, delegating to specialized classes.
 """
 
 from typing import Union
+from backgammon.core.replay import GameReplay
 from .board_renderer import BoardRenderer
 from .command_parser import CommandParser
 from .input_validator import InputValidator
@@ -11,7 +12,7 @@ from .game_controller import GameController
 from .user_interface import UserInterface
 
 
-class BackgammonCLI:
+class BackgammonCLI:  # pylint: disable=too-many-instance-attributes
     """
     Main CLI coordinator for Backgammon game.
 
@@ -23,18 +24,24 @@ class BackgammonCLI:
     - UserInterface: User I/O operations
     """
 
-    def __init__(self, game=None) -> None:
+    def __init__(self, game=None, bot=None) -> None:
         """
         Initialize the BackgammonCLI coordinator.
 
         Args:
             game: BackgammonGame instance to interact with
+            bot: Optional computer opponent (e.g. ExpectimaxPlayer) that
+                plays the turns of its color
         """
         self.board_renderer = BoardRenderer()
         self.command_parser = CommandParser()
         self.input_validator = InputValidator()
         self.game_controller = GameController(game)
         self.ui = UserInterface()
+        self.bot = bot
+        # Dice and moves of the computer's last turn, shown after the next redraw
+        self.bot_turn = None
+        self.replay = None
 
     def set_game(self, game) -> None:
         """
@@ -133,15 +140,13 @@ class BackgammonCLI:
         while True:
             try:
                 if self.game_controller.is_game_over():
+                    self.display_bot_turn()
                     winner = self.game_controller.get_winner()
                     self.ui.display_winner(winner)
                     break
 
-                self.ui.clear_screen()
-                self.display_board()
-
-                current_player = self.game_controller.get_current_player()
-                self.ui.display_current_player(current_player)
+                if self.start_turn():
+                    continue
 
                 if not self.game_controller.get_available_moves():
                     dice_values = self.game_controller.roll_dice()
@@ -168,14 +173,7 @@ class BackgammonCLI:
 
                     command_type = self.command_parser.get_command_type(str(from_pos))
 
-                    if command_type == "help":
-                        self.ui.display_help()
-                        continue
-                    if command_type == "moves":
-                        self.display_possible_moves()
-                        continue
-                    if command_type == "rules":
-                        self.ui.display_game_rules()
+                    if self.run_info_command(command_type, to_pos):
                         continue
                     if command_type == "quit":
                         if self.ui.confirm_action(
@@ -208,12 +206,122 @@ class BackgammonCLI:
             except KeyboardInterrupt:
                 if self.ui.confirm_action("¿Está seguro que desea salir? (s/n): "):
                     break
+            except RuntimeError as e:
+                # Raised by the computer opponent (e.g. a rejected move)
+                self.ui.display_error(f"Error de la computadora: {str(e)}")
+                break
             except (ValueError, TypeError, AttributeError) as e:
                 self.ui.display_error(f"Error del juego: {str(e)}")
                 break
 
         self.ui.display_message("¡Gracias por jugar!")
 
+    def run_info_command(self, command_type: str, argument) -> bool:
+        """
+        Run a command that only shows information (help, moves, rules, replay).
+
+        Args:
+            command_type: Command type from CommandParser.get_command_type()
+            argument: Second value of the parsed input (replay's move number)
+
+        Returns:
+            True if the command was run, False for any other command or move
+        """
+        actions = {
+            "help": self.ui.display_help,
+            "moves": self.display_possible_moves,
+            "rules": self.ui.display_game_rules,
+            "replay": lambda: self.display_replay(argument),
+        }
+        if command_type not in actions:
+            return False
+        actions[command_type]()
+        return True
+
+    def display_replay(self, move_number: int) -> None:
+        """
+        Display the board as it was after a number of moves of this game.
+
+        The replay index is kept between calls and only catches up with the
+        moves made since the last one.
+
+        Args:
+            move_number: Number of moves played (0 for the starting position)
+        """
+        game = self.game_controller.game
+        if not game:
+            self.ui.display_message("No hay partida para repetir")
+            return
+        if self.replay is None:
+            self.replay = GameReplay.from_game(game)
+        else:
+            self.replay.sync(game.move_history)
+
+        try:
+            board = self.replay.seek(move_number)
+        except IndexError:
+            self.ui.display_error(
+                f"La partida tiene {len(self.replay)} movimientos (use 0-{len(self.replay)})"
+            )
+            return
+
+        self.ui.display(self.board_renderer.render_board(board))
+        message = f"Posición tras {move_number} de {len(self.replay)} movimientos"
+        if move_number:
+            from_pos, to_pos, color = self.replay.move_at(move_number)
+            message += f" (último: {color} {from_pos} a {to_pos})"
+        self.ui.display_message(message)
+
+    def start_turn(self) -> bool:
+        """
+        Redraw the screen for the player on turn and let the computer play.
+
+        The computer's previous turn is shown after the redraw. If the
+        computer is on turn, it plays its whole turn (see play_bot_turn()).
+
+        Returns:
+            True if the computer played, False if a human is on turn
+
+        Raises:
+            RuntimeError: If the computer opponent fails (e.g. a rejected move)
+        """
+        self.ui.clear_screen()
+        self.display_board()
+        self.display_bot_turn()
+        self.ui.display_current_player(self.game_controller.get_current_player())
+        if self.bot and self.bot.is_turn(self.game_controller.game):
+            self.play_bot_turn()
+            return True
+        return False
+
+    def play_bot_turn(self) -> None:
+        """
+        Let the computer opponent play its whole turn.
+
+        Its dice and moves are kept in bot_turn and shown by
+        display_bot_turn() after the screen is redrawn.
+        """
+        moves = self.bot.play_turn(self.game_controller.game)
+        self.bot_turn = (self.game_controller.get_dice_values(), moves)
+        if not self.game_controller.is_game_over():
+            self.game_controller.complete_turn()
+
+    def display_bot_turn(self) -> None:
+        """Show the dice and moves of the computer's last turn, once."""
+        if not self.bot_turn:
+            return
+        dice_values, moves = self.bot_turn
+        self.bot_turn = None
+        if dice_values:
+            self.ui.display_dice_roll(dice_values)
+        if moves:
+            for from_pos, to_pos in moves:
+                self.ui.display_message(
+                    f"La computadora mueve: {from_pos} a {to_pos}"
+                )
+        else:
+            self.ui.display_message("La computadora no tiene movimientos válidos.")
+
     def _display_move_error(
         self, from_pos: Union[int, str], to_pos: Union[int, str]
     ) -> None:
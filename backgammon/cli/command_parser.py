@@ -24,6 +24,8 @@ class CommandParser:
         "moves",
     ]
 
+    REPLAY_COMMANDS = ["repetir", "replay"]
+
     def __init__(self) -> None:
         """Initialize the CommandParser."""
 
@@ -49,6 +51,13 @@ class CommandParser:
 
         parts = move_input.split()
 
+        if (
+            len(parts) == 2
+            and parts[0].lower() in self.REPLAY_COMMANDS
+            and parts[1].isdigit()
+        ):
+            return "replay", int(parts[1])
+
         if len(parts) != 2:
             raise ValueError(
                 "Formato inválido. Necesita especificar posición DESDE y posición HASTA."
@@ -99,7 +108,7 @@ class CommandParser:
             command: Command string
 
         Returns:
-            Command type: 'help', 'rules', 'quit', 'moves', or 'unknown'
+            Command type: 'help', 'rules', 'quit', 'moves', 'replay' or 'unknown'
         """
         command_lower = command.lower()
 
@@ -111,5 +120,7 @@ class CommandParser:
             return "quit"
         if command_lower in ["moves", "movimientos"]:
             return "moves"
+        if command_lower in self.REPLAY_COMMANDS:
+            return "replay"
 
         return "unknown"
@@ -207,6 +207,7 @@ class UserInterface:
         )
         print("║  • 'ayuda' - Mostrar esta ayuda" + " " * 36 + "║")
         print("║  • 'reglas' - Mostrar reglas del juego" + " " * 29 + "║")
+        print("║  • 'repetir N' - Ver el tablero tras N movimientos" + " " * 17 + "║")
         print("║  • 'salir' - Salir del juego" + " " * 39 + "║")
         print("╠" + "═" * 68 + "╣")
         print("║  FORMATO DE MOVIMIENTO:" + " " * 44 + "║")
@@ -8,6 +8,7 @@ from .dice import Dice
 from .player import Player
 from .board import Board
 from .checker import Checker
+from .move_generator import MoveGenerator
 from .backgammon_game import BackgammonGame
 
-__all__ = ['Dice', 'Player', 'Board', 'Checker', 'BackgammonGame']
+__all__ = ['Dice', 'Player', 'Board', 'Checker', 'MoveGenerator', 'BackgammonGame']
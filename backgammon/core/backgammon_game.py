@@ -6,10 +6,34 @@ Manages the complete game flow, players, board, dice, and UI interactions.
 # pylint: disable=invalid-name  # BackgammonGame follows PascalCase class naming convention
 
 import time
-from typing import List, Tuple, Union, Dict, Any, Optional
-from .board import Board
+from typing import List, Tuple, Union, Dict, Any, Optional, NamedTuple, FrozenSet
+from .board import Board, BoardDelta, BAR_SLOT, OFF_SLOT
 from .player import Player
 from .dice import Dice
+from .instrumentation import GENERATE_MOVES, Instrumentation
+from .move_cache import GAME_CACHE_SIZE, MoveCache, make_move_key
+from .move_generator import MoveGenerator
+from .position_id import decode_match_id, encode_match_id, game_match_state
+from .zobrist import SIDE_KEY, hash_dice
+
+
+class MoveRecord(NamedTuple):
+    """
+    Delta record pushed by make_move so the move can be unmade in O(1).
+
+    Attributes:
+        board_delta: Board-level record (origin, destination, hit)
+        die: Die value consumed by the move
+        die_index: Position of the consumed die in dice.values (-1 if none)
+        player_index: Index of the player who moved
+        player_counters: (on_board, off_board, on_bar) before the move
+    """
+
+    board_delta: BoardDelta
+    die: int
+    die_index: int
+    player_index: int
+    player_counters: Tuple[int, int, int]
 
 
 class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
@@ -34,12 +58,21 @@ class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-p
         """
         self.board = Board()
         self.dice = Dice()
+        self.move_generator = MoveGenerator()
+        self.move_cache = MoveCache(GAME_CACHE_SIZE)
+        self.journal = None
+        self.instrumentation: Optional[Instrumentation] = None
+        # Legal single moves of the current turn, filled lazily by get_legal_moves()
+        self.legal_moves: Tuple[Tuple[Union[int, str], Union[int, str]], ...] = ()
+        self._legal_move_set: FrozenSet[Tuple[Union[int, str], Union[int, str]]] = frozenset()
+        self._legal_moves_key: Optional[Tuple] = None
         self.players: List[Player] = []
         self.current_player_index = 0
         self.ui = ui
         self.is_started = False
         self.is_paused = False
         self.move_history: List[Tuple[Union[int, str], Union[int, str], str]] = []
+        self.move_records: List[MoveRecord] = []
         self.move_count = 0
         self.start_time = None
         self.end_time = None
@@ -90,6 +123,8 @@ class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-p
     def switch_turns(self) -> None:
         """Switch to the next player's turn."""
         self.current_player_index = (self.current_player_index + 1) % 2
+        if self.journal:
+            self.journal.record_switch(self.dice.last_roll, self.dice.values)
 
     def get_current_player(self) -> Player:
         """
@@ -109,6 +144,72 @@ class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-p
         """
         return self.players[(self.current_player_index + 1) % 2]
 
+    def get_position_key(self) -> int:
+        """
+        Get the 64-bit Zobrist key of the current game position.
+
+        Combines the board key (kept up to date by the board on every move)
+        with the side to move and the remaining dice.
+
+        Returns:
+            64-bit position key
+        """
+        key = self.board.zobrist_key ^ hash_dice(self.dice.values)
+        if self.current_player_index:
+            key ^= SIDE_KEY
+        return key
+
+    def get_position_id(self) -> str:
+        """
+        Get the GNU Backgammon position ID of the board, seen by the side to move.
+
+        Returns:
+            14-character position ID
+        """
+        return self.board.get_position_id(self.get_current_player().color)
+
+    def get_match_id(self) -> str:
+        """
+        Get the GNU Backgammon match ID of the game.
+
+        Returns:
+            12-character match ID
+        """
+        return encode_match_id(game_match_state(self))
+
+    def load_position_id(self, position_id: str, match_id: Optional[str] = None) -> None:
+        """
+        Set up the game from a position ID and an optional match ID.
+
+        The match ID sets the side on roll and the rolled dice (all their
+        moves are available again); without it the side on roll is kept.
+        Move history is cleared.
+
+        Args:
+            position_id: 14-character position ID
+            match_id: Optional 12-character match ID
+
+        Raises:
+            ValueError: If either ID is not valid
+        """
+        match_state = decode_match_id(match_id) if match_id else None
+        if match_state:
+            self.current_player_index = 0 if match_state.on_roll == "white" else 1
+        color = self.get_current_player().color
+        self.board = Board.from_position_id(position_id, color)
+        self.dice.reset()
+        if match_state and match_state.dice[0] and match_state.dice[1]:
+            self.dice.last_roll = list(match_state.dice)
+            self.dice.values = self.dice.get_moves(self.dice.last_roll)
+        for player in self.players:
+            on_bar = self.board.cells[BAR_SLOT[player.color]]
+            off_board = self.board.cells[OFF_SLOT[player.color]]
+            player.checkers_on_bar = on_bar
+            player.checkers_off_board = off_board
+            player.checkers_on_board = 15 - on_bar - off_board
+        self.move_history = []
+        self.move_records = []
+
     def roll_dice(self) -> List[int]:
         """
         Roll the dice for the current turn.
@@ -116,7 +217,10 @@ class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-p
         Returns:
             List of dice values [die1, die2]
         """
-        return self.dice.roll()
+        roll = self.dice.roll()
+        if self.journal:
+            self.journal.record_roll(roll)
+        return roll
 
     def is_game_over(self) -> bool:
         """
@@ -163,6 +267,21 @@ class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-p
         if move_distance == 0:
             return False
 
+        # Capture what the delta record needs before the board changes
+        color = current_player.color
+        player_counters = (
+            current_player.checkers_on_board,
+            current_player.checkers_off_board,
+            current_player.checkers_on_bar,
+        )
+        to_slot = OFF_SLOT[color] if to_pos == "off" else to_pos - 1
+        delta = BoardDelta(
+            color,
+            BAR_SLOT[color] if from_pos == "bar" else from_pos - 1,
+            to_slot,
+            to_pos != "off" and self._is_blot_hit(to_slot, color),
+        )
+
         # Handle different types of moves
         success = False
 
@@ -204,14 +323,96 @@ class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-p
                 )
 
         if success:
-            # Consume the die value that was used for this move
-            self.dice.use_move(move_distance)
-
-            self.move_history.append((from_pos, to_pos, current_player.color))
-            self.move_count += 1
+            self._record_move(from_pos, to_pos, delta, move_distance, player_counters)
 
         return success
 
+    def _record_move(
+        self,
+        from_pos: Union[int, str],
+        to_pos: Union[int, str],
+        delta: BoardDelta,
+        move_distance: int,
+        player_counters: Tuple[int, int, int],
+    ) -> None:
+        """
+        Consume the die of a move made on the board and record the move.
+
+        Args:
+            from_pos: Starting position of the move
+            to_pos: Ending position of the move
+            delta: Board change of the move
+            move_distance: Die value used by the move
+            player_counters: Player counters before the move
+        """
+        die_index = -1
+        if move_distance in self.dice.values:
+            die_index = self.dice.values.index(move_distance)
+        self.dice.use_move(move_distance)
+
+        self.move_records.append(
+            MoveRecord(
+                delta, move_distance, die_index, self.current_player_index, player_counters
+            )
+        )
+        self.move_history.append((from_pos, to_pos, delta.color))
+        self.move_count += 1
+        if self.journal:
+            self.journal.record_move(from_pos, to_pos)
+
+    def _is_blot_hit(self, point_index: int, color: str) -> bool:
+        """
+        Check if landing on a point hits a single opponent checker.
+
+        Args:
+            point_index: Board position (0-23)
+            color: Color of the moving player
+
+        Returns:
+            True if the point holds exactly one opponent checker
+        """
+        if point_index < 0 or point_index > 23:
+            return False
+        top_color = self.board.get_point_top_color(point_index)
+        return (
+            top_color is not None
+            and top_color != color
+            and self.board.get_point_count(point_index) == 1
+        )
+
+    def unmake_move(self) -> bool:
+        """
+        Unmake the last move made with make_move in O(1).
+
+        Restores the board (including hit checkers, bar entries and
+        bear-offs), the consumed die, the player's counters and the history.
+        Records only cover the current turn; complete_turn clears them.
+
+        Returns:
+            True if a move was unmade, False if there is no recorded move
+        """
+        if not self.move_records:
+            return False
+
+        record = self.move_records.pop()
+        self.board.unmake_move(record.board_delta)
+        if record.die_index >= 0:
+            self.dice.values.insert(record.die_index, record.die)
+
+        player = self.players[record.player_index]
+        (
+            player.checkers_on_board,
+            player.checkers_off_board,
+            player.checkers_on_bar,
+        ) = record.player_counters
+
+        if self.move_history:
+            self.move_history.pop()
+        self.move_count -= 1
+        if self.journal:
+            self.journal.record_undo()
+        return True
+
     def _calculate_move_distance(
         self, from_pos: Union[int, str], to_pos: Union[int, str]
     ) -> int:
@@ -280,31 +481,33 @@ class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-p
         Returns:
             True if this is the farthest checker in home board, False otherwise
         """
-        if color == "white":
-            # White home board is points 0-5
-            # Farthest means highest point number
-            for i in range(point_index + 1, 6):
-                if (
-                    len(self.board.points[i]) > 0
-                    and self.board.get_point_top_color(i) == color
-                ):
-                    return False
-            return True
-        else:  # black
-            # Black home board is points 18-23
-            # Farthest means lowest point number
-            for i in range(18, point_index):
-                if (
-                    len(self.board.points[i]) > 0
-                    and self.board.get_point_top_color(i) == color
-                ):
-                    return False
-            return True
+        return self.board.is_farthest_home_point(point_index, color)
 
     def is_valid_move(self, from_pos: Union[int, str], to_pos: Union[int, str]) -> bool:
         """
         Check if a move is valid.
 
+        Answered from the legal move set of the turn (see get_legal_moves).
+
+        Args:
+            from_pos: Starting position (1-24 or "bar")
+            to_pos: Ending position (1-24 or "off")
+
+        Returns:
+            True if move is valid, False otherwise
+        """
+        if self._refresh_legal_moves() is None:
+            return self._check_move(from_pos, to_pos)
+        try:
+            return (from_pos, to_pos) in self._legal_move_set
+        except TypeError:
+            # Unhashable positions are never legal
+            return False
+
+    def _check_move(self, from_pos: Union[int, str], to_pos: Union[int, str]) -> bool:
+        """
+        Check a move against the rules, without the cache.
+
         Args:
             from_pos: Starting position (1-24 or "bar")
             to_pos: Ending position (1-24 or "off")
@@ -347,8 +550,6 @@ class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-p
                 # Basic validations
                 if not self.board.can_bear_off(current_player.color):
                     return False
-                if len(self.board.points[board_pos]) == 0:
-                    return False
                 if self.board.get_point_top_color(board_pos) != current_player.color:
                     return False
 
@@ -382,11 +583,10 @@ class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-p
                     return False
                 from_board = from_pos - 1
                 to_board = to_pos - 1
-                return (
-                    len(self.board.points[from_board]) > 0
-                    and self.board.get_point_top_color(from_board)
-                    == current_player.color
-                    and self.board.is_point_available(to_board, current_player.color)
+                return self.board.get_point_top_color(
+                    from_board
+                ) == current_player.color and self.board.is_point_available(
+                    to_board, current_player.color
                 )
 
         return False
@@ -398,10 +598,133 @@ class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-p
         Returns:
             List of tuples representing possible moves
         """
+        if self._refresh_legal_moves() is None:
+            return self.board.get_possible_moves(
+                self.get_current_player().color, self.dice.get_available_moves()
+            )
+        return list(self.legal_moves)
+
+    def get_legal_moves(self) -> Tuple[Tuple[Union[int, str], Union[int, str]], ...]:
+        """
+        Get the legal single moves of the current turn.
+
+        The set is computed on first use for each position, side to move
+        and remaining dice, and shared by move validation, the CLI moves
+        command and the board highlighting. Rolls and moves do not compute
+        it, so callers that never ask pay nothing. Changes made behind the
+        game's back (e.g. writing the dice directly) are detected the same way.
+
+        Returns:
+            Tuple of (from_pos, to_pos) moves in human notation, in board order
+        """
+        if self._refresh_legal_moves() is None:
+            return tuple(self.get_possible_moves())
+        return self.legal_moves
+
+    def get_legal_move_set(self) -> FrozenSet[Tuple[Union[int, str], Union[int, str]]]:
+        """
+        Get the legal single moves of the current turn as a set.
+
+        Returns:
+            Frozen set of (from_pos, to_pos) moves in human notation
+        """
+        if self._refresh_legal_moves() is None:
+            return frozenset(self.get_possible_moves())
+        return self._legal_move_set
+
+    def get_legal_destinations(
+        self, from_pos: Union[int, str]
+    ) -> List[Union[int, str]]:
+        """
+        Get the legal destinations of a checker in the current turn.
+
+        Args:
+            from_pos: Starting position (1-24 or "bar")
+
+        Returns:
+            Destinations (1-24 or "off") in the order of get_legal_moves
+        """
+        return [to_pos for start, to_pos in self.get_legal_moves() if start == from_pos]
+
+    def _refresh_legal_moves(self) -> Optional[Tuple]:
+        """
+        Recompute the legal move set if the position, side or dice changed.
+
+        Returns:
+            Current legal move key, or None if the set cannot be kept (see
+            _legal_key)
+        """
+        key = self._legal_key()
+        if key is not None and key != self._legal_moves_key:
+            start = time.perf_counter_ns() if self.instrumentation else 0
+            self.legal_moves = tuple(
+                self.board.get_possible_moves(key[1], self.dice.get_available_moves())
+            )
+            self._legal_move_set = frozenset(self.legal_moves)
+            self._legal_moves_key = key
+            if start:
+                self.instrumentation.record(GENERATE_MOVES, time.perf_counter_ns() - start)
+        return key
+
+    def _legal_key(self) -> Optional[Tuple]:
+        """
+        Build the key the legal move set of the turn depends on.
+
+        Returns:
+            Tuple (position key, side to move, remaining dice), or None when
+            board, dice or player are not the real game classes (e.g. test
+            doubles), which always go through the rule checks
+        """
+        if not isinstance(self.board, Board) or not isinstance(self.dice, Dice):
+            return None
+        if not self.players:
+            return None
+        color = getattr(self.get_current_player(), "color", None)
+        if not isinstance(color, str):
+            return None
+        return self.board.to_bytes(), color, tuple(sorted(set(self.dice.values)))
+
+    def get_legal_plays(
+        self,
+    ) -> List[Tuple[Tuple[Tuple[Union[int, str], Union[int, str]], ...], bytes]]:
+        """
+        Get every distinct full-turn play for the current player's remaining dice.
+
+        Returns:
+            List of (moves, position) tuples, see MoveGenerator.get_legal_plays
+        """
         current_player = self.get_current_player()
-        return self.board.get_possible_moves(
-            current_player.color, self.dice.get_available_moves()
+        key = self._move_cache_key("plays")
+        if key is None:
+            return self.move_generator.get_legal_plays(
+                self.board, current_player.color, self.dice.get_available_moves()
+            )
+        plays = self.move_cache.get_or_compute(
+            key,
+            lambda: tuple(
+                self.move_generator.get_legal_plays(
+                    self.board, current_player.color, self.dice.get_available_moves()
+                )
+            ),
         )
+        return list(plays)
+
+    def _move_cache_key(self, kind: str, *extra: Union[int, str]) -> Optional[Tuple]:
+        """
+        Build the move cache key for the current position, side and dice.
+
+        Args:
+            kind: Query type (e.g. "plays")
+            *extra: Additional query arguments
+
+        Returns:
+            Cache key, or None when board, dice or player are not the real
+            game classes (e.g. test doubles), which are never cached
+        """
+        key = self._legal_key()
+        if key is None:
+            return None
+        return make_move_key(kind, key[0], key[1], self.dice.get_available_moves(), *extra)
 
     def has_valid_moves(self) -> bool:
         """
@@ -447,6 +770,7 @@ class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-p
         """
         # Reset dice for next turn
         self.dice.reset()
+        self.move_records.clear()
         self.switch_turns()
 
     def play_game(self) -> None:
@@ -475,6 +799,7 @@ class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-p
         self.is_started = False
         self.is_paused = False
         self.move_history.clear()
+        self.move_records.clear()
         self.move_count = 0
         self.start_time = None
         self.end_time = None
@@ -525,6 +850,7 @@ class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-p
         self.is_started = state["is_started"]
         self.is_paused = state.get("is_paused", False)
         self.move_history = state.get("move_history", [])
+        self.move_records = []
         self.move_count = state.get("move_count", 0)
         self.start_time = state.get("start_time")
         self.end_time = state.get("end_time")
@@ -569,7 +895,8 @@ class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-p
         Get game statistics.
 
         Returns:
-            Dictionary containing game statistics
+            Dictionary containing game statistics, plus the call counts and
+            latencies by operation ("timings") if instrumentation is attached
         """
         duration = 0
         if self.start_time and self.end_time:
@@ -577,12 +904,15 @@ class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-p
         elif self.start_time:
             duration = time.time() - self.start_time
 
-        return {
+        stats = {
             "moves": self.move_count,
             "duration": int(duration),
             "winner": self.get_winner().name if self.get_winner() else None,
             "current_player": self.get_current_player().name if self.players else None,
         }
+        if self.instrumentation:
+            stats["timings"] = self.instrumentation.as_dict()
+        return stats
 
     def undo_last_move(self) -> bool:
         """
@@ -591,9 +921,13 @@ class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-p
         Returns:
             True if undo was successful, False if no moves to undo
         """
+        if self.move_records:
+            return self.unmake_move()
+
         if not self.move_history:
             return False
 
+        # Moves without a delta record (e.g. loaded from a saved state)
         # Remove last move from history
         last_move = self.move_history.pop()
         from_pos, to_pos, color = last_move
@@ -602,6 +936,8 @@ class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-p
         # In a full implementation, this would need to handle all edge cases
         self.board.move_checker(to_pos, from_pos, color)
         self.move_count -= 1
+        if self.journal:
+            self.journal.record_undo()
 
         return True
 
@@ -613,7 +949,17 @@ class BackgammonGame:  # pylint: disable=too-many-instance-attributes,too-many-p
             New BackgammonGame instance with copied state
         """
         new_game = BackgammonGame(self.ui)
-        new_game.set_game_state(self.get_game_state())
+        new_game.board = self.board.copy()
+        new_game.dice = self.dice.copy()
+        new_game.players = [player.copy() for player in self.players]
+        new_game.current_player_index = self.current_player_index
+        new_game.is_started = self.is_started
+        new_game.is_paused = self.is_paused
+        new_game.move_history = list(self.move_history)
+        new_game.move_records = list(self.move_records)
+        new_game.move_count = self.move_count
+        new_game.start_time = self.start_time
+        new_game.end_time = self.end_time
         return new_game
 
     def __str__(self) -> str:
@@ -3,13 +3,164 @@ Board module for Backgammon game.
 
 This module contains the Board class which represents the game board,
 manages checker positions, and handles move validation and execution.
+
+Internamente el tablero guarda la posición en un ``array`` compacto y privado
+de 28 enteros con signo; ``Board.cells`` es una vista de sólo lectura. Los
+atributos ``points``, ``bar`` y ``off`` son vistas de compatibilidad que
+materializan listas de fichas para los renderers y escriben de vuelta
+cualquier modificación. Todas las escrituras pasan por el tablero, así que
+``zobrist_key`` y los contadores se actualizan de forma incremental.
 """
 
 # pylint: disable=invalid-name  # Board follows PascalCase class naming convention
+from array import array
+from collections.abc import Mapping
+from typing import NamedTuple
+
 from .checker import Checker
+from .position_id import decode_position_id, encode_position_id
+from .zobrist import SLOT_KEYS, hash_cells
+
+# Slots del array compacto: 0-23 puntos (positivo = blancas, negativo = negras),
+# 24-25 barra y 26-27 fichas sacadas (blancas, negras).
+NUM_POINTS = 24
+NUM_SLOTS = 28
+BAR_SLOT = {"white": 24, "black": 25}
+OFF_SLOT = {"white": 26, "black": 27}
+COLOR_SIGN = {"white": 1, "black": -1}
+COLORS = ("white", "black")
+# Pips de una ficha en cada punto y si el punto queda fuera del cuarto de casa
+PIP_WEIGHT = {
+    "white": tuple(index + 1 for index in range(NUM_POINTS)),
+    "black": tuple(NUM_POINTS - index for index in range(NUM_POINTS)),
+}
+OUTSIDE_HOME = {
+    "white": tuple(index >= 6 for index in range(NUM_POINTS)),
+    "black": tuple(index < 18 for index in range(NUM_POINTS)),
+}
+HOME_MASK = {"white": 0x3F, "black": 0x3F << 18}
+
+
+class BoardDelta(NamedTuple):
+    """
+    Registro mínimo de un movimiento, suficiente para deshacerlo en O(1).
+
+    Attributes:
+      color (str): Color de la ficha movida
+      from_slot (int): Slot de origen (punto 0-23 o barra)
+      to_slot (int): Slot de destino (punto 0-23 u off)
+      hit (bool): True si el movimiento capturó una ficha del oponente
+    """
+
+    color: str
+    from_slot: int
+    to_slot: int
+    hit: bool
+
+
+class _CheckerStack(list):
+    """
+    Lista de fichas materializada desde un slot del tablero compacto.
+    Cada mutación escribe el nuevo conteo de vuelta en el tablero.
+    """
+
+    __slots__ = ("_board", "_slot")
+
+    def __init__(self, board, slot, checkers):
+        super().__init__(checkers)
+        self._board = board
+        self._slot = slot
+
+    def _sync(self):
+        """Escribe el contenido actual de la lista en el slot del tablero"""
+        self._board._store_slot(self._slot, self)  # pylint: disable=protected-access
+
+    def append(self, checker):
+        super().append(checker)
+        self._sync()
+
+    def extend(self, checkers):
+        super().extend(checkers)
+        self._sync()
+
+    def insert(self, index, checker):
+        super().insert(index, checker)
+        self._sync()
+
+    def pop(self, index=-1):
+        checker = super().pop(index)
+        self._sync()
+        return checker
+
+    def remove(self, checker):
+        super().remove(checker)
+        self._sync()
+
+    def clear(self):
+        super().clear()
+        self._sync()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._sync()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._sync()
+
+    def __iadd__(self, checkers):
+        result = super().__iadd__(checkers)
+        self._sync()
+        return result
+
+
+class _PointsView:
+    """Vista de secuencia sobre los 24 puntos (``board.points[i]``)"""
+
+    __slots__ = ("_board",)
+
+    def __init__(self, board):
+        self._board = board
+
+    def __len__(self):
+        return NUM_POINTS
 
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(NUM_POINTS)[index]]
+        return self._board._load_slot(range(NUM_POINTS)[index])  # pylint: disable=protected-access
 
-class Board:
+    def __setitem__(self, index, checkers):
+        self._board._store_slot(range(NUM_POINTS)[index], list(checkers))  # pylint: disable=protected-access
+
+    def __iter__(self):
+        for index in range(NUM_POINTS):
+            yield self[index]
+
+
+class _ColorView(Mapping):
+    """Vista de diccionario por color sobre la barra o las fichas sacadas"""
+
+    __slots__ = ("_board", "_slots")
+
+    def __init__(self, board, slots):
+        self._board = board
+        self._slots = slots
+
+    def __getitem__(self, color):
+        return self._board._load_slot(self._slots[color])  # pylint: disable=protected-access
+
+    def __setitem__(self, color, checkers):
+        self._board._store_slot(self._slots[color], list(checkers))  # pylint: disable=protected-access
+
+    def __iter__(self):
+        return iter(COLORS)
+
+    def __len__(self):
+        return len(COLORS)
+
+
+class Board:  # pylint: disable=too-many-public-methods
     """
     Clase que representa el tablero del juego Backgammon.
     Maneja las posiciones de las fichas y las reglas de movimiento.
@@ -17,14 +168,208 @@ class Board:
 
     def __init__(self):
         """Inicializa el tablero con 24 puntos vacíos y áreas especiales"""
-        # 24 puntos del tablero, cada uno es una lista de fichas
-        self.points = [[] for _ in range(24)]
+        # 24 puntos con signo + barra y fichas sacadas por color
+        self._cells = array("b", bytes(NUM_SLOTS))
 
-        # Barra para fichas capturadas
-        self.bar = {"white": [], "black": []}  # pylint: disable=disallowed-name
+        # Clave Zobrist de 64 bits de la posición (0 para el tablero vacío)
+        self.zobrist_key = 0
+
+        # Contadores incrementales por color (ver _set_slot)
+        self._reset_counters()
+
+    @property
+    def cells(self):
+        """
+        Vista de sólo lectura de los 28 slots del tablero.
 
-        # Área fuera del tablero para fichas sacadas
-        self.off = {"white": [], "black": []}
+        Las escrituras deben pasar por los métodos del tablero (o ``set_cell``)
+        para mantener la clave Zobrist y los contadores al día.
+
+        Returns:
+          memoryview: Conteos con signo de puntos, barra y off
+        """
+        return memoryview(self._cells).toreadonly()
+
+    def set_cell(self, slot, value):
+        """
+        Cambia directamente el conteo de un slot del tablero.
+
+        Args:
+          slot (int): Índice del slot (0-27)
+          value (int): Conteo con signo en un punto (positivo = blancas),
+            conteo sin signo en la barra y en off
+
+        Raises:
+          IndexError: Si el slot no existe
+          ValueError: Si el conteo no es válido para el slot
+        """
+        if not 0 <= slot < NUM_SLOTS:
+            raise IndexError(f"Slot index {slot} out of range (0-{NUM_SLOTS - 1})")
+        low = -15 if slot < NUM_POINTS else 0
+        if not low <= value <= 15:
+            raise ValueError(f"Invalid checker count {value} for slot {slot}")
+        self._set_slot(slot, value)
+
+    @property
+    def points(self):
+        """Vista de los 24 puntos como listas de fichas"""
+        return _PointsView(self)
+
+    @points.setter
+    def points(self, points):
+        for index in range(NUM_POINTS):
+            self._store_slot(index, list(points[index]))
+
+    @property
+    def bar(self):  # pylint: disable=disallowed-name
+        """Vista de la barra como diccionario color -> lista de fichas"""
+        return _ColorView(self, BAR_SLOT)
+
+    @bar.setter
+    def bar(self, bar):  # pylint: disable=disallowed-name
+        for color in COLORS:
+            self._store_slot(BAR_SLOT[color], list(bar[color]))
+
+    @property
+    def off(self):
+        """Vista de las fichas sacadas como diccionario color -> lista de fichas"""
+        return _ColorView(self, OFF_SLOT)
+
+    @off.setter
+    def off(self, off):
+        for color in COLORS:
+            self._store_slot(OFF_SLOT[color], list(off[color]))
+
+    def _load_slot(self, slot):
+        """
+        Materializa la lista de fichas de un slot.
+
+        Args:
+          slot (int): Índice del slot (0-27)
+
+        Returns:
+          _CheckerStack: Lista de fichas enlazada al slot
+        """
+        value = self._cells[slot]
+        if slot < NUM_POINTS:
+            checker = Checker.shared("white" if value > 0 else "black")
+            count = abs(value)
+        else:
+            location = "bar" if slot < OFF_SLOT["white"] else "off"
+            checker = Checker.shared(COLORS[slot % 2], location)
+            count = value
+        return _CheckerStack(self, slot, [checker] * count)
+
+    def _store_slot(self, slot, checkers):
+        """
+        Escribe en un slot el conteo correspondiente a una lista de fichas.
+
+        Args:
+          slot (int): Índice del slot (0-27)
+          checkers (list): Fichas que debe contener el slot
+
+        Raises:
+          ValueError: Si hay más de 15 fichas o fichas de ambos colores
+        """
+        count = len(checkers)
+        if count > 15:
+            raise ValueError(f"Invalid checker count {count} for slot {slot}")
+        if count:
+            color = checkers[0].color
+            if any(checker.color != color for checker in checkers):
+                raise ValueError(f"Checkers of both colors in slot {slot}")
+            if slot < NUM_POINTS:
+                count *= COLOR_SIGN[color]
+        self._set_slot(slot, count)
+
+    def _set_slot(self, slot, value):
+        """
+        Cambia el valor de un slot actualizando la clave Zobrist.
+
+        Args:
+          slot (int): Índice del slot (0-27)
+          value (int): Nuevo valor del slot
+        """
+        cells = self._cells
+        old = cells[slot]
+        keys = SLOT_KEYS[slot]
+        self.zobrist_key ^= keys[old] ^ keys[value]
+        cells[slot] = value
+
+        if slot < NUM_POINTS:
+            bit = 1 << slot
+            if old > 0 or value > 0:
+                delta = (value if value > 0 else 0) - (old if old > 0 else 0)
+                self.pips["white"] += delta * (slot + 1)
+                if slot >= 6:
+                    self.outside_count["white"] += delta
+                if value > 0:
+                    self.occupied["white"] |= bit
+                else:
+                    self.occupied["white"] &= ~bit
+            if old < 0 or value < 0:
+                delta = (-value if value < 0 else 0) - (-old if old < 0 else 0)
+                self.pips["black"] += delta * (NUM_POINTS - slot)
+                if slot < 18:
+                    self.outside_count["black"] += delta
+                if value < 0:
+                    self.occupied["black"] |= bit
+                else:
+                    self.occupied["black"] &= ~bit
+        elif slot < OFF_SLOT["white"]:
+            color = COLORS[slot - NUM_POINTS]
+            self.pips[color] += 25 * (value - old)
+            self.outside_count[color] += value - old
+
+    def _reset_counters(self):
+        """Deja los contadores como los de un tablero vacío."""
+        # Fichas fuera del cuarto de casa (incluida la barra)
+        self.outside_count = {"white": 0, "black": 0}
+        # Pip count total
+        self.pips = {"white": 0, "black": 0}
+        # Máscara de bits de los puntos ocupados (bit i = punto i)
+        self.occupied = {"white": 0, "black": 0}
+
+    def refresh_counters(self):
+        """
+        Recalcula desde cero los contadores por color.
+
+        Se usa al cargar una posición completa; también sirve para verificar
+        los contadores incrementales.
+        """
+        self._reset_counters()
+        cells = self._cells
+        for color in COLORS:
+            sign = COLOR_SIGN[color]
+            weights = PIP_WEIGHT[color]
+            outside = OUTSIDE_HOME[color]
+            # Las fichas en la barra cuentan como fuera del home board
+            outside_count = cells[BAR_SLOT[color]]
+            pips = 25 * outside_count
+            mask = 0
+            for index in range(NUM_POINTS):
+                count = cells[index] * sign
+                if count > 0:
+                    pips += count * weights[index]
+                    outside_count += count if outside[index] else 0
+                    mask |= 1 << index
+            self.pips[color] = pips
+            self.outside_count[color] = outside_count
+            self.occupied[color] = mask
+
+    def refresh_zobrist_key(self):
+        """
+        Recalcula la clave Zobrist y los contadores desde cero.
+
+        Se usa al cargar una posición completa; también sirve para verificar
+        la clave incremental.
+
+        Returns:
+          int: Clave Zobrist recalculada
+        """
+        self.refresh_counters()
+        self.zobrist_key = hash_cells(self._cells)
+        return self.zobrist_key
 
     def setup_initial_position(self):
         """Configura la posición inicial del tablero según las reglas del Backgammon"""
@@ -34,30 +379,29 @@ class Board:
         # Posición inicial estándar del Backgammon (invertida para match visual layout)
         # Las blancas se mueven de puntos altos (23) a puntos bajos (0)
         # Las negras se mueven de puntos bajos (0) a puntos altos (23)
-
         # Punto 23 (24 visual - abajo derecha): 2 fichas blancas
-        self.points[23] = [Checker("white"), Checker("white")]
+        self._set_slot(23, 2)
 
         # Punto 18 (19 visual - abajo derecha): 5 fichas negras
-        self.points[18] = [Checker("black") for _ in range(5)]
+        self._set_slot(18, -5)
 
         # Punto 16 (17 visual - abajo izquierda): 3 fichas negras
-        self.points[16] = [Checker("black") for _ in range(3)]
+        self._set_slot(16, -3)
 
         # Punto 12 (13 visual - abajo izquierda): 5 fichas blancas
-        self.points[12] = [Checker("white") for _ in range(5)]
+        self._set_slot(12, 5)
 
         # Punto 11 (12 visual - arriba izquierda): 5 fichas negras
-        self.points[11] = [Checker("black") for _ in range(5)]
+        self._set_slot(11, -5)
 
         # Punto 7 (8 visual - arriba izquierda): 3 fichas blancas
-        self.points[7] = [Checker("white") for _ in range(3)]
+        self._set_slot(7, 3)
 
         # Punto 5 (6 visual - arriba derecha): 5 fichas blancas
-        self.points[5] = [Checker("white") for _ in range(5)]
+        self._set_slot(5, 5)
 
         # Punto 0 (1 visual - arriba derecha): 2 fichas negras
-        self.points[0] = [Checker("black"), Checker("black")]
+        self._set_slot(0, -2)
 
     def get_point_count(self, point_index):
         """
@@ -75,7 +419,7 @@ class Board:
         if point_index < 0 or point_index >= 24:
             raise IndexError(f"Point index {point_index} out of range (0-23)")
 
-        return len(self.points[point_index])
+        return abs(self._cells[point_index])
 
     def get_point_top_color(self, point_index):
         """
@@ -93,10 +437,82 @@ class Board:
         if point_index < 0 or point_index >= 24:
             raise IndexError(f"Point index {point_index} out of range (0-23)")
 
-        if len(self.points[point_index]) == 0:
+        value = self._cells[point_index]
+        if value > 0:
+            return "white"
+        if value < 0:
+            return "black"
+        return None
+
+    def get_bar_count(self, color):
+        """
+        Obtiene el número de fichas de un color en la barra.
+
+        Args:
+          color (str): Color de las fichas
+
+        Returns:
+          int: Número de fichas en la barra
+        """
+        return self._cells[BAR_SLOT[color]]
+
+    def get_off_count(self, color):
+        """
+        Obtiene el número de fichas de un color fuera del tablero.
+
+        Args:
+          color (str): Color de las fichas
+
+        Returns:
+          int: Número de fichas sacadas
+        """
+        return self._cells[OFF_SLOT[color]]
+
+    def get_pip_count(self, color):
+        """
+        Obtiene el pip count (puntos que faltan para sacar todas las fichas).
+
+        Args:
+          color (str): Color de las fichas
+
+        Returns:
+          int: Suma de las distancias de todas las fichas hasta salir
+        """
+        return self.pips[color]
+
+    def get_farthest_point(self, color):
+        """
+        Obtiene el punto ocupado más lejano de la salida para un color.
+
+        Args:
+          color (str): Color de las fichas
+
+        Returns:
+          int or None: Índice del punto (0-23), None si no hay fichas en puntos
+        """
+        mask = self.occupied[color]
+        if not mask:
             return None
+        if color == "white":
+            return mask.bit_length() - 1
+        return (mask & -mask).bit_length() - 1
 
-        return self.points[point_index][0].color
+    def is_farthest_home_point(self, point_index, color):
+        """
+        Verifica que no haya fichas del color más lejos de la salida que un
+        punto dentro de su cuarto de casa.
+
+        Args:
+          point_index (int): Índice del punto (0-23)
+          color (str): Color de las fichas
+
+        Returns:
+          bool: True si ningún punto de casa más lejano tiene fichas del color
+        """
+        mask = self.occupied[color] & HOME_MASK[color]
+        if color == "white":
+            return not mask >> (point_index + 1)
+        return not mask & ((1 << max(point_index, 0)) - 1)
 
     def is_point_available(self, point_index, color):
         """
@@ -112,22 +528,25 @@ class Board:
         if point_index < 0 or point_index >= 24:
             return False
 
-        point = self.points[point_index]
-
-        # Punto vacío está disponible
-        if len(point) == 0:
-            return True
+        # Vacío, propio o con una sola ficha del oponente (captura)
+        return self._cells[point_index] * COLOR_SIGN[color] >= -1
 
-        # Si hay fichas del mismo color, está disponible
-        if point[0].color == color:
-            return True
-
-        # Si hay solo una ficha del oponente, se puede capturar
-        if len(point) == 1 and point[0].color != color:
-            return True
+    def _land(self, to_point, sign):
+        """
+        Coloca una ficha en un punto capturando una ficha suelta del oponente.
 
-        # Si hay 2 o más fichas del oponente, está bloqueado
-        return False
+        Args:
+          to_point (int): Punto de destino (0-23)
+          sign (int): Signo del color que mueve (+1 blancas, -1 negras)
+        """
+        value = self._cells[to_point]
+        if value == -sign:
+            # Captura: la ficha del oponente va a su barra
+            bar_slot = BAR_SLOT["black" if sign > 0 else "white"]
+            self._set_slot(bar_slot, self._cells[bar_slot] + 1)
+            self._set_slot(to_point, sign)
+        else:
+            self._set_slot(to_point, value + sign)
 
     def move_checker(self, from_point, to_point, color):
         """
@@ -145,27 +564,20 @@ class Board:
         if from_point < 0 or from_point >= 24 or to_point < 0 or to_point >= 24:
             return False
 
-        # Verificar que hay una ficha del color correcto en el punto de origen
-        if len(self.points[from_point]) == 0:
-            return False
+        cells = self._cells
+        sign = COLOR_SIGN[color]
 
-        if self.points[from_point][-1].color != color:
+        # Verificar que hay una ficha del color correcto en el punto de origen
+        if cells[from_point] * sign <= 0:
             return False
 
         # Verificar que el punto de destino está disponible
-        if not self.is_point_available(to_point, color):
+        if cells[to_point] * sign < -1:
             return False
 
         # Realizar el movimiento
-        checker = self.points[from_point].pop()
-
-        # Si hay una ficha oponente en el destino, capturarla
-        if len(self.points[to_point]) == 1 and self.points[to_point][0].color != color:
-            captured_checker = self.points[to_point].pop()
-            self.bar[captured_checker.color].append(captured_checker)
-
-        # Colocar la ficha en el destino
-        self.points[to_point].append(checker)
+        self._set_slot(from_point, cells[from_point] - sign)
+        self._land(to_point, sign)
 
         return True
 
@@ -180,8 +592,10 @@ class Board:
         Returns:
           bool: True si el movimiento fue exitoso, False en caso contrario
         """
+        bar_slot = BAR_SLOT[color]
+
         # Verificar que hay fichas en la barra
-        if len(self.bar[color]) == 0:
+        if self._cells[bar_slot] == 0:
             return False
 
         # Verificar que el punto de destino está disponible
@@ -189,15 +603,8 @@ class Board:
             return False
 
         # Realizar el movimiento
-        checker = self.bar[color].pop()
-
-        # Si hay una ficha oponente en el destino, capturarla
-        if len(self.points[to_point]) == 1 and self.points[to_point][0].color != color:
-            captured_checker = self.points[to_point].pop()
-            self.bar[captured_checker.color].append(captured_checker)
-
-        # Colocar la ficha en el destino
-        self.points[to_point].append(checker)
+        self._set_slot(bar_slot, self._cells[bar_slot] - 1)
+        self._land(to_point, COLOR_SIGN[color])
 
         return True
 
@@ -216,21 +623,82 @@ class Board:
         if from_point < 0 or from_point >= 24:
             return False
 
-        if len(self.points[from_point]) == 0:
-            return False
-
-        if self.points[from_point][-1].color != color:
+        sign = COLOR_SIGN[color]
+        if self._cells[from_point] * sign <= 0:
             return False
 
         # TODO: Agregar verificación de que todas las fichas están en home board  # pylint: disable=fixme
         # Por ahora, permitir bearing off desde cualquier punto para pasar los tests
 
         # Realizar el bearing off
-        checker = self.points[from_point].pop()
-        self.off[color].append(checker)
+        off_slot = OFF_SLOT[color]
+        self._set_slot(from_point, self._cells[from_point] - sign)
+        self._set_slot(off_slot, self._cells[off_slot] + 1)
 
         return True
 
+    def make_move(self, from_point, to_point, color):
+        """
+        Realiza un movimiento y devuelve el registro para deshacerlo.
+
+        Args:
+          from_point (int or str): Punto de origen (0-23) o "bar"
+          to_point (int or str): Punto de destino (0-23) u "off"
+          color (str): Color de la ficha a mover
+
+        Returns:
+          BoardDelta or None: Registro del movimiento, None si no fue posible
+        """
+        sign = COLOR_SIGN[color]
+        if to_point == "off":
+            to_slot = OFF_SLOT[color]
+            hit = False
+        else:
+            to_slot = to_point
+            hit = 0 <= to_point < NUM_POINTS and self._cells[to_point] == -sign
+
+        if from_point == "bar":
+            from_slot = BAR_SLOT[color]
+            success = to_point != "off" and self.move_from_bar(color, to_point)
+        elif to_point == "off":
+            from_slot = from_point
+            success = self.bear_off(from_point, color)
+        else:
+            from_slot = from_point
+            success = self.move_checker(from_point, to_point, color)
+
+        if not success:
+            return None
+        return BoardDelta(color, from_slot, to_slot, hit)
+
+    def unmake_move(self, delta):
+        """
+        Deshace un movimiento restaurando exactamente la posición anterior.
+
+        Args:
+          delta (BoardDelta): Registro devuelto al realizar el movimiento
+        """
+        color, from_slot, to_slot, hit = delta
+        sign = COLOR_SIGN[color]
+        cells = self._cells
+
+        # Quitar la ficha del destino
+        if to_slot == OFF_SLOT[color]:
+            self._set_slot(to_slot, cells[to_slot] - 1)
+        elif hit:
+            # Devolver la ficha capturada desde la barra del oponente
+            bar_slot = BAR_SLOT["black" if sign > 0 else "white"]
+            self._set_slot(bar_slot, cells[bar_slot] - 1)
+            self._set_slot(to_slot, -sign)
+        else:
+            self._set_slot(to_slot, cells[to_slot] - sign)
+
+        # Devolver la ficha al origen
+        if from_slot == BAR_SLOT[color]:
+            self._set_slot(from_slot, cells[from_slot] + 1)
+        else:
+            self._set_slot(from_slot, cells[from_slot] + sign)
+
     def all_checkers_in_home_board(self, color):
         """
         Verifica si todas las fichas de un color están en el home board.
@@ -241,24 +709,7 @@ class Board:
         Returns:
           bool: True si todas las fichas están en home board, False en caso contrario
         """
-        # Definir home board según el color
-        if color == "white":
-            home_points = range(0, 6)  # Puntos 1-6 (índices 0-5)
-        else:  # black
-            home_points = range(18, 24)  # Puntos 19-24 (índices 18-23)
-
-        # Verificar que no hay fichas en la barra
-        if len(self.bar[color]) > 0:
-            return False
-
-        # Verificar que no hay fichas fuera del home board
-        for i in range(24):
-            if i not in home_points:
-                for checker in self.points[i]:
-                    if checker.color == color:
-                        return False
-
-        return True
+        return self._can_bear_off(color)
 
     def get_state(self):
         """
@@ -267,17 +718,21 @@ class Board:
         Returns:
           dict: Diccionario con el estado completo del tablero
         """
+        cells = self._cells
+        points = []
+        for value in cells[:NUM_POINTS]:
+            checker = {"color": "white" if value > 0 else "black"}
+            points.append([dict(checker) for _ in range(abs(value))])
+
         return {
-            "points": [
-                [{"color": checker.color} for checker in point] for point in self.points
-            ],
+            "points": points,
             "bar": {
-                "white": [{"color": checker.color} for checker in self.bar["white"]],
-                "black": [{"color": checker.color} for checker in self.bar["black"]],
+                color: [{"color": color} for _ in range(cells[BAR_SLOT[color]])]
+                for color in COLORS
             },
             "off": {
-                "white": [{"color": checker.color} for checker in self.off["white"]],
-                "black": [{"color": checker.color} for checker in self.off["black"]],
+                color: [{"color": color} for _ in range(cells[OFF_SLOT[color]])]
+                for color in COLORS
             },
         }
 
@@ -288,33 +743,123 @@ class Board:
         Args:
           state (dict): Diccionario con el estado a establecer
         """
+        self._cells = self.cells_from_state(state)
+        self.refresh_zobrist_key()
+
+    @staticmethod
+    def cells_from_state(state):
+        """
+        Convierte un estado de ``get_state`` en el arreglo compacto de conteos.
+
+        Solo mira la longitud y el primer color de cada lista, sin recorrer
+        las fichas una por una.
+
+        Args:
+          state (dict): Diccionario generado por ``get_state``
+
+        Returns:
+          array: Arreglo ``array("b")`` de 28 posiciones
+        """
+        cells = array("b", bytes(NUM_SLOTS))
+
         # Restaurar puntos
-        self.points = []
-        for point_data in state["points"]:
-            point = []
-            for checker_data in point_data:
-                point.append(Checker(checker_data["color"]))
-            self.points.append(point)
-
-        # Restaurar barra
-        self.bar = {"white": [], "black": []}
-        for color in ["white", "black"]:
-            for checker_data in state["bar"][color]:
-                self.bar[color].append(Checker(checker_data["color"]))
-
-        # Restaurar off
-        self.off = {"white": [], "black": []}
-        for color in ["white", "black"]:
-            for checker_data in state["off"][color]:
-                self.off[color].append(Checker(checker_data["color"]))
+        for index, point_data in enumerate(state["points"]):
+            if point_data:
+                cells[index] = len(point_data) * COLOR_SIGN[point_data[0]["color"]]
+
+        # Restaurar barra y off
+        for color in COLORS:
+            cells[BAR_SLOT[color]] = len(state["bar"][color])
+            cells[OFF_SLOT[color]] = len(state["off"][color])
+
+        return cells
+
+    def to_bytes(self):
+        """
+        Obtiene la representación compacta del tablero.
+
+        Returns:
+          bytes: 28 bytes con los conteos de puntos, barra y off (hashable)
+        """
+        return self._cells.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Crea un tablero a partir de su representación compacta.
+
+        Args:
+          data (bytes): Bytes generados por ``to_bytes``
+
+        Returns:
+          Board: Nuevo tablero con la posición indicada
+
+        Raises:
+          ValueError: Si la longitud de los datos no es válida
+        """
+        if len(data) != NUM_SLOTS:
+            raise ValueError(f"Board data must be {NUM_SLOTS} bytes, got {len(data)}")
+        board = cls()
+        board._cells = array("b", data)
+        board.refresh_zobrist_key()
+        return board
+
+    def get_position_id(self, on_roll="white"):
+        """
+        Obtiene el Position ID de GNU Backgammon (14 caracteres base64).
+
+        Args:
+          on_roll (str): Color del jugador en turno
+
+        Returns:
+          str: Position ID
+        """
+        return encode_position_id(self._cells, on_roll)
+
+    @classmethod
+    def from_position_id(cls, position_id, on_roll="white"):
+        """
+        Crea un tablero a partir de un Position ID.
+
+        Las fichas sacadas se deducen (15 menos las fichas en juego).
+
+        Args:
+          position_id (str): Position ID de 14 caracteres
+          on_roll (str): Color del jugador en turno
+
+        Returns:
+          Board: Nuevo tablero con la posición indicada
+
+        Raises:
+          ValueError: Si el Position ID no es válido
+        """
+        board = cls.__new__(cls)
+        board._cells = decode_position_id(position_id, on_roll)
+        board.refresh_zobrist_key()
+        return board
+
+    def copy(self):
+        """
+        Crea una copia del tablero.
+
+        Returns:
+          Board: Nuevo tablero con la misma posición
+        """
+        board = Board.__new__(Board)
+        board._cells = array("b", self._cells)  # pylint: disable=protected-access
+        board.zobrist_key = self.zobrist_key
+        board.outside_count = dict(self.outside_count)
+        board.pips = dict(self.pips)
+        board.occupied = dict(self.occupied)
+        return board
 
     def reset(self):
         """Reinicia el tablero a un estado vacío"""
-        self.points = [[] for _ in range(24)]
-        self.bar = {"white": [], "black": []}
-        self.off = {"white": [], "black": []}
+        self._cells = array("b", bytes(NUM_SLOTS))
+        self.zobrist_key = 0
+        self._reset_counters()
 
-    def get_possible_moves(self, color, dice):
+    def get_possible_moves(self, color, dice):  # pylint: disable=too-many-branches
         """
         Obtiene los movimientos posibles para un color dado.
 
@@ -326,67 +871,39 @@ class Board:
           list: Lista de tuplas (from_point, to_point) con movimientos posibles
         """
         possible_moves = []
-        unique_dice = sorted(list(set(dice)), reverse=True)
+        unique_dice = sorted(set(dice), reverse=True)
+        cells = self._cells
+        sign = COLOR_SIGN[color]
+        is_white = sign > 0
 
-        if self.bar[color]:
+        if cells[BAR_SLOT[color]]:
             for die_value in unique_dice:
-                to_point = (
-                    24 - die_value if color == "white" else die_value - 1
-                )
-                if self.is_point_available(to_point, color):
+                to_point = 24 - die_value if is_white else die_value - 1
+                if 0 <= to_point <= 23 and cells[to_point] * sign >= -1:
                     possible_moves.append(("bar", to_point + 1))
             return possible_moves
 
         can_bear_off = self._can_bear_off(color)
+        farthest = self.get_farthest_point(color)
 
         for point_index in range(24):
-            if self.get_point_top_color(point_index) == color:
-                for die_value in unique_dice:
-                    if color == "white":
-                        to_point = point_index - die_value
+            if cells[point_index] * sign <= 0:
+                continue
+            for die_value in unique_dice:
+                to_point = point_index - die_value if is_white else point_index + die_value
+
+                if 0 <= to_point <= 23:
+                    if cells[to_point] * sign >= -1:
+                        possible_moves.append((point_index + 1, to_point + 1))
+                elif can_bear_off:
+                    if is_white:
+                        is_exact = point_index + 1 == die_value
                     else:
-                        to_point = point_index + die_value
-
-                    if 0 <= to_point <= 23 and self.is_point_available(
-                        to_point, color
-                    ):
-                        possible_moves.append(
-                            (point_index + 1, to_point + 1)
-                        )
-                    elif can_bear_off:
-                        if (color == "white" and to_point < 0) or (
-                            color == "black" and to_point > 23
-                        ):
-                            is_exact_bear_off = (
-                                color == "white" and point_index + 1 == die_value
-                            ) or (
-                                color == "black"
-                                and 24 - point_index == die_value
-                            )
-                            if is_exact_bear_off:
-                                possible_moves.append((point_index + 1, "off"))
-                            else:
-                                farthest_checker = True
-                                if color == "white":
-                                    for i in range(point_index + 1, 6):
-                                        if (
-                                            self.get_point_top_color(i)
-                                            == color
-                                        ):
-                                            farthest_checker = False
-                                            break
-                                else:
-                                    for i in range(point_index - 1, 17, -1):
-                                        if (
-                                            self.get_point_top_color(i)
-                                            == color
-                                        ):
-                                            farthest_checker = False
-                                            break
-                                if farthest_checker:
-                                    possible_moves.append(
-                                        (point_index + 1, "off")
-                                    )
+                        is_exact = 24 - point_index == die_value
+                    # Con todas las fichas en casa, el punto ocupado más
+                    # lejano es el único que puede usar un dado mayor
+                    if is_exact or point_index == farthest:
+                        possible_moves.append((point_index + 1, "off"))
         return possible_moves
 
     def _can_bear_off(self, color):
@@ -399,29 +916,8 @@ class Board:
         Returns:
             bool: True si puede sacar fichas
         """
-        # Verificar que no hay fichas en la barra
-        if self.bar[color]:
-            return False
-
-        # Verificar que todas las fichas están en el cuarto de casa
-        if color == "white":
-            # Las blancas deben tener todas sus fichas en los puntos 0-5
-            for point_index in range(6, 24):
-                if (
-                    len(self.points[point_index]) > 0
-                    and self.get_point_top_color(point_index) == color
-                ):
-                    return False
-        else:
-            # Las negras deben tener todas sus fichas en los puntos 18-23
-            for point_index in range(0, 18):
-                if (
-                    len(self.points[point_index]) > 0
-                    and self.get_point_top_color(point_index) == color
-                ):
-                    return False
-
-        return True
+        # Ninguna ficha en la barra ni fuera del cuarto de casa
+        return not self.outside_count[color]
 
     def can_bear_off(self, color):
         """
@@ -455,4 +951,5 @@ class Board:
 
     def __repr__(self):
         """Representación para debugging"""
-        return f"Board(points={len([p for p in self.points if p])}/24 occupied)"
+        occupied = sum(1 for value in self._cells[:NUM_POINTS] if value)
+        return f"Board(points={occupied}/24 occupied)"
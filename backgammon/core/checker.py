@@ -14,8 +14,11 @@ class Checker:
     Maneja el color, posición y operaciones relacionadas con las fichas.
     """
 
+    __slots__ = ("color", "position")
+
     VALID_COLORS = ["white", "black"]
     VALID_POSITIONS = list(range(1, 25)) + ["bar", "off"]
+    SHARED_POSITIONS = (None, "bar", "off")
 
     def __init__(self, color=None):
         """
@@ -168,6 +171,32 @@ class Checker:
         copied_checker.position = self.position
         return copied_checker
 
+    @staticmethod
+    def shared(color, position=None):
+        """
+        Obtiene la ficha compartida (flyweight) de un color y ubicación.
+
+        Las vistas del tablero devuelven siempre estas instancias en lugar de
+        crear una ficha nueva por cada casilla ocupada. Son inmutables; para
+        obtener una ficha modificable se usa copy().
+
+        Args:
+          color (str): Color de la ficha ("white" o "black")
+          position (str, optional): None para un punto, "bar" u "off"
+
+        Returns:
+          Checker: Instancia compartida
+
+        Raises:
+          ValueError: Si el color o la ubicación no son válidos
+        """
+        try:
+            return _SHARED[(color, position)]
+        except KeyError:
+            raise ValueError(
+                f"No shared checker for color {color!r} at {position!r}"
+            ) from None
+
     @staticmethod
     def get_home_board_positions(color):
         """
@@ -217,3 +246,45 @@ class Checker:
     def __repr__(self):
         """Representación para debugging"""
         return f"Checker(color='{self.color}', position={self.position})"
+
+
+class _SharedChecker(Checker):
+    """
+    Ficha compartida e inmutable devuelta por Checker.shared().
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def create(cls, color, position):
+        """
+        Crea una ficha compartida sin pasar por __setattr__.
+
+        Args:
+          color (str): Color de la ficha
+          position (str): None, "bar" u "off"
+
+        Returns:
+          _SharedChecker: Ficha compartida nueva
+        """
+        checker = object.__new__(cls)
+        object.__setattr__(checker, "color", color)
+        object.__setattr__(checker, "position", position)
+        return checker
+
+    def __setattr__(self, name, value):
+        """Impide modificar una ficha compartida"""
+        raise AttributeError(
+            "Shared checkers are immutable; use copy() to get a mutable one"
+        )
+
+    def __reduce__(self):
+        """Al copiar o serializar se conserva la instancia compartida"""
+        return (Checker.shared, (self.color, self.position))
+
+
+_SHARED = {
+    (color, position): _SharedChecker.create(color, position)
+    for color in Checker.VALID_COLORS
+    for position in Checker.SHARED_POSITIONS
+}
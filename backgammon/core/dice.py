@@ -15,8 +15,15 @@ class Dice:
     Maneja la tirada de dados, detección de dobles y gestión de movimientos disponibles.
     """
 
-    def __init__(self):
-        """Inicializa los dados con estado vacío"""
+    def __init__(self, rng=None):
+        """
+        Inicializa los dados con estado vacío.
+
+        Args:
+          rng (random.Random, optional): Generador propio para tiradas
+            reproducibles; por defecto usa el módulo ``random``
+        """
+        self.rng = rng if rng is not None else random
         self.last_roll = None
         self.values = []
 
@@ -27,7 +34,7 @@ class Dice:
         Returns:
           int: Valor entre 1 y 6
         """
-        return random.randint(1, 6)
+        return self.rng.randint(1, 6)
 
     def roll(self):
         """
@@ -125,6 +132,18 @@ class Dice:
         self.last_roll = None
         self.values = []
 
+    def copy(self):
+        """
+        Crea una copia de los dados.
+
+        Returns:
+          Dice: Nueva instancia con el mismo estado
+        """
+        copied_dice = Dice(self.rng)
+        copied_dice.last_roll = None if self.last_roll is None else list(self.last_roll)
+        copied_dice.values = self.values.copy()
+        return copied_dice
+
     def get_state(self):
         """
         Obtiene el estado actual de los dados.
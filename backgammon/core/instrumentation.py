@@ -0,0 +1,259 @@
+"""
+Instrumentation module for Backgammon game.
+
+This module contains an opt-in layer that counts calls and records latency
+histograms for the hot paths of a BackgammonGame (moves, move validation,
+move generation, dice rolls and turn completion), so the time spent per
+turn can be inspected without an external profiler.
+
+Attaching an Instrumentation wraps the instrumented methods of that one game
+instance and sets its instrumentation attribute; the class and every other
+game are untouched, so a game without instrumentation pays nothing.
+Latencies go into power-of-two nanosecond buckets: bucket b holds the calls
+that took [2**(b-1), 2**b) ns.
+"""
+
+import functools
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Public BackgammonGame methods wrapped by Instrumentation.attach
+INSTRUMENTED_METHODS = (
+    "make_move",
+    "unmake_move",
+    "is_valid_move",
+    "get_possible_moves",
+    "get_legal_plays",
+    "roll_dice",
+    "complete_turn",
+)
+# Legal move generation of the turn (Board.get_possible_moves when the game
+# computes its legal move set), timed by BackgammonGame itself
+GENERATE_MOVES = "generate_moves"
+NUM_BUCKETS = 64
+
+
+class LatencyHistogram:
+    """
+    Call count and latency distribution of one operation.
+
+    Attributes:
+        calls: Number of recorded calls
+        total_ns: Sum of the latencies in nanoseconds
+        min_ns: Fastest call (0 if there are no calls)
+        max_ns: Slowest call
+        buckets: Calls per power-of-two nanosecond bucket
+    """
+
+    __slots__ = ("calls", "total_ns", "min_ns", "max_ns", "buckets")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.calls = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.buckets: List[int] = [0] * NUM_BUCKETS
+
+    def record(self, elapsed_ns: int) -> None:
+        """
+        Record one call.
+
+        Args:
+            elapsed_ns: Latency of the call in nanoseconds
+        """
+        if not self.calls or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        self.max_ns = max(self.max_ns, elapsed_ns)
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        self.buckets[min(elapsed_ns.bit_length(), NUM_BUCKETS - 1)] += 1
+
+    def percentile(self, fraction: float) -> int:
+        """
+        Estimate a latency percentile from the buckets.
+
+        Args:
+            fraction: Percentile as a fraction (0.5 = median)
+
+        Returns:
+            Upper bound in nanoseconds of the bucket holding the percentile,
+            capped at the slowest call (0 if there are no calls)
+        """
+        if not self.calls:
+            return 0
+        target = fraction * self.calls
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= target:
+                return min(2**bucket, self.max_ns)
+        return self.max_ns
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Summarize the histogram.
+
+        Returns:
+            Dictionary with calls, total_ms, mean_us, min_us, p50_us, p90_us,
+            p99_us, max_us and the non-empty buckets ({upper bound ns: calls})
+        """
+        mean_ns = self.total_ns / self.calls if self.calls else 0
+        return {
+            "calls": self.calls,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": mean_ns / 1e3,
+            "min_us": self.min_ns / 1e3,
+            "p50_us": self.percentile(0.5) / 1e3,
+            "p90_us": self.percentile(0.9) / 1e3,
+            "p99_us": self.percentile(0.99) / 1e3,
+            "max_us": self.max_ns / 1e3,
+            "buckets": {
+                2**bucket: count for bucket, count in enumerate(self.buckets) if count
+            },
+        }
+
+
+class Instrumentation:
+    """
+    Call counters and latency histograms of one or more games.
+
+    Attributes:
+        histograms: LatencyHistogram by operation name
+    """
+
+    def __init__(self) -> None:
+        """Initialize instrumentation with no recorded calls."""
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+    def get_histogram(self, name: str) -> LatencyHistogram:
+        """
+        Get the histogram of an operation, creating it if needed.
+
+        Args:
+            name: Operation name
+
+        Returns:
+            LatencyHistogram of the operation
+        """
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram()
+        return histogram
+
+    def record(self, name: str, elapsed_ns: int) -> None:
+        """
+        Record one call of an operation.
+
+        Args:
+            name: Operation name
+            elapsed_ns: Latency of the call in nanoseconds
+        """
+        self.get_histogram(name).record(elapsed_ns)
+
+    def wrap(self, name: str, function: Callable) -> Callable:
+        """
+        Wrap a callable so every call is recorded under a name.
+
+        Args:
+            name: Operation name
+            function: Callable to time
+
+        Returns:
+            Wrapper with the same signature and return value
+        """
+        histogram = self.get_histogram(name)
+        clock = time.perf_counter_ns
+
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                histogram.record(clock() - start)
+
+        return timed
+
+    def attach(self, game) -> "Instrumentation":
+        """
+        Start counting calls and timing the hot paths of one game instance.
+
+        Wraps the INSTRUMENTED_METHODS of the game, and the game records
+        every legal move set it computes (GENERATE_MOVES). Calls
+        made by the game to its own instrumented methods (e.g. make_move
+        validating with is_valid_move) are recorded too. Only this game is
+        affected; copies are not instrumented. Instrumentation already
+        attached to the game is detached first.
+
+        Args:
+            game: BackgammonGame to instrument
+
+        Returns:
+            This Instrumentation
+        """
+        self.detach(game)
+        game.instrumentation = self
+        for name in INSTRUMENTED_METHODS:
+            setattr(game, name, self.wrap(name, getattr(game, name)))
+        return self
+
+    @staticmethod
+    def detach(game) -> Optional["Instrumentation"]:
+        """
+        Stop instrumenting a game and restore its plain methods.
+
+        Args:
+            game: BackgammonGame instrumented with attach
+
+        Returns:
+            The Instrumentation that was attached (with its records), or None
+        """
+        for name in INSTRUMENTED_METHODS:
+            game.__dict__.pop(name, None)
+        instrumentation, game.instrumentation = game.instrumentation, None
+        return instrumentation
+
+    def reset(self) -> None:
+        """Forget every recorded call."""
+        self.histograms.clear()
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize every operation that has been called.
+
+        Returns:
+            Dictionary of LatencyHistogram.as_dict() by operation name
+        """
+        return {
+            name: histogram.as_dict()
+            for name, histogram in sorted(self.histograms.items())
+            if histogram.calls
+        }
+
+    def format_text(self, title: Optional[str] = None) -> str:
+        """
+        Format the recorded calls as a table.
+
+        Args:
+            title: Optional first line
+
+        Returns:
+            Multi-line table with one row per operation, slowest total first
+        """
+        lines = [title] if title else []
+        lines.append(
+            f"{'Operation':<20} {'Calls':>9} {'Total ms':>10} {'Mean us':>9} "
+            f"{'p50 us':>9} {'p99 us':>9} {'Max us':>9}"
+        )
+        stats = sorted(self.as_dict().items(), key=lambda item: -item[1]["total_ms"])
+        for name, summary in stats:
+            lines.append(
+                f"{name:<20} {summary['calls']:>9} {summary['total_ms']:>10.2f} "
+                f"{summary['mean_us']:>9.2f} {summary['p50_us']:>9.2f} "
+                f"{summary['p99_us']:>9.2f} {summary['max_us']:>9.2f}"
+            )
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format_text()
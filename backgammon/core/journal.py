@@ -0,0 +1,437 @@
+"""
+Move journal module for Backgammon game.
+
+This module contains an append-only write-ahead journal for live games.
+Every successful move, dice roll, turn switch and undo of a game with an
+attached journal is appended as one fixed-size record, so a crashed game
+can be rebuilt from the last snapshot plus the records written after it,
+without saving the full state after every move.
+
+Journal file: an 8-byte header (<4sHH: magic b"BGJL", version, reserved)
+followed by 16-byte records:
+
+    <IB7sI  sequence number, record kind, payload, CRC32 of the first 12 bytes
+
+Payloads (unused bytes are zero):
+    ROLL    die 1, die 2
+    MOVE    from and to position codes (as in backgammon.core.serialization)
+    SWITCH  dice state after the switch: last roll (2 bytes, 0 if none),
+            number of remaining dice values, up to 4 values
+    UNDO    (empty)
+
+Snapshot file: the sequence number of the last journaled record (<Q)
+followed by a backgammon.core.serialization record. It is written to a
+temporary file and renamed into place, so it is always complete.
+"""
+
+import os
+import struct
+import zlib
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from .backgammon_game import BackgammonGame
+from .serialization import (
+    decode_move_position,
+    deserialize_game,
+    encode_move_position,
+    serialize_game,
+)
+
+MAGIC = b"BGJL"
+VERSION = 1
+FILE_HEADER = struct.Struct("<4sHH")
+RECORD = struct.Struct("<IB7sI")
+SNAPSHOT_HEADER = struct.Struct("<Q")
+
+ROLL = 1
+MOVE = 2
+SWITCH = 3
+UNDO = 4
+RECORD_KINDS = {ROLL: "roll", MOVE: "move", SWITCH: "switch", UNDO: "undo"}
+
+SYNC_ALWAYS = "always"
+SYNC_BATCH = "batch"
+SYNC_NONE = "none"
+SYNC_POLICIES = (SYNC_ALWAYS, SYNC_BATCH, SYNC_NONE)
+
+
+class JournalRecord(NamedTuple):
+    """
+    One decoded journal record.
+
+    Attributes:
+        seq: Sequence number (1, 2, ... for the life of the journal)
+        kind: ROLL, MOVE, SWITCH or UNDO
+        payload: Seven payload bytes
+    """
+
+    seq: int
+    kind: int
+    payload: bytes
+
+
+def _pack_record(seq: int, kind: int, payload: bytes) -> bytes:
+    """Pack a record and its CRC32."""
+    head = RECORD.pack(seq, kind, payload, 0)[:-4]
+    return head + struct.pack("<I", zlib.crc32(head))
+
+
+def _scan(data: bytes) -> Tuple[List[JournalRecord], int]:
+    """
+    Decode the valid prefix of a journal file.
+
+    Reading stops at the first torn, corrupted or out-of-sequence record,
+    which is how a crash in the middle of a write shows up.
+
+    Args:
+        data: Whole journal file
+
+    Returns:
+        Tuple (records, size of the valid prefix in bytes)
+
+    Raises:
+        ValueError: If the file header is not a journal header
+    """
+    if len(data) < FILE_HEADER.size:
+        return [], 0
+    magic, version, _ = FILE_HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"Not a move journal (magic {magic!r})")
+    if version != VERSION:
+        raise ValueError(f"Unsupported move journal version {version}")
+
+    records: List[JournalRecord] = []
+    offset = FILE_HEADER.size
+    while offset + RECORD.size <= len(data):
+        seq, kind, payload, crc = RECORD.unpack_from(data, offset)
+        if zlib.crc32(data[offset : offset + RECORD.size - 4]) != crc:
+            break
+        if kind not in RECORD_KINDS or (records and seq != records[-1].seq + 1):
+            break
+        records.append(JournalRecord(seq, kind, payload))
+        offset += RECORD.size
+    return records, offset
+
+
+def read_journal(path: str) -> List[JournalRecord]:
+    """
+    Read the valid records of a journal file.
+
+    Args:
+        path: Journal file path
+
+    Returns:
+        Records in order (empty if the file does not exist)
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, "rb") as stream:
+        return _scan(stream.read())[0]
+
+
+def read_snapshot(path: str) -> Optional[Tuple[int, bytes]]:
+    """
+    Read a snapshot file.
+
+    Args:
+        path: Snapshot file path
+
+    Returns:
+        Tuple (sequence number, serialized game), or None if there is none
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as stream:
+        data = stream.read()
+    if len(data) < SNAPSHOT_HEADER.size:
+        raise ValueError(f"Truncated journal snapshot {path}")
+    (seq,) = SNAPSHOT_HEADER.unpack_from(data)
+    return seq, data[SNAPSHOT_HEADER.size :]
+
+
+class MoveJournal:  # pylint: disable=too-many-instance-attributes
+    """
+    Append-only journal of the moves, rolls, turn switches and undos of a game.
+
+    Records are buffered and written in batches. The sync policy decides
+    when the operating system is asked to put them on disk:
+    - "always": write and fsync after every record
+    - "batch": write and fsync every batch_size records (and on flush())
+    - "none": write every batch_size records, never fsync
+
+    Attributes:
+        path: Journal file path
+        snapshot_path: Snapshot file path
+        sync: Sync policy
+        batch_size: Records per batch
+        seq: Sequence number of the last appended record
+        records_written: Records appended since the journal was opened
+        syncs: Number of fsync calls made
+    """
+
+    def __init__(
+        self,
+        path: str,
+        snapshot_path: Optional[str] = None,
+        sync: str = SYNC_BATCH,
+        batch_size: int = 32,
+    ) -> None:
+        """
+        Open (or create) a journal.
+
+        An existing journal is scanned to continue its sequence; a torn
+        record left at the end by a crash is cut off.
+
+        Args:
+            path: Journal file path
+            snapshot_path: Snapshot file path (path + ".snapshot" if omitted)
+            sync: Sync policy ("always", "batch" or "none")
+            batch_size: Records per batch
+
+        Raises:
+            ValueError: If the sync policy or batch size is invalid, or the
+                file is not a journal
+        """
+        if sync not in SYNC_POLICIES:
+            raise ValueError(
+                f"Invalid sync policy {sync!r}, use one of {SYNC_POLICIES}"
+            )
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        self.path = path
+        self.snapshot_path = snapshot_path or path + ".snapshot"
+        self.sync = sync
+        self.batch_size = batch_size
+        self.records_written = 0
+        self.syncs = 0
+        self._pending: List[bytes] = []
+
+        self._file = open(path, "a+b")  # pylint: disable=consider-using-with
+        self._file.seek(0)
+        records, valid_size = _scan(self._file.read())
+        snapshot = read_snapshot(self.snapshot_path)
+        self.seq = max(
+            records[-1].seq if records else 0, snapshot[0] if snapshot else 0
+        )
+        self._file.truncate(valid_size)
+        if not valid_size:
+            self._file.write(FILE_HEADER.pack(MAGIC, VERSION, 0))
+            self._file.flush()
+
+    def _append(self, kind: int, payload: bytes = b"") -> None:
+        """Buffer one record and write the batch if it is full."""
+        self.seq += 1
+        self._pending.append(_pack_record(self.seq, kind, payload))
+        self.records_written += 1
+        if self.sync == SYNC_ALWAYS or len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def record_roll(self, roll: List[int]) -> None:
+        """
+        Append a dice roll.
+
+        Args:
+            roll: Rolled values [die1, die2]
+        """
+        self._append(ROLL, bytes(roll[:2]))
+
+    def record_move(self, from_pos: Union[int, str], to_pos: Union[int, str]) -> None:
+        """
+        Append a successful move.
+
+        Args:
+            from_pos: Starting position (1-24 or "bar")
+            to_pos: Ending position (1-24 or "off")
+        """
+        codes = (encode_move_position(from_pos), encode_move_position(to_pos))
+        self._append(MOVE, bytes(codes))
+
+    def record_switch(self, last_roll: Optional[List[int]], values: List[int]) -> None:
+        """
+        Append a turn switch with the dice state left after it.
+
+        Args:
+            last_roll: Last roll, or None
+            values: Remaining dice values
+        """
+        roll = last_roll or (0, 0)
+        self._append(SWITCH, bytes((roll[0], roll[1], len(values), *values[:4])))
+
+    def record_undo(self) -> None:
+        """Append an undone move."""
+        self._append(UNDO)
+
+    def flush(self, fsync: Optional[bool] = None) -> None:
+        """
+        Write the buffered records.
+
+        Args:
+            fsync: Force (True) or skip (False) the fsync; by default the
+                sync policy decides
+        """
+        if self._pending:
+            self._file.write(b"".join(self._pending))
+            self._pending.clear()
+        self._file.flush()
+        if fsync is None:
+            fsync = self.sync != SYNC_NONE
+        if fsync:
+            os.fsync(self._file.fileno())
+            self.syncs += 1
+
+    def attach(self, game: BackgammonGame) -> None:
+        """
+        Start journaling a game.
+
+        From then on every successful move, dice roll, turn switch and undo
+        of the game is appended. A checkpoint of the current state is saved
+        first, so the journal starts from it. Call checkpoint(game) again
+        after replacing the state with set_game_state() or a loaded record.
+
+        Args:
+            game: Game to journal
+        """
+        self.checkpoint(game)
+        game.journal = self
+
+    @staticmethod
+    def detach(game: BackgammonGame) -> Optional["MoveJournal"]:
+        """
+        Stop journaling a game.
+
+        Args:
+            game: Game journaled with attach
+
+        Returns:
+            The journal that was attached (flushed), or None
+        """
+        journal, game.journal = game.journal, None
+        if journal:
+            journal.flush()
+        return journal
+
+    def checkpoint(self, game: BackgammonGame) -> None:
+        """
+        Save a full snapshot of the game and start an empty journal tail.
+
+        The snapshot is written to a temporary file, synced and renamed over
+        the previous one. Records up to the snapshot's sequence number are
+        ignored by recovery, so a crash before the journal is truncated is
+        harmless.
+
+        Args:
+            game: Game whose state is saved
+        """
+        self.flush()
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, "wb") as stream:
+            stream.write(SNAPSHOT_HEADER.pack(self.seq))
+            stream.write(serialize_game(game))
+            stream.flush()
+            if self.sync != SYNC_NONE:
+                os.fsync(stream.fileno())
+                self.syncs += 1
+        os.replace(temp_path, self.snapshot_path)
+        self._file.truncate(FILE_HEADER.size)
+        self.flush()
+
+    def close(self) -> None:
+        """Write the buffered records and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "MoveJournal":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Context manager exit: close the journal."""
+        self.close()
+
+
+def _replay(game: BackgammonGame, record: JournalRecord) -> None:
+    """
+    Apply one journal record to a game.
+
+    Raises:
+        ValueError: If the record does not fit the game state
+    """
+    payload = record.payload
+    if record.kind == ROLL:
+        game.dice.last_roll = [payload[0], payload[1]]
+        game.dice.values = game.dice.get_moves(game.dice.last_roll)
+    elif record.kind == MOVE:
+        from_pos = decode_move_position(payload[0])
+        to_pos = decode_move_position(payload[1])
+        if not game.make_move(from_pos, to_pos):
+            raise ValueError(
+                f"Journal record {record.seq} replays an invalid move "
+                f"{from_pos}->{to_pos}"
+            )
+    elif record.kind == SWITCH:
+        game.move_records.clear()
+        game.switch_turns()
+        game.dice.last_roll = [payload[0], payload[1]] if payload[0] else None
+        game.dice.values = list(payload[3 : 3 + payload[2]])
+    elif record.kind == UNDO:
+        if not game.undo_last_move():
+            raise ValueError(
+                f"Journal record {record.seq} undoes a move that is not there"
+            )
+
+
+def iter_replay(
+    game: BackgammonGame, records: List[JournalRecord]
+) -> Iterator[JournalRecord]:
+    """
+    Apply records to a game one by one, yielding each after it is applied.
+
+    Args:
+        game: Game to update (must not have a journal attached)
+        records: Records to apply
+
+    Yields:
+        Each applied record
+    """
+    for record in records:
+        _replay(game, record)
+        yield record
+
+
+def recover_game(
+    path: str, snapshot_path: Optional[str] = None, game: Optional[BackgammonGame] = None
+) -> BackgammonGame:
+    """
+    Rebuild a game from its last snapshot plus the journal tail.
+
+    Without a snapshot the journal is replayed on a freshly started game.
+    The returned game has no journal attached; attach a reopened
+    MoveJournal to keep journaling it.
+
+    Args:
+        path: Journal file path
+        snapshot_path: Snapshot file path (path + ".snapshot" if omitted)
+        game: Game to load into (a new BackgammonGame if omitted)
+
+    Returns:
+        Recovered game
+
+    Raises:
+        ValueError: If the snapshot or a journal record is invalid
+    """
+    game = game or BackgammonGame()
+    game.journal = None
+    snapshot = read_snapshot(snapshot_path or path + ".snapshot")
+    base_seq = 0
+    if snapshot:
+        base_seq, data = snapshot
+        deserialize_game(data).apply_to(game)
+    else:
+        game.setup_board()
+        game.setup_players()
+        game.is_started = True
+    tail = [record for record in read_journal(path) if record.seq > base_seq]
+    for _ in iter_replay(game, tail):
+        pass
+    return game
@@ -0,0 +1,157 @@
+"""
+Move cache module for Backgammon game.
+
+This module contains a bounded LRU cache for legal-move results. Entries are
+keyed by the compact position key (Board.to_bytes()), the side to move and
+the remaining dice, so any path that revisits a position (UI clicks, the CLI
+loop, search) gets the result without recomputing it.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+# Entries kept by one BackgammonGame: a game only revisits the positions of
+# its recent turns (undo, UI clicks), and a cached play list can run to
+# several kilobytes, so the per-game cache stays small
+GAME_CACHE_SIZE = 256
+
+
+def make_move_key(
+    kind: str, position: bytes, color: str, dice: Iterable[int], *extra: Hashable
+) -> Tuple:
+    """
+    Build a cache key for a legal-move query.
+
+    Args:
+        kind: Query type, e.g. "moves", "plays" or "valid"
+        position: Board.to_bytes() key
+        color: Color of the side to move
+        dice: Remaining dice values (order does not matter)
+        *extra: Additional query arguments (e.g. from and to positions)
+
+    Returns:
+        Hashable key
+    """
+    return (kind, position, color, tuple(sorted(dice))) + extra
+
+
+class MoveCache:
+    """
+    Bounded LRU cache with hit, miss and eviction counters.
+
+    Attributes:
+        maxsize: Maximum number of entries
+        hits: Number of lookups answered from the cache
+        misses: Number of lookups that had to compute the result
+        evictions: Number of entries dropped to respect maxsize
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries (must be positive)
+
+        Raises:
+            ValueError: If maxsize is not positive
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if a key is cached, without touching its recency or the counters."""
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Look up a key and mark it as most recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value, or default
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+        entries[key] = value
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, computing and storing it on a miss.
+
+        Args:
+            key: Cache key
+            compute: Function called without arguments on a miss
+
+        Returns:
+            Cached or freshly computed value
+        """
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+        self.misses += 1
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry (the counters are kept)."""
+        self._entries.clear()
+
+    def reset_stats(self) -> None:
+        """Set the hit, miss and eviction counters back to zero."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the cache counters.
+
+        Returns:
+            Dictionary with size, maxsize, hits, misses, evictions and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,256 @@
+"""
+MoveGenerator module for Backgammon game.
+
+This module contains the MoveGenerator class which lists every legal full-turn
+play for a roll, applying the must-use-max-dice and larger-die rules and
+returning each distinct resulting position only once.
+"""
+
+from array import array
+from typing import Dict, List, Sequence, Tuple, Union
+
+from .board import BAR_SLOT, OFF_SLOT
+
+Move = Tuple[Union[int, str], Union[int, str]]
+Play = Tuple[Tuple[Move, ...], bytes]
+
+# Mover-perspective layout used internally: 0-23 points (own checkers positive,
+# home board 0-5, moving towards 0), 24 own bar, 25 own off, 26 opponent bar.
+_OWN_BAR = 24
+_OWN_OFF = 25
+_OPP_BAR = 26
+
+
+class MoveGenerator:
+    """
+    Generates complete legal plays for a roll.
+
+    A play is the sequence of single-checker moves made with one roll. The
+    generator enforces that as many dice as possible are used and, when only
+    one die of a non-double roll can be played, that the larger one is used.
+    Plays that reach the same position (e.g. 8/5 6/5 and 6/5 8/5) are
+    returned once.
+    """
+
+    def get_legal_plays(
+        self, board, color: str, dice: Sequence[int]
+    ) -> List[Play]:
+        """
+        Get every distinct legal play for the given dice.
+
+        Args:
+            board: Board instance with the current position
+            color: Color of the player to move
+            dice: Remaining dice values (e.g. [3, 1] or [4, 4, 4, 4])
+
+        Returns:
+            List of (moves, position) tuples. ``moves`` uses the same notation
+            as ``BackgammonGame.make_move`` (1-24, "bar", "off") and
+            ``position`` is the resulting ``Board.to_bytes()`` key. When no
+            move is possible a single empty play is returned.
+        """
+        cells = array("b", board.to_bytes())
+        pos = self._to_mover(cells, color)
+        dice = list(dice)
+        if not dice:
+            return [((), board.to_bytes())]
+
+        is_double = len(set(dice)) == 1
+        if is_double:
+            orders = [tuple(dice)]
+        else:
+            # Larger die first so single-die plays record the larger die
+            high_first = tuple(sorted(dice, reverse=True))
+            orders = [high_first, tuple(reversed(high_first))]
+
+        # found[n] maps position -> (moves, first die used) for plays of n moves
+        found: List[Dict[tuple, Tuple[Tuple[Move, ...], int]]] = [
+            {} for _ in range(len(dice) + 1)
+        ]
+        for order in orders:
+            self._expand(pos, order, 0, _OWN_BAR, is_double, [], found)
+
+        max_used = max(n for n, plays in enumerate(found) if plays)
+        plays = found[max_used]
+
+        # Only one die of a non-double can be played: the larger one is mandatory
+        if max_used == 1 and not is_double:
+            larger = max(dice)
+            with_larger = {k: v for k, v in plays.items() if v[1] == larger}
+            if with_larger:
+                plays = with_larger
+
+        return [
+            (
+                tuple(self._to_notation(move, color) for move in moves),
+                self._to_bytes(key, color, cells),
+            )
+            for key, (moves, _) in plays.items()
+        ]
+
+    def count_legal_plays(self, board, color: str, dice: Sequence[int]) -> int:
+        """
+        Count the distinct legal plays for the given dice.
+
+        Args:
+            board: Board instance with the current position
+            color: Color of the player to move
+            dice: Remaining dice values
+
+        Returns:
+            Number of distinct resulting positions
+        """
+        return len(self.get_legal_plays(board, color, dice))
+
+    def _expand(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        pos: List[int],
+        dice: Tuple[int, ...],
+        depth: int,
+        max_source: int,
+        is_double: bool,
+        moves: List[Tuple[int, int, int]],
+        found: List[Dict[tuple, Tuple[Tuple[Move, ...], int]]],
+    ) -> None:
+        """
+        Depth-first expansion of the play tree (moves are applied and undone in place).
+
+        Args:
+            pos: Mover-perspective position (modified and restored)
+            dice: Dice order being tried
+            depth: Number of dice already used
+            max_source: Highest source point allowed (canonical order for doubles)
+            is_double: True when all dice have the same value
+            moves: Moves made so far as (source, destination, die)
+            found: Plays collected per number of moves used
+        """
+        key = tuple(pos)
+        if key not in found[depth]:
+            first_die = moves[0][2] if moves else 0
+            found[depth][key] = (tuple(moves), first_die)
+        if depth == len(dice):
+            return
+
+        die = dice[depth]
+        for source, destination in self._single_moves(pos, die, max_source):
+            hit = self._apply(pos, source, destination)
+            moves.append((source, destination, die))
+            self._expand(
+                pos,
+                dice,
+                depth + 1,
+                source if is_double else _OWN_BAR,
+                is_double,
+                moves,
+                found,
+            )
+            moves.pop()
+            self._undo(pos, source, destination, hit)
+
+    @staticmethod
+    def _single_moves(
+        pos: List[int], die: int, max_source: int
+    ) -> List[Tuple[int, int]]:
+        """
+        List the legal single-checker moves for one die.
+
+        Args:
+            pos: Mover-perspective position
+            die: Die value
+            max_source: Highest source point to consider
+
+        Returns:
+            List of (source, destination) tuples; destination -1 means off
+        """
+        if pos[_OWN_BAR]:
+            destination = 24 - die
+            if pos[destination] >= -1:
+                return [(_OWN_BAR, destination)]
+            return []
+
+        result = []
+        top = min(max_source, 23)
+        farthest = -1
+        for point in range(23, -1, -1):
+            if pos[point] > 0:
+                farthest = point
+                break
+        can_bear_off = 0 <= farthest <= 5
+
+        for source in range(top, -1, -1):
+            if pos[source] <= 0:
+                continue
+            destination = source - die
+            if destination >= 0:
+                if pos[destination] >= -1:
+                    result.append((source, destination))
+            elif can_bear_off and (destination == -1 or source == farthest):
+                result.append((source, -1))
+        return result
+
+    @staticmethod
+    def _apply(pos: List[int], source: int, destination: int) -> bool:
+        """Apply a single move in place and return whether it hit a blot."""
+        pos[source] -= 1
+        if destination < 0:
+            pos[_OWN_OFF] += 1
+            return False
+        if pos[destination] == -1:
+            pos[destination] = 1
+            pos[_OPP_BAR] += 1
+            return True
+        pos[destination] += 1
+        return False
+
+    @staticmethod
+    def _undo(pos: List[int], source: int, destination: int, hit: bool) -> None:
+        """Undo a move made with ``_apply``."""
+        pos[source] += 1
+        if destination < 0:
+            pos[_OWN_OFF] -= 1
+        elif hit:
+            pos[destination] = -1
+            pos[_OPP_BAR] -= 1
+        else:
+            pos[destination] -= 1
+
+    @staticmethod
+    def _to_mover(cells, color: str) -> List[int]:
+        """Convert board cells to the mover-perspective list."""
+        if color == "white":
+            pos = list(cells[:24])
+        else:
+            pos = [-value for value in reversed(cells[:24])]
+        opponent = "black" if color == "white" else "white"
+        pos.append(cells[BAR_SLOT[color]])
+        pos.append(cells[OFF_SLOT[color]])
+        pos.append(cells[BAR_SLOT[opponent]])
+        return pos
+
+    @staticmethod
+    def _to_bytes(pos: tuple, color: str, base_cells) -> bytes:
+        """Convert a mover-perspective position back to a Board key."""
+        cells = array("b", base_cells)
+        opponent = "black" if color == "white" else "white"
+        if color == "white":
+            cells[:24] = array("b", pos[:24])
+        else:
+            cells[:24] = array("b", [-value for value in reversed(pos[:24])])
+        cells[BAR_SLOT[color]] = pos[_OWN_BAR]
+        cells[OFF_SLOT[color]] = pos[_OWN_OFF]
+        cells[BAR_SLOT[opponent]] = pos[_OPP_BAR]
+        return cells.tobytes()
+
+    @staticmethod
+    def _to_notation(move: Tuple[int, int, int], color: str) -> Move:
+        """Convert an internal move to ``make_move`` notation."""
+        source, destination, _ = move
+        if source == _OWN_BAR:
+            from_pos: Union[int, str] = "bar"
+        else:
+            from_pos = source + 1 if color == "white" else 24 - source
+        if destination < 0:
+            to_pos: Union[int, str] = "off"
+        else:
+            to_pos = destination + 1 if color == "white" else 24 - destination
+        return from_pos, to_pos
@@ -0,0 +1,307 @@
+"""
+Position ID and match ID module for Backgammon game.
+
+This module encodes positions and match context into the short base64
+strings used by GNU Backgammon, so they can be pasted into other programs
+and used as compact keys in logs, caches, network messages and databases.
+
+Position ID (14 characters, 80 bits): for each side, starting with the side
+that is NOT on roll, walk its 1 point to its 24 point and then its bar,
+writing one 1 bit per checker followed by a 0 bit. Bits are packed from the
+least significant bit of the first byte. Borne-off checkers are implied
+(15 minus the checkers left).
+
+Match ID (12 characters, 66 bits), least significant bit first:
+cube value as log2 (4 bits), cube owner (2), player on roll (1),
+Crawford game (1), game state (3), player to act (1), double offered (1),
+resignation (2), die 1 (3), die 2 (3), match length (15), white score (15)
+and black score (15). Player 0 is white and player 1 is black.
+"""
+
+import base64
+import binascii
+from array import array
+from typing import NamedTuple, Optional, Tuple
+
+from .checker import Checker
+
+NUM_SLOTS = 28
+CHECKERS_PER_SIDE = 15
+POSITION_ID_LENGTH = 14
+MATCH_ID_LENGTH = 12
+# Board slots walked for each color, from its 1 point to its 24 point, then bar
+SLOT_ORDER = {
+    "white": tuple(range(24)) + (24,),
+    "black": tuple(range(23, -1, -1)) + (25,),
+}
+SIGNS = {"white": 1, "black": -1}
+OFF_SLOTS = {"white": 26, "black": 27}
+PLAYERS = ("white", "black")
+GAME_STATES = ("none", "playing", "over", "resigned", "dropped")
+CENTERED_CUBE = 3
+
+
+def _side_counts(cells, color: str) -> list:
+    """Checker counts of a color from its 1 point to its bar."""
+    sign = SIGNS[color]
+    counts = [max(cells[slot] * sign, 0) for slot in SLOT_ORDER[color][:24]]
+    counts.append(cells[SLOT_ORDER[color][24]])
+    return counts
+
+
+def encode_position_id(cells, on_roll: str = "white") -> str:
+    """
+    Encode board cells into a 14-character position ID.
+
+    Args:
+        cells: The 28 slot values of a Board (Board.cells or to_bytes())
+        on_roll: Color of the side to move
+
+    Returns:
+        Position ID string
+    """
+    if isinstance(cells, (bytes, bytearray)):
+        cells = array("b", cells)
+    runs = [
+        "1" * count + "0"
+        for color in (Checker.get_opposite_color(on_roll), on_roll)
+        for count in _side_counts(cells, color)
+    ]
+    # The bit string is written first bit first, so reverse it for int()
+    key = int("".join(runs)[::-1], 2)
+    return base64.b64encode(key.to_bytes(10, "little")).decode("ascii")[
+        :POSITION_ID_LENGTH
+    ]
+
+
+def _decode_bits(text: str, length: int, size: int) -> int:
+    """
+    Decode a base64 ID without padding into an integer (LSB first).
+
+    Args:
+        text: ID string
+        length: Expected number of characters
+        size: Number of bytes encoded
+
+    Returns:
+        Integer with the ID bits
+
+    Raises:
+        ValueError: If the ID has the wrong length or is not valid base64
+    """
+    if not isinstance(text, str) or len(text) != length:
+        raise ValueError(f"ID must be a string of {length} characters, got {text!r}")
+    try:
+        raw = base64.b64decode(text + "=" * (-length % 4), validate=True)
+    except (binascii.Error, ValueError) as error:
+        raise ValueError(f"Invalid base64 ID: {text!r}") from error
+    return int.from_bytes(raw[:size], "little")
+
+
+def decode_position_id(position_id: str, on_roll: str = "white") -> array:
+    """
+    Decode a position ID into board cells.
+
+    Args:
+        position_id: 14-character position ID
+        on_roll: Color of the side to move in the encoded position
+
+    Returns:
+        array("b") of 28 slot values in the Board.cells layout
+
+    Raises:
+        ValueError: If the ID is malformed or does not describe a legal position
+    """
+    key = _decode_bits(position_id, POSITION_ID_LENGTH, 10)
+    # Runs of 1 bits between 0 bits are the counts, in encoding order
+    runs = format(key, "080b")[::-1].split("0")
+    if len(runs) < 51 or any(runs[50:]):
+        raise ValueError(f"Position ID {position_id!r} does not encode 50 counts")
+
+    cells = array("b", bytes(NUM_SLOTS))
+    for side, color in enumerate((Checker.get_opposite_color(on_roll), on_roll)):
+        sign = SIGNS[color]
+        total = 0
+        for slot, run in zip(SLOT_ORDER[color], runs[25 * side : 25 * side + 25]):
+            count = len(run)
+            if not count:
+                continue
+            total += count
+            if slot < 24:
+                if cells[slot]:
+                    raise ValueError(
+                        f"Position ID {position_id!r} puts both colors "
+                        f"on point {slot + 1}"
+                    )
+                count *= sign
+            cells[slot] = count
+        if total > CHECKERS_PER_SIDE:
+            raise ValueError(
+                f"Position ID {position_id!r} has {total} {color} checkers"
+            )
+        cells[OFF_SLOTS[color]] = CHECKERS_PER_SIDE - total
+    return cells
+
+
+class MatchState(NamedTuple):
+    """
+    Match context stored in a match ID.
+
+    Attributes:
+        cube_value: Cube value (1, 2, 4, ...)
+        cube_owner: Color that owns the cube, or None if centered
+        on_roll: Color on roll
+        crawford: Whether this is the Crawford game
+        game_state: One of GAME_STATES
+        turn: Color that has to act (differs from on_roll on cube decisions)
+        double_offered: Whether a double is pending
+        resignation: 0 none, 1 single, 2 gammon, 3 backgammon
+        dice: Rolled dice, (0, 0) if not rolled yet
+        match_length: Match length, 0 for money games
+        score: (white score, black score)
+    """
+
+    cube_value: int = 1
+    cube_owner: Optional[str] = None
+    on_roll: str = "white"
+    crawford: bool = False
+    game_state: str = "playing"
+    turn: str = "white"
+    double_offered: bool = False
+    resignation: int = 0
+    dice: Tuple[int, int] = (0, 0)
+    match_length: int = 0
+    score: Tuple[int, int] = (0, 0)
+
+
+# (field name, width in bits) in match ID order
+_MATCH_FIELDS = (
+    ("cube_log", 4),
+    ("owner", 2),
+    ("on_roll", 1),
+    ("crawford", 1),
+    ("game_state", 3),
+    ("turn", 1),
+    ("double_offered", 1),
+    ("resignation", 2),
+    ("die1", 3),
+    ("die2", 3),
+    ("match_length", 15),
+    ("white_score", 15),
+    ("black_score", 15),
+)
+
+
+def game_match_state(game) -> MatchState:
+    """
+    Get the match context of a BackgammonGame.
+
+    The game has no doubling cube or match score, so those fields keep
+    their money-game defaults (cube 1 centered, no match length).
+
+    Args:
+        game: BackgammonGame with its players set up
+
+    Returns:
+        MatchState with the side on roll, the rolled dice and the game state
+    """
+    color = game.get_current_player().color
+    if game.players and game.is_game_over():
+        game_state = "over"
+    elif game.is_started:
+        game_state = "playing"
+    else:
+        game_state = "none"
+    roll = game.dice.last_roll
+    return MatchState(
+        on_roll=color,
+        turn=color,
+        game_state=game_state,
+        dice=(roll[0], roll[1]) if roll else (0, 0),
+    )
+
+
+def encode_match_id(state: MatchState) -> str:
+    """
+    Encode match context into a 12-character match ID.
+
+    Args:
+        state: MatchState to encode
+
+    Returns:
+        Match ID string
+
+    Raises:
+        ValueError: If a field is out of range
+    """
+    cube_log = state.cube_value.bit_length() - 1
+    if state.cube_value < 1 or 1 << cube_log != state.cube_value or cube_log > 15:
+        raise ValueError(f"Invalid cube value: {state.cube_value}")
+    owner = (
+        CENTERED_CUBE if state.cube_owner is None else PLAYERS.index(state.cube_owner)
+    )
+    values = (
+        cube_log,
+        owner,
+        PLAYERS.index(state.on_roll),
+        int(state.crawford),
+        GAME_STATES.index(state.game_state),
+        PLAYERS.index(state.turn),
+        int(state.double_offered),
+        state.resignation,
+        state.dice[0],
+        state.dice[1],
+        state.match_length,
+        state.score[0],
+        state.score[1],
+    )
+    key = 0
+    shift = 0
+    for value, (_, width) in zip(values, _MATCH_FIELDS):
+        if not 0 <= value < 1 << width:
+            raise ValueError(f"Match ID field value {value} does not fit {width} bits")
+        key |= value << shift
+        shift += width
+    return base64.b64encode(key.to_bytes(9, "little")).decode("ascii")
+
+
+def decode_match_id(match_id: str) -> MatchState:
+    """
+    Decode a match ID.
+
+    Args:
+        match_id: 12-character match ID
+
+    Returns:
+        MatchState
+
+    Raises:
+        ValueError: If the ID is malformed or has out-of-range fields
+    """
+    key = _decode_bits(match_id, MATCH_ID_LENGTH, 9)
+    fields = {}
+    for name, width in _MATCH_FIELDS:
+        fields[name] = key & ((1 << width) - 1)
+        key >>= width
+    if (
+        fields["owner"] == 2
+        or fields["game_state"] >= len(GAME_STATES)
+        or fields["die1"] > 6
+        or fields["die2"] > 6
+    ):
+        raise ValueError(f"Match ID {match_id!r} has out-of-range fields")
+    return MatchState(
+        cube_value=1 << fields["cube_log"],
+        cube_owner=(
+            None if fields["owner"] == CENTERED_CUBE else PLAYERS[fields["owner"]]
+        ),
+        on_roll=PLAYERS[fields["on_roll"]],
+        crawford=bool(fields["crawford"]),
+        game_state=GAME_STATES[fields["game_state"]],
+        turn=PLAYERS[fields["turn"]],
+        double_offered=bool(fields["double_offered"]),
+        resignation=fields["resignation"],
+        dice=(fields["die1"], fields["die2"]),
+        match_length=fields["match_length"],
+        score=(fields["white_score"], fields["black_score"]),
+    )
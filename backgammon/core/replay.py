@@ -0,0 +1,267 @@
+"""
+Replay module for Backgammon game.
+
+This module contains GameReplay, which seeks to any move number of a
+recorded game in bounded time. While the history is loaded, a compact
+position key (Board.to_bytes(), 28 bytes) is kept every `interval` moves
+together with the BoardDelta of every move. A seek restores the nearest
+snapshot and applies or unmakes at most interval / 2 deltas, instead of
+replaying the game from move 0.
+
+Move numbers count single checker moves, as in BackgammonGame.move_history:
+position 0 is the starting position and position n is the board after the
+first n moves.
+"""
+
+from typing import Iterable, List, Optional, Tuple, Union
+
+from .board import BAR_SLOT, OFF_SLOT, Board, BoardDelta
+
+Move = Tuple[Union[int, str], Union[int, str], str]
+
+
+def _board_points(move: Move) -> Tuple[Union[int, str], Union[int, str], str]:
+    """Convert a history move (human notation 1-24) to board indices (0-23)."""
+    from_pos, to_pos, color = move
+    return (
+        from_pos if from_pos == "bar" else from_pos - 1,
+        to_pos if to_pos == "off" else to_pos - 1,
+        color,
+    )
+
+
+def _redo(board: Board, delta: BoardDelta) -> None:
+    """Apply a recorded delta forward."""
+    color, from_slot, to_slot, _ = delta
+    board.make_move(
+        "bar" if from_slot == BAR_SLOT[color] else from_slot,
+        "off" if to_slot == OFF_SLOT[color] else to_slot,
+        color,
+    )
+
+
+class GameReplay:
+    """
+    Snapshot-indexed replay of a recorded game.
+
+    Attributes:
+        interval: Moves between snapshots
+        moves: Recorded moves (from, to, color) in human notation
+        position: Move number of the cursor board
+        board: Board at the cursor (do not modify it; use board_at() for
+            a private copy)
+    """
+
+    def __init__(
+        self,
+        moves: Iterable[Move] = (),
+        initial: Optional[Union[Board, bytes]] = None,
+        interval: int = 16,
+    ) -> None:
+        """
+        Build the snapshot index of a recorded game.
+
+        Args:
+            moves: Recorded moves (from, to, color) in human notation
+            initial: Starting board or position key (standard start if omitted)
+            interval: Moves between snapshots
+
+        Raises:
+            ValueError: If the interval is not positive or a move cannot be
+                played on the recorded position
+        """
+        if interval < 1:
+            raise ValueError(f"interval must be positive, got {interval}")
+        if initial is None:
+            start = Board()
+            start.setup_initial_position()
+        elif isinstance(initial, (bytes, bytearray)):
+            start = Board.from_bytes(bytes(initial))
+        else:
+            start = initial.copy()
+        self.interval = interval
+        self.moves: List[Move] = []
+        self._deltas: List[BoardDelta] = []
+        self._snapshots: List[bytes] = [start.to_bytes()]
+        self._end = start
+        self.board = start.copy()
+        self.position = 0
+        for move in moves:
+            self.append(move)
+
+    @classmethod
+    def from_game(cls, game, interval: int = 16) -> "GameReplay":
+        """
+        Build a replay of a game's move history from the standard start.
+
+        Args:
+            game: BackgammonGame instance
+            interval: Moves between snapshots
+
+        Returns:
+            GameReplay instance
+        """
+        return cls(game.move_history, interval=interval)
+
+    def __len__(self) -> int:
+        """Number of recorded moves."""
+        return len(self.moves)
+
+    def append(self, move: Move) -> None:
+        """
+        Record one more move at the end of the game.
+
+        Args:
+            move: Move (from, to, color) in human notation
+
+        Raises:
+            ValueError: If the move cannot be played on the last position
+        """
+        delta = self._end.make_move(*_board_points(move))
+        if delta is None:
+            raise ValueError(f"Move {len(self.moves) + 1} {move} cannot be replayed")
+        self.moves.append(tuple(move))
+        self._deltas.append(delta)
+        if len(self.moves) % self.interval == 0:
+            self._snapshots.append(self._end.to_bytes())
+
+    def truncate(self, count: int) -> None:
+        """
+        Drop every move after the first count moves (e.g. after an undo).
+
+        Args:
+            count: Number of moves to keep
+        """
+        if count >= len(self.moves):
+            return
+        count = max(count, 0)
+        if self.position > count:
+            self.seek(count)
+        self._end = self.board_at(count)
+        del self.moves[count:]
+        del self._deltas[count:]
+        del self._snapshots[count // self.interval + 1 :]
+
+    def sync(self, moves: List[Move]) -> None:
+        """
+        Catch up with a live game's history, reusing the common prefix.
+
+        Args:
+            moves: Current move history of the game
+        """
+        common = min(len(moves), len(self.moves))
+        # Histories only change at the end (new moves or undos), so walk
+        # back to the last recorded move that still matches
+        while common and tuple(moves[common - 1]) != self.moves[common - 1]:
+            common -= 1
+        self.truncate(common)
+        for move in moves[common:]:
+            self.append(move)
+
+    def move_at(self, number: int) -> Move:
+        """
+        Get a recorded move.
+
+        Args:
+            number: Move number (1 for the first move)
+
+        Returns:
+            Move (from, to, color)
+        """
+        self._check(number)
+        if number < 1:
+            raise IndexError("Move numbers start at 1")
+        return self.moves[number - 1]
+
+    def _check(self, number: int) -> None:
+        """Raise IndexError if number is not a position of the game."""
+        if not 0 <= number <= len(self.moves):
+            raise IndexError(f"Move number {number} out of range 0-{len(self.moves)}")
+
+    def _plan(self, number: int) -> Tuple[Optional[int], int]:
+        """
+        Choose the cheapest starting point for reaching a position.
+
+        Returns:
+            Tuple (snapshot index or None to start from the cursor, start position)
+        """
+        best = (None, self.position)
+        cost = abs(number - self.position)
+        below = number // self.interval
+        if number - below * self.interval < cost:
+            best = (below, below * self.interval)
+            cost = number - below * self.interval
+        if below + 1 < len(self._snapshots):
+            above = (below + 1) * self.interval
+            if above - number < cost:
+                best = (below + 1, above)
+        return best
+
+    def _walk(self, board: Board, start: int, number: int) -> None:
+        """Move board from position start to position number."""
+        deltas = self._deltas
+        if number >= start:
+            for index in range(start, number):
+                _redo(board, deltas[index])
+        else:
+            for index in range(start - 1, number - 1, -1):
+                board.unmake_move(deltas[index])
+
+    def board_at(self, number: int) -> Board:
+        """
+        Get a new board with the position after a number of moves.
+
+        The cursor is not moved.
+
+        Args:
+            number: Move number (0 for the starting position)
+
+        Returns:
+            New Board
+
+        Raises:
+            IndexError: If the move number is out of range
+        """
+        self._check(number)
+        snapshot, start = self._plan(number)
+        if snapshot is None:
+            board = self.board.copy()
+        else:
+            board = Board.from_bytes(self._snapshots[snapshot])
+        self._walk(board, start, number)
+        return board
+
+    def seek(self, number: int) -> Board:
+        """
+        Move the cursor to the position after a number of moves.
+
+        Args:
+            number: Move number (0 for the starting position)
+
+        Returns:
+            Board at the cursor
+
+        Raises:
+            IndexError: If the move number is out of range
+        """
+        self._check(number)
+        snapshot, start = self._plan(number)
+        if snapshot is not None:
+            self.board = Board.from_bytes(self._snapshots[snapshot])
+        self._walk(self.board, start, number)
+        self.position = number
+        return self.board
+
+    def step(self, count: int = 1) -> Board:
+        """
+        Move the cursor forward (or backward with a negative count).
+
+        The cursor stops at the first and last positions.
+
+        Args:
+            count: Number of moves to step
+
+        Returns:
+            Board at the cursor
+        """
+        return self.seek(min(max(self.position + count, 0), len(self.moves)))
@@ -0,0 +1,516 @@
+"""
+Binary serialization module for Backgammon game state.
+
+This module contains a compact, versioned binary format for the full state
+of a BackgammonGame (board counts, dice, players, move history, turn and
+timestamps), written with struct and array instead of the nested
+dictionaries of get_game_state().
+
+Each saved state is one self-contained record, so records can be appended
+to the same file (e.g. periodic autosaves) and read back one at a time with
+GameStateReader without loading the whole file:
+
+    header  <4sHHII  magic b"BGSV", version, reserved, body size, CRC32
+    body    <28sBBBBIdd  board cells, last roll (0, 0 if none), current
+                         player index, flags, move count, start and end
+                         time (NaN if not set)
+            B + N bytes  remaining dice values
+            B + players  <BBBBH color, on board, off, on bar, name size
+                         (0xFFFF if no name), then the UTF-8 name
+            I + 3N bytes move history as (from, to, color) codes
+
+Positions in the history use 1-24 for points, 25 for "bar" and 26 for
+"off"; colors use 0 for white, 1 for black and 255 for none.
+"""
+
+import math
+import struct
+import zlib
+from array import array
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from .backgammon_game import BackgammonGame
+from .board import Board
+from .player import Player
+
+MAGIC = b"BGSV"
+VERSION = 1
+RECORD_HEADER = struct.Struct("<4sHHII")
+BODY_HEADER = struct.Struct("<28sBBBBIdd")
+PLAYER_HEADER = struct.Struct("<BBBBH")
+COUNT = struct.Struct("<B")
+HISTORY_COUNT = struct.Struct("<I")
+
+FLAG_STARTED = 1
+FLAG_PAUSED = 2
+NO_NAME = 0xFFFF
+COLOR_CODES = {"white": 0, "black": 1, None: 255}
+CODE_COLORS = {code: color for color, code in COLOR_CODES.items()}
+POSITION_CODES = {"bar": 25, "off": 26}
+CODE_POSITIONS = {code: position for position, code in POSITION_CODES.items()}
+
+Move = Tuple[Union[int, str], Union[int, str], str]
+
+
+class PlayerRecord(NamedTuple):
+    """
+    Saved state of one player.
+
+    Attributes:
+        name: Player name (None if not set)
+        color: Player color (None if not set)
+        checkers_on_board: Checkers on the board
+        checkers_off_board: Checkers borne off
+        checkers_on_bar: Checkers on the bar
+    """
+
+    name: Optional[str]
+    color: Optional[str]
+    checkers_on_board: int
+    checkers_off_board: int
+    checkers_on_bar: int
+
+
+class GameSnapshot(NamedTuple):
+    """
+    Decoded game state record.
+
+    Attributes:
+        cells: Board.to_bytes() key
+        last_roll: Last roll [die1, die2], or None
+        dice_values: Remaining dice values
+        players: One PlayerRecord per player
+        current_player_index: Index of the player on turn
+        is_started: Whether the game was started
+        is_paused: Whether the game was paused
+        move_count: Number of moves made
+        start_time: Start timestamp, or None
+        end_time: End timestamp, or None
+        move_history: List of (from, to, color) moves
+    """
+
+    cells: bytes
+    last_roll: Optional[List[int]]
+    dice_values: List[int]
+    players: Tuple[PlayerRecord, ...]
+    current_player_index: int
+    is_started: bool
+    is_paused: bool
+    move_count: int
+    start_time: Optional[float]
+    end_time: Optional[float]
+    move_history: List[Move]
+
+    def apply_to(self, game) -> None:
+        """
+        Load this snapshot into a game, replacing its state.
+
+        Missing Player objects are created.
+
+        Args:
+            game: BackgammonGame instance
+        """
+        game.board = Board.from_bytes(self.cells)
+        game.dice.last_roll = list(self.last_roll) if self.last_roll else None
+        game.dice.values = list(self.dice_values)
+        while len(game.players) < len(self.players):
+            game.players.append(Player())
+        del game.players[len(self.players) :]
+        for player, record in zip(game.players, self.players):
+            player.set_state(record._asdict())
+        game.current_player_index = self.current_player_index
+        game.is_started = self.is_started
+        game.is_paused = self.is_paused
+        game.move_history = list(self.move_history)
+        game.move_records = []
+        game.move_count = self.move_count
+        game.start_time = self.start_time
+        game.end_time = self.end_time
+
+    def to_game(self) -> BackgammonGame:
+        """
+        Create a new game with this snapshot's state.
+
+        Returns:
+            New BackgammonGame
+        """
+        game = BackgammonGame()
+        self.apply_to(game)
+        return game
+
+    def to_game_state(self) -> dict:
+        """
+        Convert to the dictionary format of BackgammonGame.get_game_state().
+
+        Returns:
+            Game state dictionary
+        """
+        return {
+            "board": Board.from_bytes(self.cells).get_state(),
+            "dice": {"last_roll": self.last_roll, "values": list(self.dice_values)},
+            "players": [record._asdict() for record in self.players],
+            "current_player_index": self.current_player_index,
+            "is_started": self.is_started,
+            "is_paused": self.is_paused,
+            "move_history": list(self.move_history),
+            "move_count": self.move_count,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+        }
+
+
+def encode_move_position(position: Union[int, str]) -> int:
+    """Encode a history position (1-24, "bar" or "off") as one byte."""
+    if isinstance(position, int) and 1 <= position <= 24:
+        return position
+    try:
+        return POSITION_CODES[position]
+    except (KeyError, TypeError):
+        raise ValueError(f"Cannot encode move position {position!r}") from None
+
+
+def decode_move_position(code: int) -> Union[int, str]:
+    """Decode a history position byte."""
+    if 1 <= code <= 24:
+        return code
+    try:
+        return CODE_POSITIONS[code]
+    except KeyError:
+        raise ValueError(f"Invalid move position code {code}") from None
+
+
+def _encode_time(value: Optional[float]) -> float:
+    """Timestamps that are not set are stored as NaN."""
+    return math.nan if value is None else value
+
+
+def _decode_time(value: float) -> Optional[float]:
+    """Inverse of _encode_time."""
+    return None if math.isnan(value) else value
+
+
+def encode_body(game) -> bytes:
+    """
+    Encode the state of a game into a record body.
+
+    Args:
+        game: BackgammonGame instance
+
+    Returns:
+        Record body
+
+    Raises:
+        ValueError: If a value does not fit the format
+    """
+    last_roll = game.dice.last_roll or (0, 0)
+    flags = (FLAG_STARTED if game.is_started else 0) | (
+        FLAG_PAUSED if game.is_paused else 0
+    )
+    try:
+        parts = [
+            BODY_HEADER.pack(
+                game.board.to_bytes(),
+                last_roll[0],
+                last_roll[1],
+                game.current_player_index,
+                flags,
+                game.move_count,
+                _encode_time(game.start_time),
+                _encode_time(game.end_time),
+            ),
+            COUNT.pack(len(game.dice.values)),
+            bytes(game.dice.values),
+            COUNT.pack(len(game.players)),
+        ]
+        for player in game.players:
+            name = None if player.name is None else player.name.encode("utf-8")
+            parts.append(
+                PLAYER_HEADER.pack(
+                    COLOR_CODES[player.color],
+                    player.checkers_on_board,
+                    player.checkers_off_board,
+                    player.checkers_on_bar,
+                    NO_NAME if name is None else len(name),
+                )
+            )
+            if name:
+                parts.append(name)
+        history = array("B")
+        for from_pos, to_pos, color in game.move_history:
+            history.append(encode_move_position(from_pos))
+            history.append(encode_move_position(to_pos))
+            history.append(COLOR_CODES[color])
+    except (struct.error, KeyError, OverflowError) as error:
+        raise ValueError(f"Game state does not fit the binary format: {error}") from error
+    parts.append(HISTORY_COUNT.pack(len(game.move_history)))
+    parts.append(history.tobytes())
+    return b"".join(parts)
+
+
+def _decode_players(body: bytes, offset: int) -> Tuple[List[PlayerRecord], int]:
+    """
+    Decode the player records of a body.
+
+    Args:
+        body: Record body
+        offset: Offset of the player count
+
+    Returns:
+        Player records and the offset after them
+    """
+    (player_count,) = COUNT.unpack_from(body, offset)
+    offset += COUNT.size
+    players = []
+    for _ in range(player_count):
+        color, on_board, off_board, on_bar, name_size = PLAYER_HEADER.unpack_from(
+            body, offset
+        )
+        offset += PLAYER_HEADER.size
+        name = None
+        if name_size != NO_NAME:
+            name = bytes(body[offset : offset + name_size]).decode("utf-8")
+            offset += name_size
+        players.append(
+            PlayerRecord(name, CODE_COLORS[color], on_board, off_board, on_bar)
+        )
+    return players, offset
+
+
+def _decode_history(body: bytes, offset: int) -> List[Move]:
+    """
+    Decode the move history at the end of a body.
+
+    Args:
+        body: Record body
+        offset: Offset of the history count
+
+    Returns:
+        Move history as (from, to, color) tuples
+
+    Raises:
+        ValueError: If the history does not end the body exactly
+    """
+    (history_count,) = HISTORY_COUNT.unpack_from(body, offset)
+    offset += HISTORY_COUNT.size
+    history = body[offset : offset + 3 * history_count]
+    if len(history) != 3 * history_count or offset + len(history) != len(body):
+        raise ValueError("Record body size does not match its contents")
+    return [
+        (
+            decode_move_position(history[index]),
+            decode_move_position(history[index + 1]),
+            CODE_COLORS[history[index + 2]],
+        )
+        for index in range(0, len(history), 3)
+    ]
+
+
+def decode_body(body: bytes) -> GameSnapshot:
+    """
+    Decode a record body.
+
+    Args:
+        body: Record body from encode_body
+
+    Returns:
+        GameSnapshot
+
+    Raises:
+        ValueError: If the body is malformed
+    """
+    try:
+        (
+            cells,
+            die1,
+            die2,
+            current_player_index,
+            flags,
+            move_count,
+            start_time,
+            end_time,
+        ) = BODY_HEADER.unpack_from(body, 0)
+        offset = BODY_HEADER.size
+        (dice_count,) = COUNT.unpack_from(body, offset)
+        offset += COUNT.size
+        dice_values = list(body[offset : offset + dice_count])
+        offset += dice_count
+        players, offset = _decode_players(body, offset)
+        move_history = _decode_history(body, offset)
+    except (struct.error, KeyError, UnicodeDecodeError) as error:
+        raise ValueError(f"Malformed game state record: {error}") from error
+    return GameSnapshot(
+        cells=cells,
+        last_roll=[die1, die2] if die1 else None,
+        dice_values=dice_values,
+        players=tuple(players),
+        current_player_index=current_player_index,
+        is_started=bool(flags & FLAG_STARTED),
+        is_paused=bool(flags & FLAG_PAUSED),
+        move_count=move_count,
+        start_time=_decode_time(start_time),
+        end_time=_decode_time(end_time),
+        move_history=move_history,
+    )
+
+
+def serialize_game(game) -> bytes:
+    """
+    Serialize a game into one record (header and body).
+
+    Args:
+        game: BackgammonGame instance
+
+    Returns:
+        Record bytes
+    """
+    body = encode_body(game)
+    return RECORD_HEADER.pack(MAGIC, VERSION, 0, len(body), zlib.crc32(body)) + body
+
+
+def _check_header(header: bytes) -> Tuple[int, int]:
+    """
+    Validate a record header.
+
+    Args:
+        header: RECORD_HEADER.size bytes
+
+    Returns:
+        Tuple (body size, CRC32)
+
+    Raises:
+        ValueError: If the magic or the version is not supported
+    """
+    magic, version, _, size, crc = RECORD_HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"Not a game state record (magic {magic!r})")
+    if version != VERSION:
+        raise ValueError(f"Unsupported game state version {version}")
+    return size, crc
+
+
+def _check_body(body: bytes, size: int, crc: int) -> bytes:
+    """Check the size and CRC32 of a record body."""
+    if len(body) != size:
+        raise ValueError(f"Truncated game state record ({len(body)} of {size} bytes)")
+    if zlib.crc32(body) != crc:
+        raise ValueError("Game state record failed its CRC check")
+    return body
+
+
+def deserialize_game(data: bytes) -> GameSnapshot:
+    """
+    Decode one record produced by serialize_game.
+
+    Args:
+        data: Record bytes
+
+    Returns:
+        GameSnapshot
+
+    Raises:
+        ValueError: If the record is malformed, truncated or corrupted
+    """
+    if len(data) < RECORD_HEADER.size:
+        raise ValueError("Truncated game state record header")
+    size, crc = _check_header(data[: RECORD_HEADER.size])
+    body = _check_body(data[RECORD_HEADER.size :], size, crc)
+    return decode_body(body)
+
+
+def write_game(stream: BinaryIO, game) -> int:
+    """
+    Append the state of a game to a binary stream.
+
+    Args:
+        stream: Binary stream opened for writing
+        game: BackgammonGame instance
+
+    Returns:
+        Number of bytes written
+    """
+    return stream.write(serialize_game(game))
+
+
+class GameStateReader:
+    """
+    Streaming reader that yields one GameSnapshot per record.
+
+    Only one record is held in memory at a time, so files with many
+    appended saves can be scanned cheaply.
+
+    Attributes:
+        stream: Binary stream opened for reading
+    """
+
+    def __init__(self, stream: BinaryIO) -> None:
+        """
+        Initialize the reader.
+
+        Args:
+            stream: Binary stream opened for reading
+        """
+        self.stream = stream
+
+    def read(self) -> Optional[GameSnapshot]:
+        """
+        Read the next record.
+
+        Returns:
+            GameSnapshot, or None at the end of the stream
+
+        Raises:
+            ValueError: If the record is malformed, truncated or corrupted
+        """
+        header = self.stream.read(RECORD_HEADER.size)
+        if not header:
+            return None
+        if len(header) != RECORD_HEADER.size:
+            raise ValueError("Truncated game state record header")
+        size, crc = _check_header(header)
+        return decode_body(_check_body(self.stream.read(size), size, crc))
+
+    def __iter__(self) -> Iterator[GameSnapshot]:
+        """Iterate over the remaining records."""
+        while True:
+            snapshot = self.read()
+            if snapshot is None:
+                return
+            yield snapshot
+
+
+def save_game(path: str, game, append: bool = False) -> int:
+    """
+    Save the state of a game to a file.
+
+    Args:
+        path: File path
+        game: BackgammonGame instance
+        append: Append a record instead of replacing the file
+
+    Returns:
+        Number of bytes written
+    """
+    with open(path, "ab" if append else "wb") as stream:
+        return write_game(stream, game)
+
+
+def load_game(path: str) -> GameSnapshot:
+    """
+    Load the last record saved in a file.
+
+    Args:
+        path: File path
+
+    Returns:
+        GameSnapshot of the last record
+
+    Raises:
+        ValueError: If the file has no records or a record is malformed
+    """
+    snapshot = None
+    with open(path, "rb") as stream:
+        for snapshot in GameStateReader(stream):
+            pass
+    if snapshot is None:
+        raise ValueError(f"No game state records in {path}")
+    return snapshot
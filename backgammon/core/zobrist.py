@@ -0,0 +1,77 @@
+"""
+Zobrist hashing module for Backgammon game.
+
+This module contains the random tables and helper functions used to build
+64-bit Zobrist keys for board positions, the side to move and the dice.
+The tables come from a fixed seed so keys are stable between runs and
+processes and can be stored in caches or game archives.
+"""
+
+import random
+from typing import Iterable, List
+
+ZOBRIST_SEED = 0x6261636B  # "back"
+NUM_SLOTS = 28
+# Slot values are signed counts; indexing with a negative value wraps around,
+# so a table of 64 entries gives a unique entry for every value in -32..31.
+VALUES_PER_SLOT = 64
+
+
+def _build_tables():
+    """
+    Build the Zobrist tables from the fixed seed.
+
+    Returns:
+        tuple: (slot table, side-to-move key, dice table)
+    """
+    rng = random.Random(ZOBRIST_SEED)
+    slot_keys: List[List[int]] = []
+    for _ in range(NUM_SLOTS):
+        # Value 0 (empty slot) hashes to 0 so the empty board has key 0
+        table = [0] + [rng.getrandbits(64) for _ in range(VALUES_PER_SLOT - 1)]
+        slot_keys.append(table)
+    side_key = rng.getrandbits(64)
+    # dice_keys[value][count] for dice values 1-6 and 0-4 remaining uses
+    dice_keys = [[0] * 5 for _ in range(7)]
+    for value in range(1, 7):
+        for count in range(1, 5):
+            dice_keys[value][count] = rng.getrandbits(64)
+    return slot_keys, side_key, dice_keys
+
+
+SLOT_KEYS, SIDE_KEY, DICE_KEYS = _build_tables()
+
+
+def hash_cells(cells: Iterable[int]) -> int:
+    """
+    Compute the Zobrist key of a board from scratch.
+
+    Args:
+        cells: The 28 slot values of a Board
+
+    Returns:
+        64-bit Zobrist key
+    """
+    key = 0
+    for slot, value in enumerate(cells):
+        key ^= SLOT_KEYS[slot][value]
+    return key
+
+
+def hash_dice(values: Iterable[int]) -> int:
+    """
+    Compute the Zobrist component of the remaining dice.
+
+    Args:
+        values: Remaining dice values (order does not matter)
+
+    Returns:
+        64-bit key for the multiset of dice values
+    """
+    counts = [0] * 7
+    for value in values:
+        counts[value] += 1
+    key = 0
+    for value in range(1, 7):
+        key ^= DICE_KEYS[value][counts[value]]
+    return key
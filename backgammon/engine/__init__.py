@@ -0,0 +1,18 @@
+"""
+Engine package for Backgammon game.
+
+This package contains headless tools built on the core game logic:
+- policies: Move-selection policies (random, first, greedy) and make_policy,
+  which also creates the expectimax and neural ones by name
+- simulator: Self-play simulator (``python -m backgammon.engine.simulator``)
+- rollout: Monte Carlo rollout evaluator
+- bearoff: One-sided bearoff database (``python -m backgammon.engine.bearoff``)
+- bearoff_two_sided: Exact two-sided bearoff database
+- encoder: Vectorized batch feature encoder (requires numpy)
+- evaluator: NumPy neural-network evaluator (requires numpy)
+- search: Expectimax search player with Star1/Star2 pruning
+- tournament: Round-robin and Swiss policy tournaments with Elo ratings
+  (``python -m backgammon.engine.tournament``)
+- perft: Move tree enumeration for move generation checks and throughput
+  (``python -m backgammon.engine.perft``)
+"""
@@ -0,0 +1,457 @@
+"""
+One-sided bearoff database for Backgammon.
+
+For every arrangement of up to N checkers (15 by default) on the six home
+points the database stores the expected number of rolls needed to bear all
+of them off and the full distribution of rolls-to-finish, assuming the
+player always picks the play that minimizes the expected number of rolls.
+
+The database is written to a compact binary file and read through ``mmap``,
+so every worker process that opens the same file shares one copy of the
+pages. Lookups are constant time: a combinatorial index, then two
+``struct.unpack_from`` calls.
+
+Usage:
+    python -m backgammon.engine.bearoff --checkers 15 --output bearoff1.db
+"""
+
+import argparse
+import mmap
+import struct
+import time
+from math import comb
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from backgammon.core.board import BAR_SLOT, COLOR_SIGN
+
+MAGIC = b"BGBO"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")  # magic, version, max checkers, positions
+NUM_POINTS = 6
+MAX_ROLLS = 32
+DIST_SCALE = 65535
+
+# (die1, die2, probability) for the 21 distinct rolls
+ROLLS: List[Tuple[int, int, float]] = [
+    (a, b, (1 if a == b else 2) / 36) for a in range(1, 7) for b in range(a, 7)
+]
+
+Counts = Tuple[int, ...]
+
+
+def count_positions(max_checkers: int) -> int:
+    """
+    Get the number of arrangements of up to max_checkers on the home points.
+
+    Args:
+        max_checkers: Maximum number of checkers
+
+    Returns:
+        Number of positions, including the empty one
+    """
+    return comb(max_checkers + NUM_POINTS, NUM_POINTS)
+
+
+def position_index(counts: Sequence[int], max_checkers: int) -> int:
+    """
+    Get the combinatorial index of a home-board position.
+
+    Positions are ordered lexicographically by the count on point 1, then
+    point 2, etc. The index is computed in O(6) with binomial coefficients.
+
+    Args:
+        counts: Checkers on points 1-6 (point 1 is the closest to off)
+        max_checkers: Maximum number of checkers of the database
+
+    Returns:
+        Index in 0..count_positions(max_checkers) - 1
+    """
+    index = 0
+    remaining = max_checkers
+    points_left = NUM_POINTS
+    for count in counts:
+        points_left -= 1
+        # Positions with a smaller count on this point come first
+        for value in range(count):
+            index += comb(remaining - value + points_left, points_left)
+        remaining -= count
+    return index
+
+
+def pip_count(counts: Sequence[int]) -> int:
+    """
+    Get the pip count of a home-board position.
+
+    Args:
+        counts: Checkers on points 1-6
+
+    Returns:
+        Total pips
+    """
+    return sum((point + 1) * count for point, count in enumerate(counts))
+
+
+def enumerate_positions(max_checkers: int) -> List[Counts]:
+    """
+    List every home-board position in increasing pip order.
+
+    Children of a position always have fewer pips, so solving positions in
+    this order guarantees that every child is already solved.
+
+    Args:
+        max_checkers: Maximum number of checkers
+
+    Returns:
+        All positions with up to max_checkers checkers
+    """
+    result: List[Counts] = []
+
+    def fill(prefix: List[int], remaining: int) -> None:
+        if len(prefix) == NUM_POINTS:
+            result.append(tuple(prefix))
+            return
+        for value in range(remaining + 1):
+            prefix.append(value)
+            fill(prefix, remaining - value)
+            prefix.pop()
+
+    fill([], max_checkers)
+    result.sort(key=pip_count)
+    return result
+
+
+def get_home_counts(board, color: str) -> Optional[Counts]:
+    """
+    Get the home-board counts of a color if it is in the bearoff phase.
+
+    Args:
+        board: Board instance
+        color: Color to read
+
+    Returns:
+        Counts on points 1-6 from the color's point of view, or None if the
+        color still has checkers on the bar or outside its home board
+    """
+    cells = board.cells
+    sign = COLOR_SIGN[color]
+    if cells[BAR_SLOT[color]]:
+        return None
+    if sign > 0:
+        if any(value > 0 for value in cells[6:24]):
+            return None
+        return tuple(value if value > 0 else 0 for value in cells[0:6])
+    if any(value < 0 for value in cells[0:18]):
+        return None
+    return tuple(-value if value < 0 else 0 for value in cells[23:17:-1])
+
+
+def single_die_children(counts: Counts, die: int) -> List[Counts]:
+    """
+    List the positions reachable by playing one die in the bearoff phase.
+
+    Args:
+        counts: Checkers on points 1-6
+        die: Die value
+
+    Returns:
+        Distinct resulting positions (the position itself if it is empty)
+    """
+    highest = 0
+    for point in range(NUM_POINTS, 0, -1):
+        if counts[point - 1]:
+            highest = point
+            break
+    if not highest:
+        return [counts]
+
+    children = []
+    for point in range(1, highest + 1):
+        if not counts[point - 1]:
+            continue
+        target = point - die
+        if target < 0 and point != highest:
+            continue
+        child = list(counts)
+        child[point - 1] -= 1
+        if target > 0:
+            child[target - 1] += 1
+        children.append(tuple(child))
+    return children
+
+
+def map_database(
+    path: str, header: struct.Struct, magic: bytes, version: int, kind: str
+) -> Tuple[mmap.mmap, Tuple[int, ...]]:
+    """
+    Memory-map a database file and check its header.
+
+    Args:
+        path: Database file path
+        header: Header layout, starting with the magic and the version
+        magic: Expected magic bytes
+        version: Expected format version
+        kind: Database name used in the error message
+
+    Returns:
+        Read-only map of the file and the header fields after the version
+
+    Raises:
+        ValueError: If the magic or the version do not match
+    """
+    with open(path, "rb") as database_file:
+        data = mmap.mmap(database_file.fileno(), 0, access=mmap.ACCESS_READ)
+    fields = header.unpack_from(data, 0)
+    if fields[0] != magic or fields[1] != version:
+        data.close()
+        raise ValueError(f"{path} is not a {kind} database")
+    return data, fields[2:]
+
+
+class OneSidedBearoffBuilder:
+    """
+    Computes the one-sided bearoff tables.
+
+    Positions are processed in increasing pip order. For each position and
+    die the builder keeps the best continuation after 1-4 moves of that die,
+    so a position is solved with a few table lookups instead of a full
+    search over all plays.
+    """
+
+    def __init__(self, max_checkers: int = 15) -> None:
+        """
+        Initialize the builder.
+
+        Args:
+            max_checkers: Maximum number of checkers (1-15)
+
+        Raises:
+            ValueError: If max_checkers is out of range
+        """
+        if not 1 <= max_checkers <= 15:
+            raise ValueError(f"max_checkers must be 1-15, got {max_checkers}")
+        self.max_checkers = max_checkers
+        self.expected: Dict[Counts, float] = {}
+        self.distributions: Dict[Counts, List[float]] = {}
+        # best[(counts, die, moves)] -> best position after `moves` moves of `die`
+        self._best: Dict[Tuple[Counts, int, int], Counts] = {}
+
+    def build(self) -> None:
+        """Compute expected rolls and distributions for every position."""
+        for counts in enumerate_positions(self.max_checkers):
+            if not any(counts):
+                self.expected[counts] = 0.0
+                self.distributions[counts] = [1.0] + [0.0] * (MAX_ROLLS - 1)
+                for die in range(1, 7):
+                    for moves in range(1, 5):
+                        self._best[(counts, die, moves)] = counts
+                continue
+            for die in range(1, 7):
+                self._store_best_continuations(counts, die)
+            self._solve(counts)
+
+    def _pick(self, candidates) -> Counts:
+        """Return the candidate with the fewest expected rolls."""
+        expected = self.expected
+        return min(candidates, key=expected.__getitem__)
+
+    def _store_best_continuations(self, counts: Counts, die: int) -> None:
+        """Store the best position after 1-4 moves of die from counts."""
+        children = single_die_children(counts, die)
+        best = self._best
+        best[(counts, die, 1)] = self._pick(children)
+        for moves in range(2, 5):
+            best[(counts, die, moves)] = self._pick(
+                best[(child, die, moves - 1)] for child in children
+            )
+
+    def _solve(self, counts: Counts) -> None:
+        """Compute the distribution of rolls-to-finish for a position."""
+        best = self._best
+        weights: Dict[Counts, float] = {}
+        for die1, die2, probability in ROLLS:
+            if die1 == die2:
+                result = best[(counts, die1, 4)]
+            else:
+                first = [
+                    best[(child, die2, 1)]
+                    for child in single_die_children(counts, die1)
+                ]
+                second = [
+                    best[(child, die1, 1)]
+                    for child in single_die_children(counts, die2)
+                ]
+                result = self._pick(first + second)
+            weights[result] = weights.get(result, 0.0) + probability
+
+        distribution = [0.0] * MAX_ROLLS
+        for child, weight in weights.items():
+            child_distribution = self.distributions[child]
+            for rolls in range(MAX_ROLLS - 1):
+                distribution[rolls + 1] += weight * child_distribution[rolls]
+            distribution[MAX_ROLLS - 1] += weight * child_distribution[MAX_ROLLS - 1]
+        self.distributions[counts] = distribution
+        self.expected[counts] = sum(n * p for n, p in enumerate(distribution))
+
+    def write(self, path: str) -> None:
+        """
+        Write the database file.
+
+        Args:
+            path: Output file path
+        """
+        total = count_positions(self.max_checkers)
+        expected = [0.0] * total
+        distributions = [[0] * MAX_ROLLS for _ in range(total)]
+        for counts, value in self.expected.items():
+            index = position_index(counts, self.max_checkers)
+            expected[index] = value
+            distributions[index] = [
+                round(p * DIST_SCALE) for p in self.distributions[counts]
+            ]
+
+        with open(path, "wb") as output:
+            output.write(HEADER.pack(MAGIC, VERSION, self.max_checkers, total))
+            output.write(struct.pack(f"<{total}f", *expected))
+            for distribution in distributions:
+                output.write(struct.pack(f"<{MAX_ROLLS}H", *distribution))
+
+
+class OneSidedBearoffDatabase:
+    """
+    Read-only, memory-mapped one-sided bearoff database.
+
+    Attributes:
+        path: Database file path
+        max_checkers: Maximum number of checkers covered
+        positions: Number of positions stored
+    """
+
+    _DISTRIBUTION = struct.Struct(f"<{MAX_ROLLS}H")
+    _FLOAT = struct.Struct("<f")
+
+    def __init__(self, path: str) -> None:
+        """
+        Open and memory-map a database file.
+
+        Args:
+            path: Database file path
+
+        Raises:
+            ValueError: If the file is not a bearoff database
+        """
+        self.path = path
+        self._map, (max_checkers, positions) = map_database(
+            path, HEADER, MAGIC, VERSION, "one-sided bearoff"
+        )
+        self.max_checkers = max_checkers
+        self.positions = positions
+        self._expected_offset = HEADER.size
+        self._distribution_offset = HEADER.size + 4 * positions
+
+    def _index(self, counts: Sequence[int]) -> int:
+        """Validate counts and return their index."""
+        if len(counts) != NUM_POINTS or sum(counts) > self.max_checkers:
+            raise ValueError(f"Position {tuple(counts)} is not in the database")
+        return position_index(counts, self.max_checkers)
+
+    def expected_rolls(self, counts: Sequence[int]) -> float:
+        """
+        Get the expected number of rolls to bear off a position.
+
+        Args:
+            counts: Checkers on points 1-6
+
+        Returns:
+            Expected rolls
+
+        Raises:
+            ValueError: If the position is not covered
+        """
+        offset = self._expected_offset + 4 * self._index(counts)
+        return self._FLOAT.unpack_from(self._map, offset)[0]
+
+    def distribution(self, counts: Sequence[int]) -> List[float]:
+        """
+        Get the distribution of the number of rolls to bear off a position.
+
+        Args:
+            counts: Checkers on points 1-6
+
+        Returns:
+            List where item n is the probability of finishing in exactly n rolls
+
+        Raises:
+            ValueError: If the position is not covered
+        """
+        offset = self._distribution_offset + self._DISTRIBUTION.size * self._index(
+            counts
+        )
+        raw = self._DISTRIBUTION.unpack_from(self._map, offset)
+        return [value / DIST_SCALE for value in raw]
+
+    def lookup_board(self, board, color: str) -> Optional[float]:
+        """
+        Get the expected rolls for a color on a board, if it is covered.
+
+        Args:
+            board: Board instance
+            color: Color to evaluate
+
+        Returns:
+            Expected rolls, or None if the color is not in the bearoff phase
+            or has more checkers than the database covers
+        """
+        counts = get_home_counts(board, color)
+        if counts is None or sum(counts) > self.max_checkers:
+            return None
+        return self.expected_rolls(counts)
+
+    def close(self) -> None:
+        """Close the memory map."""
+        self._map.close()
+
+    def __enter__(self) -> "OneSidedBearoffDatabase":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+def build_database(path: str, max_checkers: int = 15) -> None:
+    """
+    Build a one-sided bearoff database and write it to a file.
+
+    Args:
+        path: Output file path
+        max_checkers: Maximum number of checkers (1-15)
+    """
+    builder = OneSidedBearoffBuilder(max_checkers)
+    builder.build()
+    builder.write(path)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Command line entry point to build the database.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Build a one-sided bearoff database")
+    parser.add_argument("--checkers", type=int, default=15, help="max checkers (1-15)")
+    parser.add_argument("--output", default="bearoff1.db", help="output file")
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    build_database(args.output, args.checkers)
+    elapsed = time.perf_counter() - start_time
+    print(
+        f"Wrote {count_positions(args.checkers)} positions to {args.output} "
+        f"in {elapsed:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
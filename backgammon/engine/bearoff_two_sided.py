@@ -0,0 +1,377 @@
+"""
+Two-sided exact bearoff database for Backgammon.
+
+For every pair of home-board positions with up to N checkers per side (6 by
+default) the database stores the exact cubeless probability that the side
+on roll wins the race, assuming both sides play to maximize it.
+
+Pairs are solved in increasing total pip order: the value of a pair only
+depends on pairs with fewer pips, so all pairs with the same total are
+independent and are split over a process pool that shares the table through
+``multiprocessing.shared_memory``. The result is written as one ``uint16``
+per pair and read back through ``mmap``.
+
+Usage:
+    python -m backgammon.engine.bearoff_two_sided --checkers 6 --workers 0
+"""
+
+import argparse
+import os
+import struct
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Sequence, Tuple
+
+from backgammon.engine.bearoff import (
+    NUM_POINTS,
+    ROLLS,
+    count_positions,
+    enumerate_positions,
+    get_home_counts,
+    map_database,
+    pip_count,
+    position_index,
+    single_die_children,
+)
+
+MAGIC = b"BGB2"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")  # magic, version, max checkers, positions
+PROB_SCALE = 65535
+
+Counts = Tuple[int, ...]
+# Per position: one (probability, resulting position indices) item per roll
+RollPlays = List[Tuple[float, List[int]]]
+
+
+def get_play_results(counts: Counts, die1: int, die2: int) -> List[Counts]:
+    """
+    List the distinct positions reachable with a full roll in the bearoff phase.
+
+    In the bearoff phase every die can always be played until no checker is
+    left, so the results are simply all combinations of single-die moves.
+
+    Args:
+        counts: Checkers on points 1-6
+        die1: First die
+        die2: Second die
+
+    Returns:
+        Distinct resulting positions
+    """
+    if die1 == die2:
+        frontier = {counts}
+        for _ in range(4):
+            frontier = {
+                child
+                for position in frontier
+                for child in single_die_children(position, die1)
+            }
+        return sorted(frontier)
+
+    results = set()
+    for first, second in ((die1, die2), (die2, die1)):
+        for middle in single_die_children(counts, first):
+            results.update(single_die_children(middle, second))
+    return sorted(results)
+
+
+class _BuildContext:
+    """Tables shared by the build loop in the parent and in each worker."""
+
+    def __init__(self, max_checkers: int, buffer) -> None:
+        """
+        Prepare positions, plays and level lists for a build.
+
+        Args:
+            max_checkers: Maximum number of checkers per side
+            buffer: Writable buffer with room for positions**2 doubles
+        """
+        self.max_checkers = max_checkers
+        self.size = count_positions(max_checkers)
+        positions = enumerate_positions(max_checkers)
+        self.pips = [0] * self.size
+        self.plays: List[RollPlays] = [[] for _ in range(self.size)]
+        for counts in positions:
+            index = position_index(counts, max_checkers)
+            self.pips[index] = pip_count(counts)
+            if not any(counts):
+                continue
+            self.plays[index] = [
+                (
+                    probability,
+                    [
+                        position_index(result, max_checkers)
+                        for result in get_play_results(counts, die1, die2)
+                    ],
+                )
+                for die1, die2, probability in ROLLS
+            ]
+        self.by_pips: List[List[int]] = [[] for _ in range(max(self.pips) + 1)]
+        for index in sorted(range(self.size), key=lambda i: (self.pips[i], i)):
+            self.by_pips[self.pips[index]].append(index)
+        self.table = memoryview(buffer).cast("B").cast("d")
+
+    def levels(self) -> range:
+        """Total pip counts of the pairs that need solving, in order."""
+        return range(2, 2 * (len(self.by_pips) - 1) + 1)
+
+    def solve_level(self, level: int, part: int = 0, parts: int = 1) -> None:
+        """
+        Solve every part-th pair with the given total pip count.
+
+        Args:
+            level: Total pips of the pairs (on roll + opponent)
+            part: Share of the pairs to solve
+            parts: Number of shares the level is split into
+        """
+        table = self.table
+        size = self.size
+        by_pips = self.by_pips
+        counter = 0
+        # Only totals where the opponent's pips are also in the table
+        for on_roll_pips in range(max(1, level - len(by_pips) + 1), min(level, len(by_pips))):
+            for opponent in by_pips[level - on_roll_pips]:
+                row = table[opponent * size:(opponent + 1) * size]
+                for on_roll in by_pips[on_roll_pips]:
+                    counter += 1
+                    if counter % parts != part:
+                        continue
+                    # The opponent's chances after our best play, weighted by roll
+                    lose = 0.0
+                    for probability, results in self.plays[on_roll]:
+                        lose += probability * min(map(row.__getitem__, results))
+                    table[on_roll * size + opponent] = 1.0 - lose
+
+
+_WORKER_CONTEXT: Optional[_BuildContext] = None
+_WORKER_MEMORY: Optional[shared_memory.SharedMemory] = None
+
+
+def _init_worker(max_checkers: int, memory_name: str) -> None:
+    """Attach a worker process to the shared table."""
+    global _WORKER_CONTEXT, _WORKER_MEMORY  # pylint: disable=global-statement
+    _WORKER_MEMORY = shared_memory.SharedMemory(name=memory_name)
+    _WORKER_CONTEXT = _BuildContext(max_checkers, _WORKER_MEMORY.buf)
+
+
+def _solve_in_worker(level: int, part: int, parts: int) -> None:
+    """Solve a share of a level in a worker process."""
+    _WORKER_CONTEXT.solve_level(level, part, parts)
+
+
+def _initialize_table(context: _BuildContext) -> None:
+    """Fill the pairs where one side has already borne off."""
+    table = context.table
+    size = context.size
+    empty = position_index((0,) * NUM_POINTS, context.max_checkers)
+    for index in range(size):
+        table[index * size + empty] = 0.0
+        table[empty * size + index] = 1.0
+    table[empty * size + empty] = 0.0
+
+
+def build_table(max_checkers: int = 6, workers: Optional[int] = 1) -> array:
+    """
+    Compute the win probability of the side on roll for every pair.
+
+    Args:
+        max_checkers: Maximum number of checkers per side (1-15)
+        workers: Number of processes (1 runs inline, None uses every core)
+
+    Returns:
+        array("d") where item on_roll * positions + opponent is the
+        probability that the side on roll wins
+
+    Raises:
+        ValueError: If max_checkers is out of range
+    """
+    if not 1 <= max_checkers <= 15:
+        raise ValueError(f"max_checkers must be 1-15, got {max_checkers}")
+    size = count_positions(max_checkers)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        table = array("d", bytes(8 * size * size))
+        context = _BuildContext(max_checkers, table)
+        _initialize_table(context)
+        for level in context.levels():
+            context.solve_level(level)
+        context.table.release()
+        return table
+
+    memory = shared_memory.SharedMemory(create=True, size=8 * size * size)
+    try:
+        context = _BuildContext(max_checkers, memory.buf)
+        _initialize_table(context)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(max_checkers, memory.name),
+        ) as executor:
+            for level in context.levels():
+                futures = [
+                    executor.submit(_solve_in_worker, level, part, workers)
+                    for part in range(workers)
+                ]
+                for future in futures:
+                    future.result()
+        table = array("d", context.table.tobytes())
+        context.table.release()
+        return table
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def build_database(
+    path: str, max_checkers: int = 6, workers: Optional[int] = 1
+) -> None:
+    """
+    Build a two-sided bearoff database and write it to a file.
+
+    Args:
+        path: Output file path
+        max_checkers: Maximum number of checkers per side
+        workers: Number of processes (1 runs inline, None uses every core)
+    """
+    table = build_table(max_checkers, workers)
+    size = count_positions(max_checkers)
+    values = array("H", (round(value * PROB_SCALE) for value in table))
+    if sys.byteorder == "big":
+        values.byteswap()
+    with open(path, "wb") as output:
+        output.write(HEADER.pack(MAGIC, VERSION, max_checkers, size))
+        values.tofile(output)
+
+
+class TwoSidedBearoffDatabase:
+    """
+    Read-only, memory-mapped two-sided bearoff database.
+
+    Attributes:
+        path: Database file path
+        max_checkers: Maximum number of checkers per side
+        positions: Number of positions per side
+    """
+
+    _PROBABILITY = struct.Struct("<H")
+
+    def __init__(self, path: str) -> None:
+        """
+        Open and memory-map a database file.
+
+        Args:
+            path: Database file path
+
+        Raises:
+            ValueError: If the file is not a two-sided bearoff database
+        """
+        self.path = path
+        self._map, (max_checkers, positions) = map_database(
+            path, HEADER, MAGIC, VERSION, "two-sided bearoff"
+        )
+        self.max_checkers = max_checkers
+        self.positions = positions
+
+    def pair_index(self, on_roll: Sequence[int], opponent: Sequence[int]) -> int:
+        """
+        Get the compact index of a pair of home-board positions.
+
+        Args:
+            on_roll: Checkers on points 1-6 of the side on roll
+            opponent: Checkers on points 1-6 of the other side
+
+        Returns:
+            Index of the pair in the table
+
+        Raises:
+            ValueError: If either position is not covered
+        """
+        for counts in (on_roll, opponent):
+            if len(counts) != NUM_POINTS or sum(counts) > self.max_checkers:
+                raise ValueError(f"Position {tuple(counts)} is not in the database")
+        return (
+            position_index(on_roll, self.max_checkers) * self.positions
+            + position_index(opponent, self.max_checkers)
+        )
+
+    def win_probability(self, on_roll: Sequence[int], opponent: Sequence[int]) -> float:
+        """
+        Get the probability that the side on roll wins.
+
+        Args:
+            on_roll: Checkers on points 1-6 of the side on roll
+            opponent: Checkers on points 1-6 of the other side
+
+        Returns:
+            Cubeless win probability of the side on roll
+
+        Raises:
+            ValueError: If either position is not covered
+        """
+        offset = HEADER.size + 2 * self.pair_index(on_roll, opponent)
+        return self._PROBABILITY.unpack_from(self._map, offset)[0] / PROB_SCALE
+
+    def lookup_board(self, board, color: str, on_roll: bool = True) -> Optional[float]:
+        """
+        Get the win probability of a color on a board, if it is covered.
+
+        Args:
+            board: Board instance
+            color: Color to evaluate
+            on_roll: Whether color is the side on roll
+
+        Returns:
+            Win probability of color, or None if either side is not in the
+            bearoff phase or has more checkers than the database covers
+        """
+        opponent_color = "black" if color == "white" else "white"
+        own = get_home_counts(board, color)
+        other = get_home_counts(board, opponent_color)
+        if own is None or other is None:
+            return None
+        if sum(own) > self.max_checkers or sum(other) > self.max_checkers:
+            return None
+        if on_roll:
+            return self.win_probability(own, other)
+        return 1.0 - self.win_probability(other, own)
+
+    def close(self) -> None:
+        """Close the memory map."""
+        self._map.close()
+
+    def __enter__(self) -> "TwoSidedBearoffDatabase":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Command line entry point to build the database.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Build a two-sided bearoff database")
+    parser.add_argument("--checkers", type=int, default=6, help="max checkers per side")
+    parser.add_argument("--workers", type=int, default=0, help="processes (0 = all cores)")
+    parser.add_argument("--output", default="bearoff2.db", help="output file")
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    build_database(args.output, args.checkers, args.workers or None)
+    elapsed = time.perf_counter() - start_time
+    size = count_positions(args.checkers)
+    print(f"Wrote {size * size} pairs to {args.output} in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Vectorized batch encoder from Backgammon positions to NumPy feature tensors.
+
+Thousands of positions are turned into one (N, NUM_FEATURES) float32 array
+in a single call. Positions can be Board instances, Board.to_bytes() keys or
+Board.get_state() dictionaries; they are first gathered into one contiguous
+buffer of 28-byte keys and then encoded with whole-array NumPy operations,
+so there is no Python loop over points or checkers.
+
+The feature layout is the 198-input TD-Gammon vector described in
+backgammon.engine.evaluator.
+"""
+
+from typing import Iterable, Optional, Sequence, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+from backgammon.core.board import BAR_SLOT, COLOR_SIGN, NUM_SLOTS, OFF_SLOT, Board
+
+NUM_FEATURES = 198
+# Points 1-24 in the color's own frame, as Board slot indices
+POINT_ORDER = {"white": np.arange(24), "black": np.arange(23, -1, -1)}
+
+Position = Union[Board, bytes, dict]
+
+
+def positions_to_keys(positions: Iterable[Position]) -> bytes:
+    """
+    Gather positions into one contiguous buffer of 28-byte keys.
+
+    Args:
+        positions: Board instances, Board.to_bytes() keys or get_state() dicts
+
+    Returns:
+        Concatenated keys
+
+    Raises:
+        TypeError: If a position has an unsupported type
+    """
+    chunks = []
+    for position in positions:
+        if isinstance(position, (bytes, bytearray)):
+            chunks.append(position)
+        elif isinstance(position, dict):
+            chunks.append(Board.cells_from_state(position).tobytes())
+        elif hasattr(position, "cells"):
+            chunks.append(position.cells.tobytes())
+        else:
+            raise TypeError(f"Cannot encode position of type {type(position).__name__}")
+    return b"".join(chunks)
+
+
+def _unit_view(out: np.ndarray, start: int) -> np.ndarray:
+    """View columns start..start+95 of out as (N, 24, 4) without copying."""
+    itemsize = out.itemsize
+    return as_strided(
+        out[:, start:],
+        shape=(out.shape[0], 24, 4),
+        strides=(out.strides[0], 4 * itemsize, itemsize),
+    )
+
+
+def _encode_points(points: np.ndarray, out: np.ndarray) -> None:
+    """Write the point units of both sides (columns 0..191) from signed counts."""
+    spare = np.empty_like(points)
+    for start, side in ((0, 1), (96, -1)):
+        units = _unit_view(out, start)
+        # Checkers of this side on each point (0 where the other side is)
+        counts = np.multiply(points, side, out=spare)
+        np.maximum(counts, 0, out=counts)
+        np.greater_equal(counts, 1, out=units[:, :, 0])
+        np.greater_equal(counts, 2, out=units[:, :, 1])
+        np.greater_equal(counts, 3, out=units[:, :, 2])
+        np.subtract(counts, 3, out=counts)
+        np.maximum(counts, 0, out=counts)
+        np.multiply(counts, 0.5, out=units[:, :, 3], casting="unsafe")
+
+
+def encode_batch(
+    positions: Sequence[Position],
+    color: str,
+    on_roll: bool = True,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Encode a batch of positions into a feature matrix.
+
+    Args:
+        positions: Board instances, Board.to_bytes() keys or get_state() dicts
+        color: Color whose point of view is encoded
+        on_roll: Whether color is the side to move
+        out: Optional float32 C-contiguous array of shape
+            (len(positions), NUM_FEATURES) to write into
+
+    Returns:
+        float32 array of shape (len(positions), NUM_FEATURES) (out if given)
+
+    Raises:
+        ValueError: If out has the wrong shape, type or layout
+    """
+    keys = positions_to_keys(positions)
+    count = len(keys) // NUM_SLOTS
+    if out is None:
+        out = np.empty((count, NUM_FEATURES), dtype=np.float32)
+    elif (
+        out.shape != (count, NUM_FEATURES)
+        or out.dtype != np.float32
+        or not out.flags.c_contiguous
+    ):
+        raise ValueError(
+            f"out must be a C-contiguous float32 array of shape ({count}, {NUM_FEATURES})"
+        )
+    if not count:
+        return out
+
+    cells = np.frombuffer(keys, dtype=np.int8).reshape(count, NUM_SLOTS)
+    points = cells[:, POINT_ORDER[color]].astype(np.int16)
+    if COLOR_SIGN[color] < 0:
+        np.negative(points, out=points)
+    _encode_points(points, out)
+
+    opponent = "black" if color == "white" else "white"
+    for column, (slot, scale) in enumerate(
+        (
+            (BAR_SLOT[color], 2.0),
+            (OFF_SLOT[color], 15.0),
+            (BAR_SLOT[opponent], 2.0),
+            (OFF_SLOT[opponent], 15.0),
+        )
+    ):
+        np.divide(cells[:, slot], scale, out=out[:, 192 + column], casting="unsafe")
+    out[:, 196] = 1.0 if on_roll else 0.0
+    out[:, 197] = 0.0 if on_roll else 1.0
+    return out
+
+
+class BatchEncoder:  # pylint: disable=too-few-public-methods
+    """
+    Encoder that reuses one preallocated output buffer between calls.
+
+    The returned array is a view into the buffer, so it is overwritten by the
+    next call; copy it if it must be kept.
+
+    Attributes:
+        capacity: Number of rows currently allocated
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        """
+        Initialize the encoder.
+
+        Args:
+            capacity: Initial number of rows (the buffer grows when needed)
+        """
+        self.capacity = capacity
+        self._buffer: Optional[np.ndarray] = None
+
+    def encode(
+        self, positions: Sequence[Position], color: str, on_roll: bool = True
+    ) -> np.ndarray:
+        """
+        Encode a batch of positions into the shared buffer.
+
+        Args:
+            positions: Board instances, Board.to_bytes() keys or get_state() dicts
+            color: Color whose point of view is encoded
+            on_roll: Whether color is the side to move
+
+        Returns:
+            float32 view of shape (len(positions), NUM_FEATURES)
+        """
+        count = len(positions)
+        if self._buffer is None or count > self.capacity:
+            self.capacity = max(self.capacity, count)
+            self._buffer = np.empty((self.capacity, NUM_FEATURES), dtype=np.float32)
+        return encode_batch(positions, color, on_roll, out=self._buffer[:count])
@@ -0,0 +1,287 @@
+"""
+Neural-network position evaluator for Backgammon (TD-Gammon style).
+
+Positions are encoded into the classic 198-input feature vector and scored
+by a small multilayer perceptron written with NumPy. The network outputs the
+probabilities of OUTCOMES[:5] (win, gammon, backgammon, lose gammon, lose
+backgammon) for the evaluated color.
+
+Evaluation is batched: all the candidate positions of one roll are encoded
+into one matrix and scored with one matrix multiply per layer.
+
+Feature vector (198 values, from the point of view of the evaluated color):
+- 96 values for the color's checkers: 4 per point, ordered from its 1 point
+  to its 24 point, encoding n as [n >= 1, n >= 2, n >= 3, (n - 3) / 2]
+- 96 values for the opponent's checkers on the same points
+- Bar / 2 and off / 15 for the color, then for the opponent
+- 2 side-to-move units: [color on roll, opponent on roll]
+"""
+
+import os
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from backgammon.core.move_generator import Play
+from backgammon.engine.encoder import NUM_FEATURES, BatchEncoder, encode_batch
+from backgammon.engine.policies import Policy
+from backgammon.engine.rollout import OUTCOMES
+
+NUM_OUTPUTS = 5
+OUTPUT_NAMES = OUTCOMES[:NUM_OUTPUTS]
+
+
+def encode_positions(
+    positions: Sequence[bytes], color: str, on_roll: bool = True
+) -> np.ndarray:
+    """
+    Encode Board.to_bytes() keys into a feature matrix.
+
+    Args:
+        positions: Position keys (Boards and get_state() dicts also work)
+        color: Color whose point of view is encoded
+        on_roll: Whether color is the side to move
+
+    Returns:
+        float32 array of shape (len(positions), NUM_FEATURES)
+    """
+    return encode_batch(positions, color, on_roll)
+
+
+def encode_board(board, color: str, on_roll: bool = True) -> np.ndarray:
+    """
+    Encode one board into a feature vector.
+
+    Args:
+        board: Board instance
+        color: Color whose point of view is encoded
+        on_roll: Whether color is the side to move
+
+    Returns:
+        float32 array of shape (NUM_FEATURES,)
+    """
+    return encode_batch([board], color, on_roll)[0]
+
+
+def _sigmoid(values: np.ndarray) -> np.ndarray:
+    """Logistic function, computed in place."""
+    np.negative(values, out=values)
+    np.exp(values, out=values)
+    values += 1.0
+    np.reciprocal(values, out=values)
+    return values
+
+
+class NeuralEvaluator:
+    """
+    Multilayer perceptron with sigmoid units.
+
+    Attributes:
+        weights: Weight matrices, weights[i] has shape (inputs, outputs)
+        biases: Bias vectors, one per layer
+        encoder: BatchEncoder reused between evaluations
+    """
+
+    def __init__(self, weights: Sequence[np.ndarray], biases: Sequence[np.ndarray]):
+        """
+        Initialize the evaluator.
+
+        Args:
+            weights: Weight matrices, first of shape (NUM_FEATURES, hidden)
+                and last of shape (hidden, NUM_OUTPUTS)
+            biases: Bias vectors, one per weight matrix
+
+        Raises:
+            ValueError: If the layer shapes do not chain
+        """
+        if not weights or len(weights) != len(biases):
+            raise ValueError("Need one bias vector per weight matrix")
+        inputs = NUM_FEATURES
+        for weight, bias in zip(weights, biases):
+            if weight.shape[0] != inputs or bias.shape != (weight.shape[1],):
+                raise ValueError(
+                    f"Layer shape {weight.shape} / {bias.shape} does not fit "
+                    f"{inputs} inputs"
+                )
+            inputs = weight.shape[1]
+        if inputs != NUM_OUTPUTS:
+            raise ValueError(f"Last layer must have {NUM_OUTPUTS} outputs, got {inputs}")
+        self.weights = [np.asarray(weight, dtype=np.float32) for weight in weights]
+        self.biases = [np.asarray(bias, dtype=np.float32) for bias in biases]
+        self.encoder = BatchEncoder()
+
+    @classmethod
+    def random(cls, hidden: Sequence[int] = (80,), seed: int = 0) -> "NeuralEvaluator":
+        """
+        Create an untrained network with small random weights.
+
+        Args:
+            hidden: Sizes of the hidden layers
+            seed: Seed for the weights
+
+        Returns:
+            NeuralEvaluator instance
+        """
+        rng = np.random.default_rng(seed)
+        sizes = [NUM_FEATURES, *hidden, NUM_OUTPUTS]
+        weights = [
+            rng.normal(0.0, 1.0 / np.sqrt(n_in), (n_in, n_out)).astype(np.float32)
+            for n_in, n_out in zip(sizes[:-1], sizes[1:])
+        ]
+        biases = [np.zeros(n_out, dtype=np.float32) for n_out in sizes[1:]]
+        return cls(weights, biases)
+
+    @classmethod
+    def load(cls, directory: str) -> "NeuralEvaluator":
+        """
+        Load weights saved as w0.npy, b0.npy, w1.npy, b1.npy, ...
+
+        Args:
+            directory: Directory with the .npy files
+
+        Returns:
+            NeuralEvaluator instance
+
+        Raises:
+            FileNotFoundError: If the directory has no w0.npy
+        """
+        weights: List[np.ndarray] = []
+        biases: List[np.ndarray] = []
+        layer = 0
+        while os.path.exists(os.path.join(directory, f"w{layer}.npy")):
+            weights.append(np.load(os.path.join(directory, f"w{layer}.npy")))
+            biases.append(np.load(os.path.join(directory, f"b{layer}.npy")))
+            layer += 1
+        if not weights:
+            raise FileNotFoundError(f"No w0.npy in {directory}")
+        return cls(weights, biases)
+
+    def save(self, directory: str) -> None:
+        """
+        Save the weights as w0.npy, b0.npy, w1.npy, b1.npy, ...
+
+        Args:
+            directory: Target directory (created if missing)
+        """
+        os.makedirs(directory, exist_ok=True)
+        for layer, (weight, bias) in enumerate(zip(self.weights, self.biases)):
+            np.save(os.path.join(directory, f"w{layer}.npy"), weight)
+            np.save(os.path.join(directory, f"b{layer}.npy"), bias)
+
+    def forward(self, features: np.ndarray) -> np.ndarray:
+        """
+        Run the network on a batch of feature vectors.
+
+        Outputs are made consistent: gammons never exceed wins and
+        backgammons never exceed gammons, on both sides.
+
+        Args:
+            features: Array of shape (N, NUM_FEATURES)
+
+        Returns:
+            float32 array of shape (N, NUM_OUTPUTS) in OUTPUT_NAMES order
+        """
+        values = features
+        for weight, bias in zip(self.weights, self.biases):
+            values = values @ weight
+            values += bias
+            _sigmoid(values)
+        win = values[:, 0]
+        np.minimum(values[:, 1], win, out=values[:, 1])
+        np.minimum(values[:, 2], values[:, 1], out=values[:, 2])
+        np.minimum(values[:, 3], 1.0 - win, out=values[:, 3])
+        np.minimum(values[:, 4], values[:, 3], out=values[:, 4])
+        return values
+
+    def evaluate_positions(
+        self, positions: Sequence[bytes], color: str, on_roll: bool = True
+    ) -> np.ndarray:
+        """
+        Evaluate a batch of positions for a color.
+
+        Args:
+            positions: Board.to_bytes() keys, Boards or get_state() dicts
+            color: Color to evaluate for
+            on_roll: Whether color is the side to move in those positions
+
+        Returns:
+            Array of shape (N, NUM_OUTPUTS)
+        """
+        return self.forward(self.encoder.encode(positions, color, on_roll))
+
+    def evaluate(self, board, color: str, on_roll: bool = True) -> dict:
+        """
+        Evaluate one board for a color.
+
+        Args:
+            board: Board instance
+            color: Color to evaluate for
+            on_roll: Whether color is the side to move
+
+        Returns:
+            Dictionary with the OUTPUT_NAMES probabilities and "equity"
+        """
+        outputs = self.evaluate_positions([board], color, on_roll)
+        result = dict(zip(OUTPUT_NAMES, outputs[0].tolist()))
+        result["equity"] = float(get_equities(outputs)[0])
+        return result
+
+    def evaluate_plays(self, plays: Sequence[Play], color: str) -> np.ndarray:
+        """
+        Get the cubeless equity of each play for the color that makes it.
+
+        All resulting positions are scored in one batch with the opponent
+        on roll.
+
+        Args:
+            plays: Legal plays from MoveGenerator
+            color: Color making the plays
+
+        Returns:
+            Array of shape (N,) with one equity per play
+        """
+        positions = [play[1] for play in plays]
+        return get_equities(self.evaluate_positions(positions, color, on_roll=False))
+
+
+def get_equities(outputs: np.ndarray) -> np.ndarray:
+    """
+    Convert network outputs to cubeless equities.
+
+    Args:
+        outputs: Array of shape (N, NUM_OUTPUTS)
+
+    Returns:
+        Array of shape (N,): 2 * win - 1 + gammon - lose_gammon
+        + backgammon - lose_backgammon
+    """
+    return (
+        2.0 * outputs[:, 0]
+        - 1.0
+        + outputs[:, 1]
+        - outputs[:, 3]
+        + outputs[:, 2]
+        - outputs[:, 4]
+    )
+
+
+class NeuralPolicy(Policy):  # pylint: disable=too-few-public-methods
+    """Picks the play with the highest network equity."""
+
+    name = "neural"
+
+    def __init__(self, evaluator: Optional[NeuralEvaluator] = None) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            evaluator: Network to use (an untrained random one if omitted)
+        """
+        self.evaluator = evaluator or NeuralEvaluator.random()
+
+    def choose_play(self, game, plays: Sequence[Play], rng) -> Play:
+        """Choose the play with the highest equity, scored in one batch."""
+        if len(plays) == 1:
+            return plays[0]
+        color = game.get_current_player().color
+        return plays[int(np.argmax(self.evaluator.evaluate_plays(plays, color)))]
@@ -0,0 +1,320 @@
+"""
+Perft module for Backgammon game.
+
+Enumerates the move tree from a position to a fixed depth in plies, where
+every ply is one player's roll and complete play. Each ply branches over the
+21 distinct rolls (or over a given roll), and every roll over the distinct
+positions its legal plays reach. The counts are a regression oracle for the
+move generation rules (bar entry, blocked points, must-use-max-dice, larger
+die and bear-off with a higher die) and the run time is a throughput
+benchmark for Board move generation.
+
+Counts (as in chess perft, rolls are not weighted by probability):
+- leaves: Tree nodes at the final depth (one per roll and distinct play)
+- sequences: Ordered legal move sequences played on the last ply; plays
+  that reach the same position in a different order count separately
+- unique: Distinct positions at the final depth
+- finished: Games that ended before the final depth (not expanded)
+- nodes: Every position generated, all depths included
+
+Command line::
+
+    python -m backgammon.engine.perft --depth 2 --expect 202782
+    python -m backgammon.engine.perft --depth 3 --dice 3-1 6-6
+    python -m backgammon.engine.perft --position-id 4HPwATDgc/ABMA --depth 1 --check
+"""
+
+import argparse
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
+
+from backgammon.core import Board, MoveGenerator
+
+Move = Tuple[Union[int, str], Union[int, str]]
+Roll = Tuple[int, int]
+
+# The 21 distinct rolls, doubles included, larger die first
+ALL_ROLLS: Tuple[Roll, ...] = tuple(
+    (high, low) for high in range(1, 7) for low in range(1, high + 1)
+)
+OPPONENT = {"white": "black", "black": "white"}
+
+
+class PerftResult(NamedTuple):
+    """
+    Counts of one move tree enumeration.
+
+    Attributes:
+        depth: Depth in plies
+        leaves: Tree nodes at the final depth
+        sequences: Ordered legal move sequences played on the last ply
+        unique: Distinct positions at the final depth
+        finished: Games that ended before the final depth
+        nodes: Positions generated at every depth
+        elapsed: Wall time in seconds
+    """
+
+    depth: int
+    leaves: int
+    sequences: int
+    unique: int
+    finished: int
+    nodes: int
+    elapsed: float
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Generated positions per second."""
+        return self.nodes / self.elapsed if self.elapsed else 0.0
+
+
+def parse_roll(text: str) -> Roll:
+    """
+    Parse a roll written as "3-1" (or "31").
+
+    Args:
+        text: Roll text
+
+    Returns:
+        Roll tuple with the larger die first
+
+    Raises:
+        ValueError: If the text is not a roll of two dice from 1 to 6
+    """
+    digits = text.replace("-", "")
+    if len(digits) != 2 or not all(digit in "123456" for digit in digits):
+        raise ValueError(f"Invalid roll: {text!r}")
+    first, second = int(digits[0]), int(digits[1])
+    return max(first, second), min(first, second)
+
+
+def roll_values(roll: Roll) -> List[int]:
+    """
+    Get the dice values a roll can play.
+
+    Args:
+        roll: Roll tuple
+
+    Returns:
+        Four values for a double, the two dice otherwise
+    """
+    return [roll[0]] * 4 if roll[0] == roll[1] else list(roll)
+
+
+def get_move_sequences(
+    board: Board, color: str, dice: Sequence[int]
+) -> Dict[Tuple[Move, ...], bytes]:
+    """
+    List every legal ordered move sequence for a roll using the board rules.
+
+    Moves are generated with Board.get_possible_moves one die at a time and
+    made and unmade in place, then the must-use-max-dice and larger-die rules
+    are applied.
+
+    Args:
+        board: Board with the position (restored before returning)
+        color: Color of the player to move
+        dice: Dice values (two, or four for a double)
+
+    Returns:
+        Resulting Board.to_bytes() position by move sequence (in make_move
+        notation); a single empty sequence when nothing can be played
+    """
+    if len(set(dice)) == 1:
+        orders = [tuple(dice)]
+    else:
+        orders = [tuple(dice), tuple(reversed(dice))]
+    # Complete sequences by number of moves: sequence -> (position, dice used)
+    found: List[Dict[Tuple[Move, ...], Tuple[bytes, Set[int]]]] = [
+        {} for _ in range(len(dice) + 1)
+    ]
+    moves: List[Move] = []
+
+    def expand(order: Tuple[int, ...], depth: int) -> None:
+        options = ()
+        if depth < len(order):
+            options = board.get_possible_moves(color, [order[depth]])
+        if not options:
+            sequence = tuple(moves)
+            if sequence in found[depth]:
+                found[depth][sequence][1].add(order[0])
+            else:
+                found[depth][sequence] = (board.to_bytes(), {order[0]})
+            return
+        for from_pos, to_pos in options:
+            delta = board.make_move(
+                from_pos if from_pos == "bar" else from_pos - 1,
+                to_pos if to_pos == "off" else to_pos - 1,
+                color,
+            )
+            moves.append((from_pos, to_pos))
+            expand(order, depth + 1)
+            moves.pop()
+            board.unmake_move(delta)
+
+    for order in orders:
+        expand(order, 0)
+
+    plays = found[max(count for count, sequences in enumerate(found) if sequences)]
+    # Only one die of a non-double can be played: the larger one is mandatory
+    if len(orders) == 2 and all(len(sequence) == 1 for sequence in plays):
+        larger = max(dice)
+        with_larger = {
+            sequence: entry for sequence, entry in plays.items() if larger in entry[1]
+        }
+        plays = with_larger or plays
+    return {sequence: position for sequence, (position, _) in plays.items()}
+
+
+def perft(
+    board: Board,
+    color: str,
+    depth: int,
+    rolls: Sequence[Roll] = (),
+    check: bool = False,
+) -> PerftResult:
+    """
+    Enumerate the move tree from a position.
+
+    Args:
+        board: Board with the starting position (copied, not modified)
+        color: Color of the player to move first
+        depth: Number of plies to enumerate
+        rolls: Rolls of the first plies (the remaining plies use all 21)
+        check: Compare every node with MoveGenerator and fail on a difference
+
+    Returns:
+        PerftResult with the counts and the time taken
+
+    Raises:
+        ValueError: If depth is negative or a roll is not valid
+        RuntimeError: If check is set and the two move generators disagree
+    """
+    if depth < 0:
+        raise ValueError("Depth must not be negative")
+    for roll in rolls:
+        if roll not in ALL_ROLLS:
+            raise ValueError(f"Invalid roll: {roll}")
+    board = board.copy()
+    generator = MoveGenerator()
+    leaves = sequences = finished = nodes = 0
+    unique: Set[bytes] = set()
+
+    def walk(color: str, ply: int) -> None:
+        nonlocal leaves, sequences, finished, nodes
+        nodes += 1
+        if ply == depth:
+            leaves += 1
+            unique.add(board.to_bytes())
+            return
+        if board.get_off_count("white") == 15 or board.get_off_count("black") == 15:
+            finished += 1
+            return
+        for roll in (rolls[ply],) if ply < len(rolls) else ALL_ROLLS:
+            dice = roll_values(roll)
+            plays = get_move_sequences(board, color, dice)
+            if ply == depth - 1:
+                sequences += len(plays)
+            children = {}
+            for sequence, position in plays.items():
+                children.setdefault(position, sequence)
+            if check:
+                expected = {
+                    position
+                    for _, position in generator.get_legal_plays(board, color, dice)
+                }
+                if expected != set(children):
+                    raise RuntimeError(
+                        f"Move generators disagree for {color} {roll[0]}-{roll[1]} in "
+                        f"position {board.get_position_id(color)}"
+                    )
+            for sequence in children.values():
+                deltas = [
+                    board.make_move(
+                        from_pos if from_pos == "bar" else from_pos - 1,
+                        to_pos if to_pos == "off" else to_pos - 1,
+                        color,
+                    )
+                    for from_pos, to_pos in sequence
+                ]
+                walk(OPPONENT[color], ply + 1)
+                for delta in reversed(deltas):
+                    board.unmake_move(delta)
+
+    start = time.perf_counter()
+    walk(color, 0)
+    elapsed = time.perf_counter() - start
+    return PerftResult(depth, leaves, sequences, len(unique), finished, nodes, elapsed)
+
+
+def format_result(result: PerftResult) -> str:
+    """
+    Format a perft result for the command line.
+
+    Args:
+        result: PerftResult to format
+
+    Returns:
+        Multi-line summary
+    """
+    return "\n".join(
+        [
+            f"depth: {result.depth}",
+            f"leaves: {result.leaves}",
+            f"sequences: {result.sequences}",
+            f"unique: {result.unique}",
+            f"finished: {result.finished}",
+            f"nodes: {result.nodes}",
+            f"time: {result.elapsed:.3f} s",
+            f"nodes/s: {result.nodes_per_second:.0f}",
+        ]
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point for perft.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+
+    Returns:
+        Exit status: 1 if the leaf count differs from --expect, else 0
+    """
+    parser = argparse.ArgumentParser(description="Backgammon move tree enumeration")
+    parser.add_argument("--depth", type=int, default=1, help="plies to enumerate")
+    parser.add_argument(
+        "--position-id", help="GNU Backgammon position ID (initial position if omitted)"
+    )
+    parser.add_argument(
+        "--color", default="white", choices=sorted(OPPONENT), help="side to move first"
+    )
+    parser.add_argument(
+        "--dice", nargs="*", default=[], metavar="ROLL",
+        help="rolls of the first plies, e.g. 3-1 6-6",
+    )
+    parser.add_argument("--expect", type=int, help="expected number of leaves")
+    parser.add_argument(
+        "--check", action="store_true", help="cross-check every node against MoveGenerator"
+    )
+    args = parser.parse_args(argv)
+
+    if args.position_id:
+        board = Board.from_position_id(args.position_id, args.color)
+    else:
+        board = Board()
+        board.setup_initial_position()
+    try:
+        rolls = [parse_roll(text) for text in args.dice]
+        result = perft(board, args.color, args.depth, rolls, args.check)
+    except ValueError as error:
+        parser.error(str(error))
+    print(format_result(result))
+    if args.expect is not None and result.leaves != args.expect:
+        print(f"MISMATCH: expected {args.expect} leaves, got {result.leaves}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,186 @@
+"""
+Move-selection policies for headless play.
+
+A policy receives the game, the list of legal plays produced by
+BackgammonGame.get_legal_plays() and a random generator, and returns the
+play to make. Policies keep no state between calls, so the same instance
+can be shared by several games and sent to worker processes.
+"""
+
+import importlib
+from array import array
+from typing import List, Optional, Sequence
+
+from backgammon.core.board import BAR_SLOT, COLOR_SIGN
+from backgammon.core.move_generator import Play
+
+
+class Policy:
+    """Base class for move-selection policies."""
+
+    name = "policy"
+
+    def choose_play(self, game, plays: Sequence[Play], rng) -> Play:
+        """
+        Choose one of the legal plays.
+
+        Args:
+            game: BackgammonGame in the position before the play
+            plays: Legal plays, never empty
+            rng: random.Random instance owned by the caller
+
+        Returns:
+            The selected play
+        """
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        """Repr representation of the policy."""
+        return f"{type(self).__name__}()"
+
+
+class RandomPolicy(Policy):  # pylint: disable=too-few-public-methods
+    """Picks a uniformly random legal play."""
+
+    name = "random"
+
+    def choose_play(self, game, plays: Sequence[Play], rng) -> Play:
+        """Choose a random play."""
+        return plays[rng.randrange(len(plays))]
+
+
+class FirstPlayPolicy(Policy):  # pylint: disable=too-few-public-methods
+    """Always picks the first legal play (deterministic, fastest)."""
+
+    name = "first"
+
+    def choose_play(self, game, plays: Sequence[Play], rng) -> Play:
+        """Choose the first play."""
+        return plays[0]
+
+
+class GreedyPolicy(Policy):
+    """
+    Picks the play whose resulting position scores best on a simple heuristic.
+
+    The score rewards the pip-count lead, hitting, made points and penalizes
+    own blots. It is cheap enough for high-throughput self-play.
+    """
+
+    name = "greedy"
+
+    def choose_play(self, game, plays: Sequence[Play], rng) -> Play:
+        """Choose the play with the highest heuristic score."""
+        color = game.get_current_player().color
+        best_play = plays[0]
+        best_score = None
+        for play in plays:
+            score = self.score_position(play[1], color)
+            if best_score is None or score > best_score:
+                best_play, best_score = play, score
+        return best_play
+
+    @staticmethod
+    def score_position(position: bytes, color: str) -> float:
+        """
+        Score a position from the point of view of a color.
+
+        Args:
+            position: Board.to_bytes() key
+            color: Color to evaluate for
+
+        Returns:
+            Heuristic score (higher is better for color)
+        """
+        cells: List[int] = array("b", position).tolist()
+        sign = COLOR_SIGN[color]
+        opponent = "black" if color == "white" else "white"
+        own_pips = 25 * cells[BAR_SLOT[color]]
+        opp_pips = 25 * cells[BAR_SLOT[opponent]]
+        blots = 0
+        points_made = 0
+        for index in range(24):
+            value = cells[index] * sign
+            distance = index + 1 if sign > 0 else 24 - index
+            if value > 0:
+                own_pips += value * distance
+                if value == 1:
+                    blots += 1
+                else:
+                    points_made += 1
+            elif value < 0:
+                opp_pips -= value * (25 - distance)
+        return (
+            (opp_pips - own_pips)
+            + 6 * cells[BAR_SLOT[opponent]]
+            + 2 * points_made
+            - 3 * blots
+        )
+
+
+POLICIES = {
+    RandomPolicy.name: RandomPolicy,
+    FirstPlayPolicy.name: FirstPlayPolicy,
+    GreedyPolicy.name: GreedyPolicy,
+}
+
+
+# Modules of the search and network policies. They import this module, so
+# make_policy() loads them by name when first needed
+ENGINE_POLICIES = {
+    "expectimax": "backgammon.engine.search",
+    "neural": "backgammon.engine.evaluator",
+}
+POLICY_NAMES = tuple(POLICIES) + tuple(ENGINE_POLICIES)
+
+
+def get_policy(name: str) -> Policy:
+    """
+    Create a registered policy by name.
+
+    Args:
+        name: Policy name ("random", "first", "greedy"); see make_policy()
+            for the search and network policies
+
+    Returns:
+        New policy instance
+
+    Raises:
+        ValueError: If the name is not registered
+    """
+    if name not in POLICIES:
+        raise ValueError(f"Unknown policy: {name}. Must be one of {sorted(POLICIES)}")
+    return POLICIES[name]()
+
+
+def make_policy(
+    name: str, max_depth: int = 1, time_budget: Optional[float] = 0.5
+) -> Policy:
+    """
+    Create any policy by name: a registered one, "expectimax" or "neural".
+
+    Args:
+        name: Policy name (one of POLICY_NAMES)
+        max_depth: Search depth of the expectimax policy (1-3)
+        time_budget: Seconds per move of the expectimax policy, or None
+            for no limit (reproducible plays)
+
+    Returns:
+        New policy instance ("neural" uses an untrained network)
+
+    Raises:
+        ValueError: If the name is unknown, or "neural" without NumPy
+    """
+    if name in ENGINE_POLICIES:
+        try:
+            module = importlib.import_module(ENGINE_POLICIES[name])
+        except ImportError as error:
+            raise ValueError(f"The {name} policy is not available ({error})") from error
+        if name == "expectimax":
+            return module.ExpectimaxPolicy(
+                module.ExpectimaxSearch(max_depth=max_depth, time_budget=time_budget)
+            )
+        return module.NeuralPolicy()
+    if name not in POLICIES:
+        raise ValueError(f"Unknown policy: {name}. Must be one of {sorted(POLICY_NAMES)}")
+    return POLICIES[name]()
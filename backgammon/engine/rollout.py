@@ -0,0 +1,255 @@
+"""
+Monte Carlo rollout evaluator for Backgammon positions.
+
+A rollout plays a position to the end many times with a policy and averages
+the outcomes. Trials can be spread over a process pool and use two variance
+reduction techniques:
+- First-roll rotation: trial i starts with roll i mod 36, so every block of
+  36 trials covers each first roll exactly once.
+- Quasi-random dice: the next rolls are stratified from the trial index
+  instead of drawn at random. The roll of turn d is the trial's rotated
+  first roll shifted by a turn-specific step times the block number (i // 36),
+  mapped through a seeded permutation per turn. The steps are coprime with
+  36, so every block of 36 trials covers each roll of every turn once, and
+  every 1296 trials cover each pair of first roll and later roll once.
+
+Every trial has its own dice stream derived from the seed and trial index,
+so results do not depend on the number of workers.
+"""
+
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from backgammon.core.board import Board
+from backgammon.core.dice import Dice
+from backgammon.engine.policies import Policy, RandomPolicy
+from backgammon.engine.simulator import SelfPlaySimulator, game_rng
+
+# The 36 ordered outcomes of two dice
+ALL_ROLLS: List[Tuple[int, int]] = [(a, b) for a in range(1, 7) for b in range(1, 7)]
+
+# Block steps of the stratified turns: the numbers below 36 coprime with it
+STRATA_STEPS = (1, 5, 7, 11, 13, 17, 19, 23, 25, 29, 31, 35)
+
+OUTCOMES = ("win", "gammon", "backgammon", "lose_gammon", "lose_backgammon", "equity")
+
+
+class ScriptedDice(Dice):
+    """Dice that return a fixed list of rolls first and random rolls afterwards."""
+
+    def __init__(self, rng, script: Sequence[Tuple[int, int]] = ()) -> None:
+        """
+        Initialize the dice.
+
+        Args:
+            rng: random.Random used once the script is exhausted
+            script: Rolls to return first, in order
+        """
+        super().__init__(rng)
+        self.script = list(script)
+
+    def roll(self):
+        """Roll the next scripted roll, or a random roll when none is left."""
+        if not self.script:
+            return super().roll()
+        self.last_roll = list(self.script.pop(0))
+        self.values = self.get_moves(self.last_roll)
+        return self.last_roll
+
+
+class RolloutResult(NamedTuple):
+    """
+    Averaged rollout outcome from the point of view of the side to move.
+
+    Attributes:
+        trials: Number of games played
+        probabilities: Mean of each outcome in OUTCOMES (equity in points)
+        std_errors: Standard error of each mean
+    """
+
+    trials: int
+    probabilities: Dict[str, float]
+    std_errors: Dict[str, float]
+
+    @property
+    def equity(self) -> float:
+        """Cubeless equity (expected points) for the side to move."""
+        return self.probabilities["equity"]
+
+
+class RolloutEvaluator:  # pylint: disable=too-many-instance-attributes
+    """
+    Estimates win, gammon and backgammon probabilities by playing games out.
+
+    Attributes:
+        policy: Policy used by both sides during the rollout
+        trials: Default number of trials
+        seed: Seed for the per-trial dice streams
+        workers: Number of processes (1 runs inline, None uses every core)
+        rotate_first_roll: Rotate the first roll over the 36 outcomes
+        quasi_random: Stratify the following rolls as well
+        quasi_depth: Number of rolls after the first one that are stratified
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        policy: Optional[Policy] = None,
+        trials: int = 1296,
+        seed: int = 0,
+        workers: Optional[int] = 1,
+        rotate_first_roll: bool = True,
+        quasi_random: bool = False,
+        quasi_depth: int = 2,
+    ) -> None:
+        """
+        Initialize the evaluator.
+
+        Args:
+            policy: Policy for both sides (random if omitted)
+            trials: Default number of trials
+            seed: Seed for the per-trial dice streams
+            workers: Number of processes (1 runs inline, None uses every core)
+            rotate_first_roll: Rotate the first roll over the 36 outcomes
+            quasi_random: Stratify the following rolls as well
+            quasi_depth: Number of rolls after the first one that are stratified
+
+        Raises:
+            ValueError: If quasi_random is set without rotate_first_roll (the
+                stratified rolls follow the rotated first roll), or if
+                quasi_depth is negative or above len(STRATA_STEPS)
+        """
+        if quasi_random and not rotate_first_roll:
+            raise ValueError("quasi_random requires rotate_first_roll")
+        if not 0 <= quasi_depth <= len(STRATA_STEPS):
+            raise ValueError(
+                f"quasi_depth must be between 0 and {len(STRATA_STEPS)}, got {quasi_depth}"
+            )
+        self.policy = policy or RandomPolicy()
+        self.trials = trials
+        self.seed = seed
+        self.workers = workers
+        self.rotate_first_roll = rotate_first_roll
+        self.quasi_random = quasi_random
+        self.quasi_depth = quasi_depth
+        permutation_rng = random.Random(seed)
+        self._permutations = [
+            permutation_rng.sample(range(36), 36) for _ in range(quasi_depth)
+        ]
+
+    def rollout(
+        self, board: Board, color: str, trials: Optional[int] = None
+    ) -> RolloutResult:
+        """
+        Roll out a position with the given side to move (before rolling).
+
+        Args:
+            board: Position to evaluate (not modified)
+            color: Color of the player to move
+            trials: Number of games (defaults to self.trials)
+
+        Returns:
+            RolloutResult for the side to move
+        """
+        trials = trials or self.trials
+        workers = self.workers or os.cpu_count() or 1
+        workers = max(1, min(workers, trials))
+        position = board.to_bytes()
+
+        if workers == 1:
+            samples = self.run_trials(position, color, 0, trials)
+        else:
+            bounds = [trials * i // workers for i in range(workers + 1)]
+            samples = []
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        self.run_trials, position, color, bounds[i], bounds[i + 1]
+                    )
+                    for i in range(workers)
+                ]
+                for future in futures:
+                    samples.extend(future.result())
+        return self._summarize(samples)
+
+    def run_trials(
+        self, position: bytes, color: str, start: int, stop: int
+    ) -> List[Tuple[int, ...]]:
+        """
+        Play the trials with indices start..stop-1.
+
+        Args:
+            position: Board.to_bytes() key of the position
+            color: Color of the player to move
+            start: First trial index
+            stop: One past the last trial index
+
+        Returns:
+            One outcome tuple (see OUTCOMES) per trial
+        """
+        board = Board.from_bytes(position)
+        simulator = SelfPlaySimulator(self.policy, self.policy)
+        samples = []
+        for index in range(start, stop):
+            rng = game_rng(self.seed, index)
+            dice = ScriptedDice(rng, self.get_scripted_rolls(index))
+            game = SelfPlaySimulator.game_from_position(board, color, dice)
+            result = simulator.play_out(game, rng)
+            won = result.winner == color
+            samples.append(
+                (
+                    int(won),
+                    int(won and result.points >= 2),
+                    int(won and result.points == 3),
+                    int(not won and result.points >= 2),
+                    int(not won and result.points == 3),
+                    result.points if won else -result.points,
+                )
+            )
+        return samples
+
+    def get_scripted_rolls(self, index: int) -> List[Tuple[int, int]]:
+        """
+        Get the stratified rolls that start a trial.
+
+        Args:
+            index: Trial index
+
+        Returns:
+            Rolls to use before switching to random dice
+        """
+        if not self.rotate_first_roll:
+            return []
+        rolls = [ALL_ROLLS[index % 36]]
+        if self.quasi_random:
+            block = index // 36
+            for step, permutation in zip(STRATA_STEPS, self._permutations):
+                rolls.append(ALL_ROLLS[permutation[(index + step * block) % 36]])
+        return rolls
+
+    @staticmethod
+    def _summarize(samples: Sequence[Tuple[int, ...]]) -> RolloutResult:
+        """
+        Compute means and standard errors of the trial outcomes.
+
+        Args:
+            samples: One outcome tuple per trial
+
+        Returns:
+            RolloutResult
+        """
+        count = len(samples)
+        probabilities = {}
+        std_errors = {}
+        for column, name in enumerate(OUTCOMES):
+            values = [sample[column] for sample in samples]
+            mean = sum(values) / count
+            if count > 1:
+                variance = sum((value - mean) ** 2 for value in values) / (count - 1)
+                std_errors[name] = math.sqrt(variance / count)
+            else:
+                std_errors[name] = 0.0
+            probabilities[name] = mean
+        return RolloutResult(count, probabilities, std_errors)
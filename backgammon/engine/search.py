@@ -0,0 +1,459 @@
+"""
+Expectimax search player for Backgammon.
+
+The search alternates max nodes (a player picks a play for a known roll)
+and chance nodes (the 21 distinct rolls of the next player). Depth is
+counted in plies: 1-ply scores each legal play with the static evaluator,
+2-ply also looks at every reply of the opponent, and 3-ply adds our next
+reply.
+
+Chance nodes are pruned with Star1 (the values of the rolls not searched
+yet are bounded by the evaluator range) and, optionally, Star2 (a first
+pass searches only the best-ordered reply of every roll to get a cheap
+bound). Plays are ordered by their static evaluation so cutoffs come early.
+
+The search runs iterative deepening under a per-move time budget and
+returns the best play of the deepest completed iteration.
+"""
+
+import math
+import random
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from backgammon.core.board import OFF_SLOT, Board
+from backgammon.core.move_cache import MoveCache, make_move_key
+from backgammon.core.move_generator import MoveGenerator, Play
+from backgammon.engine.bearoff import ROLLS
+from backgammon.engine.policies import GreedyPolicy, Policy
+from backgammon.engine.simulator import get_win_points
+
+# Non-doubles first: the rolls with more probability mass tighten the bounds sooner
+ORDERED_ROLLS: List[Tuple[Tuple[int, ...], float]] = sorted(
+    (((a, b) if a != b else (a,) * 4, probability) for a, b, probability in ROLLS),
+    key=lambda item: -item[1],
+)
+
+# Deepest supported search, in plies (a 4-ply search takes minutes per move)
+MAX_DEPTH = 3
+
+
+def other_color(color: str) -> str:
+    """Get the opponent of a color."""
+    return "black" if color == "white" else "white"
+
+
+class HeuristicEvaluator:  # pylint: disable=too-few-public-methods
+    """
+    Bounded static evaluator based on GreedyPolicy.score_position.
+
+    The heuristic score is squashed into a cubeless equity in (-1, 1).
+
+    Attributes:
+        scale: Score that maps to an equity of about 0.76
+        bounds: Lower and upper bounds of any value the search can return
+    """
+
+    bounds = (-3.0, 3.0)
+
+    def __init__(self, scale: float = 25.0) -> None:
+        """
+        Initialize the evaluator.
+
+        Args:
+            scale: Score that maps to an equity of about 0.76
+        """
+        self.scale = scale
+
+    def equities(self, positions: Sequence[bytes], color: str) -> List[float]:
+        """
+        Evaluate positions in which color has just moved.
+
+        Args:
+            positions: Board.to_bytes() keys, with the opponent of color on roll
+            color: Color to evaluate for
+
+        Returns:
+            Cubeless equity of each position for color
+        """
+        score = GreedyPolicy.score_position
+        return [math.tanh(score(position, color) / self.scale) for position in positions]
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget runs out."""
+
+
+class ExpectimaxSearch:  # pylint: disable=too-many-instance-attributes
+    """
+    Iterative-deepening expectimax search with Star1/Star2 pruning.
+
+    Attributes:
+        evaluator: Object with equities(positions, color) and bounds
+        max_depth: Deepest iteration, in plies (1-3)
+        time_budget: Seconds per move, or None for no limit
+        star2: Whether chance nodes do a probing pass first
+        move_cache: LRU cache of legal plays, kept between searches
+        nodes: Number of positions evaluated or expanded in the last search
+        completed_depth: Deepest iteration finished in the last search
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        evaluator=None,
+        max_depth: int = 2,
+        time_budget: Optional[float] = None,
+        star2: bool = True,
+        clock: Callable[[], float] = time.perf_counter,
+        cache_size: int = 16384,
+    ) -> None:
+        """
+        Initialize the search.
+
+        Args:
+            evaluator: Static evaluator (HeuristicEvaluator if omitted)
+            max_depth: Deepest iteration, in plies (1-3)
+            time_budget: Seconds per move, or None for no limit
+            star2: Whether chance nodes do a probing pass first
+            clock: Time source, in seconds
+            cache_size: Maximum number of cached move lists
+
+        Raises:
+            ValueError: If max_depth is not between 1 and MAX_DEPTH
+        """
+        if not 1 <= max_depth <= MAX_DEPTH:
+            raise ValueError(
+                f"max_depth must be between 1 and {MAX_DEPTH}, got {max_depth}"
+            )
+        self.evaluator = evaluator or HeuristicEvaluator()
+        self.max_depth = max_depth
+        self.time_budget = time_budget
+        self.star2 = star2
+        self.clock = clock
+        self.move_generator = MoveGenerator()
+        self.move_cache = MoveCache(cache_size)
+        self.nodes = 0
+        self.completed_depth = 0
+        self._deadline: Optional[float] = None
+        self._lower, self._upper = self.evaluator.bounds
+
+    def search(
+        self, board: Board, color: str, dice: Sequence[int]
+    ) -> Tuple[Play, float]:
+        """
+        Find the best play for a roll with iterative deepening.
+
+        Args:
+            board: Position before the play
+            color: Color to move
+            dice: Remaining dice values
+
+        Returns:
+            (best play, its value for color); the value comes from the
+            deepest iteration that finished within the time budget
+        """
+        plays = self.move_generator.get_legal_plays(board, color, dice)
+        return self.search_plays(plays, color)
+
+    def search_plays(self, plays: Sequence[Play], color: str) -> Tuple[Play, float]:
+        """
+        Pick the best of the given legal plays with iterative deepening.
+
+        Args:
+            plays: Legal plays for the roll (never empty)
+            color: Color to move
+
+        Returns:
+            (best play, its value for color)
+        """
+        self.nodes = 0
+        self.completed_depth = 0
+        self._deadline = (
+            None if self.time_budget is None else self.clock() + self.time_budget
+        )
+        ordered = self._order_plays(plays, color)
+        best_play, best_value = ordered[0][0], ordered[0][1]
+        self.completed_depth = 1
+        if len(plays) == 1:
+            return best_play, best_value
+
+        for depth in range(2, self.max_depth + 1):
+            try:
+                play, value = self._root(ordered, color, depth)
+            except SearchTimeout:
+                break
+            best_play, best_value = play, value
+            self.completed_depth = depth
+            # Search the previous best first in the next iteration
+            best_index = next(
+                index for index, item in enumerate(ordered) if item[0] is best_play
+            )
+            ordered.insert(0, ordered.pop(best_index))
+        return best_play, best_value
+
+    def _get_plays(self, position: bytes, color: str, dice: Sequence[int]):
+        """Get the legal plays of a position through the move cache."""
+        return self.move_cache.get_or_compute(
+            make_move_key("plays", position, color, dice),
+            lambda: self.move_generator.get_legal_plays(
+                Board.from_bytes(position), color, dice
+            ),
+        )
+
+    def _check_time(self) -> None:
+        """Raise SearchTimeout if the deadline has passed."""
+        if self._deadline is not None and self.clock() > self._deadline:
+            raise SearchTimeout()
+
+    def _order_plays(
+        self, plays: Sequence[Play], color: str
+    ) -> List[Tuple[Play, float]]:
+        """
+        Score plays statically in one batch and sort them best first.
+
+        Args:
+            plays: Legal plays
+            color: Color making the plays
+
+        Returns:
+            List of (play, static value) sorted by decreasing value
+        """
+        self.nodes += len(plays)
+        values = self._static_values([play[1] for play in plays], color)
+        scored = list(zip(plays, values))
+        scored.sort(key=lambda item: -item[1])
+        return scored
+
+    def _static_values(self, positions: Sequence[bytes], color: str) -> List[float]:
+        """Evaluate positions after color moved, with exact values for wins."""
+        off = OFF_SLOT[color]
+        values = list(self.evaluator.equities(positions, color))
+        for index, position in enumerate(positions):
+            if position[off] == 15:
+                values[index] = float(get_win_points(Board.from_bytes(position), color))
+        return values
+
+    def _root(
+        self, ordered: List[Tuple[Play, float]], color: str, depth: int
+    ) -> Tuple[Play, float]:
+        """Search every root play to the given depth."""
+        best_play = ordered[0][0]
+        best_value = -math.inf
+        for play, _ in ordered:
+            value = self._chance(play[1], color, depth - 1, best_value, self._upper)
+            if value > best_value:
+                best_play, best_value = play, value
+        return best_play, best_value
+
+    def _chance(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+        self, position: bytes, color: str, depth: int, alpha: float, beta: float
+    ) -> float:
+        """
+        Value for color of a position where color has just moved.
+
+        Args:
+            position: Board.to_bytes() key, opponent to roll
+            color: Color that just moved
+            depth: Remaining plies
+            alpha: Lower end of the search window
+            beta: Upper end of the search window
+
+        Returns:
+            Exact value if it lies inside (alpha, beta), otherwise a bound
+        """
+        self._check_time()
+        if position[OFF_SLOT[color]] == 15:
+            return float(get_win_points(Board.from_bytes(position), color))
+        if depth == 0:
+            self.nodes += 1
+            return self._static_values([position], color)[0]
+
+        lower, upper = self._lower, self._upper
+        opponent = other_color(color)
+        replies = []
+        for dice, probability in ORDERED_ROLLS:
+            plays = self._get_plays(position, opponent, dice)
+            replies.append((probability, self._order_plays(plays, opponent)))
+
+        probes = [None] * len(replies)
+        if self.star2 and depth > 1:
+            # Probe: the best-ordered reply bounds each roll from above (for us)
+            upper_sum = 0.0
+            for index, (probability, ordered) in enumerate(replies):
+                probes[index] = self._chance(
+                    ordered[0][0][1], opponent, depth - 1, -upper, -lower
+                )
+                upper_sum += probability * -probes[index]
+            if upper_sum <= alpha:
+                return upper_sum
+
+        total = 0.0
+        remaining = 1.0
+        for index, (probability, ordered) in enumerate(replies):
+            remaining -= probability
+            # Star1 window for this roll, given the bounds of the unsearched rolls
+            roll_alpha = (alpha - total - remaining * upper) / probability
+            roll_beta = (beta - total - remaining * lower) / probability
+            value = -self._max_node(
+                ordered,
+                opponent,
+                depth,
+                -min(roll_beta, upper),
+                -max(roll_alpha, lower),
+                probes[index],
+            )
+            total += probability * value
+            if total + remaining * upper <= alpha:
+                return total + remaining * upper
+            if total + remaining * lower >= beta:
+                return total + remaining * lower
+        return total
+
+    def _max_node(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        ordered: List[Tuple[Play, float]],
+        color: str,
+        depth: int,
+        alpha: float,
+        beta: float,
+        probe: Optional[float] = None,
+    ) -> float:
+        """
+        Value for color of its best play for a known roll.
+
+        Args:
+            ordered: Plays with static values, best first
+            color: Color to move
+            depth: Remaining plies including this one
+            alpha: Lower end of the search window
+            beta: Upper end of the search window
+            probe: Already searched value of the first play, if any
+
+        Returns:
+            Exact value if it lies inside (alpha, beta), otherwise a bound
+        """
+        if depth == 1:
+            return ordered[0][1]
+        best = -math.inf
+        start = 0
+        if probe is not None:
+            best = probe
+            start = 1
+            if best >= beta:
+                return best
+        for play, _ in ordered[start:]:
+            value = self._chance(play[1], color, depth - 1, max(alpha, best), beta)
+            if value > best:
+                best = value
+                if best >= beta:
+                    break
+        return best
+
+
+class ExpectimaxPolicy(Policy):  # pylint: disable=too-few-public-methods
+    """Policy that picks plays with ExpectimaxSearch."""
+
+    name = "expectimax"
+
+    def __init__(self, search: Optional[ExpectimaxSearch] = None) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            search: Search to use (2-ply with the heuristic evaluator if omitted)
+        """
+        self.search = search or ExpectimaxSearch()
+
+    def choose_play(self, game, plays: Sequence[Play], rng) -> Play:
+        """Choose the play with the best search value."""
+        color = game.get_current_player().color
+        return self.search.search_plays(plays, color)[0]
+
+
+class ExpectimaxPlayer:
+    """
+    Computer opponent for the CLI and Pygame front ends.
+
+    Attributes:
+        color: Color played by the computer
+        policy: Policy that picks the plays
+        rng: Random generator passed to the policy
+    """
+
+    def __init__(
+        self,
+        color: str = "black",
+        max_depth: int = 2,
+        time_budget: Optional[float] = 2.0,
+        policy: Optional[Policy] = None,
+    ) -> None:
+        """
+        Initialize the player.
+
+        Args:
+            color: Color played by the computer
+            max_depth: Deepest search iteration, in plies (1-3)
+            time_budget: Seconds per move, or None for no limit
+            policy: Policy to use instead of an ExpectimaxPolicy
+
+        Raises:
+            ValueError: If max_depth is not between 1 and MAX_DEPTH
+        """
+        self.color = color
+        self.policy = policy or ExpectimaxPolicy(
+            ExpectimaxSearch(max_depth=max_depth, time_budget=time_budget)
+        )
+        self.rng = random.Random()
+
+    def is_turn(self, game) -> bool:
+        """
+        Check if it is the computer's turn.
+
+        Args:
+            game: BackgammonGame instance
+
+        Returns:
+            True if the current player has the computer's color
+        """
+        if game.is_game_over():
+            return False
+        player = game.get_current_player()
+        return player is not None and player.color == self.color
+
+    def choose_moves(self, game) -> List[Tuple]:
+        """
+        Choose the moves of the rolled turn without making them.
+
+        Only the game's move cache is touched, so a front end can search a
+        copy of the game in another thread.
+
+        Args:
+            game: BackgammonGame instance with the computer on turn and the
+                dice rolled
+
+        Returns:
+            The moves of the chosen play, in make_move notation
+        """
+        plays = game.get_legal_plays()
+        return list(self.policy.choose_play(game, plays, self.rng)[0])
+
+    def play_turn(self, game) -> List[Tuple]:
+        """
+        Roll if needed and play the whole turn (without completing it).
+
+        Args:
+            game: BackgammonGame instance with the computer on turn
+
+        Returns:
+            The moves made, in make_move notation
+
+        Raises:
+            RuntimeError: If the game rejects a move chosen by the policy
+        """
+        if not game.dice.get_available_moves():
+            game.roll_dice()
+        moves = self.choose_moves(game)
+        for from_pos, to_pos in moves:
+            if not game.make_move(from_pos, to_pos):
+                raise RuntimeError(f"Move rejected: {from_pos} {to_pos}")
+        return moves
@@ -0,0 +1,364 @@
+"""
+Headless self-play simulator for Backgammon.
+
+Plays complete games between two policies on BackgammonGame without any UI,
+reports throughput (games and moves per second) and can spread the games over
+a process pool. Every game gets its own dice stream derived from the run seed
+and the game index, so results do not depend on the number of workers.
+
+Usage:
+    python -m backgammon.engine.simulator --games 1000 --workers 4 --seed 7
+"""
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from backgammon.core.backgammon_game import BackgammonGame
+from backgammon.core.dice import Dice
+from backgammon.engine.policies import Policy, RandomPolicy, make_policy
+
+
+class GameResult(NamedTuple):
+    """
+    Outcome of one simulated game.
+
+    Attributes:
+        winner: Color of the winner
+        points: 1 for a single game, 2 for a gammon, 3 for a backgammon
+        plies: Number of turns played
+        moves: Number of checker moves made
+    """
+
+    winner: str
+    points: int
+    plies: int
+    moves: int
+
+
+def game_rng(seed: int, game_index: int) -> random.Random:
+    """
+    Create the dice stream for one game of a run.
+
+    Args:
+        seed: Run seed
+        game_index: Index of the game in the run
+
+    Returns:
+        Seeded random.Random instance
+    """
+    return random.Random(seed * 1_000_003 + game_index)
+
+
+def get_win_points(board, winner: str) -> int:
+    """
+    Get the points won: single game, gammon or backgammon.
+
+    Args:
+        board: Final Board
+        winner: Color of the winner
+
+    Returns:
+        1, 2 or 3
+    """
+    loser = "black" if winner == "white" else "white"
+    if board.get_off_count(loser) > 0:
+        return 1
+    # Loser still on the bar or in the winner's home board: backgammon
+    home = range(0, 6) if winner == "white" else range(18, 24)
+    if board.get_bar_count(loser) or any(
+        board.get_point_top_color(i) == loser for i in home
+    ):
+        return 3
+    return 2
+
+
+class SelfPlaySimulator:
+    """
+    Plays complete games between two policies without any UI.
+
+    Attributes:
+        white_policy: Policy used by white
+        black_policy: Policy used by black
+        max_plies: Safety limit on the number of turns per game
+    """
+
+    def __init__(
+        self,
+        white_policy: Optional[Policy] = None,
+        black_policy: Optional[Policy] = None,
+        max_plies: int = 10000,
+    ) -> None:
+        """
+        Initialize the simulator.
+
+        Args:
+            white_policy: Policy for white (random if omitted)
+            black_policy: Policy for black (random if omitted)
+            max_plies: Safety limit on the number of turns per game
+        """
+        self.white_policy = white_policy or RandomPolicy()
+        self.black_policy = black_policy or RandomPolicy()
+        self.max_plies = max_plies
+
+    @staticmethod
+    def new_game(rng: random.Random) -> BackgammonGame:
+        """
+        Create a game in the initial position after the opening roll.
+
+        The opening roll is repeated until the dice differ; the player with
+        the higher die moves first using both dice.
+
+        Args:
+            rng: Dice stream for the game
+
+        Returns:
+            BackgammonGame ready for the first play
+        """
+        game = BackgammonGame()
+        game.dice = Dice(rng)
+        game.setup_players()
+        game.setup_board()
+        game.is_started = True
+        while True:
+            die1, die2 = game.dice.roll()
+            if die1 != die2:
+                break
+        game.current_player_index = 0 if die1 > die2 else 1
+        return game
+
+    @staticmethod
+    def game_from_position(
+        board, color: str, dice: Optional[Dice] = None
+    ) -> BackgammonGame:
+        """
+        Create a game from an arbitrary position with a given side to move.
+
+        Args:
+            board: Board with the position (copied, not modified)
+            color: Color of the player to move
+            dice: Dice to use (a new Dice if omitted); no roll is made
+
+        Returns:
+            BackgammonGame ready for the player to roll
+        """
+        game = BackgammonGame()
+        game.dice = dice if dice is not None else Dice()
+        game.setup_players()
+        game.board = board.copy()
+        for player in game.players:
+            player.checkers_off_board = board.get_off_count(player.color)
+            player.checkers_on_board = 15 - player.checkers_off_board
+        game.current_player_index = 0 if color == "white" else 1
+        game.is_started = True
+        return game
+
+    def play_out(self, game: BackgammonGame, rng: random.Random) -> GameResult:
+        """
+        Play a game to the end from its current state.
+
+        Args:
+            game: Game to play (modified in place); dice already rolled are used
+            rng: Random generator passed to the policies
+
+        Returns:
+            GameResult of the finished game
+
+        Raises:
+            RuntimeError: If a generated move is rejected or max_plies is exceeded
+        """
+        plies = 0
+        moves = 0
+        while not game.is_game_over():
+            if plies >= self.max_plies:
+                raise RuntimeError(f"Game exceeded {self.max_plies} plies")
+            moves += self.play_turn(game, rng)
+            plies += 1
+
+        winner = game.get_winner().color
+        return GameResult(winner, get_win_points(game.board, winner), plies, moves)
+
+    def play_turn(self, game: BackgammonGame, rng: random.Random) -> int:
+        """
+        Play one turn of the player on roll and pass the dice.
+
+        Args:
+            game: Game to play (modified in place); dice already rolled are used
+            rng: Random generator passed to the policy
+
+        Returns:
+            Number of checker moves made
+
+        Raises:
+            RuntimeError: If a generated move is rejected
+        """
+        if not game.dice.values:
+            game.roll_dice()
+        policy = (self.white_policy, self.black_policy)[game.current_player_index]
+        play = policy.choose_play(game, game.get_legal_plays(), rng)
+        for from_pos, to_pos in play[0]:
+            if not game.make_move(from_pos, to_pos):
+                raise RuntimeError(f"Generated move rejected: {from_pos} {to_pos}")
+        if not game.is_game_over():
+            game.complete_turn()
+        return len(play[0])
+
+    def play_game(self, rng: random.Random) -> GameResult:
+        """
+        Play one complete game from the initial position.
+
+        Args:
+            rng: Dice and policy random stream for the game
+
+        Returns:
+            GameResult of the game
+        """
+        return self.play_out(self.new_game(rng), rng)
+
+    def simulate_range(self, seed: int, start: int, stop: int) -> List[GameResult]:
+        """
+        Play the games with indices start..stop-1 of a run.
+
+        Args:
+            seed: Run seed
+            start: First game index
+            stop: One past the last game index
+
+        Returns:
+            List of GameResult in game index order
+        """
+        return [self.play_game(game_rng(seed, index)) for index in range(start, stop)]
+
+    def simulate(
+        self, num_games: int, seed: int = 0, workers: Optional[int] = 1
+    ) -> List[GameResult]:
+        """
+        Play a batch of games, optionally over a process pool.
+
+        Args:
+            num_games: Number of games to play
+            seed: Run seed (same seed gives the same results for any worker count)
+            workers: Number of processes (None uses every core, 1 runs inline)
+
+        Returns:
+            List of GameResult in game index order
+        """
+        workers = worker_count(num_games, workers)
+        if workers == 1:
+            return self.simulate_range(seed, 0, num_games)
+
+        bounds = [num_games * i // workers for i in range(workers + 1)]
+        results: List[GameResult] = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.simulate_range, seed, bounds[i], bounds[i + 1])
+                for i in range(workers)
+            ]
+            for future in futures:
+                results.extend(future.result())
+        return results
+
+    def run(
+        self, num_games: int, seed: int = 0, workers: Optional[int] = 1
+    ) -> Dict[str, Any]:
+        """
+        Play a batch of games and report results and throughput.
+
+        Args:
+            num_games: Number of games to play
+            seed: Run seed
+            workers: Number of processes (None uses every core)
+
+        Returns:
+            Dictionary with wins, gammons, totals, elapsed time,
+            games_per_second, moves_per_second and the workers used
+        """
+        start_time = time.perf_counter()
+        results = self.simulate(num_games, seed, workers)
+        elapsed = time.perf_counter() - start_time
+        stats = summarize_results(results, elapsed)
+        stats["seed"] = seed
+        stats["workers"] = worker_count(num_games, workers)
+        return stats
+
+
+def worker_count(num_games: int, workers: Optional[int]) -> int:
+    """
+    Get the number of processes a batch of games actually uses.
+
+    Args:
+        num_games: Number of games to play
+        workers: Requested number of processes (None uses every core)
+
+    Returns:
+        Requested count clamped to the number of games (at least 1)
+    """
+    workers = workers or os.cpu_count() or 1
+    return max(1, min(workers, num_games))
+
+
+def summarize_results(results: Sequence[GameResult], elapsed: float) -> Dict[str, Any]:
+    """
+    Aggregate game results into a statistics dictionary.
+
+    Args:
+        results: Finished games
+        elapsed: Wall time in seconds
+
+    Returns:
+        Dictionary of totals and throughput figures
+    """
+    moves = sum(result.moves for result in results)
+    elapsed = max(elapsed, 1e-9)
+    return {
+        "games": len(results),
+        "white_wins": sum(1 for r in results if r.winner == "white"),
+        "black_wins": sum(1 for r in results if r.winner == "black"),
+        "gammons": sum(1 for r in results if r.points == 2),
+        "backgammons": sum(1 for r in results if r.points == 3),
+        "white_points": sum(r.points for r in results if r.winner == "white"),
+        "black_points": sum(r.points for r in results if r.winner == "black"),
+        "plies": sum(result.plies for result in results),
+        "moves": moves,
+        "elapsed": elapsed,
+        "games_per_second": len(results) / elapsed,
+        "moves_per_second": moves / elapsed,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    Command line entry point for the simulator.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+
+    Returns:
+        The statistics dictionary that was printed
+    """
+    parser = argparse.ArgumentParser(description="Headless Backgammon self-play")
+    parser.add_argument("--games", type=int, default=100, help="number of games")
+    parser.add_argument("--workers", type=int, default=1, help="processes (0 = all cores)")
+    parser.add_argument("--seed", type=int, default=0, help="run seed")
+    parser.add_argument("--white", default="random", help="white policy name")
+    parser.add_argument("--black", default="random", help="black policy name")
+    args = parser.parse_args(argv)
+
+    simulator = SelfPlaySimulator(
+        make_policy(args.white, time_budget=None),
+        make_policy(args.black, time_budget=None),
+    )
+    stats = simulator.run(args.games, args.seed, args.workers or None)
+    for key, value in stats.items():
+        if isinstance(value, float):
+            print(f"{key}: {value:.2f}")
+        else:
+            print(f"{key}: {value}")
+    return stats
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,631 @@
+"""
+Tournament runner for move-selection policies.
+
+Runs round-robin or Swiss events between policies (any name accepted by
+backgammon.engine.policies.make_policy) on the headless self-play
+simulator. Every match is a series of games with the colors alternating;
+the games are spread over a process pool in chunks.
+
+Results are streamed to a JSON-lines file, one line per game, as soon as a
+chunk finishes. Next to it a checkpoint file holds the event settings and
+the size of the results file that has been accounted for; it is replaced
+atomically after every chunk. An interrupted event resumes from the
+checkpoint: the results are read back, a partly written last line is cut
+off and only the missing games are played. Every game has its own dice
+stream derived from the event seed and the game number, and expectimax
+players search without a time budget, so a resumed event gives the same
+results as an uninterrupted one.
+
+Ratings are Bradley-Terry Elo ratings fitted on the pairwise win counts,
+which are updated game by game; the 95% margin of each rating comes from
+the standard error of the player's score (delta method).
+
+Usage:
+    python -m backgammon.engine.tournament --players random greedy expectimax \\
+        --format swiss --rounds 5 --games 200 --workers 4 --results event.jsonl
+    python -m backgammon.engine.tournament --resume --results event.jsonl
+"""
+
+import argparse
+import json
+import math
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from backgammon.engine.policies import make_policy
+from backgammon.engine.simulator import SelfPlaySimulator, game_rng
+
+FORMATS = ("round-robin", "swiss")
+CHUNK_SIZE = 16
+Z_95 = 1.959964
+
+
+class GameTask(NamedTuple):
+    """
+    One game to play.
+
+    Attributes:
+        number: Game number in the event (also selects the dice stream)
+        round: Round index
+        white: Policy name of white
+        black: Policy name of black
+    """
+
+    number: int
+    round: int
+    white: str
+    black: str
+
+
+class Rating(NamedTuple):
+    """
+    Rating of one player.
+
+    Attributes:
+        name: Policy name
+        elo: Elo rating (the field averages 0)
+        margin: Half width of the 95% confidence interval
+        games: Games played
+        score: Fraction of games won
+    """
+
+    name: str
+    elo: float
+    margin: float
+    games: int
+    score: float
+
+
+class EloTable:
+    """
+    Pairwise results and Bradley-Terry Elo ratings.
+
+    Recording a game is O(1); ratings() fits the ratings on the
+    accumulated counts.
+    """
+
+    def __init__(self, players: Iterable[str] = ()) -> None:
+        """
+        Initialize an empty table.
+
+        Args:
+            players: Players to list even before their first game
+        """
+        self.wins: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.games: Dict[str, int] = defaultdict(int)
+        for player in players:
+            self.games[player] += 0
+
+    def add(self, winner: str, loser: str) -> None:
+        """
+        Record one game.
+
+        Args:
+            winner: Name of the winner
+            loser: Name of the loser
+        """
+        self.wins[winner][loser] += 1
+        self.games[winner] += 1
+        self.games[loser] += 1
+
+    def _pair_games(self, first: str, second: str) -> int:
+        """Games played between two players."""
+        return self.wins[first][second] + self.wins[second][first]
+
+    def _fit_strengths(self, players: List[str], iterations: int) -> Dict[str, float]:
+        """Bradley-Terry strengths, normalized to a geometric mean of 1."""
+        strength = {player: 1.0 for player in players}
+        for _ in range(iterations):
+            updated = {}
+            for player in players:
+                won = 0.0
+                denominator = 0.0
+                for other in players:
+                    games = self._pair_games(player, other) if other != player else 0
+                    if games:
+                        won += self.wins[player][other] + 0.5
+                        denominator += (games + 1) / (strength[player] + strength[other])
+                updated[player] = won / denominator if denominator else 1.0
+            mean_log = sum(math.log(value) for value in updated.values()) / len(players)
+            strength = {
+                player: value / math.exp(mean_log) for player, value in updated.items()
+            }
+        return strength
+
+    def _rating(self, player: str, strength: float) -> Rating:
+        """Rating of a player with a fitted strength and a 95% margin."""
+        elo = 400.0 * math.log10(strength)
+        games = self.games[player]
+        won = sum(self.wins[player].values())
+        score = won / games if games else 0.5
+        margin = 0.0
+        if games:
+            # Delta method: standard error of the score times the slope
+            # of the Elo curve at that score
+            clamped = min(max(score, 0.5 / games), 1 - 0.5 / games)
+            variance = clamped * (1 - clamped)
+            margin = Z_95 * math.sqrt(variance / games) * 400 / (math.log(10) * variance)
+        return Rating(player, elo, margin, games, score)
+
+    def ratings(self, iterations: int = 200) -> List[Rating]:
+        """
+        Fit the ratings with the minorization-maximization algorithm.
+
+        Every pair that has played gets one virtual drawn game, so players
+        that won or lost every game still get finite ratings.
+
+        Args:
+            iterations: Fitting iterations
+
+        Returns:
+            Ratings, best first
+        """
+        players = sorted(self.games)
+        strength = self._fit_strengths(players, iterations)
+        ratings = [self._rating(player, strength[player]) for player in players]
+        return sorted(ratings, key=lambda rating: (-rating.elo, rating.name))
+
+
+def play_games(tasks: Sequence[GameTask], seed: int) -> List[Dict[str, Any]]:
+    """
+    Play a chunk of games (runs in a worker process).
+
+    Args:
+        tasks: Games to play
+        seed: Event seed
+
+    Returns:
+        One result dictionary per game, in task order
+    """
+    results = []
+    for task in tasks:
+        simulator = SelfPlaySimulator(
+            make_policy(task.white, time_budget=None),
+            make_policy(task.black, time_budget=None),
+        )
+        result = simulator.play_game(game_rng(seed, task.number))
+        results.append(
+            {
+                "game": task.number,
+                "round": task.round,
+                "white": task.white,
+                "black": task.black,
+                "winner": result.winner,
+                "points": result.points,
+                "plies": result.plies,
+            }
+        )
+    return results
+
+
+class Tournament:  # pylint: disable=too-many-instance-attributes
+    """
+    Round-robin or Swiss event between policies.
+
+    Attributes:
+        players: Policy names
+        event_format: "round-robin" or "swiss"
+        rounds: Rounds to play (a round-robin round is one match per pair)
+        games_per_match: Games per match (colors alternate)
+        seed: Event seed
+        results_path: JSON-lines results file
+        checkpoint_path: Checkpoint file
+        elo: EloTable of the results so far
+        results: Results so far by game number
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        players: Sequence[str],
+        event_format: str = "round-robin",
+        rounds: int = 1,
+        games_per_match: int = 100,
+        seed: int = 0,
+        results_path: str = "tournament.jsonl",
+    ) -> None:
+        """
+        Initialize a new event.
+
+        Args:
+            players: Policy names (at least two, no repeats)
+            event_format: "round-robin" or "swiss"
+            rounds: Rounds to play
+            games_per_match: Games per match
+            seed: Event seed
+            results_path: JSON-lines results file
+
+        Raises:
+            ValueError: If a setting is invalid or a policy name is unknown
+        """
+        if event_format not in FORMATS:
+            raise ValueError(f"Unknown format {event_format!r}, use one of {FORMATS}")
+        if len(players) < 2 or len(set(players)) != len(players):
+            raise ValueError("A tournament needs at least two different players")
+        if rounds < 1 or games_per_match < 1:
+            raise ValueError("rounds and games_per_match must be positive")
+        for player in players:
+            make_policy(player)
+        self.players = list(players)
+        self.event_format = event_format
+        self.rounds = rounds
+        self.games_per_match = games_per_match
+        self.seed = seed
+        self.results_path = results_path
+        self.checkpoint_path = results_path + ".checkpoint"
+        self.elo = EloTable(players)
+        self.results: Dict[int, Dict[str, Any]] = {}
+        self._pairings: Dict[int, List[Tuple[str, Optional[str]]]] = {}
+
+    def get_settings(self) -> Dict[str, Any]:
+        """Settings stored in the checkpoint."""
+        return {
+            "players": self.players,
+            "format": self.event_format,
+            "rounds": self.rounds,
+            "games_per_match": self.games_per_match,
+            "seed": self.seed,
+        }
+
+    @classmethod
+    def resume(cls, results_path: str) -> "Tournament":
+        """
+        Reopen an interrupted event from its checkpoint.
+
+        Args:
+            results_path: JSON-lines results file of the event
+
+        Returns:
+            Tournament with the recorded results loaded
+
+        Raises:
+            ValueError: If there is no checkpoint
+        """
+        checkpoint_path = results_path + ".checkpoint"
+        if not os.path.exists(checkpoint_path):
+            raise ValueError(f"No tournament checkpoint at {checkpoint_path}")
+        with open(checkpoint_path, encoding="utf-8") as stream:
+            checkpoint = json.load(stream)
+        settings = checkpoint["settings"]
+        tournament = cls(
+            settings["players"],
+            settings["format"],
+            settings["rounds"],
+            settings["games_per_match"],
+            settings["seed"],
+            results_path,
+        )
+        tournament._load_results(checkpoint["size"])
+        return tournament
+
+    def _load_results(self, size: int) -> None:
+        """
+        Read the results file back, cutting off a partly written last line.
+
+        Complete lines written after the last checkpoint are kept: every
+        line is a whole game result.
+
+        Raises:
+            ValueError: If results accounted for by the checkpoint are missing
+        """
+        data = b""
+        if os.path.exists(self.results_path):
+            with open(self.results_path, "r+b") as stream:
+                data = stream.read()
+                data = data[: data.rfind(b"\n") + 1]
+                stream.truncate(len(data))
+        if len(data) < size:
+            raise ValueError(
+                f"{self.results_path} is shorter than its checkpoint ({size} bytes)"
+            )
+        for line in data.splitlines():
+            if line.strip():
+                self._record(json.loads(line))
+
+    def _record(self, result: Dict[str, Any]) -> None:
+        """Account for one game result."""
+        if result["game"] in self.results:
+            return
+        self.results[result["game"]] = result
+        loser = result["black"] if result["winner"] == "white" else result["white"]
+        self.elo.add(result[result["winner"]], loser)
+
+    def _match_stride(self) -> int:
+        """Game numbers reserved per round."""
+        pairs = len(self.players) * (len(self.players) - 1) // 2
+        if self.event_format == "swiss":
+            pairs = (len(self.players) + 1) // 2
+        return pairs * self.games_per_match
+
+    def get_pairings(self, round_index: int) -> List[Tuple[str, Optional[str]]]:
+        """
+        Get the matches of a round.
+
+        Swiss pairings depend on the results of the previous rounds, which
+        must be complete.
+
+        Args:
+            round_index: Round index
+
+        Returns:
+            List of (player, opponent) pairs; opponent None is a bye
+        """
+        if round_index not in self._pairings:
+            if self.event_format == "round-robin":
+                players = self.players
+                pairings = [
+                    (players[i], players[j])
+                    for i in range(len(players))
+                    for j in range(i + 1, len(players))
+                ]
+            else:
+                pairings = self._swiss_pairings(round_index)
+            self._pairings[round_index] = pairings
+        return self._pairings[round_index]
+
+    def get_standings(self, before_round: Optional[int] = None) -> Dict[str, float]:
+        """
+        Get the match points of every player (1 per match won, 0.5 per tie).
+
+        Args:
+            before_round: Only count rounds before this one (all if omitted)
+
+        Returns:
+            Match points by player
+        """
+        standings = {player: 0.0 for player in self.players}
+        last = self.rounds if before_round is None else before_round
+        for round_index in range(last):
+            if round_index not in self._pairings:
+                break
+            for match_index, (first, second) in enumerate(self._pairings[round_index]):
+                if second is None:
+                    standings[first] += 1.0
+                    continue
+                won = self._match_wins(round_index, match_index, first, second)
+                if won is None:
+                    continue
+                if won[0] == won[1]:
+                    standings[first] += 0.5
+                    standings[second] += 0.5
+                else:
+                    standings[first if won[0] > won[1] else second] += 1.0
+        return standings
+
+    def _match_wins(
+        self, round_index: int, match_index: int, first: str, second: str
+    ) -> Optional[Tuple[int, int]]:
+        """Games won by each side of a finished match, None if unfinished."""
+        wins = [0, 0]
+        for task in self._match_tasks(round_index, match_index, first, second):
+            result = self.results.get(task.number)
+            if result is None:
+                return None
+            wins[0 if result[result["winner"]] == first else 1] += 1
+        return wins[0], wins[1]
+
+    def _previous_elo(self, round_index: int) -> Dict[str, float]:
+        """
+        Elo of every player from the games of the rounds before a round.
+
+        Swiss ties are broken by these ratings only, so the pairings do not
+        change when an event is resumed.
+        """
+        previous = EloTable(self.players)
+        for result in self.results.values():
+            if result["round"] < round_index:
+                loser = result["black"] if result["winner"] == "white" else result["white"]
+                previous.add(result[result["winner"]], loser)
+        return {rating.name: rating.elo for rating in previous.ratings()}
+
+    def _swiss_pairings(self, round_index: int) -> List[Tuple[str, Optional[str]]]:
+        """Pair players with equal or close scores who have not met yet."""
+        standings = self.get_standings(round_index)
+        elo = self._previous_elo(round_index)
+        order = sorted(self.players, key=lambda name: (-standings[name], -elo[name], name))
+        met = set()
+        byes = set()
+        for previous in range(round_index):
+            for first, second in self.get_pairings(previous):
+                if second is None:
+                    byes.add(first)
+                else:
+                    met.add(frozenset((first, second)))
+
+        bye = None
+        if len(order) % 2:
+            # The lowest ranked player without a bye sits out
+            candidates = [name for name in reversed(order) if name not in byes]
+            bye = candidates[0] if candidates else order[-1]
+            order.remove(bye)
+        pairings: List[Tuple[str, Optional[str]]] = []
+        while order:
+            first = order.pop(0)
+            opponent = next(
+                (name for name in order if frozenset((first, name)) not in met), order[0]
+            )
+            order.remove(opponent)
+            pairings.append((first, opponent))
+        if bye is not None:
+            pairings.append((bye, None))
+        return pairings
+
+    def _match_tasks(
+        self, round_index: int, match_index: int, first: str, second: str
+    ) -> List[GameTask]:
+        """Games of one match, alternating colors."""
+        base = round_index * self._match_stride() + match_index * self.games_per_match
+        tasks = []
+        for game in range(self.games_per_match):
+            white, black = (first, second) if game % 2 == 0 else (second, first)
+            tasks.append(GameTask(base + game, round_index, white, black))
+        return tasks
+
+    def get_round_tasks(self, round_index: int) -> List[GameTask]:
+        """
+        Get the games of a round that have not been played yet.
+
+        Args:
+            round_index: Round index
+
+        Returns:
+            Missing games in game number order
+        """
+        tasks = []
+        for match_index, (first, second) in enumerate(self.get_pairings(round_index)):
+            if second is not None:
+                tasks.extend(
+                    task
+                    for task in self._match_tasks(round_index, match_index, first, second)
+                    if task.number not in self.results
+                )
+        return tasks
+
+    def _write_checkpoint(self, size: int) -> None:
+        """Replace the checkpoint with the current settings and results size."""
+        temp_path = self.checkpoint_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as stream:
+            json.dump({"settings": self.get_settings(), "size": size}, stream)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def run(
+        self,
+        workers: Optional[int] = 1,
+        max_games: Optional[int] = None,
+        progress: Optional[Callable[[int, List[Rating]], None]] = None,
+    ) -> List[Rating]:
+        """
+        Play the missing games of the event.
+
+        Args:
+            workers: Processes (None uses every core, 1 plays inline)
+            max_games: Stop after this many new games (e.g. for time-boxed
+                sessions); the event can be resumed later
+            progress: Called after every chunk with the number of games
+                played so far and the current ratings
+
+        Returns:
+            Ratings, best first
+        """
+        workers = workers or os.cpu_count() or 1
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        played = 0
+        try:
+            with open(self.results_path, "ab") as stream:
+                self._write_checkpoint(stream.tell())
+                for round_index in range(self.rounds):
+                    tasks = self.get_round_tasks(round_index)
+                    if max_games is not None:
+                        tasks = tasks[: max(max_games - played, 0)]
+                    chunks = [
+                        tasks[start : start + CHUNK_SIZE]
+                        for start in range(0, len(tasks), CHUNK_SIZE)
+                    ]
+                    for results in self._play_chunks(executor, chunks):
+                        for result in results:
+                            stream.write(json.dumps(result).encode() + b"\n")
+                            self._record(result)
+                        stream.flush()
+                        self._write_checkpoint(stream.tell())
+                        played += len(results)
+                        if progress:
+                            progress(len(self.results), self.elo.ratings())
+                    if max_games is not None and played >= max_games:
+                        break
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+        return self.elo.ratings()
+
+    def _play_chunks(
+        self, executor: Optional[ProcessPoolExecutor], chunks: List[List[GameTask]]
+    ) -> Iterable[List[Dict[str, Any]]]:
+        """Yield the results of each chunk as it finishes."""
+        if executor is None:
+            for chunk in chunks:
+                yield play_games(chunk, self.seed)
+            return
+        futures = [executor.submit(play_games, chunk, self.seed) for chunk in chunks]
+        for future in as_completed(futures):
+            yield future.result()
+
+    def is_complete(self) -> bool:
+        """Check if every game of the event has been played."""
+        return all(
+            not self.get_round_tasks(round_index) for round_index in range(self.rounds)
+        )
+
+
+def format_ratings(ratings: Sequence[Rating]) -> str:
+    """
+    Format a rating table.
+
+    Args:
+        ratings: Ratings, best first
+
+    Returns:
+        Multi-line table
+    """
+    lines = [f"{'Player':<12} {'Elo':>8} {'+/-':>7} {'Games':>7} {'Score':>7}"]
+    for rating in ratings:
+        lines.append(
+            f"{rating.name:<12} {rating.elo:>8.1f} {rating.margin:>7.1f} "
+            f"{rating.games:>7} {rating.score:>7.1%}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> List[Rating]:
+    """
+    Command line entry point for the tournament runner.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+
+    Returns:
+        The final ratings
+    """
+    parser = argparse.ArgumentParser(description="Backgammon policy tournament")
+    parser.add_argument("--players", nargs="+", help="policy names")
+    parser.add_argument("--format", choices=FORMATS, default="round-robin")
+    parser.add_argument("--rounds", type=int, default=1, help="number of rounds")
+    parser.add_argument("--games", type=int, default=100, help="games per match")
+    parser.add_argument("--seed", type=int, default=0, help="event seed")
+    parser.add_argument("--workers", type=int, default=1, help="processes (0 = all cores)")
+    parser.add_argument("--results", default="tournament.jsonl", help="results file")
+    parser.add_argument("--resume", action="store_true", help="resume from checkpoint")
+    args = parser.parse_args(argv)
+
+    if args.resume:
+        tournament = Tournament.resume(args.results)
+    else:
+        if not args.players:
+            parser.error("--players is required for a new event")
+        if os.path.exists(args.results):
+            parser.error(f"{args.results} exists; use --resume or another file")
+        tournament = Tournament(
+            args.players, args.format, args.rounds, args.games, args.seed, args.results
+        )
+
+    def report(games: int, ratings: List[Rating]) -> None:
+        leader = ratings[0]
+        print(f"{games} games - leader {leader.name} {leader.elo:+.1f}")
+
+    ratings = tournament.run(args.workers or None, progress=report)
+    print(format_ratings(ratings))
+    return ratings
+
+
+if __name__ == "__main__":
+    main()
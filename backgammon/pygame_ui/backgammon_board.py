@@ -81,6 +81,19 @@ class BackgammonBoard:
         if hasattr(game, "current_player_index"):
             self.last_player_index = game.current_player_index
 
+    def start_turn(self) -> None:
+        """
+        Prepare the board for the player on roll.
+
+        Clears the selection and the rolled flag and enables the dice button.
+        Called when the turn changes, also when another turn was played in
+        between (e.g. by the computer) and the player index looks unchanged.
+        """
+        if self.game is not None:
+            self.last_player_index = self.game.current_player_index
+        self.interaction.reset_turn_state()
+        self.dice_button.set_enabled(True)
+
     def handle_mouse_click(self, mouse_pos: Tuple[int, int]) -> None:
         """
         Handle mouse click events.
@@ -202,9 +215,7 @@ class BackgammonBoard:
                 f"Turn changed from player {self.last_player_index}"
                 f" to player {current_player_index}"
             )
-            self.last_player_index = current_player_index
-            self.interaction.reset_turn_state()
-            self.dice_button.set_enabled(True)
+            self.start_turn()
             return
 
         # If no moves available after rolling, keep button disabled until turn changes
@@ -279,70 +279,21 @@ class BoardInteraction:
         """
         Calculate valid destination points for a selected checker.
 
+        Reads the game's legal move set of the turn, which is empty before
+        the dice are rolled and for points without a checker of the player.
+
         Args:
             from_point: The point number where the checker is (0-23)
 
         Returns:
             List of valid destination point numbers or "off" for bearing off
         """
-        valid_destinations = []
-
-        if not self.game or not hasattr(self.game, "dice"):
-            return valid_destinations
-
-        if not self.game.dice.last_roll:
-            return valid_destinations
-
-        available_moves = self.game.dice.get_available_moves()
-        if not available_moves:
-            return valid_destinations
-
-        current_player = self.game.get_current_player()
-        if not current_player:
-            return valid_destinations
-
-        player_color = current_player.color
-
-        if not hasattr(self.game, "board"):
-            return valid_destinations
-
-        checkers = self.game.board.points[from_point]
-        if not checkers or checkers[0].color != player_color:
-            return valid_destinations
-
-        seen_destinations = set()
-
-        for move in available_moves:
-            if player_color == "white":
-                destination = from_point - move
-            else:
-                destination = from_point + move
-
-            # Check for bearing off
-            if (player_color == "white" and destination < 0) or (
-                player_color == "black" and destination > 23
-            ):
-                # Check if bearing off is valid
-                from_notation = from_point + 1
-                if self.game.is_valid_move(from_notation, "off"):
-                    if "off" not in seen_destinations:
-                        valid_destinations.append("off")
-                        seen_destinations.add("off")
-                continue
-
-            if destination in seen_destinations:
-                continue
-
-            seen_destinations.add(destination)
-
-            if 0 <= destination <= 23:
-                from_notation = from_point + 1
-                to_notation = destination + 1
-
-                if self.game.is_valid_move(from_notation, to_notation):
-                    valid_destinations.append(destination)
-
-        return valid_destinations
+        if not self.game:
+            return []
+        return [
+            destination if destination == "off" else destination - 1
+            for destination in self.game.get_legal_destinations(from_point + 1)
+        ]
 
     def _calculate_valid_destinations_from_bar(self) -> List[int]:
         """
@@ -351,51 +302,9 @@ class BoardInteraction:
         Returns:
             List of valid destination point numbers
         """
-        valid_destinations = []
-
-        if not self.game or not hasattr(self.game, "dice"):
-            return valid_destinations
-
-        if not self.game.dice.last_roll:
-            return valid_destinations
-
-        available_moves = self.game.dice.get_available_moves()
-        if not available_moves:
-            return valid_destinations
-
-        current_player = self.game.get_current_player()
-        if not current_player:
-            return valid_destinations
-
-        player_color = current_player.color
-
-        seen_destinations = set()
-
-        for move in available_moves:
-            # For white: entering from point 24 (bar) towards point 1
-            # Entry points are 24, 23, 22, 21, 20, 19 (home board)
-            # For black: entering from point -1 (bar) towards point 24
-            # Entry points are 1, 2, 3, 4, 5, 6 (home board)
-
-            if player_color == "white":
-                # White enters from high numbers (24-move)
-                destination = 24 - move
-            else:
-                # Black enters from low numbers (move-1)
-                destination = move - 1
-
-            if destination in seen_destinations:
-                continue
-
-            seen_destinations.add(destination)
-
-            if 0 <= destination <= 23:
-                to_notation = destination + 1
-
-                if self.game.is_valid_move("bar", to_notation):
-                    valid_destinations.append(destination)
-
-        return valid_destinations
+        if not self.game:
+            return []
+        return [destination - 1 for destination in self.game.get_legal_destinations("bar")]
 
     def clear_selection(self) -> None:
         """Clear current selection state."""
@@ -3,8 +3,10 @@ Pygame UI for Backgammon game.
 Main entry point for the graphical user interface using Pygame library.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 import pygame
+from backgammon.core.serialization import deserialize_game, serialize_game
 from backgammon.pygame_ui.backgammon_board import BackgammonBoard
 
 
@@ -26,6 +28,8 @@ class PygameUI:
         width: Screen width in pixels
         height: Screen height in pixels
         board: BackgammonBoard coordinator instance
+        bot: Optional computer opponent that plays the turns of its color
+        bot_search: Pending search of the computer's play, if any
     """
 
     def __init__(self, width: int = 1600, height: int = 900) -> None:
@@ -37,6 +41,9 @@ class PygameUI:
             height: Screen height in pixels (default: 900)
         """
         self.game: Optional[object] = None
+        self.bot: Optional[object] = None
+        self.bot_search: Optional[Future] = None
+        self._bot_executor: Optional[ThreadPoolExecutor] = None
         self.width: int = width
         self.height: int = height
         self.running: bool = False
@@ -60,6 +67,52 @@ class PygameUI:
         self.game = game
         self.board.set_game(game)
 
+    def set_bot(self, bot: object) -> None:
+        """
+        Set a computer opponent (e.g. ExpectimaxPlayer).
+
+        Args:
+            bot: Object with is_turn(game) and choose_moves(game)
+        """
+        self.bot = bot
+
+    def play_bot_turn(self) -> None:
+        """
+        Advance the computer's turn if it is on roll.
+
+        The first call rolls and starts searching a copy of the game in a
+        worker thread, so the window keeps handling events during the search.
+        The first call after the search finishes makes the moves.
+
+        Raises:
+            RuntimeError: If the game rejects a move chosen by the computer
+        """
+        if self.bot_search is not None:
+            if self.bot_search.done():
+                search, self.bot_search = self.bot_search, None
+                self._finish_bot_turn(search.result())
+            return
+        if not self.bot or not self.game or not self.bot.is_turn(self.game):
+            return
+        if not self.game.dice.get_available_moves():
+            self.game.roll_dice()
+        if self._bot_executor is None:
+            self._bot_executor = ThreadPoolExecutor(max_workers=1)
+        snapshot = deserialize_game(serialize_game(self.game)).to_game()
+        self.bot_search = self._bot_executor.submit(self.bot.choose_moves, snapshot)
+
+    def _finish_bot_turn(self, moves: list) -> None:
+        """Make the moves of a finished search and hand the turn over."""
+        for from_pos, to_pos in moves:
+            if not self.game.make_move(from_pos, to_pos):
+                raise RuntimeError(f"Computer move rejected: {from_pos} {to_pos}")
+        print(f"Computer rolled {self.game.dice.last_roll}, moves: {moves}")
+        if not self.game.is_game_over():
+            self.game.complete_turn()
+            # The human's turn ended this same frame, so the board never saw
+            # the player index change: start the human's turn explicitly
+            self.board.start_turn()
+
     def display_message(self, message: str) -> None:
         """
         Display a message to the user.
@@ -82,6 +135,8 @@ class PygameUI:
         Returns:
             True if should continue running, False otherwise
         """
+        # Clicks are ignored while the computer is thinking: the board is
+        # not the human's to move and the search runs on a copy of the game
         mouse_pos = pygame.mouse.get_pos()
         self.board.update_hover_state(mouse_pos)
 
@@ -91,7 +146,7 @@ class PygameUI:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     return False
-            if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.type == pygame.MOUSEBUTTONDOWN and self.bot_search is None:
                 if event.button == 1:
                     self.board.handle_mouse_click(event.pos)
         return True
@@ -105,9 +160,14 @@ class PygameUI:
 
         while self.running:
             self.running = self.handle_events()
+            self.play_bot_turn()
             self.display_board()
             self.clock.tick(60)
 
+        if self._bot_executor is not None:
+            self._bot_executor.shutdown(wait=False, cancel_futures=True)
+            self._bot_executor = None
+            self.bot_search = None
         pygame.quit()
         print("\nPygame window closed. Thanks for playing!")
 
@@ -0,0 +1,15 @@
+"""
+Server package for Backgammon game.
+
+This package runs BackgammonGame as a network service:
+- game_server: Asyncio TCP server hosting many concurrent game sessions
+  (``python -m backgammon.server.game_server``)
+- session: One hosted game with its seats and result
+- session_store: Session store with LRU eviction of idle games to disk
+"""
+
+from .game_server import GameServer
+from .session import GameSession
+from .session_store import SessionStore
+
+__all__ = ["GameServer", "GameSession", "SessionStore"]
@@ -0,0 +1,490 @@
+"""
+Asyncio game server for Backgammon.
+
+Hosts many independent BackgammonGame sessions behind a local TCP line
+protocol, so the game can run as a service instead of being bound to one
+terminal or one Pygame window.
+
+Protocol: every request and response is one JSON object on one line.
+
+Requests:
+    {"op": "create", "opponent": null, "seed": 7}
+        New game; the creator plays white. "opponent" names a computer
+        player for black ("random", "first", "greedy", "expectimax" or
+        "neural", see backgammon.engine.policies.make_policy).
+    {"op": "join", "game": 1}
+        Take the free black seat of a game.
+    {"op": "roll", "token": "..."}
+    {"op": "move", "token": "...", "from": 13, "to": 8}
+        Positions use move_history notation: 1-24, "bar" and "off".
+    {"op": "state", "game": 1, "format": "json"}
+        With "format": "binary", "data" holds the game as a
+        backgammon.core.serialization record, base64 encoded
+        (load it with deserialize_game(data).to_game()).
+    {"op": "resign", "token": "..."}
+
+create and join return the seat "token" that identifies the player in the
+following requests. Responses are {"ok": true, ...} or
+{"ok": false, "error": "..."}.
+
+Binary messages: the framing is always JSON lines; there is no binary
+framing. Binary is offered as a payload instead: the state op with
+"format": "binary" returns the compact serialization record (about 110
+bytes plus the move history) base64 encoded, which is the part of a state
+message that grows with the game. Requests are a few dozen bytes of JSON
+and gain nothing from a binary encoding.
+
+Rules are evaluated in the event loop: a roll or a move costs microseconds.
+Computer turns, which may search for a long time, can be sent to a process
+pool; without one, expectimax turns run in a thread so they never stall the
+event loop. Requests on the same session are serialized by a per-session lock.
+
+Usage:
+    python -m backgammon.server.game_server --port 8765 --max-connections 1000
+    python -m backgammon.server.game_server --session-dir sessions --max-sessions 500
+"""
+
+import argparse
+import asyncio
+import base64
+import itertools
+import json
+import random
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from backgammon.core.serialization import deserialize_game, serialize_game
+from backgammon.engine.policies import POLICY_NAMES, Policy, make_policy
+from backgammon.engine.search import MAX_DEPTH
+from backgammon.engine.simulator import SelfPlaySimulator
+
+from .session import GameSession, other_color
+from .session_store import SessionStore
+
+Move = Tuple[Union[int, str], Union[int, str]]
+
+OPPONENTS = POLICY_NAMES
+MAX_LINE = 64 * 1024
+
+
+def choose_moves(data: bytes, policy: Policy, seed: int) -> List[Move]:
+    """
+    Choose the play of a computer turn.
+
+    Runs in a worker process for pooled turns, so it only receives
+    picklable arguments: the game as a serialized record and the policy.
+
+    Args:
+        data: Game record (serialize_game) with the dice rolled
+        policy: Policy of the computer player
+        seed: Seed of the policy's random generator
+
+    Returns:
+        Moves of the chosen play, in make_move notation
+    """
+    game = deserialize_game(data).to_game()
+    plays = game.get_legal_plays()
+    if not plays or not plays[0][0]:
+        return []
+    return list(policy.choose_play(game, plays, random.Random(seed))[0])
+
+
+class GameServer:  # pylint: disable=too-many-instance-attributes
+    """
+    Asyncio TCP server hosting concurrent game sessions.
+
+    Attributes:
+        host: Interface to listen on
+        port: TCP port (0 picks a free port, updated by start())
+        max_connections: Open connections accepted at the same time
+        workers: Processes for computer turns (0 plays them in this process)
+        sessions: SessionStore with the hosted sessions by game id
+        connections: Currently open connections
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        max_connections: int = 1000,
+        workers: int = 0,
+        ai_depth: int = 1,
+        ai_time_budget: Optional[float] = 0.5,
+        sessions: Optional[SessionStore] = None,
+    ) -> None:
+        """
+        Initialize the server.
+
+        Args:
+            host: Interface to listen on
+            port: TCP port (0 picks a free port)
+            max_connections: Open connections accepted at the same time
+            workers: Processes for computer turns (0 plays them in this process)
+            ai_depth: Search depth of "expectimax" opponents (1-3)
+            ai_time_budget: Seconds per move of "expectimax" opponents
+            sessions: Session store, e.g. with eviction limits (an
+                unlimited in-memory store if omitted)
+        """
+        if max_connections < 1:
+            raise ValueError(f"max_connections must be positive, got {max_connections}")
+        if not 1 <= ai_depth <= MAX_DEPTH:
+            raise ValueError(f"ai_depth must be between 1 and {MAX_DEPTH}, got {ai_depth}")
+        self.host = host
+        self.port = port
+        self.max_connections = max_connections
+        self.workers = workers
+        self.ai_depth = ai_depth
+        self.ai_time_budget = ai_time_budget
+        self.sessions = sessions if sessions is not None else SessionStore()
+        self.connections = 0
+        self._seats: Dict[str, Tuple[int, str]] = {}
+        self._ids = itertools.count(1)
+        self._policies: Dict[str, Policy] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._operations = {
+            "create": self._op_create,
+            "join": self._op_join,
+            "roll": self._op_roll,
+            "move": self._op_move,
+            "state": self._op_state,
+            "resign": self._op_resign,
+        }
+
+    async def start(self) -> None:
+        """Start listening (and the worker pool, if any)."""
+        if self.workers > 0 and self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        self._server = await asyncio.start_server(
+            self.handle_connection, self.host, self.port, limit=MAX_LINE
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Start the server if needed and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening and shut the worker pool down."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Serve one client connection until it closes.
+
+        Args:
+            reader: Stream of request lines
+            writer: Stream for response lines
+        """
+        if self.connections >= self.max_connections:
+            await self._send(writer, {"ok": False, "error": "Too many connections"})
+            writer.close()
+            return
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    await self._send(writer, {"ok": False, "error": "Line too long"})
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    response = {"ok": False, "error": "Invalid JSON"}
+                else:
+                    response = await self.handle_request(request)
+                await self._send(writer, response)
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, response: Dict[str, Any]) -> None:
+        """Write one response line."""
+        writer.write(json.dumps(response).encode() + b"\n")
+        await writer.drain()
+
+    async def handle_request(self, request: Any) -> Dict[str, Any]:
+        """
+        Execute one decoded request.
+
+        Args:
+            request: Decoded JSON request
+
+        Returns:
+            Response dictionary
+        """
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "Request must be a JSON object"}
+        operation = self._operations.get(request.get("op"))
+        if operation is None:
+            return {"ok": False, "error": f"Unknown op {request.get('op')!r}"}
+        try:
+            response = await operation(request)
+        except KeyError as error:
+            return {"ok": False, "error": f"Missing field {error.args[0]!r}"}
+        except ValueError as error:
+            return {"ok": False, "error": str(error)}
+        except RuntimeError as error:
+            # Raised by a computer turn (rejected move or broken worker pool)
+            return {"ok": False, "error": f"Computer player failed: {error}"}
+        return {"ok": True, **response}
+
+    @contextmanager
+    def _use_session(self, request: Dict[str, Any]) -> Iterator[GameSession]:
+        """Use the session named by the request's "game" (reloaded if evicted)."""
+        game_id = request.get("game")
+        if game_id not in self.sessions:
+            raise ValueError(f"Unknown game {game_id!r}")
+        with self.sessions.acquire(game_id) as session:
+            yield session
+
+    @contextmanager
+    def _use_seat(self, request: Dict[str, Any]) -> Iterator[Tuple[GameSession, str]]:
+        """Use the session and color of the request's seat token."""
+        seat = self._seats.get(request.get("token"))
+        if seat is None:
+            raise ValueError("Unknown seat token")
+        game_id, color = seat
+        with self.sessions.acquire(game_id) as session:
+            yield session, color
+
+    def _take_seat(self, session: GameSession, color: str) -> str:
+        """Create the token of a seat."""
+        token = secrets.token_hex(8)
+        session.tokens[color] = token
+        self._seats[token] = (session.game_id, color)
+        return token
+
+    @staticmethod
+    def _check_turn(session: GameSession, color: str) -> None:
+        """Reject a request of a player who is not on turn."""
+        if session.is_over():
+            raise ValueError("Game is over")
+        if session.turn != color:
+            raise ValueError(f"Not your turn ({session.turn} to play)")
+
+    async def _op_create(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a session; the creator plays white."""
+        opponent = request.get("opponent")
+        if opponent is not None and opponent not in OPPONENTS:
+            raise ValueError(f"Unknown opponent {opponent!r}, use one of {OPPONENTS}")
+        seed = request.get("seed")
+        rng = random.Random(seed) if seed is not None else random.Random()
+        new_session = GameSession(
+            next(self._ids), SelfPlaySimulator.new_game(rng), opponent
+        )
+        token = self._take_seat(new_session, "white")
+        with self.sessions.acquire(new_session.game_id, new_session) as session:
+            async with session.lock:
+                computer_moves = await self._play_computer(session)
+                return {
+                    "game": session.game_id,
+                    "color": "white",
+                    "token": token,
+                    "computer_moves": computer_moves,
+                    "state": session.get_state(),
+                }
+
+    async def _op_join(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Take the black seat of a session."""
+        with self._use_session(request) as session:
+            async with session.lock:
+                if session.is_computer("black") or "black" in session.tokens:
+                    raise ValueError(f"Game {session.game_id} is full")
+                token = self._take_seat(session, "black")
+                return {
+                    "game": session.game_id,
+                    "color": "black",
+                    "token": token,
+                    "state": session.get_state(),
+                }
+
+    async def _op_roll(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Roll the dice of the player on turn."""
+        with self._use_seat(request) as (session, color):
+            async with session.lock:
+                self._check_turn(session, color)
+                game = session.game
+                if game.dice.values:
+                    raise ValueError("Dice already rolled")
+                roll = game.roll_dice()
+                passed = not game.get_legal_moves()
+                computer_moves: List[Move] = []
+                if passed:
+                    game.complete_turn()
+                    computer_moves = await self._play_computer(session)
+                return {
+                    "roll": roll,
+                    "passed": passed,
+                    "computer_moves": computer_moves,
+                    "state": session.get_state(),
+                }
+
+    async def _op_move(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Make one checker move of the player on turn."""
+        from_pos, to_pos = request["from"], request["to"]
+        with self._use_seat(request) as (session, color):
+            async with session.lock:
+                self._check_turn(session, color)
+                game = session.game
+                if not game.make_move(from_pos, to_pos):
+                    raise ValueError(f"Invalid move {from_pos} {to_pos}")
+                turn_over = False
+                computer_moves: List[Move] = []
+                if not session.check_game_over() and not game.get_legal_moves():
+                    turn_over = True
+                    game.complete_turn()
+                    computer_moves = await self._play_computer(session)
+                return {
+                    "turn_over": turn_over,
+                    "computer_moves": computer_moves,
+                    "state": session.get_state(),
+                }
+
+    async def _op_state(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Describe a session as JSON or as a binary game record."""
+        response_format = request.get("format", "json")
+        with self._use_session(request) as session:
+            async with session.lock:
+                if response_format == "binary":
+                    data = base64.b64encode(serialize_game(session.game)).decode()
+                    return {"game": session.game_id, "format": "binary", "data": data}
+                if response_format != "json":
+                    raise ValueError(f"Unknown format {response_format!r}")
+                return {"format": "json", "state": session.get_state()}
+
+    async def _op_resign(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Resign the game; the opponent wins a single game."""
+        with self._use_seat(request) as (session, color):
+            async with session.lock:
+                if session.is_over():
+                    raise ValueError("Game is over")
+                session.resigned = color
+                session.winner = other_color(color)
+                session.points = 1
+                return {"state": session.get_state()}
+
+    def _get_policy(self, name: str) -> Policy:
+        """Get the shared policy instance of an opponent name."""
+        if name not in self._policies:
+            self._policies[name] = make_policy(name, self.ai_depth, self.ai_time_budget)
+        return self._policies[name]
+
+    async def _play_computer(self, session: GameSession) -> List[Move]:
+        """
+        Play the computer's turns while it is on turn.
+
+        Must be called with the session lock held. With a worker pool the
+        play is chosen in another process, and without one an expectimax
+        play is chosen in a thread; either way the event loop keeps serving
+        other sessions meanwhile.
+
+        Returns:
+            Moves made by the computer
+        """
+        game = session.game
+        moves: List[Move] = []
+        while not session.check_game_over() and session.is_computer(session.turn):
+            if not game.dice.values:
+                game.roll_dice()
+            policy = self._get_policy(session.opponent)
+            seed = game.dice.rng.getrandbits(32)
+            if self._executor is not None:
+                loop = asyncio.get_running_loop()
+                play = await loop.run_in_executor(
+                    self._executor, choose_moves, serialize_game(game), policy, seed
+                )
+            elif session.opponent == "expectimax":
+                # The search keeps per-search state, so a thread gets its own copy
+                policy = make_policy(session.opponent, self.ai_depth, self.ai_time_budget)
+                play = await asyncio.to_thread(
+                    choose_moves, serialize_game(game), policy, seed
+                )
+            else:
+                play = choose_moves(serialize_game(game), policy, seed)
+            for from_pos, to_pos in play:
+                if not game.make_move(from_pos, to_pos):
+                    raise RuntimeError(f"Computer move rejected: {from_pos} {to_pos}")
+            moves.extend(play)
+            if not session.check_game_over():
+                game.complete_turn()
+        return moves
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Command line entry point for the server.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Backgammon game server")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port")
+    parser.add_argument(
+        "--max-connections", type=int, default=1000, help="open connections allowed"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=0, help="processes for computer turns (0 = none)"
+    )
+    parser.add_argument(
+        "--ai-depth",
+        type=int,
+        default=1,
+        choices=range(1, MAX_DEPTH + 1),
+        help="expectimax depth in plies",
+    )
+    parser.add_argument("--session-dir", help="directory for evicted idle sessions")
+    parser.add_argument("--max-sessions", type=int, help="sessions kept in memory")
+    parser.add_argument(
+        "--max-session-bytes", type=int, help="estimated memory for sessions"
+    )
+    args = parser.parse_args(argv)
+
+    sessions = SessionStore(args.session_dir, args.max_sessions, args.max_session_bytes)
+    server = GameServer(
+        args.host,
+        args.port,
+        args.max_connections,
+        args.workers,
+        args.ai_depth,
+        sessions=sessions,
+    )
+
+    async def run() -> None:
+        await server.start()
+        print(f"Backgammon server listening on {server.host}:{server.port}")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
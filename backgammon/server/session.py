@@ -0,0 +1,105 @@
+"""
+Game session module for the Backgammon game server.
+
+This module contains GameSession, one hosted game together with its seats
+and result.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+from backgammon.core.backgammon_game import BackgammonGame
+from backgammon.engine.simulator import get_win_points
+
+COLORS = ("white", "black")
+
+
+def other_color(color: str) -> str:
+    """Return the opposing color."""
+    return "black" if color == "white" else "white"
+
+
+class GameSession:  # pylint: disable=too-many-instance-attributes
+    """
+    One hosted game and its seats.
+
+    Attributes:
+        game_id: Session number
+        game: BackgammonGame being played
+        tokens: Seat token of each human color
+        opponent: Policy name of the computer player (black), or None
+        lock: Serializes the requests of the session
+        winner: Color of the winner once the game is over
+        points: Points won (1 single, 2 gammon, 3 backgammon)
+        resigned: Color that resigned, if any
+    """
+
+    def __init__(
+        self, game_id: int, game: BackgammonGame, opponent: Optional[str] = None
+    ) -> None:
+        """
+        Initialize the session.
+
+        Args:
+            game_id: Session number
+            game: Game ready for its first play
+            opponent: Policy name of the computer player (black), or None
+        """
+        self.game_id = game_id
+        self.game = game
+        self.tokens: Dict[str, str] = {}
+        self.opponent = opponent
+        self.lock = asyncio.Lock()
+        self.winner: Optional[str] = None
+        self.points = 0
+        self.resigned: Optional[str] = None
+
+    @property
+    def turn(self) -> str:
+        """Color of the player on turn."""
+        return self.game.get_current_player().color
+
+    def is_computer(self, color: str) -> bool:
+        """Check if a color is played by the server."""
+        return self.opponent is not None and color == "black"
+
+    def is_over(self) -> bool:
+        """Check if the game has ended (by bearing off or resignation)."""
+        return self.winner is not None
+
+    def check_game_over(self) -> bool:
+        """
+        Record the winner if the last move ended the game.
+
+        Returns:
+            True if the game is over
+        """
+        if self.winner is None and self.game.is_game_over():
+            self.winner = self.game.get_winner().color
+            self.points = get_win_points(self.game.board, self.winner)
+        return self.is_over()
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Describe the session for a "state" response.
+
+        Returns:
+            JSON-serializable dictionary
+        """
+        game = self.game
+        return {
+            "game": self.game_id,
+            "cells": list(game.board.cells),
+            "turn": self.turn,
+            "dice": list(game.dice.values),
+            "last_roll": game.dice.last_roll,
+            "position_id": game.get_position_id(),
+            "moves": len(game.move_history),
+            "seats": {
+                color: "computer" if self.is_computer(color) else color in self.tokens
+                for color in COLORS
+            },
+            "winner": self.winner,
+            "points": self.points,
+            "resigned": self.resigned,
+        }
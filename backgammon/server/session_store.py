@@ -0,0 +1,331 @@
+"""
+Session store for the Backgammon game server.
+
+Keeps recently used game sessions in memory and evicts idle ones to disk,
+least recently used first, once a count or memory limit is exceeded. An
+evicted session is reloaded transparently the next time it is acquired.
+
+Eviction file (one per session, written to a temporary file and renamed
+into place): a 4-byte little-endian length, the session metadata as JSON
+(seats, opponent and result), the dice generator state (625 <I words) and
+the game as a backgammon.core.serialization record.
+
+A resident session costs about 6.5 KB plus about 64 bytes per recorded
+move, and each play list in its game's move cache about 5 KB more
+(measured with tracemalloc). The cache only pays off while the session is
+in use, so it is cleared whenever the session goes idle. An eviction file
+takes about 2.7 KB plus 3 bytes per move.
+"""
+
+import json
+import os
+import random
+import struct
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from backgammon.core.backgammon_game import BackgammonGame
+from backgammon.core.dice import Dice
+from backgammon.core.serialization import deserialize_game, serialize_game
+
+from .session import GameSession
+
+METADATA_LENGTH = struct.Struct("<I")
+RNG_STATE = struct.Struct("<625I")
+SESSION_BYTES = 6656
+MOVE_BYTES = 64
+CACHE_ENTRY_BYTES = 5120
+
+
+def estimate_session_bytes(session: GameSession) -> int:
+    """
+    Estimate the memory held by a resident session.
+
+    Args:
+        session: Session to measure
+
+    Returns:
+        Estimated size in bytes
+    """
+    game = session.game
+    return (
+        SESSION_BYTES
+        + MOVE_BYTES * len(game.move_history)
+        + CACHE_ENTRY_BYTES * len(game.move_cache)
+    )
+
+
+def _get_metadata(session: GameSession) -> Dict[str, Any]:
+    """Collect the session state that is not part of the game record."""
+    return {
+        "tokens": session.tokens,
+        "opponent": session.opponent,
+        "winner": session.winner,
+        "points": session.points,
+        "resigned": session.resigned,
+    }
+
+
+def _pack_rng(rng: Any) -> bytes:
+    """Pack the Mersenne Twister state of a dice generator (empty if shared)."""
+    if not isinstance(rng, random.Random):
+        return b""
+    _, internal, _ = rng.getstate()
+    return RNG_STATE.pack(*internal)
+
+
+def _restore_session(game_id: int, data: bytes) -> GameSession:
+    """Rebuild a session from the contents of its eviction file."""
+    (length,) = METADATA_LENGTH.unpack_from(data)
+    start = METADATA_LENGTH.size
+    metadata = json.loads(data[start : start + length])
+    start += length
+    rng = random.Random()
+    if metadata["rng"]:
+        rng.setstate((3, RNG_STATE.unpack_from(data, start), None))
+        start += RNG_STATE.size
+    game = BackgammonGame()
+    game.dice = Dice(rng)
+    deserialize_game(data[start:]).apply_to(game)
+    session = GameSession(game_id, game, metadata["opponent"])
+    session.tokens = metadata["tokens"]
+    session.winner = metadata["winner"]
+    session.points = metadata["points"]
+    session.resigned = metadata["resigned"]
+    return session
+
+
+class SessionStore:  # pylint: disable=too-many-instance-attributes
+    """
+    Game sessions by id, with LRU eviction of idle sessions to disk.
+
+    Sessions are used through acquire(); a session in use is never evicted.
+
+    Attributes:
+        directory: Directory for eviction files (None disables eviction)
+        max_sessions: Resident sessions allowed, or None for no limit
+        max_bytes: Estimated resident memory allowed, or None for no limit
+        resident_bytes: Estimated memory of the resident sessions
+        evictions: Sessions written to disk
+        loads: Sessions read back from disk
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_sessions: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory for eviction files (created if missing)
+            max_sessions: Resident sessions allowed, or None for no limit
+            max_bytes: Estimated resident memory allowed, or None for no limit
+
+        Raises:
+            ValueError: If a limit is set without a directory or is not positive
+        """
+        if (max_sessions is not None or max_bytes is not None) and directory is None:
+            raise ValueError("Session limits need a directory to evict to")
+        for name, limit in (("max_sessions", max_sessions), ("max_bytes", max_bytes)):
+            if limit is not None and limit < 1:
+                raise ValueError(f"{name} must be positive, got {limit}")
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.resident_bytes = 0
+        self.evictions = 0
+        self.loads = 0
+        self._resident: "OrderedDict[int, GameSession]" = OrderedDict()
+        self._sizes: Dict[int, int] = {}
+        self._users: Dict[int, int] = {}
+        self._evicted = set()
+
+    def __len__(self) -> int:
+        """Number of sessions, resident or evicted."""
+        return len(self._resident) + len(self._evicted)
+
+    def __contains__(self, game_id: Any) -> bool:
+        """Check if a session exists, resident or evicted."""
+        return game_id in self._resident or game_id in self._evicted
+
+    def __getitem__(self, game_id: int) -> GameSession:
+        """Get a session (see get()), raising KeyError if it does not exist."""
+        session = self.get(game_id)
+        if session is None:
+            raise KeyError(game_id)
+        return session
+
+    def is_resident(self, game_id: int) -> bool:
+        """Check if a session is in memory."""
+        return game_id in self._resident
+
+    def _path(self, game_id: int) -> str:
+        """Eviction file of a session."""
+        return os.path.join(self.directory, f"session-{game_id}.bgs")
+
+    def add(self, session: GameSession) -> None:
+        """
+        Store a new session as the most recently used one.
+
+        Args:
+            session: Session to store
+
+        Raises:
+            ValueError: If a session with the same id exists
+        """
+        if session.game_id in self:
+            raise ValueError(f"Game {session.game_id} already exists")
+        self._resident[session.game_id] = session
+        self._sizes[session.game_id] = estimate_session_bytes(session)
+        self.resident_bytes += self._sizes[session.game_id]
+        self._enforce_limits()
+
+    def get(self, game_id: int) -> Optional[GameSession]:
+        """
+        Get a session, reloading it from disk if it was evicted.
+
+        Callers that modify the session or wait on its lock should use
+        acquire(), which also protects it from eviction meanwhile.
+
+        Args:
+            game_id: Session id
+
+        Returns:
+            The session, or None if it does not exist
+        """
+        session = self._resident.get(game_id)
+        if session is not None:
+            self._resident.move_to_end(game_id)
+            return session
+        if game_id not in self._evicted:
+            return None
+        path = self._path(game_id)
+        with open(path, "rb") as stream:
+            session = _restore_session(game_id, stream.read())
+        os.remove(path)
+        self._evicted.discard(game_id)
+        self._resident[game_id] = session
+        self._sizes[game_id] = estimate_session_bytes(session)
+        self.resident_bytes += self._sizes[game_id]
+        self.loads += 1
+        self._enforce_limits()
+        return session
+
+    @contextmanager
+    def acquire(
+        self, game_id: int, new_session: Optional[GameSession] = None
+    ) -> Iterator[GameSession]:
+        """
+        Use a session, keeping it in memory until the block ends.
+
+        When the last user releases the session, its game's move cache is
+        cleared so an idle session only holds its game state.
+
+        Args:
+            game_id: Session id
+            new_session: Session to add() under game_id first; it is marked
+                in use before the limits are enforced, so it cannot be
+                evicted before the block starts
+
+        Yields:
+            The session
+
+        Raises:
+            KeyError: If the session does not exist
+            ValueError: If new_session has another id or already exists
+        """
+        if new_session is not None and new_session.game_id != game_id:
+            raise ValueError(
+                f"Session {new_session.game_id} cannot be added as game {game_id}"
+            )
+        self._users[game_id] = self._users.get(game_id, 0) + 1
+        try:
+            if new_session is not None:
+                self.add(new_session)
+            session = self.get(game_id)
+            if session is None:
+                raise KeyError(game_id)
+            yield session
+        finally:
+            self._users[game_id] -= 1
+            if not self._users[game_id]:
+                del self._users[game_id]
+                if game_id in self._resident:
+                    self._resident[game_id].game.move_cache.clear()
+            if game_id in self._resident:
+                self._update_size(game_id)
+                self._enforce_limits()
+
+    def _update_size(self, game_id: int) -> None:
+        """Re-estimate the memory of a resident session after it was used."""
+        size = estimate_session_bytes(self._resident[game_id])
+        self.resident_bytes += size - self._sizes[game_id]
+        self._sizes[game_id] = size
+
+    def _over_limits(self) -> bool:
+        """Check if the resident sessions exceed a limit."""
+        return (
+            self.max_sessions is not None and len(self._resident) > self.max_sessions
+        ) or (self.max_bytes is not None and self.resident_bytes > self.max_bytes)
+
+    def _enforce_limits(self) -> None:
+        """Evict least recently used idle sessions until within the limits."""
+        if not self._over_limits():
+            return
+        for game_id in list(self._resident):
+            if game_id in self._users:
+                continue
+            self.evict(game_id)
+            if not self._over_limits():
+                return
+
+    def evict(self, game_id: int) -> None:
+        """
+        Write a resident session to disk and drop it from memory.
+
+        Args:
+            game_id: Session id
+
+        Raises:
+            ValueError: If eviction is disabled or the session is in use
+        """
+        if self.directory is None:
+            raise ValueError("Session eviction needs a directory")
+        if game_id in self._users:
+            raise ValueError(f"Game {game_id} is in use")
+        session = self._resident[game_id]
+        rng_state = _pack_rng(session.game.dice.rng)
+        metadata = _get_metadata(session)
+        metadata["rng"] = bool(rng_state)
+        metadata = json.dumps(metadata).encode()
+        path = self._path(game_id)
+        with open(path + ".tmp", "wb") as stream:
+            stream.write(METADATA_LENGTH.pack(len(metadata)))
+            stream.write(metadata)
+            stream.write(rng_state)
+            stream.write(serialize_game(session.game))
+        os.replace(path + ".tmp", path)
+        del self._resident[game_id]
+        self.resident_bytes -= self._sizes.pop(game_id)
+        self._evicted.add(game_id)
+        self.evictions += 1
+
+    def remove(self, game_id: int) -> None:
+        """
+        Delete a session from memory and disk.
+
+        Args:
+            game_id: Session id
+        """
+        if game_id in self._resident:
+            del self._resident[game_id]
+            self.resident_bytes -= self._sizes.pop(game_id)
+        elif game_id in self._evicted:
+            self._evicted.discard(game_id)
+            os.remove(self._path(game_id))
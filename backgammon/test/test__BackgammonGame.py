@@ -7,7 +7,13 @@ the main game logic and state for the backgammon game.
 
 import unittest
 from unittest.mock import MagicMock, Mock
-from backgammon.core import BackgammonGame, Player
+from backgammon.core import BackgammonGame, Board, Player
+from backgammon.core.position_id import (
+    MatchState,
+    decode_match_id,
+    encode_match_id,
+    game_match_state,
+)
 from backgammon.cli import BackgammonCLI  # Updated to use new SOLID architecture
 
 # pylint: disable=C0116  # many simple test methods without individual docstrings
@@ -164,7 +170,7 @@ class TestBackgammonGame(unittest.TestCase):
         self.game.board = MagicMock()
         self.game.dice = MagicMock()
         self.game.board.move_checker.return_value = True
-        self.game.board.bar = {"white": [], "black": []}  # Add bar structure
+        self.game.board.configure_mock(bar={"white": [], "black": []})  # Add bar structure
         self.game.board.points = [[] for _ in range(24)]
         self.game.board.points[23] = [MagicMock(color="white")]  # Checker at position 24
         self.game.board.get_point_top_color = MagicMock(return_value="white")
@@ -230,7 +236,7 @@ class TestBackgammonGame(unittest.TestCase):
         self.game.get_current_player = MagicMock(return_value=current_player)
 
         # Mock the methods that is_valid_move actually uses
-        self.game.board.bar = {"white": [], "black": []}  # Add bar structure
+        self.game.board.configure_mock(bar={"white": [], "black": []})  # Add bar structure
         self.game.dice.can_use_move.return_value = True
         self.game.board.points = [[] for _ in range(24)]
         self.game.board.points[23] = [MagicMock(color="white")]  # Checker at position 24
@@ -599,5 +605,167 @@ class TestBackgammonGame(unittest.TestCase):
         self.assertFalse(result)
 
 
+    def test_position_key_includes_side_and_dice(self):
+        """Test position key changes with side to move and remaining dice"""
+        self.game.setup_players()
+        self.game.setup_board()
+        base = self.game.get_position_key()
+        self.assertEqual(base, self.game.board.zobrist_key)
+
+        self.game.switch_turns()
+        self.assertNotEqual(self.game.get_position_key(), base)
+        self.game.switch_turns()
+
+        self.game.dice.values = [3, 1]
+        with_dice = self.game.get_position_key()
+        self.assertNotEqual(with_dice, base)
+        self.game.dice.values = [1, 3]
+        self.assertEqual(self.game.get_position_key(), with_dice)
+
+    def test_position_key_updates_after_move(self):
+        """Test position key follows moves made through make_move"""
+        self.game.setup_players()
+        self.game.setup_board()
+        self.game.dice.values = [3, 1]
+        before = self.game.get_position_key()
+        self.assertTrue(self.game.make_move(24, 21))
+        after = self.game.get_position_key()
+        self.assertNotEqual(before, after)
+        self.assertEqual(
+            self.game.board.zobrist_key, self.game.board.refresh_zobrist_key()
+        )
+
+
+    def test_unmake_move_restores_hit_die_and_history(self):
+        """Test unmake_move restores board, dice and history exactly"""
+        self.game.setup_players()
+        self.game.setup_board()
+        self.game.board.move_checker(18, 20, "black")  # leave a black blot on 21
+        self.game.dice.values = [5, 3]
+        before_key = self.game.get_position_key()
+
+        self.assertTrue(self.game.make_move(24, 21))
+        self.assertEqual(self.game.board.get_bar_count("black"), 1)
+        self.assertTrue(self.game.unmake_move())
+
+        self.assertEqual(self.game.get_position_key(), before_key)
+        self.assertEqual(self.game.dice.values, [5, 3])
+        self.assertEqual(self.game.board.get_bar_count("black"), 0)
+        self.assertEqual(self.game.move_history, [])
+        self.assertEqual(self.game.move_count, 0)
+        self.assertFalse(self.game.unmake_move())
+
+    def test_unmake_move_restores_bear_off_counters(self):
+        """Test unmake_move restores the player's off-board counter"""
+        self.game.setup_players()
+        self.game.board.set_cell(2, 1)
+        self.game.dice.values = [3, 1]
+        self.assertTrue(self.game.make_move(3, "off"))
+        self.assertEqual(self.game.players[0].checkers_off_board, 1)
+        self.assertTrue(self.game.undo_last_move())
+        self.assertEqual(self.game.players[0].checkers_off_board, 0)
+        self.assertEqual(self.game.board.get_point_count(2), 1)
+        self.assertEqual(self.game.dice.values, [3, 1])
+
+    def test_copy_game_is_independent(self):
+        """Test copy shares no mutable state with the original"""
+        self.game.setup_players()
+        self.game.setup_board()
+        self.game.dice.values = [3, 1]
+        copied_game = self.game.copy()
+        self.assertTrue(copied_game.make_move(24, 21))
+        self.assertEqual(self.game.board.get_point_count(23), 2)
+        self.assertEqual(self.game.dice.values, [3, 1])
+        self.assertEqual(self.game.move_history, [])
+
+    def test_possible_moves_are_computed_once_per_turn_state(self):
+        self.game.setup_players()
+        self.game.setup_board()
+        self.game.current_player_index = 0
+        self.game.dice.values = [3, 1]
+        first = self.game.get_possible_moves()
+        legal_moves = self.game.legal_moves
+        first.clear()
+        second = self.game.get_possible_moves()
+        self.assertTrue(second)
+        self.assertIs(self.game.get_legal_moves(), legal_moves)
+        self.assertEqual(self.game.get_legal_move_set(), set(second))
+        self.assertEqual(self.game.get_legal_destinations(8), [5, 7])
+        self.assertEqual(self.game.get_legal_destinations("bar"), [])
+
+    def test_legal_moves_are_computed_lazily(self):
+        self.game.setup_players()
+        self.game.setup_board()
+        self.game.current_player_index = 0
+        self.game.roll_dice()
+        self.assertEqual(self.game.legal_moves, ())
+        moves = self.game.get_legal_moves()
+        self.assertTrue(moves)
+        self.assertTrue(self.game.make_move(*moves[0]))
+        self.assertIs(self.game.legal_moves, moves)
+        self.assertEqual(
+            self.game.get_legal_moves(),
+            tuple(self.game.board.get_possible_moves("white", self.game.dice.values)),
+        )
+
+    def test_legal_moves_follow_position_and_dice(self):
+        self.game.setup_players()
+        self.game.setup_board()
+        self.game.current_player_index = 0
+        self.game.dice.values = [3, 1]
+        self.assertTrue(self.game.is_valid_move(8, 5))
+        self.assertFalse(self.game.is_valid_move(8, 4))
+        self.assertFalse(self.game.is_valid_move([8], 5))
+        self.game.dice.values = [4]
+        self.assertTrue(self.game.is_valid_move(8, 4))
+        self.game.dice.values = [3, 1]
+        plays = self.game.get_legal_plays()
+        self.assertTrue(self.game.make_move(8, 5))
+        self.assertFalse(self.game.is_valid_move(8, 5))
+        self.assertNotEqual(self.game.get_legal_plays(), plays)
+        self.assertEqual(self.game.get_possible_moves(),
+                         self.game.board.get_possible_moves("white", [1]))
+
+
+    def test_position_and_match_id(self):
+        self.game.setup_players()
+        self.game.setup_board()
+        self.assertEqual(self.game.get_position_id(), "4HPwATDgc/ABMA")
+        self.assertEqual(game_match_state(self.game).game_state, "none")
+        self.game.start_game()
+        self.game.dice.last_roll = [3, 1]
+        state = decode_match_id(self.game.get_match_id())
+        self.assertEqual(state.game_state, "playing")
+        self.assertEqual(state.on_roll, "white")
+        self.assertEqual(state.dice, (3, 1))
+
+    def test_load_position_id(self):
+        self.game.start_game()
+        match_id = encode_match_id(MatchState(on_roll="black", turn="black", dice=(5, 5)))
+        self.game.load_position_id("sGfwATDgc/ABMA", match_id)
+        self.assertEqual(self.game.get_current_player().color, "black")
+        self.assertEqual(self.game.board.cells[4], 2)
+        self.assertEqual(self.game.dice.values, [5, 5, 5, 5])
+        self.assertEqual(self.game.get_position_id(), "sGfwATDgc/ABMA")
+        self.assertEqual(self.game.get_match_id(), match_id)
+        self.assertTrue(self.game.get_possible_moves())
+
+    def test_load_position_id_updates_player_counters(self):
+        self.game.setup_players()
+        board = Board()
+        board.set_cell(0, 1)
+        board.set_cell(24, 1)
+        board.set_cell(26, 13)
+        board.set_cell(23, -15)
+        self.game.load_position_id(board.get_position_id("white"))
+        white = self.game.players[0]
+        self.assertEqual(
+            (white.checkers_on_board, white.checkers_on_bar, white.checkers_off_board),
+            (1, 1, 13),
+        )
+        self.assertEqual(self.game.players[1].checkers_on_board, 15)
+        self.assertFalse(self.game.dice.values)
+
+
 if __name__ == "__main__":
     unittest.main()
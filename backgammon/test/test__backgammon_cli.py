@@ -6,6 +6,7 @@ Tests CLI coordinator functionality following SOLID principles.
 import unittest
 from unittest.mock import Mock, patch
 from backgammon.cli.backgammon_cli import BackgammonCLI
+from backgammon.core import BackgammonGame
 
 
 class TestBackgammonCLIInitialization(unittest.TestCase):
@@ -853,5 +854,147 @@ class TestBackgammonCLIRunGame(unittest.TestCase):
         self.cli.game_controller.complete_turn.assert_called()
 
 
+class TestBackgammonCLIBot(unittest.TestCase):
+    """Test BackgammonCLI computer opponent turns."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mock_game = Mock()
+        self.mock_game.is_game_over.return_value = False
+        self.mock_game.dice.last_roll = [3, 1]
+        self.bot = Mock()
+        self.cli = BackgammonCLI(self.mock_game, self.bot)
+
+    def test_init_stores_bot(self):
+        """Test the bot is stored and defaults to None."""
+        self.assertIs(self.cli.bot, self.bot)
+        self.assertIsNone(BackgammonCLI().bot)
+
+    def test_play_bot_turn(self):
+        """Test the bot plays, its turn is kept for display and the turn ends."""
+        self.bot.play_turn.return_value = [(8, 5), (6, 5)]
+        self.cli.ui = Mock()
+        self.cli.play_bot_turn()
+        self.bot.play_turn.assert_called_once_with(self.mock_game)
+        self.assertEqual(self.cli.bot_turn, ([3, 1], [(8, 5), (6, 5)]))
+        self.cli.ui.display_message.assert_not_called()
+        self.mock_game.complete_turn.assert_called_once()
+
+    @patch("backgammon.cli.backgammon_cli.UserInterface.display_message")
+    @patch("backgammon.cli.backgammon_cli.UserInterface.display_dice_roll")
+    def test_display_bot_turn(self, mock_dice, mock_message):
+        """Test the bot's dice and moves are shown once."""
+        self.cli.bot_turn = ([3, 1], [(8, 5), (6, 5)])
+        self.cli.display_bot_turn()
+        self.cli.display_bot_turn()
+        mock_dice.assert_called_once_with([3, 1])
+        mock_message.assert_any_call("La computadora mueve: 6 a 5")
+        self.assertEqual(mock_message.call_count, 2)
+        self.assertIsNone(self.cli.bot_turn)
+
+    @patch("backgammon.cli.backgammon_cli.UserInterface.display_message")
+    @patch("backgammon.cli.backgammon_cli.UserInterface.display_dice_roll")
+    def test_display_bot_turn_without_moves(self, _mock_dice, mock_message):
+        """Test a blocked bot's turn is reported."""
+        self.bot.play_turn.return_value = []
+        self.cli.play_bot_turn()
+        self.cli.display_bot_turn()
+        mock_message.assert_called_once_with(
+            "La computadora no tiene movimientos válidos."
+        )
+        self.mock_game.complete_turn.assert_called_once()
+
+    def test_play_bot_turn_game_over(self):
+        """Test the turn is not completed once the bot has won."""
+        self.bot.play_turn.return_value = [(1, "off")]
+        self.mock_game.is_game_over.return_value = True
+        self.cli.play_bot_turn()
+        self.mock_game.complete_turn.assert_not_called()
+
+    def test_run_game_shows_bot_turn_after_redraw(self):
+        """Test the bot's moves are printed after the screen is cleared."""
+        self.cli.ui = Mock()
+        self.cli.ui.get_player_name.side_effect = ["Human", "Computer"]
+        self.cli.game_controller = Mock()
+        self.cli.game_controller.game = self.mock_game
+        # Loop check, bot turn end check, loop check, loop check
+        self.cli.game_controller.is_game_over.side_effect = [False, False, False, True]
+        self.cli.game_controller.get_dice_values.return_value = [3, 1]
+        self.cli.display_board = Mock()
+        self.bot.is_turn.side_effect = [True, False]
+        self.bot.play_turn.return_value = [(8, 5)]
+        self.cli.game_controller.has_valid_moves.return_value = False
+
+        self.cli.run_game()
+
+        calls = [name for name, _, _ in self.cli.ui.mock_calls]
+        bot_move = calls.index("display_message", calls.index("display_dice_roll"))
+        self.assertLess(calls.index("clear_screen", 2), bot_move)
+        self.assertEqual(calls.count("clear_screen"), 2)
+        self.cli.ui.display_message.assert_any_call("La computadora mueve: 8 a 5")
+
+    def test_run_game_reports_bot_error(self):
+        """Test an error raised by the bot is reported instead of crashing."""
+        self.cli.ui = Mock()
+        self.cli.ui.get_player_name.side_effect = ["Human", "Computer"]
+        self.cli.game_controller = Mock()
+        self.cli.game_controller.is_game_over.return_value = False
+        self.cli.display_board = Mock()
+        self.bot.is_turn.return_value = True
+        self.bot.play_turn.side_effect = RuntimeError("Generated move rejected")
+
+        self.cli.run_game()
+
+        self.cli.ui.display_error.assert_called_once_with(
+            "Error de la computadora: Generated move rejected"
+        )
+        self.cli.ui.display_message.assert_called_with("¡Gracias por jugar!")
+
+
+class TestBackgammonCLIReplay(unittest.TestCase):
+    """Test BackgammonCLI replay of earlier positions."""
+
+    def setUp(self):
+        """Set up a game with a few moves."""
+        self.game = BackgammonGame()
+        self.game.start_game()
+        self.game.dice.last_roll = [3, 1]
+        self.game.dice.values = [3, 1]
+        self.game.make_move(8, 5)
+        self.game.make_move(6, 5)
+        self.cli = BackgammonCLI(self.game)
+
+    @patch("backgammon.cli.backgammon_cli.UserInterface.display_message")
+    @patch("backgammon.cli.backgammon_cli.UserInterface.display")
+    def test_display_replay(self, mock_display, mock_message):
+        """Test the board after a move number is rendered."""
+        with patch.object(
+            self.cli.board_renderer, "render_board", return_value="BOARD"
+        ) as mock_render:
+            self.cli.display_replay(1)
+        board = mock_render.call_args[0][0]
+        self.assertEqual(board.get_point_count(7), 2)
+        self.assertEqual(board.get_point_count(5), 5)
+        mock_display.assert_called_with("BOARD")
+        self.assertIn("1 de 2", mock_message.call_args[0][0])
+
+    @patch("backgammon.cli.backgammon_cli.UserInterface.display_message")
+    @patch("backgammon.cli.backgammon_cli.UserInterface.display")
+    def test_display_replay_follows_game(self, _mock_display, _mock_message):
+        """Test the replay index catches up with new moves and undos."""
+        self.cli.display_replay(0)
+        replay = self.cli.replay
+        self.game.undo_last_move()
+        self.cli.display_replay(1)
+        self.assertIs(self.cli.replay, replay)
+        self.assertEqual(len(replay), 1)
+
+    @patch("backgammon.cli.backgammon_cli.UserInterface.display_error")
+    def test_display_replay_out_of_range(self, mock_error):
+        """Test an out-of-range replay command shows an error."""
+        self.assertTrue(self.cli.run_info_command("replay", 5))
+        mock_error.assert_called_once()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,153 @@
+"""
+Test module for the one-sided bearoff database.
+
+This module contains unit tests for the index, the builder and the
+memory-mapped OneSidedBearoffDatabase, using small databases.
+"""
+
+import os
+import tempfile
+import unittest
+from backgammon.core import Board
+from backgammon.engine.bearoff import (
+    OneSidedBearoffBuilder,
+    OneSidedBearoffDatabase,
+    build_database,
+    count_positions,
+    enumerate_positions,
+    get_home_counts,
+    position_index,
+    single_die_children,
+)
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+
+
+class TestBearoffIndex(unittest.TestCase):
+    """Test cases for the combinatorial position index."""
+
+    def test_index_is_a_bijection(self):
+        indices = sorted(position_index(c, 4) for c in enumerate_positions(4))
+        self.assertEqual(indices, list(range(count_positions(4))))
+
+    def test_count_positions(self):
+        self.assertEqual(count_positions(15), 54264)
+        self.assertEqual(count_positions(1), 7)
+
+    def test_single_die_children(self):
+        # A lower checker cannot bear off with a larger die while a higher one remains
+        self.assertEqual(
+            sorted(single_die_children((1, 0, 1, 0, 0, 0), 3)),
+            [(1, 0, 0, 0, 0, 0)],
+        )
+        self.assertEqual(
+            sorted(single_die_children((1, 0, 1, 0, 0, 0), 6)),
+            [(1, 0, 0, 0, 0, 0)],
+        )
+        self.assertEqual(
+            sorted(single_die_children((1, 0, 1, 0, 0, 0), 1)),
+            [(0, 0, 1, 0, 0, 0), (1, 1, 0, 0, 0, 0)],
+        )
+
+    def test_get_home_counts(self):
+        board = Board()
+        board.setup_initial_position()
+        self.assertIsNone(get_home_counts(board, "white"))
+        white_board = Board()
+        white_board.set_cell(0, 2)
+        white_board.set_cell(5, 1)
+        white_board.set_cell(12, -3)
+        self.assertEqual(get_home_counts(white_board, "white"), (2, 0, 0, 0, 0, 1))
+        self.assertIsNone(get_home_counts(white_board, "black"))
+        black_board = Board()
+        black_board.set_cell(23, -3)
+        black_board.set_cell(18, -1)
+        self.assertEqual(get_home_counts(black_board, "black"), (3, 0, 0, 0, 0, 1))
+        black_board.set_cell(25, 1)
+        self.assertIsNone(get_home_counts(black_board, "black"))
+
+
+class TestBearoffBuilder(unittest.TestCase):
+    """Test cases for OneSidedBearoffBuilder."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.builder = OneSidedBearoffBuilder(4)
+        cls.builder.build()
+
+    def test_known_values(self):
+        expected = self.builder.expected
+        self.assertEqual(expected[(0, 0, 0, 0, 0, 0)], 0.0)
+        self.assertAlmostEqual(expected[(1, 0, 0, 0, 0, 0)], 1.0)
+        self.assertAlmostEqual(expected[(2, 0, 0, 0, 0, 0)], 1.0)
+        # One checker on the 6 point misses with 9 of the 36 rolls
+        self.assertAlmostEqual(expected[(0, 0, 0, 0, 0, 1)], 1.25)
+
+    def test_distributions_sum_to_one(self):
+        for counts, distribution in self.builder.distributions.items():
+            self.assertAlmostEqual(sum(distribution), 1.0, msg=str(counts))
+
+    def test_more_pips_never_faster(self):
+        expected = self.builder.expected
+        self.assertLessEqual(expected[(1, 1, 0, 0, 0, 0)], expected[(0, 1, 1, 0, 0, 0)])
+        self.assertLess(expected[(4, 0, 0, 0, 0, 0)], expected[(0, 0, 0, 0, 0, 4)])
+
+    def test_invalid_checker_count(self):
+        with self.assertRaises(ValueError):
+            OneSidedBearoffBuilder(16)
+
+
+class TestBearoffDatabase(unittest.TestCase):
+    """Test cases for the memory-mapped OneSidedBearoffDatabase."""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        build_database(self.path, 5)
+        self.database = OneSidedBearoffDatabase(self.path)
+
+    def tearDown(self):
+        self.database.close()
+        os.remove(self.path)
+
+    def test_header(self):
+        self.assertEqual(self.database.max_checkers, 5)
+        self.assertEqual(self.database.positions, count_positions(5))
+
+    def test_lookups_match_builder(self):
+        builder = OneSidedBearoffBuilder(5)
+        builder.build()
+        for counts, value in builder.expected.items():
+            self.assertAlmostEqual(self.database.expected_rolls(counts), value, 5)
+        distribution = self.database.distribution((0, 0, 0, 0, 0, 2))
+        self.assertEqual(len(distribution), 32)
+        self.assertAlmostEqual(sum(distribution), 1.0, 3)
+
+    def test_lookup_board(self):
+        board = Board()
+        board.set_cell(3, 2)
+        board.set_cell(26, 13)
+        board.set_cell(12, -15)
+        self.assertAlmostEqual(
+            self.database.lookup_board(board, "white"),
+            self.database.expected_rolls((0, 0, 0, 2, 0, 0)),
+        )
+        self.assertIsNone(self.database.lookup_board(board, "black"))
+
+    def test_too_many_checkers(self):
+        with self.assertRaises(ValueError):
+            self.database.expected_rolls((6, 0, 0, 0, 0, 0))
+        board = Board()
+        board.set_cell(0, 6)
+        self.assertIsNone(self.database.lookup_board(board, "white"))
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as database_file:
+            database_file.write(b"\x00" * 64)
+        with self.assertRaises(ValueError):
+            OneSidedBearoffDatabase(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
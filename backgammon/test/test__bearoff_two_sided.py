@@ -0,0 +1,117 @@
+"""
+Test module for the two-sided exact bearoff database.
+
+This module contains unit tests for the table builder and the memory-mapped
+TwoSidedBearoffDatabase, using small checker counts.
+"""
+
+import os
+import tempfile
+import unittest
+from backgammon.core import Board
+from backgammon.engine.bearoff import count_positions, position_index
+from backgammon.engine.bearoff_two_sided import (
+    TwoSidedBearoffDatabase,
+    build_database,
+    build_table,
+    get_play_results,
+)
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+
+SIX = (0, 0, 0, 0, 0, 1)
+ACE = (1, 0, 0, 0, 0, 0)
+
+
+class TestTwoSidedBuilder(unittest.TestCase):
+    """Test cases for build_table and get_play_results."""
+
+    def test_play_results(self):
+        self.assertEqual(get_play_results((0, 0, 1, 0, 0, 0), 1, 2), [(0,) * 6])
+        self.assertEqual(
+            get_play_results((1, 0, 2, 0, 0, 0), 2, 1),
+            [(1, 0, 1, 0, 0, 0), (2, 1, 0, 0, 0, 0)],
+        )
+        # 1-1 moves four pips in total: 4+4, 5+3 or 6+2 from the 6 point
+        self.assertEqual(
+            get_play_results((0, 0, 0, 0, 0, 2), 1, 1),
+            [(0, 0, 0, 2, 0, 0), (0, 0, 1, 0, 1, 0), (0, 1, 0, 0, 0, 1)],
+        )
+
+    def test_known_values(self):
+        table = build_table(2)
+        size = count_positions(2)
+        six = position_index(SIX, 2)
+        ace = position_index(ACE, 2)
+        self.assertEqual(table[ace * size + six], 1.0)
+        # Misses with 9 of 36 rolls, then the opponent misses as often
+        self.assertAlmostEqual(table[six * size + six], 0.75 + 0.25 * 0.25)
+        self.assertAlmostEqual(table[six * size + ace], 0.75)
+
+    def test_workers_give_same_table(self):
+        self.assertEqual(build_table(2, workers=1), build_table(2, workers=2))
+
+    def test_probabilities_in_range(self):
+        table = build_table(3)
+        self.assertTrue(all(0.0 <= value <= 1.0 for value in table))
+
+    def test_invalid_checker_count(self):
+        with self.assertRaises(ValueError):
+            build_table(0)
+
+
+class TestTwoSidedDatabase(unittest.TestCase):
+    """Test cases for the memory-mapped TwoSidedBearoffDatabase."""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        build_database(self.path, 3)
+        self.database = TwoSidedBearoffDatabase(self.path)
+
+    def tearDown(self):
+        self.database.close()
+        os.remove(self.path)
+
+    def test_header(self):
+        self.assertEqual(self.database.max_checkers, 3)
+        self.assertEqual(self.database.positions, count_positions(3))
+
+    def test_win_probability(self):
+        self.assertAlmostEqual(self.database.win_probability(SIX, SIX), 0.8125, 4)
+        self.assertEqual(self.database.win_probability(ACE, (3, 0, 0, 0, 0, 0)), 1.0)
+
+    def test_lookup_board(self):
+        board = Board()
+        board.set_cell(5, 1)
+        board.set_cell(26, 14)
+        board.set_cell(18, -1)
+        board.set_cell(27, 14)
+        self.assertAlmostEqual(self.database.lookup_board(board, "white"), 0.8125, 4)
+        self.assertAlmostEqual(
+            self.database.lookup_board(board, "black", on_roll=False), 0.1875, 4
+        )
+
+    def test_lookup_board_not_covered(self):
+        board = Board()
+        board.setup_initial_position()
+        self.assertIsNone(self.database.lookup_board(board, "white"))
+        board = Board()
+        board.set_cell(0, 4)
+        board.set_cell(23, -1)
+        self.assertIsNone(self.database.lookup_board(board, "black"))
+
+    def test_position_not_covered(self):
+        with self.assertRaises(ValueError):
+            self.database.win_probability((4, 0, 0, 0, 0, 0), ACE)
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as database_file:
+            database_file.write(b"BGBO" + b"\x00" * 60)
+        with self.assertRaises(ValueError):
+            TwoSidedBearoffDatabase(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
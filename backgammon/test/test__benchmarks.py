@@ -0,0 +1,139 @@
+"""
+Test module for the benchmarks package.
+
+This module contains unit tests for the benchmark runner, the JSON reports
+and the regression check against a baseline.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from benchmarks import Benchmark, BenchmarkSkipped, compare, get_benchmarks, run_benchmarks
+from benchmarks.__main__ import main
+from benchmarks.cases import bearoff_game, middle_game
+from benchmarks.runner import format_report, read_report, write_report
+
+# pylint: disable=C0116  # many simple test methods without docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+
+
+def make_report(**times):
+    return {
+        "results": {
+            name: {"best_us": best, "median_us": best} for name, best in times.items()
+        }
+    }
+
+
+def skipped_setup():
+    raise BenchmarkSkipped("not here")
+
+
+class TestRunner(unittest.TestCase):
+    """Tests for the benchmark runner"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_run_and_skip(self):
+        benchmarks = [
+            Benchmark("a.sum", "micro", lambda: lambda: sum(range(10)), 100, 3),
+            Benchmark("a.skipped", "micro", skipped_setup, 100),
+            Benchmark("b.other", "micro", lambda: lambda: None, 100),
+        ]
+        report = run_benchmarks(benchmarks, pattern="a.", scale=0.5)
+        self.assertEqual(list(report["results"]), ["a.sum", "a.skipped"])
+        result = report["results"]["a.sum"]
+        self.assertEqual((result["number"], result["repeat"]), (50, 3))
+        self.assertLessEqual(result["best_us"], result["median_us"])
+        self.assertEqual(report["results"]["a.skipped"]["skipped"], "not here")
+        self.assertIn("skipped: not here", format_report(report))
+
+    def test_report_round_trip(self):
+        path = os.path.join(self.directory, "report.json")
+        report = make_report(first=1.5)
+        write_report(report, path)
+        self.assertEqual(read_report(path), report)
+
+    def test_compare_flags_regressions(self):
+        baseline = make_report(same=10.0, slower=10.0, faster=10.0, removed=1.0)
+        report = make_report(same=10.5, slower=12.0, faster=8.0, added=1.0)
+        report["results"]["skipped"] = {"skipped": "no pygame"}
+        baseline["results"]["skipped"] = {"best_us": 1.0}
+        statuses = {c.name: c.status for c in compare(report, baseline, tolerance=0.1)}
+        self.assertEqual(
+            statuses, {"same": "same", "slower": "regression", "faster": "improvement"}
+        )
+        self.assertIn("+20.0% !", format_report(report, compare(report, baseline)))
+
+
+class TestCases(unittest.TestCase):
+    """Tests for the benchmark positions and definitions"""
+
+    def test_positions_are_reproducible(self):
+        first, second = middle_game(), middle_game()
+        self.assertEqual(first.board.cells, second.board.cells)
+        self.assertEqual(first.dice.values, second.dice.values)
+        self.assertTrue(first.get_legal_moves())
+        self.assertTrue(bearoff_game().board.can_bear_off("white"))
+
+    def test_micro_benchmarks_run_repeatedly(self):
+        names = [benchmark.name for benchmark in get_benchmarks()]
+        self.assertEqual(len(names), len(set(names)))
+        for benchmark in get_benchmarks():
+            if benchmark.kind != "micro":
+                continue
+            try:
+                function = benchmark.setup()
+            except BenchmarkSkipped:
+                continue
+            function()
+            function()
+
+
+class TestMain(unittest.TestCase):
+    """Tests for the command line"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def run_main(self, *argv):
+        with redirect_stdout(io.StringIO()) as output:
+            status = main(list(argv))
+        return status, output.getvalue()
+
+    def test_baseline_comparison(self):
+        baseline = os.path.join(self.directory, "baseline.json")
+        status, _ = self.run_main(
+            "--filter", "get_possible_moves.opening", "--quick", "--save-baseline", baseline
+        )
+        self.assertEqual(status, 0)
+        saved = read_report(baseline)
+        self.assertEqual(list(saved["results"]), ["board.get_possible_moves.opening"])
+
+        saved["results"]["board.get_possible_moves.opening"]["best_us"] /= 100
+        write_report(saved, baseline)
+        status, output = self.run_main(
+            "--filter", "get_possible_moves.opening", "--quick", "--baseline", baseline
+        )
+        self.assertEqual(status, 1)
+        self.assertIn("1 regression(s)", output)
+
+    def test_list(self):
+        status, output = self.run_main("--list")
+        self.assertEqual(status, 0)
+        self.assertIn("selfplay.random_game (macro)", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,7 +5,9 @@ This module contains unit tests for the Board class which represents
 the backgammon game board and handles checker movements.
 """
 
+import random
 import unittest
+from array import array
 from unittest.mock import Mock
 from backgammon.core import Board, Checker
 
@@ -112,8 +114,8 @@ class TestBoard(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(len(self.board.bar["black"]), 1)  # Black checker moved to bar
         self.assertEqual(
-            self.board.points[6][0], mock_white_checker
-        )  # White checker at position 6
+            self.board.points[6][0].color, mock_white_checker.color
+        )  # White checker at position 6 (board stores counts, not objects)
 
     def test_move_checker_invalid_from_empty(self):
         self.board.points[10] = []
@@ -277,5 +279,244 @@ class TestBoard(unittest.TestCase):
         self.assertFalse(self.board.all_checkers_in_home_board("white"))
 
 
+    def test_compact_cells_initial_position(self):
+        self.board.setup_initial_position()
+        self.assertEqual(len(self.board.cells), 28)
+        self.assertEqual(self.board.cells[23], 2)
+        self.assertEqual(self.board.cells[0], -2)
+        self.assertEqual(sum(v for v in self.board.cells[:24] if v > 0), 15)
+        self.assertEqual(sum(-v for v in self.board.cells[:24] if v < 0), 15)
+
+    def test_to_bytes_and_from_bytes_roundtrip(self):
+        self.board.setup_initial_position()
+        self.board.move_checker(5, 0, self.white)
+        data = self.board.to_bytes()
+        self.assertEqual(len(data), 28)
+        restored = Board.from_bytes(data)
+        self.assertEqual(restored.to_bytes(), data)
+        self.assertEqual(hash(restored.to_bytes()), hash(data))
+        with self.assertRaises(ValueError):
+            Board.from_bytes(b"\x00" * 5)
+
+    def test_copy_is_independent(self):
+        self.board.setup_initial_position()
+        clone = self.board.copy()
+        clone.move_checker(23, 20, self.white)
+        self.assertEqual(self.board.get_point_count(23), 2)
+        self.assertEqual(clone.get_point_count(23), 1)
+
+    def test_views_write_through_to_cells(self):
+        self.board.points[4] = [Checker(self.black) for _ in range(3)]
+        self.assertEqual(self.board.cells[4], -3)
+        self.board.points[4].pop()
+        self.assertEqual(self.board.get_point_count(4), 2)
+        self.board.bar[self.white].append(Checker(self.white))
+        self.assertEqual(self.board.get_bar_count(self.white), 1)
+        self.board.off[self.black].extend([Checker(self.black)] * 2)
+        self.assertEqual(self.board.get_off_count(self.black), 2)
+
+    def test_hit_and_bear_off_update_counts(self):
+        self.board.points[3] = [Checker(self.white)]
+        self.board.points[1] = [Checker(self.black)]
+        self.assertTrue(self.board.move_checker(3, 1, self.white))
+        self.assertEqual(self.board.get_bar_count(self.black), 1)
+        self.assertEqual(self.board.get_point_top_color(1), self.white)
+        self.assertTrue(self.board.bear_off(1, self.white))
+        self.assertEqual(self.board.get_off_count(self.white), 1)
+        self.assertIsNone(self.board.get_point_top_color(1))
+
+
+    def test_zobrist_key_incremental_matches_full_hash(self):
+        self.assertEqual(self.board.zobrist_key, 0)
+        self.board.setup_initial_position()
+        self.assertEqual(self.board.zobrist_key, self.board.refresh_zobrist_key())
+        self.board.points[1] = [Checker(self.black)]
+        self.board.move_checker(5, 1, self.white)  # hit
+        self.board.move_from_bar(self.black, 3)
+        self.board.bear_off(0, self.black)
+        key = self.board.zobrist_key
+        self.assertNotEqual(key, 0)
+        self.assertEqual(key, self.board.refresh_zobrist_key())
+
+    def test_zobrist_key_same_for_transpositions(self):
+        self.board.setup_initial_position()
+        other = self.board.copy()
+        self.board.move_checker(7, 4, self.white)
+        self.board.move_checker(5, 4, self.white)
+        other.move_checker(5, 4, self.white)
+        other.move_checker(7, 4, self.white)
+        self.assertEqual(self.board.zobrist_key, other.zobrist_key)
+        self.assertEqual(
+            Board.from_bytes(self.board.to_bytes()).zobrist_key, other.zobrist_key
+        )
+
+    def test_cells_from_state(self):
+        self.board.setup_initial_position()
+        self.board.set_cell(24, 1)
+        self.board.set_cell(27, 2)
+        cells = Board.cells_from_state(self.board.get_state())
+        self.assertEqual(cells, self.board.cells)
+        self.assertIsNot(cells, self.board.cells)
+
+    def test_zobrist_key_after_set_state_and_reset(self):
+        self.board.setup_initial_position()
+        key = self.board.zobrist_key
+        new = Board()
+        new.set_state(self.board.get_state())
+        self.assertEqual(new.zobrist_key, key)
+        new.reset()
+        self.assertEqual(new.zobrist_key, 0)
+
+
+    def test_cells_are_read_only(self):
+        self.board.setup_initial_position()
+        with self.assertRaises(TypeError):
+            self.board.cells[0] = 5
+        with self.assertRaises(AttributeError):
+            self.board.cells = array("b", bytes(28))
+        self.assertEqual(self.board.cells.tobytes(), self.board.to_bytes())
+
+    def test_set_cell_keeps_key_and_counters(self):
+        self.board.setup_initial_position()
+        self.board.set_cell(2, 3)
+        self.board.set_cell(24, 1)
+        self.board.set_cell(12, -6)
+        expected = Board.from_bytes(self.board.to_bytes())
+        self.assertEqual(self.board.zobrist_key, expected.zobrist_key)
+        self.assertEqual(self.board.pips, expected.pips)
+        self.assertEqual(self.board.outside_count, expected.outside_count)
+        self.assertEqual(self.board.occupied, expected.occupied)
+
+    def test_set_cell_rejects_invalid_values(self):
+        with self.assertRaises(IndexError):
+            self.board.set_cell(28, 1)
+        with self.assertRaises(ValueError):
+            self.board.set_cell(24, -1)
+        with self.assertRaises(ValueError):
+            self.board.set_cell(0, 16)
+        self.assertEqual(self.board.to_bytes(), bytes(28))
+
+    def test_views_reject_invalid_checker_lists(self):
+        with self.assertRaises(ValueError):
+            self.board.points[0] = [Checker(self.white), Checker(self.black)]
+        with self.assertRaises(ValueError):
+            self.board.bar[self.white] = [Checker(self.white)] * 16
+        self.board.points[3].append(Checker(self.white))
+        with self.assertRaises(ValueError):
+            self.board.points[3].append(Checker(self.black))
+        self.assertEqual(self.board.cells[3], 1)
+        expected = Board.from_bytes(self.board.to_bytes())
+        self.assertEqual(self.board.zobrist_key, expected.zobrist_key)
+
+    def test_make_and_unmake_move_restore_position(self):
+        self.board.setup_initial_position()
+        self.board.points[20] = [Checker(self.black)]
+        self.board.set_cell(18, -4)
+        before = (self.board.to_bytes(), self.board.zobrist_key)
+        delta = self.board.make_move(23, 20, self.white)  # hit
+        self.assertTrue(delta.hit)
+        self.assertEqual(self.board.get_bar_count(self.black), 1)
+        self.board.unmake_move(delta)
+        self.assertEqual((self.board.to_bytes(), self.board.zobrist_key), before)
+
+    def test_make_and_unmake_bar_entry_and_bear_off(self):
+        self.board.bar[self.white].append(Checker(self.white))
+        self.board.points[2] = [Checker(self.white)]
+        before = self.board.to_bytes()
+        entry = self.board.make_move("bar", 19, self.white)
+        bear = self.board.make_move(2, "off", self.white)
+        self.assertEqual(self.board.get_off_count(self.white), 1)
+        self.board.unmake_move(bear)
+        self.board.unmake_move(entry)
+        self.assertEqual(self.board.to_bytes(), before)
+
+    def test_make_move_illegal_returns_none(self):
+        self.board.points[1] = [Checker(self.white)]
+        self.board.points[0] = [Checker(self.black), Checker(self.black)]
+        self.assertIsNone(self.board.make_move(1, 0, self.white))
+        self.assertIsNone(self.board.make_move("bar", 5, self.white))
+
+
+    def test_get_pip_count_initial_position(self):
+        self.board.setup_initial_position()
+        self.assertEqual(self.board.get_pip_count(self.white), 167)
+        self.assertEqual(self.board.get_pip_count(self.black), 167)
+        self.board.bar[self.white].append(Checker(self.white))
+        self.assertEqual(self.board.get_pip_count(self.white), 192)
+
+
+    def test_views_share_checker_instances(self):
+        self.board.setup_initial_position()
+        self.board.set_cell(24, 2)
+        self.board.set_cell(27, 1)
+        white_point = self.board.points[23]
+        self.assertIs(white_point[0], white_point[1])
+        self.assertIs(white_point[0], self.board.points[5][0])
+        self.assertIs(self.board.points[0][0], Checker.shared("black"))
+        self.assertTrue(all(checker.is_on_bar() for checker in self.board.bar["white"]))
+        self.assertTrue(self.board.off["black"][0].is_off_board())
+        self.assertFalse(self.board.points[0][0].is_on_bar())
+
+
+    def test_position_id_round_trip(self):
+        self.board.setup_initial_position()
+        self.board.set_cell(7, self.board.cells[7] - 1)
+        self.board.set_cell(5, self.board.cells[5] - 1)
+        self.board.set_cell(4, self.board.cells[4] + 2)
+        position_id = self.board.get_position_id("black")
+        self.assertEqual(position_id, "sGfwATDgc/ABMA")
+        board = Board.from_position_id(position_id, "black")
+        self.assertEqual(board.cells, self.board.cells)
+        self.assertEqual(board.zobrist_key, self.board.refresh_zobrist_key())
+
+
+
+    def test_counters_follow_moves(self):
+        self.board.setup_initial_position()
+        self.assertEqual(self.board.pips, {"white": 167, "black": 167})
+        self.assertEqual(self.board.outside_count, {"white": 10, "black": 10})
+        rng = random.Random(7)
+        deltas = []
+        for turn in range(200):
+            color = ("white", "black")[turn % 2]
+            moves = self.board.get_possible_moves(color, [rng.randint(1, 6)])
+            if not moves:
+                continue
+            from_pos, to_pos = rng.choice(moves)
+            delta = self.board.make_move(
+                from_pos if from_pos == "bar" else from_pos - 1,
+                to_pos if to_pos == "off" else to_pos - 1,
+                color,
+            )
+            deltas.append(delta)
+            expected = self.board.copy()
+            expected.refresh_counters()
+            self.assertEqual(self.board.pips, expected.pips)
+            self.assertEqual(self.board.outside_count, expected.outside_count)
+            self.assertEqual(self.board.occupied, expected.occupied)
+        for delta in reversed(deltas):
+            self.board.unmake_move(delta)
+        self.assertEqual(self.board.pips, {"white": 167, "black": 167})
+        self.assertEqual(self.board.occupied["white"], (1 << 5) | (1 << 7) | (1 << 12) | (1 << 23))
+
+
+    def test_farthest_point(self):
+        self.assertIsNone(self.board.get_farthest_point("white"))
+        self.board.set_cell(2, 2)
+        self.board.set_cell(4, 1)
+        self.board.set_cell(19, -3)
+        self.board.set_cell(22, -1)
+        self.assertEqual(self.board.get_farthest_point("white"), 4)
+        self.assertEqual(self.board.get_farthest_point("black"), 19)
+        self.assertTrue(self.board.is_farthest_home_point(4, "white"))
+        self.assertFalse(self.board.is_farthest_home_point(2, "white"))
+        self.assertTrue(self.board.is_farthest_home_point(19, "black"))
+        self.assertFalse(self.board.is_farthest_home_point(22, "black"))
+        self.assertTrue(self.board.all_checkers_in_home_board("white"))
+        self.board.set_cell(25, 1)
+        self.assertFalse(self.board.all_checkers_in_home_board("black"))
+        self.assertEqual(self.board.get_pip_count("black"), 3 * 5 + 2 + 25)
+
+
 if __name__ == "__main__":
     unittest.main()
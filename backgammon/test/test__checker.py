@@ -5,6 +5,8 @@ This module contains unit tests for the Checker class which represents
 individual checker pieces in the backgammon game.
 """
 
+import copy
+import pickle
 import unittest
 from backgammon.core import Checker
 
@@ -313,5 +315,56 @@ class TestChecker(unittest.TestCase):
             Checker.get_opposite_color("red")
 
 
+    def test_checker_has_no_dict(self):
+        """Test checkers use __slots__ instead of a per-instance __dict__"""
+        checker = Checker("white")
+        self.assertFalse(hasattr(checker, "__dict__"))
+        with self.assertRaises(AttributeError):
+            checker.label = "x"  # pylint: disable=assigning-non-slot
+
+    def test_shared_returns_interned_instance(self):
+        """Test shared checkers are interned per color and location"""
+        self.assertIs(Checker.shared("white"), Checker.shared("white"))
+        self.assertIsNot(Checker.shared("white"), Checker.shared("black"))
+        self.assertIsNot(Checker.shared("black"), Checker.shared("black", "bar"))
+        self.assertTrue(Checker.shared("black", "bar").is_on_bar())
+        self.assertTrue(Checker.shared("white", "off").is_off_board())
+        self.assertIsInstance(Checker.shared("white"), Checker)
+
+    def test_shared_invalid_arguments(self):
+        """Test shared rejects unknown colors and locations"""
+        with self.assertRaises(ValueError):
+            Checker.shared("red")
+        with self.assertRaises(ValueError):
+            Checker.shared("white", 5)
+
+    def test_shared_checker_is_immutable(self):
+        """Test shared checkers cannot be modified in place"""
+        shared = Checker.shared("white")
+        with self.assertRaises(AttributeError):
+            shared.set_position(5)
+        with self.assertRaises(AttributeError):
+            shared.move_to_bar()
+        self.assertIsNone(shared.position)
+
+    def test_shared_checker_copy_is_mutable(self):
+        """Test copy of a shared checker returns an independent checker"""
+        shared = Checker.shared("black", "bar")
+        copied = shared.copy()
+        self.assertIsNot(copied, shared)
+        self.assertEqual(copied.color, "black")
+        self.assertTrue(copied.is_on_bar())
+        copied.set_position(3)
+        self.assertEqual(copied.position, 3)
+        self.assertTrue(shared.is_on_bar())
+
+    def test_shared_checker_survives_copy_and_pickle(self):
+        """Test copying or pickling a shared checker keeps the interned instance"""
+        shared = Checker.shared("white", "off")
+        self.assertIs(copy.copy(shared), shared)
+        self.assertIs(copy.deepcopy(shared), shared)
+        self.assertIs(pickle.loads(pickle.dumps(shared)), shared)
+
+
 if __name__ == "__main__":
     unittest.main()
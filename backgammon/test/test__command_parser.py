@@ -6,6 +6,8 @@ Tests command parsing functionality following SOLID principles.
 import unittest
 from backgammon.cli.command_parser import CommandParser
 
+# pylint: disable=R0904  # many public methods needed for comprehensive testing
+
 
 class TestCommandParser(unittest.TestCase):
     """Test cases for CommandParser class."""
@@ -122,5 +124,13 @@ class TestCommandParser(unittest.TestCase):
         self.assertEqual(self.parser.get_command_type("Help"), "help")
 
 
+    def test_parse_move_input_replay(self):
+        """Test parsing the replay command with a move number."""
+        self.assertEqual(self.parser.parse_move_input("repetir 12"), ("replay", 12))
+        self.assertEqual(self.parser.parse_move_input("Replay 0"), ("replay", 0))
+        self.assertEqual(self.parser.get_command_type("repetir"), "replay")
+        self.assertEqual(self.parser.get_command_type("replay"), "replay")
+
+
 if __name__ == "__main__":
     unittest.main()
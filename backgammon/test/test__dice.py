@@ -5,6 +5,7 @@ This module contains unit tests for the Dice class which handles
 dice rolling and move management in the backgammon game.
 """
 
+import random
 import unittest
 from unittest.mock import patch
 from backgammon.core import Dice
@@ -309,5 +310,22 @@ class TestDice(unittest.TestCase):
         self.assertIsInstance(repr_str, str)
 
 
+    def test_dice_with_seeded_rng_is_reproducible(self):
+        first = Dice(random.Random(42))
+        second = Dice(random.Random(42))
+        rolls_first = [first.roll() for _ in range(10)]
+        rolls_second = [second.roll() for _ in range(10)]
+        self.assertEqual(rolls_first, rolls_second)
+
+    def test_dice_copy_keeps_state(self):
+        dice = Dice(random.Random(1))
+        dice.roll()
+        copied = dice.copy()
+        self.assertEqual(copied.last_roll, dice.last_roll)
+        self.assertEqual(copied.values, dice.values)
+        copied.values.clear()
+        self.assertTrue(dice.values)
+
+
 if __name__ == "__main__":
     unittest.main()
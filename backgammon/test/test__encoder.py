@@ -0,0 +1,127 @@
+"""
+Test module for the vectorized batch encoder.
+
+This module contains unit tests for encode_batch and BatchEncoder. The tests
+are skipped when NumPy is not installed.
+"""
+
+import random
+import unittest
+
+try:
+    import numpy as np
+    from backgammon.engine.encoder import (
+        NUM_FEATURES,
+        BatchEncoder,
+        encode_batch,
+        positions_to_keys,
+    )
+except ImportError:  # pragma: no cover - NumPy is optional for the core game
+    np = None
+
+from backgammon.core import Board
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+
+
+def reference_features(board, color, on_roll=True):
+    """Encode one board with plain Python loops, point by point."""
+    opponent = "black" if color == "white" else "white"
+    order = range(24) if color == "white" else range(23, -1, -1)
+    features = []
+    for side in (color, opponent):
+        for index in order:
+            n = board.get_point_count(index) if board.get_point_top_color(index) == side else 0
+            features += [n >= 1, n >= 2, n >= 3, max(n - 3, 0) / 2]
+    features += [
+        board.get_bar_count(color) / 2,
+        board.get_off_count(color) / 15,
+        board.get_bar_count(opponent) / 2,
+        board.get_off_count(opponent) / 15,
+        1.0 if on_roll else 0.0,
+        0.0 if on_roll else 1.0,
+    ]
+    return features
+
+
+def random_board(rng):
+    """Build a random legal-looking board."""
+    board = Board()
+    for sign, bar_slot, off_slot in ((1, 24, 26), (-1, 25, 27)):
+        for _ in range(15):
+            slot = rng.randrange(26)
+            if slot == 24:
+                board.set_cell(bar_slot, board.cells[bar_slot] + 1)
+            elif slot == 25:
+                board.set_cell(off_slot, board.cells[off_slot] + 1)
+            elif board.cells[slot] * sign >= 0:
+                board.set_cell(slot, board.cells[slot] + sign)
+            else:
+                board.set_cell(off_slot, board.cells[off_slot] + 1)
+    return board
+
+
+@unittest.skipUnless(np is not None, "NumPy is not installed")
+class TestEncodeBatch(unittest.TestCase):
+    """Test cases for encode_batch."""
+
+    def setUp(self):
+        rng = random.Random(5)
+        self.boards = [random_board(rng) for _ in range(50)]
+
+    def test_matches_reference(self):
+        for color in ("white", "black"):
+            for on_roll in (True, False):
+                features = encode_batch(self.boards, color, on_roll)
+                expected = [reference_features(b, color, on_roll) for b in self.boards]
+                np.testing.assert_allclose(features, np.array(expected, dtype=np.float32))
+
+    def test_input_types_agree(self):
+        boards = encode_batch(self.boards, "white")
+        keys = encode_batch([b.to_bytes() for b in self.boards], "white")
+        states = encode_batch([b.get_state() for b in self.boards], "white")
+        np.testing.assert_array_equal(boards, keys)
+        np.testing.assert_array_equal(boards, states)
+
+    def test_writes_into_out(self):
+        out = np.full((len(self.boards), NUM_FEATURES), -1.0, dtype=np.float32)
+        result = encode_batch(self.boards, "black", out=out)
+        self.assertIs(result, out)
+        self.assertTrue(np.all(out >= 0.0))
+
+    def test_bad_out(self):
+        with self.assertRaises(ValueError):
+            encode_batch(self.boards, "white", out=np.empty((3, NUM_FEATURES), np.float32))
+        with self.assertRaises(ValueError):
+            encode_batch(
+                self.boards, "white", out=np.empty((50, NUM_FEATURES), np.float64)
+            )
+
+    def test_empty_batch(self):
+        self.assertEqual(encode_batch([], "white").shape, (0, NUM_FEATURES))
+
+    def test_unsupported_type(self):
+        with self.assertRaises(TypeError):
+            positions_to_keys([42])
+
+
+@unittest.skipUnless(np is not None, "NumPy is not installed")
+class TestBatchEncoder(unittest.TestCase):
+    """Test cases for the buffer-reusing BatchEncoder."""
+
+    def test_reuses_and_grows_buffer(self):
+        encoder = BatchEncoder(capacity=4)
+        board = Board()
+        board.setup_initial_position()
+        first = encoder.encode([board] * 3, "white")
+        second = encoder.encode([board] * 2, "black")
+        self.assertTrue(np.shares_memory(first, second))
+        large = encoder.encode([board] * 10, "white")
+        self.assertEqual(large.shape, (10, NUM_FEATURES))
+        self.assertEqual(encoder.capacity, 10)
+        np.testing.assert_array_equal(large[9], encode_batch([board], "white")[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
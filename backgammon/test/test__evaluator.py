@@ -0,0 +1,147 @@
+"""
+Test module for the neural-network position evaluator.
+
+This module contains unit tests for the feature encoding, NeuralEvaluator
+and NeuralPolicy. The tests are skipped when NumPy is not installed.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+    from backgammon.engine.evaluator import (
+        NUM_FEATURES,
+        NUM_OUTPUTS,
+        NeuralEvaluator,
+        NeuralPolicy,
+        encode_board,
+        encode_positions,
+        get_equities,
+    )
+except ImportError:  # pragma: no cover - NumPy is optional for the core game
+    np = None
+
+from backgammon.core import BackgammonGame, Board
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+
+
+@unittest.skipUnless(np is not None, "NumPy is not installed")
+class TestEncoding(unittest.TestCase):
+    """Test cases for the 198-input feature encoding."""
+
+    def setUp(self):
+        self.board = Board()
+        self.board.setup_initial_position()
+
+    def test_shape_and_type(self):
+        features = encode_board(self.board, "white")
+        self.assertEqual(features.shape, (NUM_FEATURES,))
+        self.assertEqual(features.dtype, np.float32)
+
+    def test_initial_position_is_symmetric(self):
+        white = encode_board(self.board, "white")
+        black = encode_board(self.board, "black")
+        np.testing.assert_array_equal(white, black)
+
+    def test_point_units(self):
+        # White has 5 checkers on its 6 point (slot 5) and 2 on its 24 point
+        features = encode_board(self.board, "white")
+        np.testing.assert_array_equal(features[20:24], [1, 1, 1, 1])
+        np.testing.assert_array_equal(features[92:96], [1, 1, 0, 0])
+        # Black has 2 checkers on white's 1 point (slot 0)
+        np.testing.assert_array_equal(features[96:100], [1, 1, 0, 0])
+
+    def test_bar_off_and_turn(self):
+        self.board.set_cell(0, 0)
+        self.board.set_cell(25, 2)
+        self.board.set_cell(26, 3)
+        features = encode_board(self.board, "white", on_roll=False)
+        self.assertAlmostEqual(features[193], 3 / 15)
+        self.assertAlmostEqual(features[194], 1.0)
+        np.testing.assert_array_equal(features[196:], [0, 1])
+
+    def test_batch_matches_single(self):
+        other = Board()
+        other.set_cell(3, 15)
+        other.set_cell(20, -15)
+        batch = encode_positions([self.board.to_bytes(), other.to_bytes()], "black")
+        np.testing.assert_array_equal(batch[1], encode_board(other, "black"))
+
+
+@unittest.skipUnless(np is not None, "NumPy is not installed")
+class TestNeuralEvaluator(unittest.TestCase):
+    """Test cases for the NeuralEvaluator class."""
+
+    def setUp(self):
+        self.evaluator = NeuralEvaluator.random(hidden=(16,), seed=1)
+        self.board = Board()
+        self.board.setup_initial_position()
+
+    def test_outputs_consistent(self):
+        game = BackgammonGame()
+        game.setup_players()
+        game.setup_board()
+        game.current_player_index = 0
+        game.dice.values = [3, 1]
+        plays = game.get_legal_plays()
+        outputs = self.evaluator.evaluate_positions([p[1] for p in plays], "white")
+        self.assertEqual(outputs.shape, (len(plays), NUM_OUTPUTS))
+        self.assertTrue(np.all(outputs[:, 1] <= outputs[:, 0]))
+        self.assertTrue(np.all(outputs[:, 2] <= outputs[:, 1]))
+        self.assertTrue(np.all(outputs[:, 3] <= 1.0 - outputs[:, 0] + 1e-6))
+        self.assertTrue(np.all(outputs[:, 4] <= outputs[:, 3]))
+
+    def test_evaluate_dict(self):
+        result = self.evaluator.evaluate(self.board, "white")
+        self.assertEqual(
+            set(result),
+            {"win", "gammon", "backgammon", "lose_gammon", "lose_backgammon", "equity"},
+        )
+        self.assertGreaterEqual(result["equity"], -3.0)
+        self.assertLessEqual(result["equity"], 3.0)
+
+    def test_equities(self):
+        outputs = np.array([[1, 1, 1, 0, 0], [0, 0, 0, 1, 1]], dtype=np.float32)
+        np.testing.assert_allclose(get_equities(outputs), [3.0, -3.0])
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.evaluator.save(directory)
+            self.assertTrue(os.path.exists(os.path.join(directory, "w1.npy")))
+            loaded = NeuralEvaluator.load(directory)
+        features = encode_board(self.board, "black")[np.newaxis, :]
+        np.testing.assert_array_equal(
+            loaded.forward(features), self.evaluator.forward(features)
+        )
+
+    def test_load_missing(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(FileNotFoundError):
+                NeuralEvaluator.load(directory)
+
+    def test_shape_mismatch(self):
+        with self.assertRaises(ValueError):
+            NeuralEvaluator([np.zeros((10, 5))], [np.zeros(5)])
+        with self.assertRaises(ValueError):
+            NeuralEvaluator([np.zeros((NUM_FEATURES, 4))], [np.zeros(4)])
+
+    def test_policy_picks_best_equity(self):
+        game = BackgammonGame()
+        game.setup_players()
+        game.setup_board()
+        game.current_player_index = 1
+        game.dice.values = [6, 5]
+        plays = game.get_legal_plays()
+        policy = NeuralPolicy(self.evaluator)
+        chosen = policy.choose_play(game, plays, random.Random(0))
+        equities = self.evaluator.evaluate_plays(plays, "black")
+        self.assertEqual(chosen, plays[int(np.argmax(equities))])
+
+
+if __name__ == "__main__":
+    unittest.main()
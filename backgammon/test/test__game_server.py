@@ -0,0 +1,247 @@
+"""
+Test module for the asyncio game server.
+
+This module contains unit tests for the game sessions, the request
+operations and the TCP line protocol of the game server.
+"""
+
+import asyncio
+import base64
+import json
+import threading
+import unittest
+from unittest.mock import patch
+
+from backgammon.core import BackgammonGame
+from backgammon.core.serialization import deserialize_game, serialize_game
+from backgammon.server import GameServer
+from backgammon.engine.policies import make_policy
+from backgammon.server.game_server import choose_moves
+
+# pylint: disable=C0116  # many simple test methods without docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    """Tests for GameServer request handling"""
+
+    def setUp(self):
+        self.server = GameServer(port=0)
+
+    async def request(self, **request):
+        return await self.server.handle_request(request)
+
+    async def create_human_game(self, seed=3):
+        created = await self.request(op="create", seed=seed)
+        joined = await self.request(op="join", game=created["game"])
+        return created, joined
+
+    async def test_create_and_join(self):
+        created, joined = await self.create_human_game()
+        self.assertTrue(created["ok"])
+        self.assertEqual(created["color"], "white")
+        self.assertEqual(joined["color"], "black")
+        self.assertEqual(joined["state"]["seats"], {"white": True, "black": True})
+        self.assertEqual(len(created["state"]["dice"]), 2)
+        full = await self.request(op="join", game=created["game"])
+        self.assertFalse(full["ok"])
+        self.assertIn("full", full["error"])
+
+    async def test_sessions_are_independent(self):
+        first, _ = await self.create_human_game(seed=1)
+        second, _ = await self.create_human_game(seed=1)
+        self.assertNotEqual(first["game"], second["game"])
+        self.assertEqual(first["state"]["cells"], second["state"]["cells"])
+        self.assertEqual(len(self.server.sessions), 2)
+
+    async def test_moves_follow_turns(self):
+        created, joined = await self.create_human_game()
+        session = self.server.sessions[created["game"]]
+        tokens = {"white": created["token"], "black": joined["token"]}
+        color = session.turn
+        other = "black" if color == "white" else "white"
+
+        wrong = await self.request(op="move", token=tokens[other], **{"from": 1, "to": 2})
+        self.assertFalse(wrong["ok"])
+        self.assertIn("Not your turn", wrong["error"])
+        invalid = await self.request(op="move", token=tokens[color], **{"from": 1, "to": 24})
+        self.assertFalse(invalid["ok"])
+
+        while session.turn == color:
+            from_pos, to_pos = session.game.get_legal_moves()[0]
+            response = await self.request(
+                op="move", token=tokens[color], **{"from": from_pos, "to": to_pos}
+            )
+            self.assertTrue(response["ok"])
+        self.assertTrue(response["turn_over"])
+        self.assertEqual(response["state"]["turn"], other)
+        self.assertEqual(response["state"]["dice"], [])
+
+        rolled = await self.request(op="roll", token=tokens[other])
+        self.assertTrue(rolled["ok"])
+        self.assertEqual(len(rolled["roll"]), 2)
+        again = await self.request(op="roll", token=tokens[other])
+        self.assertFalse(again["ok"])
+
+    async def test_resign(self):
+        created, joined = await self.create_human_game()
+        response = await self.request(op="resign", token=joined["token"])
+        self.assertTrue(response["ok"])
+        self.assertEqual(response["state"]["winner"], "white")
+        self.assertEqual(response["state"]["resigned"], "black")
+        late = await self.request(op="roll", token=created["token"])
+        self.assertFalse(late["ok"])
+        self.assertEqual(late["error"], "Game is over")
+
+    async def test_errors(self):
+        self.assertEqual(
+            await self.request(op="fly"), {"ok": False, "error": "Unknown op 'fly'"}
+        )
+        self.assertFalse((await self.request(op="state", game=99))["ok"])
+        self.assertFalse((await self.request(op="roll", token="nope"))["ok"])
+        self.assertFalse((await self.request(op="create", opponent="gnubg"))["ok"])
+        created, _ = await self.create_human_game()
+        missing = await self.request(op="move", token=created["token"])
+        self.assertEqual(missing["error"], "Missing field 'from'")
+        self.assertFalse((await self.server.handle_request([1, 2]))["ok"])
+
+    async def test_binary_state_loads_into_a_game(self):
+        created, _ = await self.create_human_game()
+        response = await self.request(op="state", game=created["game"], format="binary")
+        game = deserialize_game(base64.b64decode(response["data"])).to_game()
+        session = self.server.sessions[created["game"]]
+        self.assertEqual(game.board.cells, session.game.board.cells)
+        self.assertEqual(game.dice.values, session.game.dice.values)
+        self.assertEqual(game.current_player_index, session.game.current_player_index)
+
+    async def test_computer_opponent_plays_its_turns(self):
+        created = await self.request(op="create", opponent="first", seed=5)
+        session = self.server.sessions[created["game"]]
+        self.assertEqual(created["state"]["seats"]["black"], "computer")
+        self.assertFalse((await self.request(op="join", game=created["game"]))["ok"])
+        for _ in range(500):
+            if session.is_over():
+                break
+            self.assertEqual(session.turn, "white")
+            if not session.game.dice.values:
+                await self.request(op="roll", token=created["token"])
+                continue
+            from_pos, to_pos = session.game.get_legal_moves()[0]
+            response = await self.request(
+                op="move", token=created["token"], **{"from": from_pos, "to": to_pos}
+            )
+            self.assertTrue(response["ok"], response)
+        self.assertTrue(session.is_over())
+        self.assertIn(session.points, (1, 2, 3))
+
+    async def test_computer_failure_is_reported(self):
+        with patch(
+            "backgammon.server.game_server.choose_moves", return_value=[("bar", "off")]
+        ):
+            response = await self.request(op="create", opponent="first", seed=5)
+            token = response["token"]
+            session = self.server.sessions[response["game"]]
+            while response["ok"]:
+                if not session.game.dice.values:
+                    response = await self.request(op="roll", token=token)
+                    continue
+                from_pos, to_pos = session.game.get_legal_moves()[0]
+                response = await self.request(
+                    op="move", token=token, **{"from": from_pos, "to": to_pos}
+                )
+        self.assertEqual(
+            response,
+            {"ok": False, "error": "Computer player failed: Computer move rejected: bar off"},
+        )
+        self.assertTrue((await self.request(op="state", game=session.game_id))["ok"])
+
+    async def test_expectimax_turns_leave_the_event_loop(self):
+        threads = []
+
+        def record_thread(data, policy, seed):
+            threads.append(threading.current_thread())
+            return choose_moves(data, policy, seed)
+
+        self.server = GameServer(port=0, ai_time_budget=None)
+        with patch(
+            "backgammon.server.game_server.choose_moves", side_effect=record_thread
+        ):
+            for seed in range(50):
+                created = await self.request(op="create", opponent="expectimax", seed=seed)
+                if created["computer_moves"]:
+                    break
+        self.assertTrue(created["ok"], created)
+        self.assertTrue(created["computer_moves"])
+        self.assertTrue(threads)
+        self.assertNotIn(threading.current_thread(), threads)
+
+    def test_invalid_ai_depth(self):
+        for depth in (0, 4):
+            with self.assertRaises(ValueError):
+                GameServer(port=0, ai_depth=depth)
+
+    def test_choose_moves_from_record(self):
+        game = BackgammonGame()
+        game.setup_players()
+        game.setup_board()
+        game.dice.last_roll = [3, 1]
+        game.dice.values = [3, 1]
+        moves = choose_moves(serialize_game(game), make_policy("first"), 0)
+        self.assertEqual(len(moves), 2)
+        self.assertTrue(all(game.make_move(*move) for move in moves))
+
+
+class TestGameServerConnections(unittest.IsolatedAsyncioTestCase):
+    """Tests for the TCP line protocol"""
+
+    async def asyncSetUp(self):
+        self.server = GameServer(port=0, max_connections=1)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def connect(self):
+        return await asyncio.open_connection("127.0.0.1", self.server.port)
+
+    @staticmethod
+    async def exchange(reader, writer, line):
+        writer.write(line)
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    @staticmethod
+    async def disconnect(writer):
+        writer.close()
+        await writer.wait_closed()
+        await asyncio.sleep(0.01)
+
+    async def test_line_protocol(self):
+        reader, writer = await self.connect()
+        created = await self.exchange(reader, writer, b'{"op": "create", "seed": 1}\n')
+        self.assertTrue(created["ok"])
+        state = await self.exchange(
+            reader, writer, json.dumps({"op": "state", "game": created["game"]}).encode()
+            + b"\n"
+        )
+        self.assertEqual(state["state"]["game"], created["game"])
+        self.assertEqual(
+            await self.exchange(reader, writer, b"not json\n"),
+            {"ok": False, "error": "Invalid JSON"},
+        )
+        await self.disconnect(writer)
+        self.assertEqual(self.server.connections, 0)
+
+    async def test_connection_limit(self):
+        _, writer = await self.connect()
+        await asyncio.sleep(0.01)
+        second_reader, second_writer = await self.connect()
+        response = json.loads(await second_reader.readline())
+        self.assertEqual(response, {"ok": False, "error": "Too many connections"})
+        self.assertEqual(await second_reader.readline(), b"")
+        await self.disconnect(second_writer)
+        await self.disconnect(writer)
+
+
+if __name__ == "__main__":
+    unittest.main()
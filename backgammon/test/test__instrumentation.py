@@ -0,0 +1,118 @@
+"""
+Test module for the game instrumentation.
+
+This module contains unit tests for the latency histograms, the call
+counters of an instrumented BackgammonGame and their text summary.
+"""
+
+import random
+import unittest
+
+from backgammon.core import BackgammonGame
+from backgammon.core.instrumentation import Instrumentation, LatencyHistogram
+from backgammon.engine.simulator import SelfPlaySimulator
+
+# pylint: disable=C0116  # many simple test methods without docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Tests for LatencyHistogram"""
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        self.assertEqual(histogram.percentile(0.5), 0)
+        self.assertEqual(histogram.as_dict()["calls"], 0)
+        self.assertEqual(histogram.as_dict()["mean_us"], 0)
+
+    def test_record(self):
+        histogram = LatencyHistogram()
+        for elapsed in [1000] * 98 + [5000, 100000]:
+            histogram.record(elapsed)
+        summary = histogram.as_dict()
+        self.assertEqual(summary["calls"], 100)
+        self.assertEqual(summary["min_us"], 1.0)
+        self.assertEqual(summary["max_us"], 100.0)
+        self.assertAlmostEqual(summary["total_ms"], 0.203)
+        # 1000 ns falls in [512, 1024)
+        self.assertEqual(summary["buckets"], {1024: 98, 8192: 1, 131072: 1})
+        self.assertEqual(histogram.percentile(0.5), 1024)
+        self.assertEqual(histogram.percentile(0.99), 8192)
+        self.assertEqual(histogram.percentile(1.0), 100000)
+
+
+class TestGameInstrumentation(unittest.TestCase):
+    """Tests for Instrumentation.attach on a game"""
+
+    def setUp(self):
+        self.game = SelfPlaySimulator.new_game(random.Random(3))
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(self.game.instrumentation)
+        self.assertNotIn("make_move", vars(self.game))
+        self.assertNotIn("timings", self.game.get_game_statistics())
+        self.assertIsNone(Instrumentation.detach(self.game))
+
+    def test_counts_hot_paths(self):
+        instrumentation = Instrumentation().attach(self.game)
+        self.game.roll_dice()
+        moves = self.game.get_possible_moves()
+        self.assertTrue(self.game.make_move(*moves[0]))
+        self.assertFalse(self.game.make_move("bar", "off"))
+        self.game.unmake_move()
+        self.game.complete_turn()
+
+        timings = self.game.get_game_statistics()["timings"]
+        self.assertEqual(timings, instrumentation.as_dict())
+        self.assertEqual(timings["roll_dice"]["calls"], 1)
+        self.assertEqual(timings["make_move"]["calls"], 2)
+        # make_move validates through is_valid_move
+        self.assertEqual(timings["is_valid_move"]["calls"], 2)
+        self.assertEqual(timings["get_possible_moves"]["calls"], 1)
+        self.assertEqual(timings["unmake_move"]["calls"], 1)
+        self.assertEqual(timings["complete_turn"]["calls"], 1)
+        # Computed lazily: for get_possible_moves and to validate the second
+        # make_move in the new position; the roll and the undo compute nothing
+        self.assertEqual(timings["generate_moves"]["calls"], 2)
+        self.assertNotIn("get_legal_plays", timings)
+        self.assertGreater(timings["make_move"]["total_ms"], 0)
+
+        text = instrumentation.format_text("Timings")
+        self.assertTrue(text.startswith("Timings\nOperation"))
+        self.assertIn("generate_moves", text)
+
+    def test_detach_restores_methods(self):
+        instrumentation = Instrumentation().attach(self.game)
+        self.game.roll_dice()
+        self.assertIs(Instrumentation.detach(self.game), instrumentation)
+        self.assertEqual(vars(self.game).keys() & {"make_move", "roll_dice"}, set())
+        self.game.complete_turn()
+        self.game.roll_dice()
+        self.assertEqual(instrumentation.as_dict()["roll_dice"]["calls"], 1)
+        self.assertNotIn("complete_turn", instrumentation.as_dict())
+
+    def test_shared_instrumentation_and_copies(self):
+        shared = Instrumentation()
+        other = BackgammonGame()
+        shared.attach(self.game)
+        shared.attach(other)
+        self.game.roll_dice()
+        other.roll_dice()
+        self.assertEqual(shared.as_dict()["roll_dice"]["calls"], 2)
+        copy = self.game.copy()
+        self.assertIsNone(copy.instrumentation)
+        copy.complete_turn()
+        self.assertNotIn("complete_turn", shared.as_dict())
+        shared.reset()
+        self.assertEqual(shared.as_dict(), {})
+
+    def test_reattach_does_not_double_wrap(self):
+        first = Instrumentation().attach(self.game)
+        second = Instrumentation().attach(self.game)
+        self.game.roll_dice()
+        self.assertNotIn("roll_dice", first.as_dict())
+        self.assertEqual(second.as_dict()["roll_dice"]["calls"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
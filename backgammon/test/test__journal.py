@@ -0,0 +1,233 @@
+"""
+Test module for the move journal.
+
+This module contains unit tests for the append-only move journal, its sync
+policies, checkpoints and crash recovery.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from backgammon.core import BackgammonGame, Dice
+from backgammon.core.journal import (
+    FILE_HEADER,
+    MOVE,
+    RECORD,
+    ROLL,
+    SWITCH,
+    UNDO,
+    MoveJournal,
+    read_journal,
+    read_snapshot,
+    recover_game,
+)
+from backgammon.engine.simulator import game_rng
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+# pylint: disable=R1732  # journals are closed explicitly in the tests
+
+
+def new_game(seed=5):
+    game = BackgammonGame()
+    game.dice = Dice(rng=game_rng(seed, 0))
+    game.start_game()
+    return game
+
+
+def play_turns(game, turns):
+    """Roll and play the first legal play for a number of turns."""
+    for _ in range(turns):
+        game.roll_dice()
+        for move in game.get_legal_plays()[0][0]:
+            game.make_move(*move)
+        game.complete_turn()
+
+
+def comparable_state(game):
+    state = game.get_game_state()
+    state["move_history"] = [tuple(move) for move in state["move_history"]]
+    return state
+
+
+class TestMoveJournal(unittest.TestCase):
+    """Test cases for MoveJournal and recover_game."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "game.journal")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_records_moves_rolls_and_switches(self):
+        game = new_game()
+        journal = MoveJournal(self.path, sync="always")
+        journal.attach(game)
+        play_turns(game, 1)
+        kinds = [record.kind for record in read_journal(self.path)]
+        self.assertEqual(kinds[0], ROLL)
+        self.assertEqual(kinds[-1], SWITCH)
+        self.assertEqual(kinds.count(MOVE), len(game.move_history))
+        seqs = [record.seq for record in read_journal(self.path)]
+        self.assertEqual(seqs, list(range(1, len(kinds) + 1)))
+        journal.close()
+
+    def test_recover_after_crash(self):
+        game = new_game()
+        journal = MoveJournal(self.path, sync="always")
+        journal.attach(game)
+        play_turns(game, 6)
+        game.roll_dice()
+        game.make_move(*game.get_possible_moves()[0])
+        # Crash: the journal is never closed
+        recovered = recover_game(self.path)
+        self.assertEqual(comparable_state(recovered), comparable_state(game))
+        self.assertEqual(recovered.get_possible_moves(), game.get_possible_moves())
+        self.assertIsNone(recovered.journal)
+        journal.close()
+
+    def test_recover_replays_undo(self):
+        game = new_game()
+        journal = MoveJournal(self.path, sync="always")
+        journal.attach(game)
+        game.roll_dice()
+        game.make_move(*game.get_possible_moves()[0])
+        game.undo_last_move()
+        self.assertEqual(read_journal(self.path)[-1].kind, UNDO)
+        recovered = recover_game(self.path)
+        self.assertEqual(comparable_state(recovered), comparable_state(game))
+        journal.close()
+
+    def test_batch_policy_buffers_records(self):
+        game = new_game()
+        journal = MoveJournal(self.path, sync="batch", batch_size=1000)
+        journal.attach(game)
+        syncs = journal.syncs
+        play_turns(game, 2)
+        self.assertEqual(read_journal(self.path), [])
+        self.assertEqual(journal.syncs, syncs)
+        journal.flush()
+        self.assertEqual(len(read_journal(self.path)), journal.records_written)
+        self.assertEqual(journal.syncs, syncs + 1)
+        journal.close()
+
+    def test_batch_size_triggers_write(self):
+        journal = MoveJournal(self.path, sync="none", batch_size=3)
+        for _ in range(7):
+            journal.record_roll([3, 4])
+        self.assertEqual(len(read_journal(self.path)), 6)
+        self.assertEqual(journal.syncs, 0)
+        journal.close()
+        self.assertEqual(len(read_journal(self.path)), 7)
+
+    def test_checkpoint_truncates_journal(self):
+        game = new_game()
+        journal = MoveJournal(self.path, sync="always")
+        journal.attach(game)
+        play_turns(game, 3)
+        journal.checkpoint(game)
+        self.assertEqual(os.path.getsize(self.path), FILE_HEADER.size)
+        self.assertEqual(read_snapshot(journal.snapshot_path)[0], journal.seq)
+        play_turns(game, 2)
+        snapshot_seq = read_snapshot(journal.snapshot_path)[0]
+        self.assertEqual(read_journal(self.path)[0].seq, snapshot_seq + 1)
+        recovered = recover_game(self.path)
+        self.assertEqual(comparable_state(recovered), comparable_state(game))
+        journal.close()
+
+    def test_records_before_snapshot_are_skipped(self):
+        game = new_game()
+        journal = MoveJournal(self.path, sync="always")
+        journal.attach(game)
+        play_turns(game, 2)
+        old_journal = open(self.path, "rb").read()
+        journal.checkpoint(game)
+        # Crash after the snapshot was renamed but before the truncation
+        with open(self.path, "wb") as stream:
+            stream.write(old_journal)
+        self.assertEqual(comparable_state(recover_game(self.path)), comparable_state(game))
+        journal.close()
+
+    def test_torn_tail_is_ignored_and_cut(self):
+        game = new_game()
+        journal = MoveJournal(self.path, sync="always")
+        journal.attach(game)
+        play_turns(game, 2)
+        journal.close()
+        with open(self.path, "ab") as stream:
+            stream.write(b"\x01\x02\x03")
+        self.assertEqual(comparable_state(recover_game(self.path)), comparable_state(game))
+
+        reopened = MoveJournal(self.path, sync="always")
+        self.assertEqual(reopened.seq, journal.seq)
+        self.assertEqual((os.path.getsize(self.path) - FILE_HEADER.size) % RECORD.size, 0)
+        recovered = recover_game(self.path)
+        recovered.dice = Dice(rng=game_rng(9, 0))
+        recovered.journal = reopened
+        play_turns(recovered, 2)
+        self.assertEqual(
+            comparable_state(recover_game(self.path)), comparable_state(recovered)
+        )
+        reopened.close()
+
+    def test_corrupted_record_stops_replay(self):
+        journal = MoveJournal(self.path, sync="always")
+        journal.record_roll([6, 5])
+        journal.record_roll([2, 1])
+        journal.close()
+        with open(self.path, "r+b") as stream:
+            stream.seek(FILE_HEADER.size + RECORD.size + 5)
+            stream.write(b"\xff")
+        self.assertEqual(len(read_journal(self.path)), 1)
+
+    def test_recover_without_snapshot(self):
+        journal = MoveJournal(self.path, sync="always")
+        journal.record_roll([3, 1])
+        journal.record_move(8, 5)
+        journal.record_move(6, 5)
+        journal.close()
+        game = recover_game(self.path)
+        self.assertEqual(game.board.get_position_id("black"), "sGfwATDgc/ABMA")
+        self.assertEqual(game.move_history, [(8, 5, "white"), (6, 5, "white")])
+
+    def test_invalid_replay(self):
+        journal = MoveJournal(self.path, sync="always")
+        journal.record_roll([3, 1])
+        journal.record_move(1, 4)
+        journal.close()
+        with self.assertRaises(ValueError):
+            recover_game(self.path)
+
+    def test_invalid_arguments_and_files(self):
+        with self.assertRaises(ValueError):
+            MoveJournal(self.path, sync="sometimes")
+        with self.assertRaises(ValueError):
+            MoveJournal(self.path, batch_size=0)
+        with open(self.path, "wb") as stream:
+            stream.write(b"NOTAJOURNAL!")
+        with self.assertRaises(ValueError):
+            MoveJournal(self.path)
+
+    def test_detach_journal(self):
+        game = new_game()
+        journal = MoveJournal(self.path, sync="batch")
+        journal.attach(game)
+        game.roll_dice()
+        self.assertIs(MoveJournal.detach(game), journal)
+        self.assertEqual(len(read_journal(self.path)), 1)
+        game.roll_dice()
+        self.assertEqual(journal.records_written, 1)
+        self.assertIsNone(MoveJournal.detach(game))
+        journal.close()
+
+    def test_context_manager(self):
+        with MoveJournal(self.path, sync="none") as journal:
+            journal.record_undo()
+        self.assertEqual(len(read_journal(self.path)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Test module for the move cache.
+
+This module contains unit tests for MoveCache and make_move_key.
+"""
+
+import unittest
+from backgammon.core import BackgammonGame
+from backgammon.core.move_cache import GAME_CACHE_SIZE, MoveCache, make_move_key
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+
+
+class TestMoveCache(unittest.TestCase):
+    """Test cases for the MoveCache class."""
+
+    def setUp(self):
+        self.cache = MoveCache(maxsize=2)
+
+    def test_get_counts_hits_and_misses(self):
+        self.assertIsNone(self.cache.get("a"))
+        self.cache.put("a", 1)
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_lru_eviction(self):
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        self.cache.get("a")
+        self.cache.put("c", 3)
+        self.assertIn("a", self.cache)
+        self.assertNotIn("b", self.cache)
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_put_existing_key_does_not_evict(self):
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        self.cache.put("a", 3)
+        self.assertEqual(self.cache.evictions, 0)
+        self.assertEqual(self.cache.get("a"), 3)
+
+    def test_get_or_compute(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return "value"
+
+        self.assertEqual(self.cache.get_or_compute("k", compute), "value")
+        self.assertEqual(self.cache.get_or_compute("k", compute), "value")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.cache.get_stats()["hit_rate"], 0.5)
+
+    def test_clear_and_reset_stats(self):
+        self.cache.put("a", 1)
+        self.cache.get("a")
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.hits, 1)
+        self.cache.reset_stats()
+        self.assertEqual(
+            self.cache.get_stats(),
+            {"size": 0, "maxsize": 2, "hits": 0, "misses": 0, "evictions": 0,
+             "hit_rate": 0.0},
+        )
+
+    def test_game_cache_is_sized_for_one_game(self):
+        game = BackgammonGame()
+        self.assertEqual(game.move_cache.maxsize, GAME_CACHE_SIZE)
+        self.assertLess(GAME_CACHE_SIZE, MoveCache().maxsize)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            MoveCache(0)
+
+    def test_key_ignores_dice_order(self):
+        self.assertEqual(
+            make_move_key("moves", b"x", "white", [5, 2]),
+            make_move_key("moves", b"x", "white", [2, 5]),
+        )
+        self.assertNotEqual(
+            make_move_key("valid", b"x", "white", [5, 2], 13, 8),
+            make_move_key("valid", b"x", "black", [5, 2], 13, 8),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
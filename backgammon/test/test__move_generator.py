@@ -0,0 +1,110 @@
+"""
+Test module for MoveGenerator class.
+
+This module contains unit tests for the MoveGenerator class which lists
+complete legal plays for a roll.
+"""
+
+import unittest
+from backgammon.core import Board, BackgammonGame, MoveGenerator
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+
+
+class TestMoveGenerator(unittest.TestCase):
+    """Test cases for the MoveGenerator class."""
+
+    def setUp(self):
+        self.generator = MoveGenerator()
+        self.board = Board()
+        self.board.setup_initial_position()
+
+    def _replay(self, moves, color):
+        board = self.board.copy()
+        for from_pos, to_pos in moves:
+            if from_pos == "bar":
+                self.assertTrue(board.move_from_bar(color, to_pos - 1))
+            elif to_pos == "off":
+                self.assertTrue(board.bear_off(from_pos - 1, color))
+            else:
+                self.assertTrue(board.move_checker(from_pos - 1, to_pos - 1, color))
+        return board.to_bytes()
+
+    def test_opening_plays_are_distinct(self):
+        plays = self.generator.get_legal_plays(self.board, "white", [3, 1])
+        positions = [position for _, position in plays]
+        self.assertEqual(len(plays), 16)
+        self.assertEqual(len(positions), len(set(positions)))
+
+    def test_transpositions_collapse(self):
+        plays = self.generator.get_legal_plays(self.board, "white", [3, 1])
+        point_plays = [
+            moves for moves, _ in plays if sorted(moves) == [(6, 5), (8, 5)]
+        ]
+        self.assertEqual(len(point_plays), 1)
+
+    def test_plays_replay_to_reported_position(self):
+        for dice in ([6, 5], [4, 4, 4, 4], [2, 1]):
+            for color in ("white", "black"):
+                for moves, position in self.generator.get_legal_plays(
+                    self.board, color, dice
+                ):
+                    self.assertEqual(self._replay(moves, color), position)
+
+    def test_doubles_use_four_moves(self):
+        plays = self.generator.get_legal_plays(self.board, "black", [1, 1, 1, 1])
+        self.assertTrue(plays)
+        self.assertTrue(all(len(moves) == 4 for moves, _ in plays))
+
+    def test_must_use_both_dice_when_possible(self):
+        # 11-5 is blocked, so the 3 must be played first to use both dice
+        self.board.reset()
+        self.board.set_cell(10, 1)
+        self.board.set_cell(2, 1)
+        self.board.set_cell(4, -2)
+        self.board.set_cell(18, -13)
+        plays = self.generator.get_legal_plays(self.board, "white", [6, 3])
+        self.assertEqual([moves for moves, _ in plays], [((11, 8), (8, 2))])
+
+    def test_larger_die_rule(self):
+        # Either die can be played alone but not both: the 6 is mandatory
+        self.board.reset()
+        self.board.set_cell(12, 1)
+        self.board.set_cell(1, -2)
+        self.board.set_cell(18, -13)
+        plays = self.generator.get_legal_plays(self.board, "white", [5, 6])
+        self.assertEqual([moves for moves, _ in plays], [((13, 7),)])
+
+    def test_bar_entry_required_first(self):
+        self.board.set_cell(23, 1)
+        self.board.set_cell(24, 1)
+        plays = self.generator.get_legal_plays(self.board, "white", [6, 5])
+        self.assertTrue(all(moves[0][0] == "bar" for moves, _ in plays))
+
+    def test_closed_board_returns_empty_play(self):
+        self.board.reset()
+        for i in range(18, 24):
+            self.board.set_cell(i, -2)
+        self.board.set_cell(24, 1)
+        plays = self.generator.get_legal_plays(self.board, "white", [3, 2])
+        self.assertEqual(plays, [((), self.board.to_bytes())])
+
+    def test_bear_off_with_higher_die(self):
+        self.board.reset()
+        self.board.set_cell(3, 1)
+        self.board.set_cell(0, 1)
+        plays = self.generator.get_legal_plays(self.board, "white", [6, 5])
+        self.assertEqual(len(plays), 1)
+        self.assertEqual(Board.from_bytes(plays[0][1]).get_off_count("white"), 2)
+
+    def test_game_get_legal_plays_uses_remaining_dice(self):
+        game = BackgammonGame()
+        game.setup_players()
+        game.setup_board()
+        game.dice.values = [3, 1]
+        self.assertEqual(len(game.get_legal_plays()), 16)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+Test module for the perft move tree enumeration.
+
+This module contains unit tests for the leaf, sequence and unique position
+counts of known positions, including bar entry, blocked points, the larger
+die rule and bear-off with a higher die.
+"""
+
+import io
+import random
+import unittest
+from array import array
+from contextlib import redirect_stdout
+
+from backgammon.core import Board, MoveGenerator
+from backgammon.engine.perft import (
+    ALL_ROLLS,
+    get_move_sequences,
+    main,
+    parse_roll,
+    perft,
+)
+from backgammon.engine.policies import RandomPolicy
+from backgammon.engine.simulator import SelfPlaySimulator
+
+# pylint: disable=C0116  # many simple test methods without docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+
+
+def make_board(points, white_bar=0, black_bar=0):
+    """Board with the given {index: count} points; missing checkers are off."""
+    cells = array("b", bytes(28))
+    for index, count in points.items():
+        cells[index] = count
+    cells[24], cells[25] = white_bar, black_bar
+    white = sum(count for count in points.values() if count > 0) + white_bar
+    black = -sum(count for count in points.values() if count < 0) + black_bar
+    cells[26], cells[27] = 15 - white, 15 - black
+    return Board.from_bytes(cells.tobytes())
+
+
+def initial_board():
+    board = Board()
+    board.setup_initial_position()
+    return board
+
+
+class TestPerft(unittest.TestCase):
+    """Tests for perft"""
+
+    def test_rolls(self):
+        self.assertEqual(len(ALL_ROLLS), 21)
+        self.assertEqual(parse_roll("1-3"), (3, 1))
+        self.assertEqual(parse_roll("66"), (6, 6))
+        for text in ("7-1", "3", "a-b"):
+            with self.assertRaises(ValueError):
+                parse_roll(text)
+        with self.assertRaises(ValueError):
+            perft(initial_board(), "white", 1, [(1, 3)])
+        with self.assertRaises(ValueError):
+            perft(initial_board(), "white", -1)
+
+    def test_depth_zero(self):
+        result = perft(initial_board(), "white", 0)
+        self.assertEqual((result.leaves, result.unique, result.nodes), (1, 1, 1))
+
+    def test_opening_position(self):
+        board = initial_board()
+        result = perft(board, "white", 1, check=True)
+        self.assertEqual(
+            (result.leaves, result.sequences, result.unique, result.nodes),
+            (447, 2195, 406, 448),
+        )
+        self.assertEqual(board.to_bytes(), initial_board().to_bytes())
+
+    def test_fixed_rolls_match_move_generator(self):
+        result = perft(initial_board(), "white", 2, [(3, 1), (6, 6)])
+        generator = MoveGenerator()
+        expected = 0
+        for _, position in generator.get_legal_plays(initial_board(), "white", [3, 1]):
+            expected += generator.count_legal_plays(
+                Board.from_bytes(position), "black", [6, 6, 6, 6]
+            )
+        self.assertEqual(result.leaves, expected)
+        self.assertEqual(result.nodes, 1 + 16 + expected)
+        self.assertGreater(result.sequences, result.leaves)
+
+    def test_random_positions_agree_with_move_generator(self):
+        rng = random.Random(5)
+        game = SelfPlaySimulator.new_game(rng)
+        policy = RandomPolicy()
+        for ply in range(60):
+            if game.is_game_over():
+                break
+            if ply % 6 == 0:
+                color = game.get_current_player().color
+                result = perft(game.board, color, 1, check=True)
+                self.assertEqual(result.nodes, result.leaves + 1)
+            game.roll_dice()
+            play = policy.choose_play(game, game.get_legal_plays(), rng)
+            for move in play[0]:
+                game.make_move(*move)
+            game.complete_turn()
+
+    def test_bar_entry_and_blocked_points(self):
+        # White on the bar; black holds every entry point but the 24
+        board = make_board({18: -2, 19: -2, 20: -2, 21: -2, 22: -2}, white_bar=1)
+        self.assertEqual(
+            get_move_sequences(board, "white", [6, 5]), {(): board.to_bytes()}
+        )
+        # The 1 enters; the 2 can neither enter nor move on from the 24
+        for dice in ([2, 1], [1, 1, 1, 1]):
+            self.assertEqual(list(get_move_sequences(board, "white", dice)), [(("bar", 24),)])
+
+    def test_larger_die_is_mandatory(self):
+        # Either die can be played from the 21, but not both
+        board = make_board({20: 1, 9: -2})
+        self.assertEqual(list(get_move_sequences(board, "white", [5, 6])), [((21, 15),)])
+
+    def test_bear_off_with_higher_die(self):
+        board = make_board({0: 1, 1: 1, 23: -1})
+        sequences = get_move_sequences(board, "white", [6, 5])
+        self.assertEqual(list(sequences), [((2, "off"), (1, "off"))])
+        # White has borne off every checker: the game ends before depth 2
+        result = perft(board, "white", 2, [(6, 5)])
+        self.assertEqual((result.leaves, result.finished), (0, 1))
+
+    def test_main(self):
+        with redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(main(["--depth", "1", "--expect", "447"]), 0)
+        self.assertIn("nodes/s:", output.getvalue())
+        with redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(main(["--dice", "3-1", "--expect", "1"]), 1)
+        self.assertIn("MISMATCH: expected 1 leaves, got 16", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Test module for the position ID and match ID codec.
+
+This module contains unit tests for encoding and decoding GNU Backgammon
+position IDs and match IDs.
+"""
+
+import random
+import unittest
+from array import array
+
+from backgammon.core import Board
+from backgammon.core.position_id import (
+    MatchState,
+    decode_match_id,
+    decode_position_id,
+    encode_match_id,
+    encode_position_id,
+)
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+
+START_ID = "4HPwATDgc/ABMA"
+
+
+def random_cells(rng):
+    """Build random legal cells with up to 15 checkers per side."""
+    cells = array("b", bytes(28))
+    for color, sign, bar_slot in (("white", 1, 24), ("black", -1, 25)):
+        left = rng.randint(0, 15)
+        cells[26 if color == "white" else 27] = 15 - left
+        while left:
+            slot = rng.randrange(25)
+            if slot == 24:
+                cells[bar_slot] += 1
+            elif cells[slot] * sign >= 0:
+                cells[slot] += sign
+            else:
+                continue
+            left -= 1
+    return cells
+
+
+class TestPositionId(unittest.TestCase):
+    """Test cases for position IDs."""
+
+    def setUp(self):
+        self.board = Board()
+        self.board.setup_initial_position()
+
+    def test_starting_position(self):
+        self.assertEqual(encode_position_id(self.board.cells, "white"), START_ID)
+        self.assertEqual(encode_position_id(self.board.cells, "black"), START_ID)
+        self.assertEqual(decode_position_id(START_ID, "black"), self.board.cells)
+
+    def test_known_position_after_opening_move(self):
+        # White plays 31 (8/5 6/5) and black is on roll
+        self.board.set_cell(7, self.board.cells[7] - 1)
+        self.board.set_cell(5, self.board.cells[5] - 1)
+        self.board.set_cell(4, self.board.cells[4] + 2)
+        self.assertEqual(encode_position_id(self.board.cells, "black"), "sGfwATDgc/ABMA")
+        self.assertEqual(decode_position_id("sGfwATDgc/ABMA", "black"), self.board.cells)
+
+    def test_side_on_roll_changes_id(self):
+        self.board.set_cell(7, self.board.cells[7] - 1)
+        self.board.set_cell(5, self.board.cells[5] - 1)
+        self.board.set_cell(4, self.board.cells[4] + 2)
+        white_id = encode_position_id(self.board.cells, "white")
+        self.assertNotEqual(white_id, encode_position_id(self.board.cells, "black"))
+        self.assertEqual(decode_position_id(white_id, "white"), self.board.cells)
+
+    def test_accepts_board_bytes(self):
+        self.assertEqual(encode_position_id(self.board.to_bytes()), START_ID)
+
+    def test_round_trip_random_positions(self):
+        rng = random.Random(7)
+        for _ in range(300):
+            cells = random_cells(rng)
+            for color in ("white", "black"):
+                position_id = encode_position_id(cells, color)
+                self.assertEqual(len(position_id), 14)
+                self.assertEqual(decode_position_id(position_id, color), cells)
+
+    def test_bar_and_off_round_trip(self):
+        self.board.reset()
+        self.board.set_cell(24, 3)
+        self.board.set_cell(0, 2)
+        self.board.set_cell(26, 10)
+        self.board.set_cell(25, 1)
+        self.board.set_cell(27, 14)
+        decoded = decode_position_id(encode_position_id(self.board.cells))
+        self.assertEqual(decoded, self.board.cells)
+
+    def test_decode_invalid_ids(self):
+        for bad in ("", "4HPwATDgc/ABM", "4HPwATDgc/ABMAA", "4HPwATDgc/AB!A", None):
+            with self.assertRaises(ValueError):
+                decode_position_id(bad)
+
+    def test_decode_too_many_checkers(self):
+        # 80 one bits: far more than 15 checkers
+        with self.assertRaises(ValueError):
+            decode_position_id("/////////////w")
+
+    def test_decode_invalid_color(self):
+        with self.assertRaises(ValueError):
+            decode_position_id(START_ID, "red")
+
+
+class TestMatchId(unittest.TestCase):
+    """Test cases for match IDs."""
+
+    def test_money_game_default(self):
+        self.assertEqual(encode_match_id(MatchState()), "MAEAAAAAAAAA")
+        self.assertEqual(decode_match_id("MAEAAAAAAAAA"), MatchState())
+
+    def test_round_trip(self):
+        state = MatchState(
+            cube_value=4,
+            cube_owner="black",
+            on_roll="black",
+            crawford=True,
+            game_state="playing",
+            turn="white",
+            double_offered=True,
+            resignation=2,
+            dice=(6, 3),
+            match_length=7,
+            score=(5, 6),
+        )
+        match_id = encode_match_id(state)
+        self.assertEqual(len(match_id), 12)
+        self.assertEqual(decode_match_id(match_id), state)
+
+    def test_encode_out_of_range(self):
+        for state in (
+            MatchState(cube_value=3),
+            MatchState(dice=(8, 1)),
+            MatchState(match_length=1 << 15),
+        ):
+            with self.assertRaises(ValueError):
+                encode_match_id(state)
+
+    def test_encode_invalid_names(self):
+        with self.assertRaises(ValueError):
+            encode_match_id(MatchState(on_roll="red"))
+        with self.assertRaises(ValueError):
+            encode_match_id(MatchState(game_state="paused"))
+
+    def test_decode_invalid(self):
+        with self.assertRaises(ValueError):
+            decode_match_id("MAEAAAAAAAA")
+        with self.assertRaises(ValueError):
+            decode_match_id("MAEAAAAAAAA*")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Unit tests for PygameUI class.
+Tests a game against the computer on the dummy video driver.
+"""
+
+import os
+import random
+import threading
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# pylint: disable=wrong-import-position  # the video driver must be set first
+from backgammon.engine.search import ExpectimaxPlayer
+from backgammon.engine.simulator import SelfPlaySimulator
+from backgammon.pygame_ui.pygame_ui import PygameUI
+
+
+class TestPygameUIBotTurn(unittest.TestCase):
+    """Test PygameUI with a computer opponent."""
+
+    def setUp(self):
+        self.ui = PygameUI(800, 450)
+        self.game = SelfPlaySimulator.new_game(random.Random(4))
+        self.game.current_player_index = 0
+        self.ui.set_game(self.game)
+        self.ui.set_bot(ExpectimaxPlayer("black", max_depth=1))
+
+    def tearDown(self):
+        if self.ui.bot_search is not None:
+            self.ui.bot_search.cancel()
+
+    def finish_bot_turn(self):
+        """Run frames until the computer's search finishes and its turn is made."""
+        self.ui.play_bot_turn()
+        while self.ui.bot_search is not None:
+            self.ui.bot_search.result(timeout=10)
+            self.ui.play_bot_turn()
+
+    def click_dice_button(self):
+        """Click the dice button like the human would."""
+        self.ui.board.handle_mouse_click(self.ui.board.dice_button.button_rect.center)
+
+    @patch("builtins.print")
+    def test_human_can_roll_after_bot_turn(self, _mock_print):
+        """Test one human turn plus one bot turn leaves the dice to the human."""
+        self.ui.display_board()
+        self.click_dice_button()
+        self.assertTrue(self.ui.board.interaction.dice_rolled)
+
+        # Play the human's turn through the board clicks
+        while self.game.current_player_index == 0:
+            from_pos, to_pos = self.game.get_legal_moves()[0]
+            self.ui.board.interaction.handle_point_click(from_pos - 1)
+            self.ui.board.interaction.handle_point_click(to_pos - 1)
+        self.assertEqual(self.game.current_player_index, 1)
+
+        # Same frame as the human's last move, as in run_game
+        self.finish_bot_turn()
+        self.ui.display_board()
+        self.assertEqual(self.game.current_player_index, 0)
+        self.assertFalse(self.ui.board.interaction.dice_rolled)
+        self.assertTrue(self.ui.board.dice_button.is_enabled)
+
+        self.click_dice_button()
+        self.assertTrue(self.ui.board.interaction.dice_rolled)
+        self.assertTrue(self.game.dice.values)
+
+    @patch("builtins.print")
+    def test_bot_search_runs_off_the_ui_thread(self, _mock_print):
+        """Test frames keep running while the computer searches its play."""
+        bot = self.ui.bot
+        release = threading.Event()
+        threads = []
+
+        def slow_choose_moves(game):
+            threads.append(threading.current_thread())
+            release.wait(10)
+            return ExpectimaxPlayer.choose_moves(bot, game)
+
+        self.game.current_player_index = 1
+        with patch.object(bot, "choose_moves", side_effect=slow_choose_moves):
+            self.ui.play_bot_turn()
+            self.assertIsNotNone(self.ui.bot_search)
+            for _ in range(3):
+                self.assertTrue(self.ui.handle_events())
+                self.ui.play_bot_turn()
+                self.ui.display_board()
+            self.assertEqual(self.game.current_player_index, 1)
+            self.assertEqual(self.game.move_history, [])
+            release.set()
+            self.finish_bot_turn()
+        self.assertNotIn(threading.current_thread(), threads)
+        self.assertEqual(self.game.current_player_index, 0)
+        self.assertTrue(self.game.move_history)
+
+    @patch("builtins.print")
+    def test_destinations_follow_legal_moves(self, _mock_print):
+        """Test highlighted destinations come from the game's legal move set."""
+        interaction = self.ui.board.interaction
+        self.game.dice.reset()
+        # pylint: disable=protected-access  # highlighting helpers under test
+        self.assertEqual(interaction._calculate_valid_destinations(12), [])
+        self.click_dice_button()
+        for from_pos, _ in self.game.get_legal_moves():
+            self.assertEqual(
+                interaction._calculate_valid_destinations(from_pos - 1),
+                [to_pos - 1 for to_pos in self.game.get_legal_destinations(from_pos)],
+            )
+        self.assertEqual(interaction._calculate_valid_destinations_from_bar(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
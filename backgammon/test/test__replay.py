@@ -0,0 +1,136 @@
+"""
+Test module for GameReplay.
+
+This module contains unit tests for the snapshot-indexed replay engine that
+seeks through recorded games.
+"""
+
+import unittest
+
+from backgammon.core import BackgammonGame, Board, Dice
+from backgammon.core.replay import GameReplay
+from backgammon.engine.simulator import game_rng
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+# pylint: disable=W0212  # tests inspect the snapshot index
+
+
+def recorded_game(turns=40, seed=11):
+    """Play a game with the first legal move and keep every position."""
+    game = BackgammonGame()
+    game.dice = Dice(rng=game_rng(seed, 0))
+    game.start_game()
+    positions = [game.board.to_bytes()]
+    for _ in range(turns):
+        if game.is_game_over():
+            break
+        game.roll_dice()
+        moves = game.get_possible_moves()
+        while moves:
+            game.make_move(*moves[0])
+            positions.append(game.board.to_bytes())
+            moves = game.get_possible_moves()
+        game.complete_turn()
+    return game, positions
+
+
+class TestGameReplay(unittest.TestCase):
+    """Test cases for GameReplay."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.game, cls.positions = recorded_game()
+
+    def setUp(self):
+        self.replay = GameReplay.from_game(self.game, interval=8)
+
+    def test_snapshot_index(self):
+        self.assertEqual(len(self.replay), len(self.game.move_history))
+        self.assertGreater(len(self.replay), 40)
+        self.assertEqual(len(self.replay._snapshots), len(self.replay) // 8 + 1)
+
+    def test_seek_every_position(self):
+        for number in range(len(self.replay) + 1):
+            board = self.replay.seek(number)
+            self.assertEqual(board.to_bytes(), self.positions[number])
+            self.assertEqual(self.replay.position, number)
+
+    def test_seek_random_order(self):
+        for number in (37, 3, len(self.replay), 0, 20, 19, 21, 8):
+            self.assertEqual(self.replay.seek(number).to_bytes(), self.positions[number])
+            self.assertEqual(
+                self.replay.board.zobrist_key,
+                Board.from_bytes(self.positions[number]).zobrist_key,
+            )
+
+    def test_board_at_does_not_move_cursor(self):
+        self.replay.seek(5)
+        board = self.replay.board_at(30)
+        self.assertEqual(board.to_bytes(), self.positions[30])
+        self.assertEqual(self.replay.position, 5)
+        self.assertEqual(self.replay.board.to_bytes(), self.positions[5])
+        board.reset()
+        self.assertEqual(self.replay.board_at(5).to_bytes(), self.positions[5])
+
+    def test_step(self):
+        self.replay.seek(10)
+        self.assertEqual(self.replay.step().to_bytes(), self.positions[11])
+        self.assertEqual(self.replay.step(-3).to_bytes(), self.positions[8])
+        self.assertEqual(self.replay.step(-100).to_bytes(), self.positions[0])
+        self.replay.step(10000)
+        self.assertEqual(self.replay.position, len(self.replay))
+
+    def test_seek_cost_is_bounded(self):
+        calls = []
+        original = Board.make_move
+
+        def counting(board, *args):
+            calls.append(args)
+            return original(board, *args)
+
+        Board.make_move = counting
+        try:
+            for number in (len(self.replay), 3, len(self.replay) - 2):
+                calls.clear()
+                self.replay.seek(number)
+                self.assertLessEqual(len(calls), 4)
+        finally:
+            Board.make_move = original
+
+    def test_move_at(self):
+        self.assertEqual(self.replay.move_at(1), self.game.move_history[0])
+        with self.assertRaises(IndexError):
+            self.replay.move_at(0)
+        with self.assertRaises(IndexError):
+            self.replay.seek(len(self.replay) + 1)
+
+    def test_truncate_and_sync(self):
+        moves = list(self.game.move_history)
+        self.replay.seek(len(moves))
+        self.replay.truncate(20)
+        self.assertEqual(len(self.replay), 20)
+        self.assertEqual(self.replay.position, 20)
+        self.assertEqual(self.replay.board.to_bytes(), self.positions[20])
+        self.assertEqual(len(self.replay._snapshots), 3)
+        self.replay.sync(moves)
+        self.assertEqual(len(self.replay), len(moves))
+        self.assertEqual(self.replay.seek(len(moves)).to_bytes(), self.positions[-1])
+
+    def test_custom_initial_position(self):
+        board = Board()
+        board.set_cell(5, 2)
+        board.set_cell(26, 13)
+        replay = GameReplay([(6, 2, "white"), (6, "off", "white")], initial=board.to_bytes())
+        self.assertEqual(replay.seek(2).get_point_count(1), 1)
+        self.assertEqual(replay.board.get_off_count("white"), 14)
+
+    def test_invalid_moves_and_interval(self):
+        with self.assertRaises(ValueError):
+            GameReplay([(1, 5, "white")])
+        with self.assertRaises(ValueError):
+            GameReplay(interval=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
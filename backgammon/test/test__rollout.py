@@ -0,0 +1,100 @@
+"""
+Test module for the Monte Carlo rollout evaluator.
+
+This module contains unit tests for RolloutEvaluator and ScriptedDice.
+"""
+
+import random
+import unittest
+from backgammon.core import Board
+from backgammon.engine.policies import FirstPlayPolicy
+from backgammon.engine.rollout import ALL_ROLLS, RolloutEvaluator, ScriptedDice
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+
+
+class TestRolloutEvaluator(unittest.TestCase):
+    """Test cases for the RolloutEvaluator class."""
+
+    def setUp(self):
+        # Short race: white needs one roll, black needs several
+        self.board = Board()
+        self.board.set_cell(0, 1)
+        self.board.set_cell(26, 14)
+        self.board.set_cell(12, -3)
+        self.board.set_cell(27, 12)
+
+    def test_certain_win(self):
+        result = RolloutEvaluator(trials=36).rollout(self.board, "white")
+        self.assertEqual(result.trials, 36)
+        self.assertEqual(result.probabilities["win"], 1.0)
+        self.assertEqual(result.std_errors["win"], 0.0)
+        self.assertEqual(result.equity, 1.0)
+
+    def test_probabilities_in_range(self):
+        result = RolloutEvaluator(trials=36, seed=3).rollout(self.board, "black")
+        for name, value in result.probabilities.items():
+            if name != "equity":
+                self.assertGreaterEqual(value, 0.0)
+                self.assertLessEqual(value, 1.0)
+        self.assertLessEqual(result.probabilities["gammon"], result.probabilities["win"])
+
+    def test_parallel_matches_inline(self):
+        evaluator = RolloutEvaluator(FirstPlayPolicy(), trials=8, seed=4)
+        inline = evaluator.rollout(self.board, "black")
+        evaluator.workers = 2
+        self.assertEqual(evaluator.rollout(self.board, "black"), inline)
+
+    def test_first_roll_rotation_covers_all_rolls(self):
+        evaluator = RolloutEvaluator()
+        first_rolls = [evaluator.get_scripted_rolls(i)[0] for i in range(36)]
+        self.assertEqual(sorted(first_rolls), sorted(ALL_ROLLS))
+
+    def test_quasi_random_stratifies_second_roll(self):
+        evaluator = RolloutEvaluator(quasi_random=True, quasi_depth=1)
+        second_rolls = [evaluator.get_scripted_rolls(i * 36)[1] for i in range(36)]
+        self.assertEqual(sorted(second_rolls), sorted(ALL_ROLLS))
+
+    def test_quasi_random_stratifies_every_depth(self):
+        evaluator = RolloutEvaluator(quasi_random=True)
+        scripts = [evaluator.get_scripted_rolls(i) for i in range(evaluator.trials)]
+        for depth in range(evaluator.quasi_depth + 1):
+            rolls = [script[depth] for script in scripts]
+            self.assertEqual(len(set(rolls)), 36)
+            # Each block of 36 trials covers every roll of every depth
+            self.assertEqual(sorted(rolls[36:72]), sorted(ALL_ROLLS))
+            # Each later roll is paired with every first roll
+            if depth:
+                pairs = {(script[0], script[depth]) for script in scripts}
+                self.assertEqual(len(pairs), evaluator.trials)
+
+    def test_quasi_depth_is_checked(self):
+        with self.assertRaises(ValueError):
+            RolloutEvaluator(quasi_random=True, quasi_depth=-1)
+        with self.assertRaises(ValueError):
+            RolloutEvaluator(quasi_random=True, quasi_depth=13)
+
+    def test_no_rotation_uses_random_dice(self):
+        evaluator = RolloutEvaluator(rotate_first_roll=False)
+        self.assertEqual(evaluator.get_scripted_rolls(5), [])
+
+    def test_quasi_random_requires_rotation(self):
+        with self.assertRaises(ValueError):
+            RolloutEvaluator(rotate_first_roll=False, quasi_random=True)
+
+
+class TestScriptedDice(unittest.TestCase):
+    """Test cases for the ScriptedDice class."""
+
+    def test_script_then_random(self):
+        dice = ScriptedDice(random.Random(0), [(3, 3), (6, 1)])
+        self.assertEqual(dice.roll(), [3, 3])
+        self.assertEqual(dice.values, [3, 3, 3, 3])
+        self.assertEqual(dice.roll(), [6, 1])
+        die1, die2 = dice.roll()
+        self.assertTrue(1 <= die1 <= 6 and 1 <= die2 <= 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+"""
+Test module for the expectimax search player.
+
+This module contains unit tests for ExpectimaxSearch, ExpectimaxPolicy and
+ExpectimaxPlayer, checking the pruned search against a plain expectimax.
+"""
+
+import itertools
+import random
+import unittest
+from backgammon.core import BackgammonGame, Board, Dice
+from backgammon.core.move_generator import MoveGenerator
+from backgammon.engine.search import (
+    MAX_DEPTH,
+    ORDERED_ROLLS,
+    ExpectimaxPlayer,
+    ExpectimaxPolicy,
+    ExpectimaxSearch,
+    HeuristicEvaluator,
+    other_color,
+)
+from backgammon.engine.simulator import get_win_points
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+
+
+def reference_value(position, color, depth, evaluator, generator):
+    """Plain expectimax value for color after color moved, without pruning."""
+    board = Board.from_bytes(position)
+    if board.get_off_count(color) == 15:
+        return float(get_win_points(board, color))
+    if depth == 0:
+        return evaluator.equities([position], color)[0]
+    opponent = other_color(color)
+    total = 0.0
+    for dice, probability in ORDERED_ROLLS:
+        plays = generator.get_legal_plays(board, opponent, dice)
+        best = max(
+            reference_value(play[1], opponent, depth - 1, evaluator, generator)
+            for play in plays
+        )
+        total -= probability * best
+    return total
+
+
+def race_board():
+    """Short race with few checkers so a full 3-ply tree stays small."""
+    board = Board()
+    board.set_cell(7, 2)
+    board.set_cell(3, 1)
+    board.set_cell(26, 12)
+    board.set_cell(15, -2)
+    board.set_cell(21, -1)
+    board.set_cell(27, 12)
+    return board
+
+
+class TestExpectimaxSearch(unittest.TestCase):
+    """Test cases for the ExpectimaxSearch class."""
+
+    def setUp(self):
+        self.evaluator = HeuristicEvaluator()
+        self.generator = MoveGenerator()
+
+    def _reference_root(self, board, color, dice, depth):
+        plays = self.generator.get_legal_plays(board, color, dice)
+        return max(
+            reference_value(p[1], color, depth - 1, self.evaluator, self.generator)
+            for p in plays
+        )
+
+    def test_matches_plain_expectimax(self):
+        board = race_board()
+        for depth, star2 in itertools.product((2, 3), (False, True)):
+            search = ExpectimaxSearch(max_depth=depth, star2=star2)
+            _, value = search.search(board, "white", [5, 2])
+            self.assertEqual(search.completed_depth, depth)
+            self.assertAlmostEqual(
+                value, self._reference_root(board, "white", [5, 2], depth), places=9
+            )
+
+    def test_one_ply_picks_best_static_play(self):
+        board = Board()
+        board.setup_initial_position()
+        search = ExpectimaxSearch(max_depth=1)
+        play, value = search.search(board, "black", [6, 1])
+        plays = self.generator.get_legal_plays(board, "black", [6, 1])
+        values = self.evaluator.equities([p[1] for p in plays], "black")
+        self.assertEqual(value, max(values))
+        self.assertIn(play, plays)
+
+    def test_finds_winning_play(self):
+        board = Board()
+        board.set_cell(0, 1)
+        board.set_cell(4, 1)
+        board.set_cell(26, 13)
+        board.set_cell(12, -15)
+        play, value = ExpectimaxSearch(max_depth=2).search(board, "white", [5, 1])
+        self.assertEqual(sorted(play[0]), [(1, "off"), (5, "off")])
+        self.assertEqual(value, 2.0)
+
+    def test_time_budget_returns_completed_depth(self):
+        ticks = itertools.count()
+        search = ExpectimaxSearch(
+            max_depth=3, time_budget=5, clock=lambda: float(next(ticks))
+        )
+        board = Board()
+        board.setup_initial_position()
+        play, _ = search.search(board, "white", [4, 2])
+        self.assertEqual(search.completed_depth, 1)
+        self.assertIn(play, self.generator.get_legal_plays(board, "white", [4, 2]))
+
+    def test_single_play_is_returned_without_search(self):
+        board = Board()
+        board.set_cell(0, 1)
+        board.set_cell(26, 14)
+        board.set_cell(12, -15)
+        search = ExpectimaxSearch(max_depth=3)
+        play, _ = search.search(board, "white", [1, 1, 1, 1])
+        self.assertEqual(play[0], ((1, "off"),))
+        self.assertEqual(search.completed_depth, 1)
+
+    def test_invalid_depth(self):
+        with self.assertRaises(ValueError):
+            ExpectimaxSearch(max_depth=0)
+        with self.assertRaises(ValueError):
+            ExpectimaxSearch(max_depth=MAX_DEPTH + 1)
+        with self.assertRaises(ValueError):
+            ExpectimaxPlayer("black", max_depth=4)
+
+
+class TestExpectimaxPlayer(unittest.TestCase):
+    """Test cases for ExpectimaxPolicy and ExpectimaxPlayer."""
+
+    def setUp(self):
+        self.game = BackgammonGame()
+        self.game.dice = Dice(random.Random(11))
+        self.game.setup_players()
+        self.game.setup_board()
+        self.game.current_player_index = 1
+
+    def test_policy_returns_legal_play(self):
+        self.game.dice.values = [3, 1]
+        plays = self.game.get_legal_plays()
+        play = ExpectimaxPolicy().choose_play(self.game, plays, random.Random(0))
+        self.assertIn(play, plays)
+
+    def test_play_turn_rolls_and_moves(self):
+        player = ExpectimaxPlayer("black", max_depth=1)
+        self.assertTrue(player.is_turn(self.game))
+        moves = player.play_turn(self.game)
+        self.assertTrue(moves)
+        self.assertFalse(self.game.dice.get_available_moves())
+        die1, die2 = self.game.dice.last_roll
+        used = 4 * die1 if die1 == die2 else die1 + die2
+        self.assertEqual(self.game.board.get_pip_count("black"), 167 - used)
+
+    def test_is_turn_other_color(self):
+        self.assertFalse(ExpectimaxPlayer("white").is_turn(self.game))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Test module for the binary game state format.
+
+This module contains unit tests for serializing BackgammonGame state into
+versioned binary records and reading them back, one at a time or streamed.
+"""
+
+import io
+import os
+import struct
+import tempfile
+import unittest
+
+from backgammon.core import BackgammonGame, Dice
+from backgammon.core.serialization import (
+    MAGIC,
+    RECORD_HEADER,
+    GameStateReader,
+    decode_body,
+    deserialize_game,
+    load_game,
+    save_game,
+    serialize_game,
+    write_game,
+)
+from backgammon.engine.simulator import game_rng
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+
+
+def played_game(turns=12, seed=3):
+    """Play a few turns with the first legal move so there is history."""
+    game = BackgammonGame()
+    game.dice = Dice(rng=game_rng(seed, 0))
+    game.start_game()
+    for _ in range(turns):
+        game.roll_dice()
+        moves = game.get_possible_moves()
+        while moves:
+            game.make_move(*moves[0])
+            moves = game.get_possible_moves()
+        game.switch_turns()
+    game.roll_dice()
+    return game
+
+
+class TestSerialization(unittest.TestCase):
+    """Test cases for the binary game state format."""
+
+    def setUp(self):
+        self.game = played_game()
+
+    def test_round_trip_matches_game_state(self):
+        restored = deserialize_game(serialize_game(self.game)).to_game()
+        self.assertEqual(restored.get_game_state(), self.game.get_game_state())
+        self.assertEqual(restored.get_position_key(), self.game.get_position_key())
+        self.assertTrue(self.game.move_history)
+
+    def test_round_trip_new_game(self):
+        game = BackgammonGame()
+        game.setup_players("Ana", None)
+        restored = deserialize_game(serialize_game(game)).to_game()
+        self.assertEqual(restored.get_game_state(), game.get_game_state())
+        self.assertIsNone(restored.start_time)
+        self.assertIsNone(restored.dice.last_roll)
+
+    def test_unicode_names_and_flags(self):
+        self.game.players[0].set_name("Jugador Ñandú")
+        self.game.is_paused = True
+        self.game.end_time = 12345.5
+        snapshot = deserialize_game(serialize_game(self.game))
+        self.assertEqual(snapshot.players[0].name, "Jugador Ñandú")
+        self.assertTrue(snapshot.is_paused)
+        self.assertEqual(snapshot.end_time, 12345.5)
+
+    def test_restored_game_is_playable(self):
+        restored = deserialize_game(serialize_game(self.game)).to_game()
+        self.assertEqual(restored.get_possible_moves(), self.game.get_possible_moves())
+        moves = restored.get_possible_moves()
+        if moves:
+            self.assertTrue(restored.make_move(*moves[0]))
+
+    def test_snapshot_to_game_state(self):
+        snapshot = deserialize_game(serialize_game(self.game))
+        self.assertEqual(snapshot.to_game_state(), self.game.get_game_state())
+
+    def test_smaller_than_per_checker_state(self):
+        self.assertLess(len(serialize_game(self.game)), len(repr(self.game.get_game_state())) // 4)
+
+    def test_rejects_bad_magic_and_version(self):
+        data = serialize_game(self.game)
+        with self.assertRaises(ValueError):
+            deserialize_game(b"XXXX" + data[4:])
+        header = list(RECORD_HEADER.unpack_from(data))
+        header[1] = 99
+        with self.assertRaises(ValueError):
+            deserialize_game(RECORD_HEADER.pack(*header) + data[RECORD_HEADER.size :])
+
+    def test_rejects_corruption_and_truncation(self):
+        data = bytearray(serialize_game(self.game))
+        data[-1] ^= 0xFF
+        with self.assertRaises(ValueError):
+            deserialize_game(bytes(data))
+        with self.assertRaises(ValueError):
+            deserialize_game(serialize_game(self.game)[:-2])
+        with self.assertRaises(ValueError):
+            deserialize_game(MAGIC)
+
+    def test_decode_body_size_mismatch(self):
+        body = serialize_game(self.game)[RECORD_HEADER.size :]
+        with self.assertRaises(ValueError):
+            decode_body(body + b"\x00")
+        with self.assertRaises(ValueError):
+            decode_body(body[:20])
+
+    def test_unencodable_state(self):
+        self.game.move_history.append((0, "nowhere", "white"))
+        with self.assertRaises(ValueError):
+            serialize_game(self.game)
+
+    def test_streaming_reader(self):
+        stream = io.BytesIO()
+        expected = []
+        for seed in range(4):
+            game = played_game(turns=seed * 3, seed=seed)
+            write_game(stream, game)
+            expected.append(game.get_game_state())
+        stream.seek(0)
+        states = [snapshot.to_game_state() for snapshot in GameStateReader(stream)]
+        self.assertEqual(states, expected)
+
+    def test_streaming_reader_truncated_header(self):
+        stream = io.BytesIO(serialize_game(self.game) + struct.pack("<4s", MAGIC))
+        reader = GameStateReader(stream)
+        self.assertIsNotNone(reader.read())
+        with self.assertRaises(ValueError):
+            reader.read()
+
+    def test_save_and_load_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "autosave.bgs")
+            first = played_game(turns=2)
+            save_game(path, first)
+            save_game(path, self.game, append=True)
+            snapshot = load_game(path)
+            self.assertEqual(snapshot.to_game_state(), self.game.get_game_state())
+            save_game(path, first)
+            self.assertEqual(load_game(path).to_game_state(), first.get_game_state())
+            os.truncate(path, 0)
+            with self.assertRaises(ValueError):
+                load_game(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
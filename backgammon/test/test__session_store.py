@@ -0,0 +1,236 @@
+"""
+Test module for the server session store.
+
+This module contains unit tests for the LRU eviction of idle game sessions
+to disk and their transparent reloading.
+"""
+
+import gc
+import os
+import random
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+
+from backgammon.engine.simulator import SelfPlaySimulator
+from backgammon.server import GameServer, GameSession, SessionStore
+from backgammon.server.session_store import (
+    MOVE_BYTES,
+    SESSION_BYTES,
+    estimate_session_bytes,
+)
+
+# pylint: disable=C0116  # many simple test methods without docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+
+
+def make_session(game_id, seed=None):
+    rng = random.Random(game_id if seed is None else seed)
+    return GameSession(game_id, SelfPlaySimulator.new_game(rng))
+
+
+class TestSessionStore(unittest.TestCase):
+    """Tests for SessionStore"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_unlimited_store_keeps_everything(self):
+        store = SessionStore()
+        for game_id in range(1, 6):
+            store.add(make_session(game_id))
+        self.assertEqual(len(store), 5)
+        self.assertEqual(store.evictions, 0)
+        self.assertIsNone(store.get(9))
+        with self.assertRaises(KeyError):
+            store[9]  # pylint: disable=pointless-statement
+        with self.assertRaises(ValueError):
+            store.evict(1)
+
+    def test_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            SessionStore(max_sessions=10)
+        with self.assertRaises(ValueError):
+            SessionStore(self.directory, max_bytes=0)
+        store = SessionStore()
+        store.add(make_session(1))
+        with self.assertRaises(ValueError):
+            store.add(make_session(1))
+
+    def test_count_limit_evicts_least_recently_used(self):
+        store = SessionStore(self.directory, max_sessions=2)
+        for game_id in (1, 2):
+            store.add(make_session(game_id))
+        store.get(1)
+        store.add(make_session(3))
+        self.assertEqual(len(store), 3)
+        self.assertTrue(store.is_resident(1))
+        self.assertFalse(store.is_resident(2))
+        self.assertTrue(os.path.exists(os.path.join(self.directory, "session-2.bgs")))
+        self.assertIn(2, store)
+        self.assertEqual(store.evictions, 1)
+
+    def test_evicted_session_reloads_transparently(self):
+        store = SessionStore(self.directory, max_sessions=1)
+        session = make_session(1, seed=11)
+        session.tokens = {"white": "abc"}
+        game = session.game
+        game.make_move(*game.get_legal_moves()[0])
+        store.add(session)
+        reference = make_session(1, seed=11).game
+        reference.make_move(*reference.get_legal_moves()[0])
+
+        store.add(make_session(2))
+        self.assertFalse(store.is_resident(1))
+        with store.acquire(1) as reloaded:
+            self.assertIsNot(reloaded, session)
+            self.assertEqual(reloaded.tokens, {"white": "abc"})
+            self.assertEqual(reloaded.game.board.cells, game.board.cells)
+            self.assertEqual(reloaded.game.dice.values, game.dice.values)
+            self.assertEqual(reloaded.game.move_history, game.move_history)
+            # The dice stream continues where it was
+            reloaded.game.dice.reset()
+            reference.dice.reset()
+            self.assertEqual(reloaded.game.roll_dice(), reference.roll_dice())
+        self.assertEqual(store.loads, 1)
+        self.assertFalse(store.is_resident(2))
+        self.assertFalse(os.path.exists(os.path.join(self.directory, "session-1.bgs")))
+
+    def test_sessions_in_use_are_not_evicted(self):
+        store = SessionStore(self.directory, max_sessions=1)
+        store.add(make_session(1))
+        with store.acquire(1):
+            store.add(make_session(2))
+            store.add(make_session(3))
+            self.assertTrue(store.is_resident(1))
+            with self.assertRaises(ValueError):
+                store.evict(1)
+        self.assertEqual(store.evictions, 2)
+        self.assertTrue(store.is_resident(1))
+
+    def test_new_session_is_in_use_before_limits_are_enforced(self):
+        store = SessionStore(self.directory, max_sessions=1)
+        store.add(make_session(1))
+        session = make_session(2)
+        with store.acquire(1):
+            with store.acquire(2, session) as acquired:
+                self.assertIs(acquired, session)
+                self.assertTrue(store.is_resident(2))
+                self.assertEqual(store.evictions, 0)
+            # Released and idle again: now the new session is evicted
+            self.assertFalse(store.is_resident(2))
+        self.assertEqual(store.evictions, 1)
+        with self.assertRaises(ValueError):
+            with store.acquire(3, make_session(4)):
+                pass
+        with self.assertRaises(ValueError):
+            with store.acquire(2, make_session(2)):
+                pass
+        self.assertEqual(len(store), 2)
+
+    def test_byte_limit(self):
+        store = SessionStore(self.directory, max_bytes=3 * SESSION_BYTES)
+        for game_id in range(1, 6):
+            store.add(make_session(game_id))
+        self.assertEqual(store.resident_bytes, 3 * SESSION_BYTES)
+        self.assertEqual(store.evictions, 2)
+        with store.acquire(5) as session:
+            session.game.make_move(*session.game.get_legal_moves()[0])
+        self.assertEqual(estimate_session_bytes(session), SESSION_BYTES + MOVE_BYTES)
+        self.assertLessEqual(store.resident_bytes, 3 * SESSION_BYTES)
+        self.assertEqual(store.evictions, 3)
+
+    def test_estimate_follows_measured_memory(self):
+        store = SessionStore()
+        tracemalloc.start()
+        try:
+            start = tracemalloc.get_traced_memory()[0]
+            store.add(make_session(1))
+            with store.acquire(1) as session:
+                SelfPlaySimulator().play_out(session.game, random.Random(1))
+                gc.collect()
+                in_use = tracemalloc.get_traced_memory()[0] - start
+                in_use_estimate = estimate_session_bytes(session)
+            gc.collect()
+            idle = tracemalloc.get_traced_memory()[0] - start
+        finally:
+            tracemalloc.stop()
+        self.assertGreater(in_use_estimate, 10 * SESSION_BYTES)
+        self.assertEqual(len(session.game.move_cache), 0)
+        self.assertEqual(store.resident_bytes, estimate_session_bytes(session))
+        for measured, estimate in ((in_use, in_use_estimate), (idle, store.resident_bytes)):
+            self.assertGreater(estimate, measured / 2)
+            self.assertLess(estimate, measured * 2)
+
+    def test_remove(self):
+        store = SessionStore(self.directory, max_sessions=1)
+        store.add(make_session(1))
+        store.add(make_session(2))
+        store.remove(1)
+        store.remove(2)
+        self.assertEqual(len(store), 0)
+        self.assertEqual(store.resident_bytes, 0)
+        self.assertEqual(os.listdir(self.directory), [])
+
+
+class TestGameServerEviction(unittest.IsolatedAsyncioTestCase):
+    """Tests for a GameServer whose idle sessions are evicted"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.server = GameServer(
+            port=0, sessions=SessionStore(self.directory, max_sessions=2)
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    async def test_players_act_on_evicted_games(self):
+        games = []
+        for seed in range(4):
+            created = await self.server.handle_request({"op": "create", "seed": seed})
+            joined = await self.server.handle_request(
+                {"op": "join", "game": created["game"]}
+            )
+            games.append((created, joined))
+        self.assertEqual(self.server.sessions.evictions, 2)
+
+        created, joined = games[0]
+        state = await self.server.handle_request(
+            {"op": "state", "game": created["game"]}
+        )
+        self.assertEqual(state["state"]["cells"], created["state"]["cells"])
+        color = state["state"]["turn"]
+        token = (created if color == "white" else joined)["token"]
+        from_pos, to_pos = self.server.sessions[created["game"]].game.get_legal_moves()[0]
+        response = await self.server.handle_request(
+            {"op": "move", "token": token, "from": from_pos, "to": to_pos}
+        )
+        self.assertTrue(response["ok"], response)
+        self.assertEqual(response["state"]["moves"], 1)
+        self.assertEqual(len(self.server.sessions), 4)
+
+    async def test_create_keeps_computer_moves_while_other_games_are_held(self):
+        server = GameServer(
+            port=0, sessions=SessionStore(self.directory, max_sessions=1)
+        )
+        first = await server.handle_request({"op": "create", "seed": 0})
+        for seed in range(50):
+            with server.sessions.acquire(first["game"]):
+                created = await server.handle_request(
+                    {"op": "create", "opponent": "first", "seed": seed}
+                )
+            if created["computer_moves"]:
+                break
+        self.assertTrue(created["computer_moves"])
+        game = server.sessions[created["game"]].game
+        self.assertEqual(len(game.move_history), len(created["computer_moves"]))
+        self.assertEqual(list(game.board.cells), created["state"]["cells"])
+
+
+if __name__ == "__main__":
+    unittest.main()
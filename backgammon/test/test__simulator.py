@@ -0,0 +1,147 @@
+"""
+Test module for the headless self-play simulator.
+
+This module contains unit tests for SelfPlaySimulator and the
+move-selection policies.
+"""
+
+import random
+import unittest
+from backgammon.core import Board
+from backgammon.engine.policies import (
+    FirstPlayPolicy,
+    GreedyPolicy,
+    POLICY_NAMES,
+    RandomPolicy,
+    get_policy,
+    make_policy,
+)
+from backgammon.engine.simulator import (
+    SelfPlaySimulator,
+    get_win_points,
+    summarize_results,
+)
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+
+
+class TestSelfPlaySimulator(unittest.TestCase):
+    """Test cases for the SelfPlaySimulator class."""
+
+    def setUp(self):
+        self.simulator = SelfPlaySimulator(RandomPolicy(), RandomPolicy())
+
+    def test_play_game_finishes_with_winner(self):
+        result = self.simulator.play_game(random.Random(1))
+        self.assertIn(result.winner, ("white", "black"))
+        self.assertIn(result.points, (1, 2, 3))
+        self.assertGreater(result.plies, 0)
+        self.assertGreater(result.moves, 0)
+
+    def test_same_seed_same_results(self):
+        first = self.simulator.simulate(4, seed=11)
+        second = self.simulator.simulate(4, seed=11)
+        self.assertEqual(first, second)
+
+    def test_parallel_matches_sequential(self):
+        sequential = self.simulator.simulate(4, seed=5, workers=1)
+        parallel = self.simulator.simulate(4, seed=5, workers=2)
+        self.assertEqual(sequential, parallel)
+
+    def test_run_reports_throughput(self):
+        stats = self.simulator.run(3, seed=2)
+        self.assertEqual(stats["games"], 3)
+        self.assertEqual(stats["white_wins"] + stats["black_wins"], 3)
+        self.assertGreater(stats["games_per_second"], 0)
+        self.assertGreater(stats["moves_per_second"], 0)
+
+    def test_run_reports_workers_used(self):
+        stats = self.simulator.run(2, seed=2, workers=8)
+        self.assertEqual(stats["workers"], 2)
+
+    def test_new_game_opening_roll_is_not_double(self):
+        game = SelfPlaySimulator.new_game(random.Random(3))
+        die1, die2 = game.dice.last_roll
+        self.assertNotEqual(die1, die2)
+        self.assertEqual(game.current_player_index, 0 if die1 > die2 else 1)
+
+    def test_play_turn_passes_the_dice(self):
+        rng = random.Random(3)
+        game = SelfPlaySimulator.new_game(rng)
+        player = game.current_player_index
+        moves = self.simulator.play_turn(game, rng)
+        self.assertEqual(len(game.move_history), moves)
+        self.assertEqual(game.current_player_index, 1 - player)
+        self.assertEqual(game.dice.values, [])
+
+    def test_max_plies_limit(self):
+        simulator = SelfPlaySimulator(max_plies=1)
+        with self.assertRaises(RuntimeError):
+            simulator.play_game(random.Random(0))
+
+    def test_win_points(self):
+        board = Board()
+        board.set_cell(26, 15)
+        board.set_cell(27, 1)
+        self.assertEqual(get_win_points(board, "white"), 1)
+        board.set_cell(27, 0)
+        board.set_cell(18, -15)
+        self.assertEqual(get_win_points(board, "white"), 2)
+        board.set_cell(18, -14)
+        board.set_cell(3, -1)
+        self.assertEqual(get_win_points(board, "white"), 3)
+
+    def test_summarize_empty_results(self):
+        stats = summarize_results([], 0.0)
+        self.assertEqual(stats["games"], 0)
+        self.assertEqual(stats["moves_per_second"], 0)
+
+
+class TestPolicies(unittest.TestCase):
+    """Test cases for the move-selection policies."""
+
+    def setUp(self):
+        self.game = SelfPlaySimulator.new_game(random.Random(4))
+        self.plays = self.game.get_legal_plays()
+
+    def test_policies_return_legal_play(self):
+        for policy in (RandomPolicy(), FirstPlayPolicy(), GreedyPolicy()):
+            play = policy.choose_play(self.game, self.plays, random.Random(0))
+            self.assertIn(play, self.plays)
+
+    def test_greedy_prefers_hitting(self):
+        board = Board()
+        board.set_cell(10, 2)
+        board.set_cell(7, -1)
+        board.set_cell(18, -14)
+        score_hit = GreedyPolicy.score_position(
+            Board.from_bytes(board.to_bytes()).to_bytes(), "white"
+        )
+        board.move_checker(10, 7, "white")
+        self.assertGreater(GreedyPolicy.score_position(board.to_bytes(), "white"), score_hit)
+
+    def test_get_policy(self):
+        self.assertIsInstance(get_policy("greedy"), GreedyPolicy)
+        with self.assertRaises(ValueError):
+            get_policy("unknown")
+        with self.assertRaises(ValueError):
+            get_policy("expectimax")
+
+    def test_make_policy(self):
+        for name in POLICY_NAMES:
+            try:
+                policy = make_policy(name)
+            except ValueError:
+                self.assertEqual(name, "neural")  # NumPy is optional
+                continue
+            self.assertEqual(policy.name, name)
+        self.assertIsInstance(make_policy("greedy"), GreedyPolicy)
+        search = make_policy("expectimax", max_depth=2, time_budget=None).search
+        self.assertEqual((search.max_depth, search.time_budget), (2, None))
+        with self.assertRaises(ValueError):
+            make_policy("unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+"""
+Test module for the policy tournament runner.
+
+This module contains unit tests for the pairings, the Elo ratings, the
+streaming results file and the checkpoint/resume of tournaments.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from backgammon.engine.tournament import EloTable, Tournament, format_ratings, main
+
+# pylint: disable=C0116  # many simple test methods without individual docstrings
+# pylint: disable=C0103  # module name follows test naming convention
+
+
+class TestEloTable(unittest.TestCase):
+    """Test cases for the EloTable class."""
+
+    def test_equal_players(self):
+        table = EloTable()
+        for _ in range(50):
+            table.add("a", "b")
+            table.add("b", "a")
+        ratings = table.ratings()
+        self.assertAlmostEqual(ratings[0].elo, 0.0, places=6)
+        self.assertEqual(ratings[0].games, 100)
+        self.assertAlmostEqual(ratings[0].score, 0.5)
+
+    def test_stronger_player_rates_higher(self):
+        table = EloTable(["c"])
+        for index in range(100):
+            if index % 4:
+                table.add("a", "b")
+            else:
+                table.add("b", "a")
+        ratings = {rating.name: rating for rating in table.ratings()}
+        # 75% score is about 191 Elo
+        self.assertAlmostEqual(ratings["a"].elo - ratings["b"].elo, 190.8, delta=3)
+        self.assertAlmostEqual(ratings["a"].elo, -ratings["b"].elo, places=6)
+        self.assertEqual(ratings["c"].games, 0)
+        self.assertGreater(ratings["a"].margin, 0)
+
+    def test_margin_shrinks_with_games(self):
+        few = EloTable()
+        many = EloTable()
+        for index in range(400):
+            winner, loser = ("a", "b") if index % 3 else ("b", "a")
+            many.add(winner, loser)
+            if index < 40:
+                few.add(winner, loser)
+        self.assertLess(many.ratings()[0].margin, few.ratings()[0].margin)
+
+    def test_unbeaten_player_has_finite_rating(self):
+        table = EloTable()
+        for _ in range(10):
+            table.add("a", "b")
+        ratings = table.ratings()
+        self.assertEqual(ratings[0].name, "a")
+        self.assertLess(ratings[0].elo, 1000)
+
+
+class TestTournament(unittest.TestCase):
+    """Test cases for the Tournament class."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "event.jsonl")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def read_results(self, path=None):
+        with open(path or self.path, encoding="utf-8") as stream:
+            return sorted(
+                (json.loads(line) for line in stream), key=lambda result: result["game"]
+            )
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            Tournament(["random"], results_path=self.path)
+        with self.assertRaises(ValueError):
+            Tournament(["random", "random"], results_path=self.path)
+        with self.assertRaises(ValueError):
+            Tournament(["random", "gnubg"], results_path=self.path)
+        with self.assertRaises(ValueError):
+            Tournament(["random", "first"], "knockout", results_path=self.path)
+        with self.assertRaises(ValueError):
+            Tournament.resume(self.path)
+
+    def test_round_robin(self):
+        tournament = Tournament(
+            ["random", "first", "greedy"], games_per_match=4, seed=1, results_path=self.path
+        )
+        self.assertEqual(
+            tournament.get_pairings(0),
+            [("random", "first"), ("random", "greedy"), ("first", "greedy")],
+        )
+        ratings = tournament.run()
+        results = self.read_results()
+        self.assertEqual(len(results), 12)
+        self.assertEqual([result["game"] for result in results], list(range(12)))
+        self.assertEqual((results[0]["white"], results[1]["white"]), ("random", "first"))
+        self.assertTrue(tournament.is_complete())
+        self.assertEqual(sum(rating.games for rating in ratings), 24)
+        self.assertEqual(sum(tournament.get_standings().values()), 3)
+        self.assertIn("greedy", format_ratings(ratings))
+
+    def test_search_policies_can_play(self):
+        tournament = Tournament(
+            ["greedy", "expectimax"], games_per_match=2, seed=1, results_path=self.path
+        )
+        tournament.run()
+        self.assertEqual(len(self.read_results()), 2)
+        self.assertTrue(tournament.is_complete())
+
+    def test_swiss_pairings_avoid_rematches(self):
+        players = ["random", "first", "greedy"]
+        tournament = Tournament(
+            players, "swiss", rounds=3, games_per_match=2, results_path=self.path
+        )
+        tournament.run()
+        met = []
+        byes = []
+        for round_index in range(3):
+            pairings = tournament.get_pairings(round_index)
+            self.assertEqual(len(pairings), 2)
+            byes.extend(first for first, second in pairings if second is None)
+            met.extend(
+                frozenset(pair) for pair in pairings if pair[1] is not None
+            )
+        self.assertEqual(len(set(met)), 3)
+        self.assertEqual(sorted(byes), sorted(players))
+        self.assertEqual(len(self.read_results()), 6)
+
+    def test_resume_matches_uninterrupted_event(self):
+        settings = (["random", "first", "greedy"], "swiss", 2, 6, 5)
+        full_path = os.path.join(self.directory, "full.jsonl")
+        Tournament(*settings, results_path=full_path).run()
+
+        Tournament(*settings, results_path=self.path).run(max_games=5)
+        self.assertEqual(len(self.read_results()), 5)
+        # A crash in the middle of a write leaves a torn last line
+        with open(self.path, "ab") as stream:
+            stream.write(b'{"game": 99, "rou')
+        resumed = Tournament.resume(self.path)
+        self.assertEqual(len(resumed.results), 5)
+        self.assertFalse(resumed.is_complete())
+        resumed.run()
+        self.assertEqual(self.read_results(), self.read_results(full_path))
+
+    def test_parallel_run_matches_inline_run(self):
+        inline_path = os.path.join(self.directory, "inline.jsonl")
+        settings = (["random", "first"], "round-robin", 2, 20, 3)
+        inline = Tournament(*settings, results_path=inline_path).run()
+        parallel = Tournament(*settings, results_path=self.path).run(workers=2)
+        self.assertEqual(self.read_results(), self.read_results(inline_path))
+        self.assertEqual(inline, parallel)
+
+    def test_main(self):
+        ratings = main(
+            ["--players", "random", "first", "--games", "2", "--results", self.path]
+        )
+        self.assertEqual(len(ratings), 2)
+        self.assertTrue(os.path.exists(self.path + ".checkpoint"))
+        resumed = main(["--resume", "--results", self.path])
+        self.assertEqual(resumed, ratings)
+
+
+if __name__ == "__main__":
+    unittest.main()
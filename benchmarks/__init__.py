@@ -0,0 +1,21 @@
+"""
+Benchmarks for Backgammon game.
+
+Reproducible micro and macro benchmarks of the hot paths of the game:
+- cases: Benchmark definitions built from fixed seeds and positions
+- runner: Timing, JSON reports and comparison against a stored baseline
+
+Run them with ``python -m benchmarks`` from the repository root.
+"""
+
+from .cases import get_benchmarks
+from .runner import Benchmark, BenchmarkSkipped, Comparison, compare, run_benchmarks
+
+__all__ = [
+    "Benchmark",
+    "BenchmarkSkipped",
+    "Comparison",
+    "compare",
+    "get_benchmarks",
+    "run_benchmarks",
+]
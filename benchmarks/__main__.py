@@ -0,0 +1,85 @@
+"""
+Command line entry point for the benchmarks.
+
+Examples:
+    python -m benchmarks --output results.json
+    python -m benchmarks --save-baseline benchmarks/baseline.json
+    python -m benchmarks --baseline benchmarks/baseline.json --tolerance 0.15
+    python -m benchmarks --filter board. --quick
+
+Baselines are machine-specific, so none is committed: save one with
+--save-baseline on the machine that will run the comparison.
+"""
+
+import argparse
+import sys
+from typing import Optional, Sequence
+
+from .cases import get_benchmarks
+from .runner import (
+    DEFAULT_TOLERANCE,
+    compare,
+    format_report,
+    read_report,
+    run_benchmarks,
+    write_report,
+)
+
+QUICK_SCALE = 0.1
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the benchmarks and optionally compare them with a baseline.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+
+    Returns:
+        Exit status: 1 if a benchmark regressed against the baseline, else 0
+    """
+    parser = argparse.ArgumentParser(description="Backgammon benchmarks")
+    parser.add_argument("--filter", help="only run benchmarks whose name contains this")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="compare with this baseline JSON file")
+    parser.add_argument("--save-baseline", help="write the results as a new baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="relative slowdown tolerated before flagging a regression",
+    )
+    parser.add_argument("--quick", action="store_true", help="run 10%% of the iterations")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    benchmarks = get_benchmarks()
+    if args.list:
+        for benchmark in benchmarks:
+            print(f"{benchmark.name} ({benchmark.kind})")
+        return 0
+
+    baseline = read_report(args.baseline) if args.baseline else None
+    report = run_benchmarks(
+        benchmarks, args.filter, QUICK_SCALE if args.quick else 1.0
+    )
+    comparisons = compare(report, baseline, args.tolerance) if baseline else None
+    print(format_report(report, comparisons))
+    for path in (args.output, args.save_baseline):
+        if path:
+            write_report(report, path)
+
+    regressions = [c for c in comparisons or () if c.status == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.tolerance:.0%}:")
+        for comparison in regressions:
+            print(
+                f"  {comparison.name}: {comparison.baseline_us:.2f} us -> "
+                f"{comparison.current_us:.2f} us ({comparison.ratio:.2f}x)"
+            )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""
+Benchmark cases.
+
+Every case builds its state from a fixed seed or a fixed position, so two
+runs time exactly the same work. Micro benchmarks time one call of a hot
+method; macro benchmarks time a whole turn or game.
+
+Positions:
+- opening: Initial position with a seeded opening roll
+- middle: Position after MIDDLE_PLIES random plies of a seeded game
+  (played by SelfPlaySimulator.play_turn)
+- bearoff: White and black with every checker in their home boards
+"""
+
+import os
+import random
+from array import array
+from typing import Any, Callable, List
+
+from backgammon.cli.board_renderer import BoardRenderer as CLIBoardRenderer
+from backgammon.core import BackgammonGame, Board, Dice
+from backgammon.engine.perft import perft
+from backgammon.engine.simulator import SelfPlaySimulator, game_rng
+
+from .runner import Benchmark, BenchmarkSkipped
+
+SEED = 20251017
+MIDDLE_PLIES = 20
+# Checkers per point from the 1-point to the 6-point of each home board
+BEAROFF_HOME = (3, 3, 3, 2, 2, 2)
+FRAME_SIZE = (1600, 900)
+
+
+def opening_game() -> BackgammonGame:
+    """
+    Build the opening position with the first player's dice rolled.
+
+    Returns:
+        BackgammonGame ready for its first move
+    """
+    game = SelfPlaySimulator.new_game(random.Random(SEED))
+    game.roll_dice()
+    return game
+
+
+def middle_game() -> BackgammonGame:
+    """
+    Build a middle-game position by playing random plies from a seeded game.
+
+    Returns:
+        BackgammonGame with the side to move's dice rolled
+    """
+    rng = random.Random(SEED)
+    game = SelfPlaySimulator.new_game(rng)
+    simulator = SelfPlaySimulator()
+    for _ in range(MIDDLE_PLIES):
+        simulator.play_turn(game, rng)
+    game.roll_dice()
+    return game
+
+
+def bearoff_game() -> BackgammonGame:
+    """
+    Build a bear-off race with white to move.
+
+    Returns:
+        BackgammonGame with white's dice rolled
+    """
+    cells = array("b", bytes(28))
+    for index, count in enumerate(BEAROFF_HOME):
+        cells[index] = count
+        cells[23 - index] = -count
+    board = Board.from_bytes(cells.tobytes())
+    game = SelfPlaySimulator.game_from_position(
+        board, "white", Dice(random.Random(SEED))
+    )
+    game.roll_dice()
+    return game
+
+
+POSITIONS = {"opening": opening_game, "middle": middle_game, "bearoff": bearoff_game}
+
+
+def board_possible_moves(position: str) -> Callable[[], Callable[[], Any]]:
+    """Time Board.get_possible_moves for the side to move."""
+
+    def setup():
+        game = POSITIONS[position]()
+        board = game.board
+        color = game.get_current_player().color
+        dice = game.dice.get_available_moves()
+        return lambda: board.get_possible_moves(color, dice)
+
+    return setup
+
+
+def game_make_move(position: str) -> Callable[[], Callable[[], Any]]:
+    """Time BackgammonGame.make_move followed by unmake_move."""
+
+    def setup():
+        game = POSITIONS[position]()
+        move = game.get_legal_moves()[0]
+
+        def make_unmake():
+            game.make_move(*move)
+            game.unmake_move()
+
+        return make_unmake
+
+    return setup
+
+
+def game_is_valid_move(position: str) -> Callable[[], Callable[[], Any]]:
+    """Time BackgammonGame.is_valid_move for a legal and an illegal move."""
+
+    def setup():
+        game = POSITIONS[position]()
+        legal = game.get_legal_moves()[0]
+        illegal = (legal[0], legal[0])
+
+        def validate():
+            game.is_valid_move(*legal)
+            game.is_valid_move(*illegal)
+
+        return validate
+
+    return setup
+
+
+def game_get_state(position: str) -> Callable[[], Callable[[], Any]]:
+    """Time BackgammonGame.get_game_state."""
+
+    def setup():
+        return POSITIONS[position]().get_game_state
+
+    return setup
+
+
+def game_set_state(position: str) -> Callable[[], Callable[[], Any]]:
+    """Time BackgammonGame.set_game_state on another game."""
+
+    def setup():
+        state = POSITIONS[position]().get_game_state()
+        target = opening_game()
+        return lambda: target.set_game_state(state)
+
+    return setup
+
+
+def game_copy(position: str) -> Callable[[], Callable[[], Any]]:
+    """Time BackgammonGame.copy."""
+
+    def setup():
+        return POSITIONS[position]().copy
+
+    return setup
+
+
+def cli_render(position: str) -> Callable[[], Callable[[], Any]]:
+    """Time the CLI BoardRenderer.render_board."""
+
+    def setup():
+        board = POSITIONS[position]().board
+        renderer = CLIBoardRenderer()
+        return lambda: renderer.render_board(board)
+
+    return setup
+
+
+def pygame_frame(position: str) -> Callable[[], Callable[[], Any]]:
+    """Time one Pygame BoardRenderer.render frame on the dummy video driver."""
+
+    def setup():
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+        try:
+            # pylint: disable=import-outside-toplevel  # optional dependency
+            import pygame
+
+            from backgammon.pygame_ui.renderers.board_renderer import (
+                BoardRenderer as PygameBoardRenderer,
+            )
+        except ImportError as error:
+            raise BenchmarkSkipped(f"pygame is not available ({error})") from error
+
+        pygame.init()  # pylint: disable=no-member  # defined by the C extension
+        surface = pygame.Surface(FRAME_SIZE)
+        renderer = PygameBoardRenderer(*FRAME_SIZE)
+        game = POSITIONS[position]()
+        dice_values = list(game.dice.values)
+        available_moves = game.dice.get_available_moves()
+
+        def render():
+            renderer.render(
+                surface,
+                game.board,
+                dice_values=dice_values,
+                available_moves=available_moves,
+                game=game,
+            )
+
+        return render
+
+    return setup
+
+
+def legal_plays(position: str) -> Callable[[], Callable[[], Any]]:
+    """Time the full-turn play generation (uncached) for the side to move."""
+
+    def setup():
+        game = POSITIONS[position]()
+        generator = game.move_generator
+        board = game.board
+        color = game.get_current_player().color
+        dice = game.dice.get_available_moves()
+        return lambda: generator.get_legal_plays(board, color, dice)
+
+    return setup
+
+
+def selfplay_game() -> Callable[[], Any]:
+    """Time one complete random-policy self-play game with a fixed seed."""
+    simulator = SelfPlaySimulator()
+    return lambda: simulator.play_game(game_rng(SEED, 0))
+
+
+def perft_opening() -> Callable[[], Any]:
+    """Time a one-ply move tree enumeration (all 21 rolls) from the opening."""
+    board = Board()
+    board.setup_initial_position()
+    return lambda: perft(board, "white", 1)
+
+
+def get_benchmarks() -> List[Benchmark]:
+    """
+    Get every registered benchmark in run order.
+
+    Returns:
+        List of Benchmark definitions
+    """
+    benchmarks = []
+    for position in POSITIONS:
+        benchmarks.extend(
+            [
+                Benchmark(
+                    f"board.get_possible_moves.{position}",
+                    "micro",
+                    board_possible_moves(position),
+                    20000,
+                ),
+                Benchmark(
+                    f"game.make_move.{position}", "micro", game_make_move(position), 5000
+                ),
+                Benchmark(
+                    f"game.is_valid_move.{position}",
+                    "micro",
+                    game_is_valid_move(position),
+                    20000,
+                ),
+            ]
+        )
+    benchmarks.extend(
+        [
+            Benchmark("game.get_game_state.middle", "micro", game_get_state("middle"), 5000),
+            Benchmark("game.set_game_state.middle", "micro", game_set_state("middle"), 2000),
+            Benchmark("game.copy.middle", "micro", game_copy("middle"), 2000),
+            Benchmark("cli.render_board.middle", "micro", cli_render("middle"), 2000),
+            Benchmark("pygame.render_frame.middle", "micro", pygame_frame("middle"), 50),
+            Benchmark("game.legal_plays.opening", "macro", legal_plays("opening"), 200),
+            Benchmark("game.legal_plays.middle", "macro", legal_plays("middle"), 200),
+            Benchmark("perft.opening.depth1", "macro", perft_opening, 5),
+            Benchmark("selfplay.random_game", "macro", selfplay_game, 5),
+        ]
+    )
+    return benchmarks
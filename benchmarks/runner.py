@@ -0,0 +1,218 @@
+"""
+Benchmark runner.
+
+Times the registered benchmarks, writes the results as JSON and compares
+them with a stored baseline to flag regressions.
+
+Every benchmark is timed `repeat` times over `number` calls; the reported
+time per call is the best repeat, which is the least disturbed by other
+load on the machine. The median repeat is reported as well.
+"""
+
+import json
+import platform
+import statistics
+import sys
+import timeit
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+DEFAULT_TOLERANCE = 0.10
+
+
+class Benchmark(NamedTuple):
+    """
+    One registered benchmark.
+
+    Attributes:
+        name: Dotted name (e.g. "board.get_possible_moves.opening")
+        kind: "micro" or "macro"
+        setup: Builds the fixed state and returns the callable to time; may
+            raise BenchmarkSkipped when an optional dependency is missing
+        number: Calls per repeat
+        repeat: Repeats
+    """
+
+    name: str
+    kind: str
+    setup: Callable[[], Callable[[], Any]]
+    number: int
+    repeat: int = 5
+
+
+class BenchmarkSkipped(Exception):
+    """Raised by a benchmark setup that cannot run in this environment."""
+
+
+class Comparison(NamedTuple):
+    """
+    Result of one benchmark against the baseline.
+
+    Attributes:
+        name: Benchmark name
+        baseline_us: Baseline time per call in microseconds
+        current_us: Current time per call in microseconds
+        ratio: current / baseline
+        status: "regression", "improvement" or "same"
+    """
+
+    name: str
+    baseline_us: float
+    current_us: float
+    ratio: float
+    status: str
+
+
+def measure(benchmark: Benchmark, scale: float = 1.0) -> Dict[str, Any]:
+    """
+    Time one benchmark.
+
+    Args:
+        benchmark: Benchmark to run
+        scale: Factor applied to the number of calls (e.g. 0.1 for a quick run)
+
+    Returns:
+        Result dictionary (best_us, median_us, number, repeat, kind), or
+        {"skipped": reason} if the benchmark cannot run here
+    """
+    try:
+        function = benchmark.setup()
+    except BenchmarkSkipped as error:
+        return {"kind": benchmark.kind, "skipped": str(error)}
+    number = max(1, int(benchmark.number * scale))
+    times = timeit.repeat(function, number=number, repeat=benchmark.repeat)
+    per_call = [total / number * 1e6 for total in times]
+    return {
+        "kind": benchmark.kind,
+        "best_us": min(per_call),
+        "median_us": statistics.median(per_call),
+        "number": number,
+        "repeat": benchmark.repeat,
+    }
+
+
+def run_benchmarks(
+    benchmarks: Sequence[Benchmark],
+    pattern: Optional[str] = None,
+    scale: float = 1.0,
+    progress: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Run benchmarks and build a report.
+
+    Args:
+        benchmarks: Benchmarks to run
+        pattern: Only run benchmarks whose name contains this text
+        scale: Factor applied to the number of calls
+        progress: Called with the name and result of every benchmark
+
+    Returns:
+        Report dictionary with the environment and the results by name
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    for benchmark in benchmarks:
+        if pattern and pattern not in benchmark.name:
+            continue
+        results[benchmark.name] = measure(benchmark, scale)
+        if progress:
+            progress(benchmark.name, results[benchmark.name])
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def write_report(report: Dict[str, Any], path: str) -> None:
+    """
+    Write a report as JSON.
+
+    Args:
+        report: Report from run_benchmarks
+        path: Output file
+    """
+    with open(path, "w", encoding="utf-8") as stream:
+        json.dump(report, stream, indent=2, sort_keys=True)
+        stream.write("\n")
+
+
+def read_report(path: str) -> Dict[str, Any]:
+    """
+    Read a report written by write_report.
+
+    Args:
+        path: Report file
+
+    Returns:
+        Report dictionary
+    """
+    with open(path, encoding="utf-8") as stream:
+        return json.load(stream)
+
+
+def compare(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[Comparison]:
+    """
+    Compare a report with a baseline report.
+
+    Benchmarks that were skipped or are missing from either report are
+    left out.
+
+    Args:
+        report: Current report
+        baseline: Baseline report
+        tolerance: Relative change tolerated before flagging (0.10 = 10%)
+
+    Returns:
+        One Comparison per benchmark present in both reports
+    """
+    comparisons = []
+    for name, result in report["results"].items():
+        reference = baseline["results"].get(name)
+        if not reference or "best_us" not in reference or "best_us" not in result:
+            continue
+        ratio = result["best_us"] / reference["best_us"]
+        if ratio > 1 + tolerance:
+            status = "regression"
+        elif ratio < 1 - tolerance:
+            status = "improvement"
+        else:
+            status = "same"
+        comparisons.append(
+            Comparison(name, reference["best_us"], result["best_us"], ratio, status)
+        )
+    return comparisons
+
+
+def format_report(
+    report: Dict[str, Any], comparisons: Optional[Sequence[Comparison]] = None
+) -> str:
+    """
+    Format a report (and its comparison with a baseline) as a table.
+
+    Args:
+        report: Report from run_benchmarks
+        comparisons: Optional comparisons from compare()
+
+    Returns:
+        Multi-line table
+    """
+    by_name = {comparison.name: comparison for comparison in comparisons or ()}
+    lines = [f"{'Benchmark':<44} {'Best us':>12} {'Median us':>12} {'vs base':>9}"]
+    for name, result in report["results"].items():
+        if "skipped" in result:
+            lines.append(f"{name:<44} skipped: {result['skipped']}")
+            continue
+        change = ""
+        if name in by_name:
+            comparison = by_name[name]
+            change = f"{comparison.ratio - 1:+.1%}"
+            if comparison.status == "regression":
+                change += " !"
+        lines.append(
+            f"{name:<44} {result['best_us']:>12.2f} {result['median_us']:>12.2f} {change:>9}"
+        )
+    return "\n".join(lines)
@@ -7,6 +7,7 @@ import sys
 from backgammon.core.backgammon_game import BackgammonGame
 from backgammon.cli.backgammon_cli import BackgammonCLI  # Updated to use new SOLID architecture
 from backgammon.pygame_ui.pygame_ui import PygameUI
+from backgammon.engine.search import ExpectimaxPlayer
 
 
 def display_welcome_message() -> None:
@@ -46,6 +47,26 @@ def get_user_choice() -> str:
             sys.exit(0)
 
 
+def ask_computer_opponent():
+    """
+    Ask whether black should be played by the computer.
+
+    Returns:
+        ExpectimaxPlayer for black, or None for two human players
+    """
+    while True:
+        try:
+            choice = input("¿Jugar contra la computadora? (s/n): ").strip().lower()
+            if choice in ["s", "si", "sí", "y", "yes"]:
+                return ExpectimaxPlayer("black")
+            if choice in ["n", "no"]:
+                return None
+            print("Opción inválida. Por favor, ingresa 's' o 'n'.")
+        except (EOFError, KeyboardInterrupt):
+            print("\nAdiós!")
+            sys.exit(0)
+
+
 def start_cli_game() -> None:
     """Initialize and start the CLI version of the game."""
     try:
@@ -56,7 +77,7 @@ def start_cli_game() -> None:
         game = BackgammonGame()
         
         # Create BackgammonCLI with game instance (new SOLID architecture)
-        cli = BackgammonCLI(game)
+        cli = BackgammonCLI(game, ask_computer_opponent())
 
         # Start the game loop through CLI
         # The CLI will handle player name input internally
@@ -82,6 +103,7 @@ def start_pygame_game() -> None:
         pygame_ui = PygameUI()
         game = BackgammonGame()
         pygame_ui.set_game(game)
+        pygame_ui.set_bot(ask_computer_opponent())
         game.set_ui(pygame_ui)
 
         # Setup players